@@ -5,34 +5,76 @@ ttk corrisponde al widget con stile moderno (cioè bottoni, spinbox, ecc.)
 messagebox corrisponde alle finestre di dialogo (info, errore, conferma)
 scrolledtext corrisponde all' area di testo con scrollbar per il log del gioco
 '''
-import threading # importazione del modulo necessario per gestire thread. Utilizzato per avanzare l'ora del gioco in background senza bloccare la GUI.
-import random # importazione del modulo per generare numeri casuali. Utilizzato per sbloccare ricette segrete casuali negli upgrade.
+import threading # importazione del modulo necessario per gestire thread. Utilizzato per il lock che protegge i cambiamenti di stato notificati dal thread del SimulationWorker.
 import sys # importazione del modulo sys per reindirizzare l'output standard (print) verso il log grafico della GUI.
 from io import StringIO # importazione di StringIO per creare un buffer di testo in memoria. Serve per reindirizzare i print() del gioco nel log visibile.
-from modules.game import GameEngine # importazione della classe principale GameEngine dal pacchetto modules. 
-from modules.inventory import Inventory # importazione della classe Inventory dal pacchetto modules.
-from modules.recipes import Recipe # importazione della classe Recipe dal pacchetto modules.
-from modules.finance import Finance # importazione della classe Finance dal pacchetto modules.
+from collections import deque # importazione di deque, coda thread-safe usata come buffer delle righe di log in attesa di essere mostrate
+from typing import TYPE_CHECKING # importazione di TYPE_CHECKING: vale True solo per i controlli statici, così i tipi del motore non vengono importati all'avvio
+if TYPE_CHECKING:
+    from modules.game import GameEngine
+    from modules.worker import SimulationWorker
+'''
+GameEngine e SimulationWorker vengono importati solo quando si avvia o si carica una partita (dentro start_game, load_game e show_game_screen),
+così la finestra del menu principale si apre senza caricare il motore di gioco.
+'''
 
 
 class LogRedirector(StringIO):
     '''
     Classe che eredita da StringIO per reindirizzare l'output di print() verso un widget Tkinter (ScrolledText).
-    In particolare ogni volta che viene chiamato write(), inserisce il testo nel widget in modo thread-safe usando after() e
-    gestisce anche errori TclError se il widget è stato distrutto.
+    In particolare write() non tocca mai il widget: accoda il testo in un buffer thread-safe (deque, append atomico) e può quindi essere chiamato
+    da qualsiasi thread; il primo testo accodato dopo uno svuotamento programma un solo _drain() dopo FRAME_MS millisecondi, che svuota il buffer
+    con un unico insert e un unico see() e poi taglia le righe più vecchie oltre max_lines. Così un avanzamento che stampa centinaia di righe costa
+    un solo aggiornamento del widget per frame e, quando nessuno stampa, non c'è alcuna callback programmata.
+    Gestisce anche errori TclError se il widget è stato distrutto (in quel caso smette di svuotare).
     '''
-    def __init__(self, widget):
+    FRAME_MS = 33 # attesa tra il primo testo accodato e lo svuotamento del buffer (al massimo circa 30 aggiornamenti al secondo)
+
+    def __init__(self, widget, max_lines: int = 2000):
         super().__init__()
         self.widget = widget
+        self.max_lines = max_lines
+        self.pending = deque(maxlen=max_lines * 4)
+        self._lock = threading.Lock()
+        self._scheduled = False
 
     def write(self, text):
-        if self.widget.winfo_exists():
-            self.widget.after(0, lambda: self._safe_write(text))
+        if text:
+            self.pending.append(text)
+            with self._lock:
+                if self._scheduled:
+                    return len(text)
+                self._scheduled = True
+            try:
+                self.widget.after(self.FRAME_MS, self._drain)
+            except (tk.TclError, RuntimeError):
+                pass
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def _drain(self):
+        with self._lock:
+            self._scheduled = False
+        chunks = []
+        try:
+            while True:
+                chunks.append(self.pending.popleft())
+        except IndexError:
+            pass
 
-    def _safe_write(self, text):
         try:
-            self.widget.insert(tk.END, text)
-            self.widget.see(tk.END)
+            if chunks:
+                text = "".join(chunks)
+                lines = text.split("\n")
+                if len(lines) > self.max_lines:
+                    text = "\n".join(lines[-self.max_lines:])
+                self.widget.insert(tk.END, text)
+                excess = int(self.widget.index("end-1c").split(".")[0]) - self.max_lines
+                if excess > 0:
+                    self.widget.delete("1.0", f"{excess + 1}.0")
+                self.widget.see(tk.END)
         except tk.TclError:
             pass
 
@@ -51,10 +93,18 @@ class FantaBurgerGUI:
         self.root.configure(bg="#2c1810")
         self.root.resizable(False, False)
 
-        self.game: GameEngine | None = None
+        self.game: "GameEngine | None" = None
         self.running = False
         self.start_btn = None
         self.achievement_label = None
+        self._state_lock = threading.Lock()
+        self._pending_state = {}
+        self._shown_state = {}
+        self._ui_job = None
+        self._ui_scheduled = False
+        self._pending_achievements = []
+        self.worker: "SimulationWorker | None" = None
+        self.autoplay_var = None
 
         self.setup_style()
         self.show_main_menu()
@@ -242,31 +292,22 @@ class FantaBurgerGUI:
         '''
         Come parametro riceve esplicitamente nome del giocatore (stringa), nome del ristorante (stringa), difficoltà (stringa) oltre all'istanza della classe FantaBurgerGUI (self implicito)
         e ha tipo di ritorno None.
-        Si occupa di inizializzare una nuova partita, in particolare, crea istanza GameEngine, imposta nome giocatore/ristorante/difficoltà,
-        inizializza inventory, recipes, finance, imposta modalità GUI, ricette base sbloccate,
-        collega callback achievement, applica impostazioni difficoltà, salva stato iniziale e mostra schermata di gioco.
-        '''
-        self.game = GameEngine()
-        self.game.player_name = player
-        self.game.restaurant_name = restaurant
-        self.game.difficulty = diff
-
-        self.game.inventory = Inventory(load_saved=False)
-        self.game.recipes = Recipe(inventory=self.game.inventory)
-        self.game.finance = Finance(self.game.config["economy"]["initial_balance"])
-        self.game.finance.game_engine = self.game
-
-        self.game.current_game_day = 1
-        self.game.current_hour = self.game.working_start
+        Si occupa di inizializzare una nuova partita, in particolare, crea istanza GameEngine, imposta modalità GUI,
+        collega callback achievement, inizializza la partita con new_game() (nome giocatore/ristorante/difficoltà, inventory, recipes, finance,
+        ricette base sbloccate, impostazioni difficoltà e salvataggio iniziale) e mostra schermata di gioco.
+        '''
+        from modules.game import GameEngine
+        from modules.settings import ConfigError
+        try:
+            self.game = GameEngine()
+        except ConfigError as e:
+            messagebox.showerror("Configurazione non valida", str(e))
+            return
         self.game.gui_mode = True
+        self.game.on_achievement_unlocked = self._queue_achievement
+        self.game.new_game(player, restaurant, diff)
         self.game.running = True
 
-        self.game.unlocked_recipes = self.game.get_base_recipes()
-        self.game.on_achievement_unlocked = self.show_achievement
-
-        self.game._apply_difficulty_settings()
-        self.game.safe_save()
-
         self.show_game_screen()
         print("✅ Partita avviata")
 
@@ -278,10 +319,16 @@ class FantaBurgerGUI:
         se riuscito imposta modalità GUI, collega callback achievement e mostra schermata gioco.
         Altrimenti mostra messaggio "Nessun salvataggio trovato".
         '''
-        self.game = GameEngine()
+        from modules.game import GameEngine
+        from modules.settings import ConfigError
+        try:
+            self.game = GameEngine()
+        except ConfigError as e:
+            messagebox.showerror("Configurazione non valida", str(e))
+            return
         if self.game.load_game():
             self.game.gui_mode = True
-            self.game.on_achievement_unlocked = self.show_achievement
+            self.game.on_achievement_unlocked = self._queue_achievement
             self.show_game_screen()
         else:
             messagebox.showinfo("Info", "Nessun salvataggio trovato")
@@ -294,7 +341,8 @@ class FantaBurgerGUI:
         In particolare, se game over o vittoria mostra schermata finale.
         Altrimenti distrugge widget esistenti, crea header con nome ristorante/giocatore/ora,
         barra informazioni (saldo, reputazione, capacità), area log (con reindirizzamento print),
-        barra comandi (SHOP, AVANZA ORA, UPGRADE, SALVA & ESCI), imposta flag running e avvia update_ui().
+        barra comandi (SHOP, AVANZA ORA, UPGRADE, AUTO con velocità in ore/s, SALVA & ESCI), si iscrive alle notifiche di stato del GameEngine,
+        avvia il SimulationWorker della partita (se non già attivo), imposta flag running e avvia update_ui().
         '''
         for w in self.root.winfo_children():
             w.destroy()
@@ -390,39 +438,121 @@ class FantaBurgerGUI:
             command=self.show_upgrades
         ).pack(side="left", padx=20)
 
+        self.autoplay_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            controls,
+            text="▶ AUTO",
+            variable=self.autoplay_var,
+            command=self.toggle_autoplay
+        ).pack(side="left", padx=(40, 5))
+
+        self.speed_spin = ttk.Spinbox(controls, from_=0.5, to=20, increment=0.5, width=5, command=self.toggle_autoplay)
+        self.speed_spin.set(self.game.config.get("gui", {}).get("autoplay_speed", 2.0))
+        self.speed_spin.pack(side="left")
+        tk.Label(controls, text="ore/s", bg="#2c1810", fg="white").pack(side="left", padx=5)
+
         ttk.Button(
             controls,
             text="💾 SALVA & ESCI",
             command=self.save_and_exit
         ).pack(side="right", padx=20)
 
+        self._shown_state = {}
+        with self._state_lock:
+            self._pending_state = self.game.get_observed_state()
+        self.game.observable.subscribe(self._on_state_changed)
+        if self.worker is None or self.worker.engine is not self.game:
+            from modules.worker import SimulationWorker
+            self._stop_worker()
+            self.worker = SimulationWorker(self.game, self.game.config.get("gui", {}).get("autoplay_speed", 2.0), self._schedule_update)
+
         self.running = True
+        if self._ui_job:
+            self.root.after_cancel(self._ui_job)
         self.update_ui()
 
+    def _stop_worker(self):
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe FantaBurgerGUI.
+        Ferma il SimulationWorker della partita precedente (dopo i comandi già accodati), se presente.
+        '''
+        if self.worker:
+            self.worker.stop()
+            self.worker = None
+
+    def _queue_achievement(self, name: str):
+        '''
+        Funzione privata che come parametro riceve esplicitamente il nome dell'achievement (stringa) oltre all'istanza della classe FantaBurgerGUI (self implicito).
+        Callback on_achievement_unlocked del GameEngine: viene chiamata dal thread del worker, quindi accoda il nome e update_ui() mostra il popup nel thread della GUI.
+        '''
+        with self._state_lock:
+            self._pending_achievements.append(name)
+        self._schedule_update()
+
+    def _on_state_changed(self, changed: dict):
+        '''
+        Funzione privata che come parametro riceve esplicitamente il dizionario dei valori cambiati (notificato da GameEngine.observable) oltre all'istanza della classe FantaBurgerGUI (self implicito).
+        Può essere chiamata da qualsiasi thread, quindi non tocca i widget: accumula i cambiamenti, che update_ui() applica al frame successivo.
+        '''
+        with self._state_lock:
+            self._pending_state.update(changed)
+        self._schedule_update()
+
+    def _schedule_update(self):
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe FantaBurgerGUI.
+        Programma un solo update_ui() dopo LogRedirector.FRAME_MS millisecondi, se non ce n'è già uno in attesa: viene chiamata quando qualcosa viene accodato
+        (cambiamenti di stato, achievement, risultati dei comandi del worker), quindi a partita ferma non c'è alcuna callback periodica.
+        Può essere chiamata da qualsiasi thread: con Tcl compilato con i thread (build standard di Python) tkinter esegue after() nel thread della GUI.
+        '''
+        with self._state_lock:
+            if self._ui_scheduled or not self.running:
+                return
+            self._ui_scheduled = True
+        try:
+            self._ui_job = self.root.after(LogRedirector.FRAME_MS, self.update_ui)
+        except (tk.TclError, RuntimeError):
+            with self._state_lock:
+                self._ui_scheduled = False
+
     def update_ui(self):
         '''
         Come parametro riceve implicitamente solo l'istanza della classe FantaBurgerGUI e ha tipo di ritorno None.
-        Aggiorna dinamicamente l'interfaccia ogni 500ms.
-        In particolare, se vittoria disabilita pulsanti di gioco, aggiorna ora, bilancio, reputazione e capacità.
-        Richiama se stessa con after() per aggiornamento continuo.
+        Aggiorna l'interfaccia applicando solo i cambiamenti notificati dal GameEngine; viene programmata da _schedule_update() quando c'è qualcosa da mostrare.
+        In particolare, esegue le callback dei comandi completati dal worker, mostra gli achievement sbloccati, riconfigura solo le label (ora, bilancio, reputazione, capacità)
+        i cui valori sono cambiati e a fine partita (vittoria o game over) mostra la schermata finale; se non è cambiato nulla non tocca alcun widget.
+        Non si riprogramma: la prossima notifica ne programmerà un'altra.
         '''
+        with self._state_lock:
+            self._ui_job = None
+            self._ui_scheduled = False
         if not self.running or not self.game:
             return
-        
-        if self.game.game_won:
-            for widget in self.root.winfo_children():
-                if widget.winfo_class() in ('TButton', 'Button'):
-                    if widget['text'] not in ['💾 SALVA & ESCI', '🚪 USCITA']:
-                        widget.config(state='disabled')
-
-        self.time_label.config(
-            text=f"Giorno {self.game.current_game_day} – Ora {self.game.current_hour:02d}:00"
-        )
-        self.money_label.config(text=f"€ {self.game.finance.get_balance():.2f}")
-        self.rep_label.config(text=f"Reputazione: {self.game.reputation:.1f}/100")
-        self.cap_label.config(text=f"Capacità: {self.game.kitchen_capacity}/ora")
 
-        self.root.after(500, self.update_ui)
+        if self.worker:
+            self.worker.dispatch_results()
+
+        with self._state_lock:
+            pending, self._pending_state = self._pending_state, {}
+            achievements, self._pending_achievements = self._pending_achievements, []
+
+        for name in achievements:
+            self.show_achievement(name)
+
+        if pending:
+            self._shown_state.update(pending)
+            state = self._shown_state
+
+            if "day" in pending or "hour" in pending:
+                self.time_label.config(text=f"Giorno {state['day']} – Ora {state['hour']:02d}:00")
+            if "balance" in pending:
+                self.money_label.config(text=f"€ {state['balance']:.2f}")
+            if "reputation" in pending:
+                self.rep_label.config(text=f"Reputazione: {state['reputation']:.1f}/100")
+            if "capacity" in pending:
+                self.cap_label.config(text=f"Capacità: {state['capacity']}/ora")
+            if pending.get("game_won") or pending.get("game_over"):
+                self.show_victory_screen()
 
 
     def show_shop(self):
@@ -431,8 +561,9 @@ class FantaBurgerGUI:
         Apre la finestra dello shop ingredienti.
         In particolare, crea finestra modale con canvas scrollabile, organizza ingredienti per categoria,
         mostra nome, costo, stock, spinbox quantità e pulsante "Compra" per ogni ingrediente (inclusi secret).
-        Mostra saldo attuale in fondo.
+        Mostra saldo attuale in fondo. I dati vengono dall'ultima istantanea del SimulationWorker, non dal GameEngine.
         '''
+        snapshot = self.worker.snapshot
         w = tk.Toplevel(self.root)
         w.title("🛒 Shop Ingredienti")
         w.geometry("900x700")
@@ -455,20 +586,14 @@ class FantaBurgerGUI:
         scrollbar.pack(side="right", fill="y")
 
         for category in ["hamburger", "topping", "bread", "sauces", "secret"]:
-            if category not in self.game.inventory.data["ingredients"]:
+            if category not in snapshot["ingredients"]:
                 continue
             cat_frame = tk.LabelFrame(scrollable, text=category.upper(),
                                       font=("Helvetica", 14, "bold"),
                                       bg="#2c1810", fg="#ffffff")
             cat_frame.pack(fill="x", pady=5, padx=10)
 
-            for name, data in self.game.inventory.data["ingredients"][category].items():
-                if not isinstance(data, dict):
-                    continue
-                display = data.get("display_name", name.replace("_", " ").title())
-                cost = data.get("current_cost", data.get("base_cost", 0.0))
-                qty = data.get("current_quantity", 0)
-
+            for name, display, cost, qty in snapshot["ingredients"][category]:
                 frame = tk.Frame(cat_frame, bg="#2c1810")
                 frame.pack(fill="x", pady=2)
 
@@ -482,7 +607,7 @@ class FantaBurgerGUI:
                 ttk.Button(frame, text="Compra",
                            command=lambda p=path, s=spin: self._buy_item(p, int(s.get()), w)).pack(side="right")
 
-        tk.Label(w, text=f"Saldo: €{self.game.finance.get_balance():.2f}",
+        tk.Label(w, text=f"Saldo: €{snapshot['balance']:.2f}",
                  font=("Helvetica", 18), bg="#2c1810", fg="#00ff00").pack(pady=20)
 
     def _buy_item(self, path, qty, win):
@@ -490,61 +615,57 @@ class FantaBurgerGUI:
         Funzione privata che come parametro riceve il percorso (str), la quantità (int) e win (Toplevel) oltre all'istanza della classe FantaBurgerGUI (self implicito).
         Gestisce l'acquisto di un ingrediente nello shop.
         In particolare, verifica che la quantità sia positiva e che path sia nel formato corretto "categoria.ingrediente",
-        controlla l'esistenza dell'ingrediente nella struttura inventory.data, calcola il costo totale,
-        verifica fondi sufficienti nel bilancio (finance.get_balance()), aggiorna direttamente la quantità corrente
-        nell'inventario, sottrae il denaro con finance.subtract_money(), mostra messaggio di successo con nuovo stock e spesa,
-        salva lo stato di gioco con safe_save(), stampa conferma nel log e chiude la finestra shop per riaprirla aggiornata.
-        In caso di errore (quantità non valida, percorso invalido, ingrediente non trovato, fondi insufficienti o eccezione generica)
+        controlla l'esistenza dell'ingrediente e i fondi sufficienti sull'istantanea del worker, poi invia il comando "buy" al SimulationWorker
+        (che acquista con purchase_ingredient() e salva); il risultato viene gestito da _on_item_bought() nel thread della GUI.
+        In caso di errore (quantità non valida, percorso invalido, ingrediente non trovato, fondi insufficienti)
         mostra messagebox di errore appropriato e interrompe l'operazione senza modificare lo stato.
         '''
         if qty <= 0:
             messagebox.showerror("Errore", "Quantità non valida")
             return
 
-        try:
-            parts = path.split('.')
-            if len(parts) != 2:
-                messagebox.showerror("Errore", "Percorso ingrediente non valido")
-                return
-                
-            category, name = parts
-            
-            if (category not in self.game.inventory.data["ingredients"] or 
-                name not in self.game.inventory.data["ingredients"][category]):
-                messagebox.showerror("Errore", "Ingrediente non trovato")
-                return
-            
-            ingredient = self.game.inventory.data["ingredients"][category][name]
-            cost = ingredient.get("current_cost", ingredient.get("base_cost", 0.0))
-            total_cost = cost * qty
-
-            balance = self.game.finance.get_balance()
-            if balance < total_cost:
-                messagebox.showerror(
-                    "Fondi insufficienti",
-                    f"Necessari: €{total_cost:.2f}\nDisponibili: €{balance:.2f}"
-                )
-                return
+        parts = path.split('.')
+        if len(parts) != 2:
+            messagebox.showerror("Errore", "Percorso ingrediente non valido")
+            return
 
-            current_qty = ingredient.get("current_quantity", 0)
-            ingredient["current_quantity"] = current_qty + qty
-            
-            self.game.finance.subtract_money(total_cost, f"Acquisto {path}")
+        category, name = parts
+        snapshot = self.worker.snapshot
+        item = next((i for i in snapshot["ingredients"].get(category, ()) if i[0] == name), None)
+        if item is None:
+            messagebox.showerror("Errore", "Ingrediente non trovato")
+            return
 
-            messagebox.showinfo(
-                "Acquisto riuscito",
-                f"Acquistati {qty}x {name}\nNuovo stock: {ingredient['current_quantity']}\nSpesa: €{total_cost:.2f}"
+        total_cost = item[2] * qty
+        balance = snapshot["balance"]
+        if balance < total_cost:
+            messagebox.showerror(
+                "Fondi insufficienti",
+                f"Necessari: €{total_cost:.2f}\nDisponibili: €{balance:.2f}"
             )
+            return
+
+        self.worker.submit("buy", path, qty, callback=lambda result: self._on_item_bought(result, path, qty, win))
 
-            self.game.safe_save()
+    def _on_item_bought(self, result, path, qty, win):
+        '''
+        Funzione privata che come parametri riceve il risultato del comando "buy" (tuple bool, messaggio), il percorso (str), la quantità (int) e win (Toplevel)
+        oltre all'istanza della classe FantaBurgerGUI (self implicito).
+        Eseguita nel thread della GUI: mostra l'esito dell'acquisto con il nuovo stock letto dall'istantanea e riapre lo shop aggiornato.
+        '''
+        success, msg = result
+        if not success:
+            messagebox.showerror("Errore", f"Errore durante l'acquisto: {msg}")
+            return
 
-            print(f"✅ Acquistati {qty}x {name}. Nuova quantità: {ingredient['current_quantity']}")
+        category, name = path.split('.')
+        stock = next((i[3] for i in self.worker.snapshot["ingredients"].get(category, ()) if i[0] == name), 0)
+        messagebox.showinfo("Acquisto riuscito", f"{msg}\nNuovo stock: {stock}")
+        print(f"✅ Acquistati {qty}x {name}. Nuova quantità: {stock}")
 
+        if win.winfo_exists():
             win.destroy()
-            self.show_shop() 
-            
-        except Exception as e:
-            messagebox.showerror("Errore", f"Errore durante l'acquisto: {str(e)}")
+        self.show_shop()
 
 
     def show_upgrades(self):
@@ -553,8 +674,9 @@ class FantaBurgerGUI:
         Apre la finestra degli upgrade disponibili.
         In particolare crea lista upgrade con descrizione, costo attuale (con aumento progressivo),
         livello corrente e limite massimo. Mostra stato (sbloccato, livello, costo), pulsante acquisto con hover.
-        Mostra saldo attuale e pulsante chiusura.
+        Mostra saldo attuale e pulsante chiusura. I dati vengono dall'ultima istantanea del SimulationWorker.
         '''
+        snapshot = self.worker.snapshot
         w = tk.Toplevel(self.root)
         w.title("Upgrade")
         w.geometry("600x700")
@@ -569,21 +691,21 @@ class FantaBurgerGUI:
             {
                 "desc": "👨‍🍳 Migliora cucina (+1 capacità)",
                 "id": "upgrade_kitchen",
-                "base_cost": self.game.upgrade_costs.get("upgrade_kitchen", 0),
-                "current_count": self.game.upgrade_counts.get("upgrade_kitchen", 0),
+                "base_cost": snapshot["upgrade_costs"].get("upgrade_kitchen", 0),
+                "current_count": snapshot["upgrade_counts"].get("upgrade_kitchen", 0),
                 "max_level": 5
             },
             {
                 "desc": "👥 Nuovo dipendente (+1 capacità)",
                 "id": "new_employee",
-                "base_cost": self.game.upgrade_costs.get("new_employee", 0),
-                "current_count": self.game.upgrade_counts.get("new_employee", 0),
+                "base_cost": snapshot["upgrade_costs"].get("new_employee", 0),
+                "current_count": snapshot["upgrade_counts"].get("new_employee", 0),
                 "max_level": 3
             },
             {
                 "desc": "📚 Nuova ricetta segreta",
                 "id": "new_recipe",
-                "base_cost": self.game.upgrade_costs.get("new_recipe", 0),
+                "base_cost": snapshot["upgrade_costs"].get("new_recipe", 0),
                 "current_count": 0,  
                 "max_level": 1
             }
@@ -601,7 +723,7 @@ class FantaBurgerGUI:
             actual_cost = upgrade["base_cost"] * cost_multiplier
             
             if upgrade_id == "new_recipe":
-                if upgrade_id in self.game.unlocked_upgrades:
+                if upgrade_id in snapshot["unlocked_upgrades"]:
                     status = "✅ SBLOCCATO"
                     btn_text = "GIÀ ACQUISTATO"
                     btn_state = "disabled"
@@ -645,7 +767,7 @@ class FantaBurgerGUI:
         balance_frame = tk.Frame(w, bg="#2c1810")
         balance_frame.pack(pady=20)
         
-        tk.Label(balance_frame, text=f"Saldo attuale: €{self.game.finance.get_balance():.2f}",
+        tk.Label(balance_frame, text=f"Saldo attuale: €{snapshot['balance']:.2f}",
                 font=("Helvetica", 18, "bold"), 
                 bg="#2c1810", fg="#00ff00").pack()
 
@@ -656,9 +778,9 @@ class FantaBurgerGUI:
         '''
         Funzione privata che come parametro riceve upgrade (dict) e win (Toplevel) oltre all'istanza della classe FantaBurgerGUI (self implicito).
         Gestisce l'acquisto di un upgrade.
-        In particolare, calcola costo attuale, verifica fondi e livello massimo,
-        chiede conferma, sottrae denaro, aggiorna contatori/upgrade sbloccati/capacità cucina,
-        controlla achievement specifici, salva stato e riapre finestra upgrade.
+        In particolare, calcola costo attuale, verifica fondi e livello massimo sull'istantanea del worker e chiede conferma,
+        poi invia il comando "upgrade" al SimulationWorker (che esegue GameEngine.buy_upgrade(): pagamento, contatori, capacità, achievement e salvataggio);
+        il risultato viene mostrato da _on_upgrade_bought() nel thread della GUI.
         '''
         upgrade_id = upgrade["id"]
         current_count = upgrade["current_count"]
@@ -668,7 +790,7 @@ class FantaBurgerGUI:
         actual_cost = upgrade["base_cost"] * cost_multiplier
         
         if upgrade_id == "new_recipe":
-            if upgrade_id in self.game.unlocked_upgrades:
+            if upgrade_id in self.worker.snapshot["unlocked_upgrades"]:
                 messagebox.showinfo("Info", "Questa ricetta è già sbloccata!")
                 return
         else:
@@ -676,7 +798,7 @@ class FantaBurgerGUI:
                 messagebox.showinfo("Info", f"Hai raggiunto il livello massimo per questo upgrade! ({current_count}/{max_level})")
                 return
         
-        balance = self.game.finance.get_balance()
+        balance = self.worker.snapshot["balance"]
         if balance < actual_cost:
             messagebox.showerror("Errore", f"Fondi insufficienti!\nNecessari: €{actual_cost:.2f}\nDisponibili: €{balance:.2f}")
             return
@@ -684,52 +806,28 @@ class FantaBurgerGUI:
         if not messagebox.askyesno("Conferma acquisto", 
                                 f"Acquistare {upgrade['desc']} per €{actual_cost:.2f}?\n\nSaldo dopo l'acquisto: €{balance - actual_cost:.2f}"):
             return
-        
-        success, msg = self.game.finance.subtract_money(actual_cost, f"Upgrade {upgrade_id}")
+
+        self.worker.submit("upgrade", upgrade_id, callback=lambda result: self._on_upgrade_bought(result, upgrade, win))
+
+    def _on_upgrade_bought(self, result, upgrade, win):
+        '''
+        Funzione privata che come parametri riceve il risultato del comando "upgrade" (tuple bool, messaggio), upgrade (dict) e win (Toplevel)
+        oltre all'istanza della classe FantaBurgerGUI (self implicito).
+        Eseguita nel thread della GUI: mostra l'esito dell'acquisto e riapre la finestra upgrade aggiornata.
+        '''
+        success, msg = result
         if not success:
-            messagebox.showerror("Errore", f"Errore transazione: {msg}")
+            messagebox.showerror("Errore", msg)
             return
-        
-        if upgrade_id == "new_recipe":
-            self.game.unlocked_upgrades.append(upgrade_id)
-            all_secret = []
-            all_recipes = self.game.recipes.get_all_recipes()
-            for recipe_id, recipe_data in all_recipes.items():
-                ingredients = recipe_data.get("ingredients", {})
-                if any(k.startswith("secret.") for k in ingredients.keys()):
-                    if recipe_id not in self.game.unlocked_recipes:
-                        all_secret.append(recipe_id)
-            
-            if not all_secret:
-                messagebox.showinfo("Info", "Nessuna altra ricetta segreta disponibile!")
-                return
-                
-            new = random.choice(all_secret)
-            self.game.unlocked_recipes.append(new)
-            name = self.game.recipes.get_recipe(new).get("name", new)
-            messagebox.showinfo("Successo!", f"📚 Nuova ricetta sbloccata:\n{name}!")
-            print(f"\033[33m📚 Nuova ricetta sbloccata: {name}!\033[0m")
-            
+
+        if upgrade["id"] == "new_recipe":
+            messagebox.showinfo("Successo!", msg)
         else:
-            self.game.upgrade_counts[upgrade_id] = current_count + 1
-            
-            self.game.kitchen_capacity = 1  
-            self.game.kitchen_capacity += self.game.upgrade_counts.get("upgrade_kitchen", 0)
-            self.game.kitchen_capacity += self.game.upgrade_counts.get("new_employee", 0)
-            
-            if upgrade_id == "upgrade_kitchen" and self.game.upgrade_counts[upgrade_id] >= 3:
-                self.game.check_achievement("non_è_la_centralina!")
-            elif upgrade_id == "new_employee" and self.game.upgrade_counts[upgrade_id] >= 2:
-                self.game.check_achievement("piccola_squadra!")
-            
-            messagebox.showinfo("Successo!", 
-                            f"✅ {upgrade['desc']} ACQUISTATO!\n"
-                            f"Livello: {self.game.upgrade_counts[upgrade_id]}/{max_level}\n"
-                            f"Nuova capacità cucina: {self.game.kitchen_capacity} panini/ora")
-        
-        self.game.safe_save()
-        win.destroy()
-        self.show_upgrades()  
+            messagebox.showinfo("Successo!", f"✅ {upgrade['desc']} ACQUISTATO!\n{msg}")
+
+        if win.winfo_exists():
+            win.destroy()
+        self.show_upgrades()
 
 
     def advance_hour(self):
@@ -737,17 +835,26 @@ class FantaBurgerGUI:
         Come parametro riceve implicitamente solo l'istanza della classe FantaBurgerGUI e ha tipo di ritorno None.
         Avanza di un'ora nel gioco.
         In particolare, se game over/vittoria mostra schermata finale.
-        Altrimenti esegue advance_hour() del GameEngine in un thread separato (per non bloccare GUI).
-        Se dopo l'avanzamento c'è game over/vittoria, mostra schermata finale in thread principale.
+        Altrimenti invia il comando "advance" al SimulationWorker (per non bloccare GUI); la schermata finale
+        viene mostrata da update_ui() quando il GameEngine notifica game over/vittoria.
         '''
         if self.game and (self.game.game_over or self.game.game_won):
             self.show_victory_screen()
             return
-        def run():
-            self.game.advance_hour()
-            if self.game.game_over or self.game.game_won:
-                self.root.after(0, self.show_victory_screen)
-        threading.Thread(target=run, daemon=True).start()
+        self.worker.submit("advance", 1)
+
+    def toggle_autoplay(self):
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe FantaBurgerGUI e ha tipo di ritorno None.
+        Attiva o disattiva l'avanzamento automatico delle ore alla velocità scelta (ore di gioco al secondo) inviando il comando "autoplay" al SimulationWorker.
+        Se il worker rifiuta (partita terminata) deseleziona la casella.
+        '''
+        try:
+            speed = float(self.speed_spin.get())
+        except ValueError:
+            speed = None
+        self.worker.submit("autoplay", self.autoplay_var.get(), speed,
+                           callback=lambda result: self.autoplay_var.set(result[0]))
 
     def show_victory_screen(self):
         '''
@@ -824,7 +931,8 @@ class FantaBurgerGUI:
             fg="#ffcc00"
         ).pack(pady=20)
 
-        self.game.safe_save()
+        if self.worker:
+            self.worker.submit("save")
 
     def _close_victory_window(self):
         '''
@@ -862,6 +970,7 @@ class FantaBurgerGUI:
         
         self.show_main_menu()
         
+        self._stop_worker()
         self.game = None
         self.running = False
 
@@ -892,9 +1001,26 @@ class FantaBurgerGUI:
         '''
         Come parametro riceve implicitamente solo l'istanza della classe FantaBurgerGUI e ha tipo di ritorno None.
         Salva la partita (se esiste) e chiude l'applicazione.
+        Il salvataggio e l'arresto vengono accodati al SimulationWorker, poi _quit_when_stopped() attende la fine del suo thread e chiude la finestra.
         '''
-        if self.game:
-            self.game.safe_save()
+        worker = self.worker
+        if worker is None:
+            self.root.quit()
+            return
+        worker.submit("save")
+        self._stop_worker()
+        self._quit_when_stopped(worker)
+
+    def _quit_when_stopped(self, worker: "SimulationWorker"):
+        '''
+        Funzione privata che come parametro riceve esplicitamente il SimulationWorker fermato (già tolto da self.worker) oltre all'istanza della classe FantaBurgerGUI (self implicito).
+        Controlla ogni 50 ms se il thread del worker ha finito i comandi accodati (compreso il salvataggio); quando è terminato esegue le callback rimaste e chiude l'applicazione.
+        Non usa join(): mentre aspetta il ciclo di Tk continua a girare, quindi i print() del worker verso il log non restano bloccati.
+        '''
+        if worker.thread.is_alive():
+            self.root.after(50, self._quit_when_stopped, worker)
+            return
+        worker.dispatch_results()
         self.root.quit()
 
 
@@ -4,9 +4,10 @@ Versione: 6.7
 Autore: I Meccanici Trappoli
 """
 
+import argparse # importazione del modulo argparse per leggere l'eventuale script di comandi da riga di comando.
 import os # importazione del modulo necessario per operazioni sul sistema operativo.
 import sys # importazione del modulo sys per manipolare il path di ricerca dei moduli Python.
-from modules.game import GameEngine # importazione della classe principale GameEngine dal pacchetto modules.
+import time # importazione del modulo time per misurare la durata di uno script di comandi.
 
 project_root = os.path.dirname(os.path.abspath(__file__)) 
 '''
@@ -25,13 +26,23 @@ def main():
     Inoltre, si occupa della gestione delle eccezioni come KeyboardInterrupt (Ctrl+C) per interrompere graziosamente,
     Exception generica per errori critici (stampa errore ma tenta di salvare) e
     nel blocco finally stampa sempre il messaggio di arrivederci.
+    Con --script FILE non apre la console: esegue lo script di comandi con run_script_file() e restituisce il suo codice di uscita.
     '''
+    parser = argparse.ArgumentParser(description="FantaBurger Delivery Tycoon")
+    parser.add_argument("--script", default=None, help="file di comandi da eseguire senza console interattiva (vedi modules/script.py)")
+    parser.add_argument("--verbose", action="store_true", help="con --script mostra anche l'output del gioco")
+    args = parser.parse_args()
+    if args.script:
+        return run_script_file(args.script, args.verbose)
+
     print("=" * 60)
     print("     FANTABURGER DELIVERY TYCOON     ".center(60))
     print("              v6.7                   ".center(60))
     print("       I Meccanici Trappolai         ".center(60))
     print("=" * 60)
 
+    from modules.game import GameEngine # importazione della classe principale GameEngine dal pacchetto modules, fatta qui (dopo l'inserimento di project_root in sys.path) e solo quando il gioco parte davvero.
+
     try:
         game = GameEngine()
         game.run()
@@ -45,8 +56,32 @@ def main():
         print("Alla prossima!")
 
 
+def run_script_file(path: str, verbose: bool = False) -> int:
+    '''
+    Come parametri riceve il percorso dello script di comandi (stringa) e verbose (bool, mostrare l'output del gioco) e ha tipo di ritorno int.
+    Esegue lo script con GameEngine.run_script() alla massima velocità (output del gioco scartato salvo verbose), stampa i comandi falliti e un riepilogo
+    e restituisce 0 se tutti i comandi sono riusciti, 1 altrimenti (2 se il file non esiste).
+    '''
+    from modules.game import GameEngine # importazione della classe principale GameEngine, come in main() solo quando serve davvero.
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            start = time.perf_counter()
+            results = GameEngine().run_script(f, sys.stdout if verbose else None)
+            elapsed = time.perf_counter() - start
+    except FileNotFoundError:
+        print(f"❌ Script {path} non trovato")
+        return 2
+
+    failed = [result for result in results if not result[2]]
+    for number, command, _, message in failed:
+        print(f"❌ Riga {number}: {command} -> {message}")
+    print(f"{'✅' if not failed else '⚠️'} {len(results)} comandi eseguiti in {elapsed:.2f}s, {len(failed)} falliti")
+    return 1 if failed else 0
+
+
 if __name__ == "__main__":
     '''
     Blocco di esecuzione condizionale standard Python.
     '''
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -1,10 +1,40 @@
-__version__ = "6.7" #Versione corrente del pacchetto. 
+__version__ = "6.7" #Versione corrente del pacchetto.
 __author__ = "I Meccanici Trappolai"  #Nome autori.
 
-from .inventory import Inventory # Importazione relativa della classe Inventory dal modulo inventory.py presente nella stessa directory
-from .recipes import Recipe # Importazione relativa della classe Recipe dal modulo recipes.py presente nella stessa directory
-from .finance import Finance # Importazione relativa della classe Finance dal modulo finance.py presente nella stessa directory
-from .game import GameEngine # Importazione relativa della classe GameEngine dal modulo game.py presente nella stessa directory
+import importlib # importazione del modulo importlib per importare i sottomoduli solo al primo utilizzo delle classi esportate
 
-__all__ = ['Inventory', 'Recipe', 'Finance', 'GameEngine'] # Definizione dell'interfaccia pubblica del pacchetto.
-# Quando qualcuno scrive "from modules import *", verranno importate solo queste quattro classi.
\ No newline at end of file
+_LAZY_EXPORTS = {
+    'Inventory': 'inventory', # classe Inventory dal modulo inventory.py presente nella stessa directory
+    'Recipe': 'recipes', # classe Recipe dal modulo recipes.py presente nella stessa directory
+    'Finance': 'finance', # classe Finance dal modulo finance.py presente nella stessa directory
+    'GameEngine': 'game', # classe GameEngine dal modulo game.py presente nella stessa directory
+    'RestockPlanner': 'restock', # classe RestockPlanner dal modulo restock.py presente nella stessa directory
+    'DemandForecaster': 'demand' # classe DemandForecaster dal modulo demand.py presente nella stessa directory
+}
+'''
+Esportazioni pigre del pacchetto: "import modules" non importa nessun sottomodulo (quindi è quasi istantaneo),
+e "from modules import GameEngine" importa solo game.py e le sue dipendenze al primo accesso (PEP 562, __getattr__ di modulo).
+Così uno strumento batch che usa solo, ad esempio, modules.kitchen non paga l'importazione del resto del pacchetto.
+'''
+
+
+def __getattr__(name):
+    '''
+    Come parametro riceve esplicitamente il nome dell'attributo richiesto al pacchetto (stringa).
+    Importa il sottomodulo che definisce la classe richiesta, memorizza la classe nel pacchetto (così gli accessi successivi non passano di qui) e la restituisce.
+    Per nomi non esportati solleva AttributeError come un normale modulo.
+    '''
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
+
+__all__ = ['Inventory', 'Recipe', 'Finance', 'GameEngine', 'RestockPlanner', 'DemandForecaster'] # Definizione dell'interfaccia pubblica del pacchetto.
+# Quando qualcuno scrive "from modules import *", verranno importate solo queste classi.
@@ -0,0 +1,108 @@
+import bisect #importazione del modulo bisect per trovare in tempo logaritmico le regole a soglia superate da un nuovo valore
+from typing import Dict, Any, List, Optional, Iterable, Set, Tuple #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+Any corrisponde ad un tipo generico (cioè accetta qualsiasi valore)
+List corrisponde ad una lista
+Optional corrisponde ad un valore che può essere None
+Iterable corrisponde a qualsiasi oggetto su cui si può iterare
+Set corrisponde ad un insieme (elementi unici, ricerca in tempo costante)
+Tuple corrisponde ad una tupla (sequenza immutabile di valori)
+'''
+
+DEFAULT_RULES = {
+    "prima_vendita!": {"counter": "orders_completed_total", "min": 1},
+    "masto_paninaro!": {"counter": "orders_completed_total", "min": 10},
+    "è perfetto!": {"counter": "recipe_completed", "key_contains": "perfetto"},
+    "comm si veloce!": {"counter": "orders_completed_today", "min": 5},
+    "attiraclienti!": {"counter": "reputation", "min": 100},
+    "non_è_la_centralina!": {"counter": "upgrade_kitchen", "min": 3},
+    "piccola_squadra!": {"counter": "new_employee", "min": 2}
+} # regole usate se config.json non ha la sezione achievements.rules (stesse condizioni delle versioni precedenti)
+
+
+class AchievementEngine:
+    def __init__(self, rules: Dict[str, Dict[str, Any]], unlocked: Iterable[str] = ()):
+        '''
+        Come parametri riceve esplicitamente rules (Dict, nome achievement -> regola) e unlocked (Iterable[str], achievement già ottenuti, di default nessuno)
+        oltre all'istanza della classe AchievementEngine (self implicito).
+        Motore degli achievement dichiarativo: ogni regola indica il contatore da cui dipende (counter), la soglia minima (min, default 1)
+        e, per i contatori con chiave come recipe_completed, la chiave esatta (key) oppure una sottostringa che la chiave deve contenere (key_contains).
+        Le regole sono indicizzate per contatore: le regole a soglia sono ordinate per soglia (bisect trova quelle superate), quelle con chiave esatta
+        in un dizionario per chiave, quelle con sottostringa in una lista a parte.
+        Le regole già soddisfatte vengono tolte dall'indice, quindi un aggiornamento costa solo una ricerca nel dizionario per contatori senza regole in sospeso.
+        '''
+        self.unlocked: Set[str] = set(unlocked)
+        self.thresholds: Dict[str, Tuple[List[float], List[str]]] = {}
+        self.keyed: Dict[str, List[Tuple[str, float, str]]] = {}
+        self.exact: Dict[str, Dict[str, List[Tuple[str, float]]]] = {}
+
+        for name, rule in sorted(rules.items(), key=lambda item: item[1].get("min", 1)):
+            if name in self.unlocked:
+                continue
+            counter = rule["counter"]
+            minimum = rule.get("min", 1)
+            if "key" in rule:
+                self.exact.setdefault(counter, {}).setdefault(rule["key"].lower(), []).append((name, minimum))
+            elif "key_contains" in rule:
+                self.keyed.setdefault(counter, []).append((name, minimum, rule["key_contains"].lower()))
+            else:
+                values, names = self.thresholds.setdefault(counter, ([], []))
+                values.append(minimum)
+                names.append(name)
+
+    @classmethod
+    def from_config(cls, achievements_config: Dict[str, Any], unlocked: Iterable[str] = ()) -> 'AchievementEngine':
+        '''
+        Come parametri riceve esplicitamente la sezione achievements di config.json (Dict[str, Any]) e gli achievement già ottenuti (Iterable[str])
+        e ha tipo di ritorno AchievementEngine.
+        Crea il motore dalle regole in achievements.rules (o da DEFAULT_RULES se mancano); con enabled a false nessuna regola è attiva.
+        '''
+        if not achievements_config.get("enabled", True):
+            return cls({}, unlocked)
+        return cls(achievements_config.get("rules", DEFAULT_RULES), unlocked)
+
+    def update(self, counter: str, value: float, key: Optional[str] = None) -> List[str]:
+        '''
+        Come parametri riceve esplicitamente il nome del contatore (stringa), il suo nuovo valore (float) e key (Optional[str], ad esempio l'id della ricetta)
+        oltre all'istanza della classe AchievementEngine (self implicito) e ha tipo di ritorno List[str].
+        Valuta solo le regole che dipendono dal contatore e restituisce gli achievement appena soddisfatti (da sbloccare con unlock()), togliendoli dall'indice.
+        '''
+        satisfied = []
+        threshold = self.thresholds.get(counter)
+        if threshold:
+            values, names = threshold
+            reached = bisect.bisect_right(values, value)
+            if reached:
+                satisfied.extend(names[:reached])
+                del values[:reached], names[:reached]
+
+        if key is not None:
+            key = key.lower()
+            exact = self.exact.get(counter, {}).get(key)
+            if exact:
+                satisfied.extend(name for name, minimum in exact if value >= minimum)
+                exact[:] = [rule for rule in exact if value < rule[1]]
+
+        keyed = self.keyed.get(counter)
+        if keyed and key is not None:
+            remaining = []
+            for rule in keyed:
+                if value >= rule[1] and rule[2] in key:
+                    satisfied.append(rule[0])
+                else:
+                    remaining.append(rule)
+            self.keyed[counter] = remaining
+
+        return [name for name in satisfied if name not in self.unlocked]
+
+    def unlock(self, name: str) -> bool:
+        '''
+        Come parametro riceve esplicitamente il nome dell'achievement (stringa) oltre all'istanza della classe AchievementEngine (self implicito) e ha tipo di ritorno bool.
+        Segna l'achievement come ottenuto; restituisce True se è nuovo, False se era già stato ottenuto.
+        '''
+        if name in self.unlocked:
+            return False
+        self.unlocked.add(name)
+        return True
@@ -0,0 +1,486 @@
+import json #importazione del modulo standard Python necessario per leggere configurazione, ingredienti e ricette in formato JSON
+import random #importazione del modulo random: ogni partita del lotto ha il suo generatore random.Random con il proprio seme
+from array import array #importazione della classe array: colonne compatte di numeri (una per grandezza, un elemento per partita)
+from typing import Dict, Any, List, Optional, Sequence, Tuple #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+Any corrisponde ad un tipo generico (cioè accetta qualsiasi valore)
+List corrisponde ad una lista
+Optional corrisponde ad un valore che può essere None
+Sequence corrisponde ad una qualsiasi sequenza indicizzabile (lista, tupla, ...)
+Tuple corrisponde ad una tupla (sequenza immutabile di valori)
+'''
+from .settings import compile_settings #importazione della compilazione della configurazione dal modulo locale (stesse sezioni tipate del GameEngine)
+from .events import EventRegistry #importazione del registro degli eventi dal modulo locale: il lotto usa le stesse tabelle alias del GameEngine
+from .modifiers import BASE_VALUES, UPGRADE_MAX_LEVELS #importazione dei valori di base delle grandezze modificabili e dei livelli massimi degli upgrade dal modulo locale
+from .money import to_cents, to_euros #importazione delle conversioni tra euro e centesimi interi dal modulo locale (il saldo del lotto è in centesimi come in Finance)
+
+RUNNING = 0 # partita in corso
+LOST = 1 # partita persa (saldo o reputazione esauriti)
+WON = 2 # partita vinta (completati i giorni richiesti)
+UPGRADE_POLICY = ("upgrade_kitchen", "new_employee", "new_recipe") # upgrade provati ogni mattina, in quest'ordine, dalla politica di acquisto delle partite simulate
+
+
+def _column(typecode: str, values: Sequence) -> Sequence:
+    '''
+    Funzione privata che come parametri riceve il codice di tipo (stringa, come per array) e i valori (Sequence) e ha tipo di ritorno Sequence.
+    Restituisce values senza copiarlo se è già una colonna compatta del tipo richiesto (array o memoryview, ad esempio su memoria condivisa), altrimenti lo copia in un array.
+    '''
+    if (isinstance(values, array) and values.typecode == typecode) or (isinstance(values, memoryview) and values.format == typecode):
+        return values
+    return array(typecode, values)
+
+
+class BatchCatalog:
+    def __init__(self, ingredient_paths: Sequence[str], initial_quantities: Sequence[int], recipe_ids: Sequence[str], prices: Sequence[int],
+                 costs: Sequence[int], requirements: Sequence[Tuple[Tuple[int, int], ...]], base_recipes: Sequence[int], secret_recipes: Sequence[int]):
+        '''
+        Come parametri riceve esplicitamente i percorsi degli ingredienti ("categoria.nome"), le loro quantità iniziali, gli id delle ricette, prezzi e costi unitari delle ricette
+        (in centesimi, come in Recipe.prepare_recipe()), i requisiti di ogni ricetta (tuple di coppie indice ingrediente, quantità), gli indici delle ricette base
+        e quelli delle ricette segrete (sbloccabili con l'upgrade new_recipe) oltre all'istanza della classe BatchCatalog (self implicito).
+        Catalogo immutabile usato dal BatchSimulator: ingredienti e ricette sono indicizzati da interi, così le partite lavorano su array e tuple invece che su dizionari annidati.
+        Quantità iniziali, prezzi e costi possono essere viste di sola lettura su un blocco di memoria condivisa (vedi SharedCatalog): in quel caso non vengono copiati.
+        '''
+        self.ingredient_paths = list(ingredient_paths)
+        self.initial_quantities = _column('q', initial_quantities)
+        self.recipe_ids = list(recipe_ids)
+        self.prices = _column('q', prices)
+        self.costs = _column('q', costs)
+        self.requirements = [tuple(requirement) for requirement in requirements]
+        self.base_recipes = list(base_recipes)
+        self.secret_recipes = list(secret_recipes)
+
+    @classmethod
+    def from_files(cls, ingredients_file: str = 'data/ingredients.json', recipes_file: str = 'data/recipes.json') -> 'BatchCatalog':
+        '''
+        Come parametri riceve esplicitamente i percorsi di ingredients.json e recipes.json (stringhe, con i file di data/ come valori di default) e ha tipo di ritorno BatchCatalog.
+        Legge i due file una volta sola e costruisce il catalogo con le stesse regole di Inventory e Recipe: le quantità iniziali sono initial_quantity (se presente) o current_quantity,
+        sono ricette solo i dizionari con 'name', sono ricette base quelle senza ingredienti "secret." e una ricetta con un ingrediente inesistente
+        non è mai preparabile (viene esclusa dalle ricette base); sono ricette segrete quelle con almeno un ingrediente "secret." (come get_secret_recipes()).
+        '''
+        with open(ingredients_file, 'r', encoding='utf-8') as f:
+            ingredients = json.load(f).get("ingredients", {})
+        with open(recipes_file, 'r', encoding='utf-8') as f:
+            recipes = json.load(f)
+
+        paths, quantities = [], []
+        for category, items in ingredients.items():
+            if not isinstance(items, dict):
+                continue
+            for name, item in items.items():
+                if isinstance(item, dict):
+                    paths.append(f"{category}.{name}")
+                    quantities.append(int(item.get("initial_quantity", item.get("current_quantity", 0))))
+        index = {path: i for i, path in enumerate(paths)}
+
+        recipe_ids, prices, costs, requirements, base, secret = [], [], [], [], [], []
+        for recipe_id, recipe in recipes.items():
+            if not isinstance(recipe, dict) or 'name' not in recipe:
+                continue
+            needed = recipe.get("ingredients", {})
+            if any(path.startswith("secret.") for path in needed):
+                secret.append(len(recipe_ids))
+            elif all(path in index for path in needed):
+                base.append(len(recipe_ids))
+            recipe_ids.append(recipe_id)
+            prices.append(to_cents(recipe.get("price", 0.0)))
+            costs.append(to_cents(recipe.get("cost", 0.0)))
+            requirements.append(tuple((index[path], qty) for path, qty in needed.items() if path in index))
+        return cls(paths, quantities, recipe_ids, prices, costs, requirements, base, secret)
+
+
+class BatchSimulator:
+    def __init__(self, seeds: Sequence[int], difficulty: str = "easy", config: Optional[Dict[str, Any]] = None, catalog: Optional[BatchCatalog] = None,
+                 upgrades: bool = False):
+        '''
+        Come parametri riceve esplicitamente i semi delle partite (Sequence[int], uno per partita), la difficoltà (stringa, default "easy"),
+        config (Optional[Dict[str, Any]], se None legge data/config.json), catalog (Optional[BatchCatalog], se None lo legge da data/)
+        e upgrades (bool, True per far acquistare upgrade alle partite con _buy_upgrades()) oltre all'istanza della classe BatchSimulator (self implicito).
+        Simulatore a passo comune di molte partite indipendenti senza console: lo stato è organizzato per colonne (un array per saldo, reputazione, contatori,
+        fattori degli eventi e un'unica matrice piatta per l'inventario, una riga per partita) e tutte le partite avanzano insieme di un'ora alla volta.
+        Segue le regole di simulate_new_orders(), process_kitchen_work() (politica FIFO) e apply_daily_costs() senza stampe, thread, salvataggi, transazioni e metriche.
+        Ogni partita ha il suo random.Random con lo stesso seme che create_headless_game() passa a random.seed() e consuma i numeri casuali nello stesso ordine
+        del GameEngine, quindi a parità di seme i risultati coincidono con quelli di play_headless() (senza rifornimento automatico, con la stessa scelta sugli upgrade).
+        '''
+        if config is None:
+            with open('data/config.json', 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        settings = compile_settings(config)
+        self.catalog = catalog or BatchCatalog.from_files()
+        self.registry = EventRegistry.from_config(config["events"])
+        self.seeds = list(seeds)
+
+        level = settings.difficulty.get(difficulty)
+        self.difficulty = difficulty
+        self.customer_frequency = level.customer_frequency if level else 1.0
+        self.profit = level.profit if level else 1.0
+        self.working_start = settings.time.working_start
+        self.working_end = settings.time.working_end
+        self.max_days = settings.time.days
+        self.queue_limit = settings.gameplay.max_concurrent_orders * 3
+        self.max_quantity = min(3, settings.gameplay.max_burgers_per_order)
+        self.order_timeout = settings.gameplay.order_timeout
+        self.events_enabled = settings.events.enabled
+        self.event_min_interval = settings.events.min_interval
+        self.event_max_interval = settings.events.max_interval
+        self.event_duration = settings.events.event_duration
+        economy = settings.economy
+        self.critical_costs = (to_cents(economy.rent), to_cents(economy.utility_price))
+        self.other_costs = (to_cents(economy.employee_salary), to_cents(economy.daily_tax), to_cents(10.0), to_cents(5.0)) # stipendi, tassa, assicurazione e smaltimento rifiuti come in Finance._setup_daily_costs()
+        self.event_multipliers = {name: tuple(definition.get("multipliers", {}).items()) for name, definition in self.registry.events.items()}
+        self.upgrades = upgrades
+        self.unlock_costs = dict(settings.gameplay.unlock)
+
+        n = len(self.seeds)
+        self.day = 1
+        self.hour = self.working_start
+        self.balance = array('q', [to_cents(economy.initial_balance)]) * n # saldo in centesimi
+        self.reputation = array('d', [settings.gameplay.initial_reputation]) * n
+        self.status = array('b', [RUNNING]) * n
+        self.days_played = array('q', [0]) * n
+        self.completed_today = array('q', [0]) * n
+        self.completed_total = array('q', [0]) * n
+        self.expired_total = array('q', [0]) * n
+        self.units_prepared = array('q', [0]) * n
+        self.last_processed_day = array('q', [0]) * n
+        self.hours_since_event = array('q', [0]) * n
+        self.next_event_interval = array('q', [0]) * n
+        self.customer_chance = array('d', [0.0]) * n
+        self.capacity = array('d', [0.0]) * n
+        self.profit_multiplier = array('d', [0.0]) * n
+        self.inventory = array('q', self.catalog.initial_quantities) * n
+        self.queues: List[List[List[int]]] = [[] for _ in range(n)]
+        self.active_events: List[Dict[str, int]] = [{} for _ in range(n)]
+        self.available: List[Optional[List[int]]] = [None] * n
+        self.unlocked_recipes: List[List[int]] = [self.catalog.base_recipes] * n # lista condivisa finché la partita non sblocca una ricetta segreta
+        self.upgrade_levels = {upgrade_id: array('q', [0]) * n for upgrade_id in UPGRADE_MAX_LEVELS}
+        self.recipe_bought = array('b', [0]) * n
+        self.rngs = [random.Random(seed) for seed in self.seeds]
+
+        for g, rng in enumerate(self.rngs):
+            rng.randint(self.event_min_interval, self.event_max_interval) # estrazione del costruttore del GameEngine, sostituita da quella di new_game()
+            self.next_event_interval[g] = rng.randint(self.event_min_interval, self.event_max_interval)
+            self._refresh_factors(g)
+        self.active = list(range(n))
+
+    def _refresh_factors(self, g: int) -> None:
+        '''
+        Funzione privata che come parametro riceve esplicitamente l'indice della partita (int) oltre all'istanza della classe BatchSimulator (self implicito)
+        e ha tipo di ritorno None (non restituisce nulla).
+        Ricalcola probabilità clienti, capacità cucina e moltiplicatore di profitto della partita come la pila dei modificatori del GameEngine
+        (base più livelli degli upgrade, × difficoltà × moltiplicatori degli eventi attivi, nello stesso ordine); chiamata solo quando eventi attivi o upgrade cambiano.
+        '''
+        factors = {"customer_chance": self.customer_frequency, "kitchen_capacity": 1.0, "profit": self.profit}
+        for name in self.active_events[g]:
+            for target, factor in self.event_multipliers.get(name, ()):
+                factors[target] = factors.get(target, 1.0) * factor
+        self.customer_chance[g] = BASE_VALUES["customer_chance"] * factors["customer_chance"]
+        levels = sum(column[g] for column in self.upgrade_levels.values())
+        self.capacity[g] = (BASE_VALUES["kitchen_capacity"] + levels) * factors["kitchen_capacity"]
+        self.profit_multiplier[g] = BASE_VALUES["profit"] * factors["profit"]
+
+    def _sample(self, table: Any, rng: random.Random) -> Optional[Any]:
+        '''
+        Funzione privata che come parametri riceve esplicitamente una tabella alias (AliasTable del registro degli eventi) e il generatore della partita (random.Random)
+        oltre all'istanza della classe BatchSimulator (self implicito) e ha tipo di ritorno Optional[Any].
+        Estrae un elemento come AliasTable.sample() ma con il generatore della partita invece del modulo random.
+        '''
+        if not table.items:
+            return None
+        column = rng.randrange(len(table.items))
+        return table.items[column] if rng.random() < table.probability[column] else table.items[table.alias[column]]
+
+    def _update_events(self) -> None:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe BatchSimulator e ha tipo di ritorno None (non restituisce nulla).
+        Per ogni partita in corso fa scadere gli eventi attivi e ne attiva uno nuovo quando è passato l'intervallo estratto,
+        come update_active_events(), check_and_trigger_events() e EventRegistry.apply().
+        '''
+        registry = self.registry
+        for g in self.active:
+            events = self.active_events[g]
+            if events:
+                expired = []
+                for name in events:
+                    events[name] -= 1
+                    if events[name] <= 0:
+                        expired.append(name)
+                for name in expired:
+                    del events[name]
+                if expired:
+                    self._refresh_factors(g)
+
+            if not self.events_enabled:
+                continue
+            hours = self.hours_since_event[g] + 1
+            if hours >= self.next_event_interval[g]:
+                rng = self.rngs[g]
+                table = registry.tables.get(self._sample(registry.category_table, rng))
+                name = self._sample(table, rng) if table else None
+                if name:
+                    events[name] = self.event_duration
+                    self._refresh_factors(g)
+                    definition = registry.events[name]
+                    if "money" in definition:
+                        low, high = definition["money"]
+                        value = to_cents(rng.uniform(low, high))
+                        if value > 0:
+                            self.balance[g] += value
+                        elif value < 0 and self.balance[g] >= -value:
+                            self.balance[g] -= -value
+                    if "reputation" in definition:
+                        self.reputation[g] = max(0, min(100, self.reputation[g] + definition["reputation"]))
+                    hours = 0
+                    self.next_event_interval[g] = rng.randint(self.event_min_interval, self.event_max_interval)
+            self.hours_since_event[g] = hours
+
+    def _available_recipes(self, g: int) -> List[int]:
+        '''
+        Funzione privata che come parametro riceve esplicitamente l'indice della partita (int) oltre all'istanza della classe BatchSimulator (self implicito)
+        e ha tipo di ritorno List[int].
+        Restituisce le ricette sbloccate preparabili con l'inventario della partita (in ordine di catalogo, come simulate_new_orders());
+        la lista resta in cache finché la cucina non consuma ingredienti.
+        '''
+        available = self.available[g]
+        if available is None:
+            inventory = self.inventory
+            offset = g * len(self.catalog.ingredient_paths)
+            requirements = self.catalog.requirements
+            available = [recipe for recipe in self.unlocked_recipes[g]
+                         if all(inventory[offset + i] >= qty for i, qty in requirements[recipe])]
+            self.available[g] = available
+        return available
+
+    def _arrive_orders(self) -> None:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe BatchSimulator e ha tipo di ritorno None (non restituisce nulla).
+        Genera i nuovi ordini di ogni partita in corso con le regole di simulate_new_orders(): coda piena, fine orario lavorativo,
+        probabilità (clienti × reputazione) divisa in fasce per 1-4 clienti, ricetta scelta tra quelle preparabili e quantità casuale.
+        '''
+        if self.hour >= self.working_end:
+            return
+        hour, limit, max_quantity = self.hour, self.queue_limit, self.max_quantity
+        for g in self.active:
+            queue = self.queues[g]
+            if len(queue) >= limit:
+                continue
+            rng = self.rngs[g]
+            chance = self.customer_chance[g] * max(0.5, self.reputation[g] / 100)
+            r = rng.random()
+            if r < chance * 0.5:
+                clients = 1
+            elif r < chance:
+                clients = 2
+            elif r < chance * 1.5:
+                clients = 3
+            elif r < chance * 2.0:
+                clients = 4
+            else:
+                continue
+
+            available = self._available_recipes(g)
+            if not available:
+                continue
+            for _ in range(clients):
+                recipe = rng.choice(available)
+                quantity = rng.randint(1, max_quantity)
+                if len(queue) < limit:
+                    queue.append([recipe, quantity, hour])
+
+    def _work_kitchens(self) -> None:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe BatchSimulator e ha tipo di ritorno None (non restituisce nulla).
+        Fa lavorare la cucina di ogni partita in corso con le regole di process_kitchen_work() e della politica FIFO: rimuove gli ordini scaduti (-5 reputazione),
+        prepara fino a capacità panini/ora con un solo passaggio sulla coda e un panino per ordine, consumando gli ingredienti dalla riga dell'inventario,
+        incassa la vendita e completa gli ordini (+5 reputazione).
+        '''
+        hour, timeout = self.hour, self.order_timeout
+        width = len(self.catalog.ingredient_paths)
+        inventory, requirements = self.inventory, self.catalog.requirements
+        prices, costs = self.catalog.prices, self.catalog.costs
+        balance, reputation = self.balance, self.reputation
+        for g in self.active:
+            capacity = int(self.capacity[g])
+            if capacity <= 0:
+                continue
+
+            queue = self.queues[g]
+            if queue:
+                waiting = [order for order in queue if hour - order[2] <= timeout]
+                expired = len(queue) - len(waiting)
+                if expired:
+                    for _ in range(expired):
+                        reputation[g] = max(0, reputation[g] - 5)
+                    self.expired_total[g] += expired
+                    queue[:] = waiting
+            if not queue:
+                continue
+
+            offset = g * width
+            multiplier = self.profit_multiplier[g]
+            prepared = 0
+            completed = 0
+            for order in queue:
+                if prepared >= capacity:
+                    break
+                recipe = order[0]
+                needed = requirements[recipe]
+                if not all(inventory[offset + i] >= qty for i, qty in needed):
+                    continue
+                for i, qty in needed:
+                    inventory[offset + i] -= qty
+                self.units_prepared[g] += 1
+                self.available[g] = None
+
+                price, cost = prices[recipe], costs[recipe]
+                if price < 0 or cost < 0:
+                    continue
+                profit = round(price * multiplier) - cost
+                if profit > 0:
+                    balance[g] += profit
+                elif profit == 0 or balance[g] < -profit:
+                    continue
+                else:
+                    balance[g] -= -profit
+
+                order[1] -= 1
+                prepared += 1
+
+                if order[1] <= 0:
+                    completed += 1
+                    reputation[g] = min(100, reputation[g] + 5.0)
+
+            if completed:
+                self.completed_today[g] += completed
+                self.completed_total[g] += completed
+                queue[:] = [order for order in queue if order[1] > 0]
+
+    def _end_day(self) -> None:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe BatchSimulator e ha tipo di ritorno None (non restituisce nulla).
+        Chiude la giornata di ogni partita in corso come end_day() e apply_daily_costs(): addebita i costi giornalieri (fallimento senza addebiti se il saldo
+        non copre i costi critici, costi non critici saltati se il saldo non basta), controlla game over e vittoria, svuota la coda e passa al giorno successivo.
+        '''
+        for g in self.active:
+            days_passed = self.day - self.last_processed_day[g]
+            if days_passed > 0:
+                balance = self.balance[g]
+                if balance >= sum(self.critical_costs) * days_passed:
+                    for cost in self.critical_costs + self.other_costs:
+                        amount = cost * days_passed
+                        if balance >= amount:
+                            balance -= amount
+                    self.balance[g] = balance
+                    self.last_processed_day[g] = self.day
+
+            if self.balance[g] <= 0 or self.reputation[g] <= 0:
+                self._finish(g, LOST)
+            elif self.day >= self.max_days:
+                self._finish(g, WON)
+            else:
+                self.completed_today[g] = 0
+                self.queues[g].clear()
+                self.hours_since_event[g] = 0
+
+        self.active = [g for g in self.active if self.status[g] == RUNNING]
+        if self.active:
+            self.day += 1
+            self.hour = self.working_start
+            if self.upgrades:
+                self._buy_upgrades()
+
+    def _buy_upgrades(self) -> None:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe BatchSimulator e ha tipo di ritorno None (non restituisce nulla).
+        Politica di acquisto deterministica delle partite simulate, eseguita all'inizio di ogni giornata (come buy_upgrades() di tools/simulation.py):
+        per ogni upgrade di UPGRADE_POLICY, in ordine, lo acquista con le regole di buy_upgrade() se il saldo copre il suo costo attuale (aumento del 15% per livello)
+        più i costi giornalieri. new_recipe si acquista una volta sola e sblocca una ricetta segreta scelta con il generatore della partita.
+        '''
+        daily_costs = sum(self.critical_costs + self.other_costs)
+        secret_recipes = self.catalog.secret_recipes
+        for g in self.active:
+            changed = False
+            for upgrade_id in UPGRADE_POLICY:
+                if upgrade_id == "new_recipe":
+                    if self.recipe_bought[g]:
+                        continue
+                    count = 0
+                else:
+                    count = self.upgrade_levels[upgrade_id][g]
+                    if count >= UPGRADE_MAX_LEVELS[upgrade_id]:
+                        continue
+                cost = to_cents(self.unlock_costs.get(upgrade_id, 0) * (1.0 + count * 0.15))
+                if cost <= 0 or self.balance[g] < cost + daily_costs:
+                    continue
+
+                self.balance[g] -= cost
+                if upgrade_id == "new_recipe":
+                    self.recipe_bought[g] = 1
+                    locked = [recipe for recipe in secret_recipes if recipe not in self.unlocked_recipes[g]]
+                    if locked:
+                        self.unlocked_recipes[g] = sorted(self.unlocked_recipes[g] + [self.rngs[g].choice(locked)])
+                        self.available[g] = None
+                else:
+                    self.upgrade_levels[upgrade_id][g] = count + 1
+                    changed = True
+            if changed:
+                self._refresh_factors(g)
+
+    def _finish(self, g: int, status: int) -> None:
+        '''
+        Funzione privata che come parametri riceve esplicitamente l'indice della partita (int) e lo stato finale (LOST o WON) oltre all'istanza della classe BatchSimulator (self implicito)
+        e ha tipo di ritorno None (non restituisce nulla).
+        Segna la partita come terminata nel giorno corrente; le partite terminate vengono tolte dalla lista delle partite in corso.
+        '''
+        self.status[g] = status
+        self.days_played[g] = self.day
+
+    def step_hour(self) -> None:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe BatchSimulator e ha tipo di ritorno None (non restituisce nulla).
+        Avanza tutte le partite in corso di un'ora, come advance_hour(): controllo game over, fine giornata dopo l'orario lavorativo,
+        altrimenti eventi, nuovi ordini e cucina (ogni fase su tutte le partite prima di passare alla successiva).
+        '''
+        self.hour += 1
+        for g in self.active:
+            if self.balance[g] <= 0 or self.reputation[g] <= 0:
+                self._finish(g, LOST)
+        self.active = [g for g in self.active if self.status[g] == RUNNING]
+
+        if self.hour > self.working_end:
+            self._end_day()
+            return
+
+        self._update_events()
+        self._arrive_orders()
+        self._work_kitchens()
+
+    def run(self, days: Optional[int] = None) -> List[Dict[str, Any]]:
+        '''
+        Come parametro riceve esplicitamente days (Optional[int], giorni da giocare, default quelli della config) oltre all'istanza della classe BatchSimulator (self implicito)
+        e ha tipo di ritorno List[Dict[str, Any]].
+        Avanza le partite finché sono tutte terminate o è passato l'ultimo giorno e restituisce i risultati (vedi results()).
+        '''
+        last_day = days if days is not None else self.max_days
+        while self.active and self.day <= last_day:
+            self.step_hour()
+        return self.results()
+
+    def results(self) -> List[Dict[str, Any]]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe BatchSimulator e ha tipo di ritorno List[Dict[str, Any]].
+        Restituisce per ogni partita le stesse metriche di play_headless() calcolate dal lotto: ordini completati e scaduti, panini preparati,
+        reputazione, saldo, vittoria e giorni giocati.
+        '''
+        return [{
+            "seed": seed,
+            "difficulty": self.difficulty,
+            "orders_completed": self.completed_total[g],
+            "orders_expired": self.expired_total[g],
+            "units_prepared": self.units_prepared[g],
+            "reputation": round(self.reputation[g], 1),
+            "balance": to_euros(self.balance[g]),
+            "game_won": self.status[g] == WON,
+            "days_played": self.days_played[g] if self.status[g] != RUNNING else self.day
+        } for g, seed in enumerate(self.seeds)]
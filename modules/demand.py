@@ -0,0 +1,186 @@
+from array import array #importazione della classe array dal modulo standard array: array di float a dimensione fissa, più compatti di liste di oggetti Python
+from typing import Dict, Any, List, Optional, Iterable #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+Any corrisponde ad un tipo generico (cioè accetta qualsiasi valore)
+List corrisponde ad una lista
+Optional corrisponde ad un valore che può essere None
+Iterable corrisponde a qualsiasi oggetto su cui si può iterare
+'''
+
+HOURS_PER_DAY = 24 # numero di fasce orarie per ricetta nel modello (una per ogni ora del giorno)
+
+
+class DemandForecaster:
+    def __init__(self, recipe_ids: Iterable[str], alpha: float = 0.3, prior: float = 0.1):
+        '''
+        Come parametri riceve esplicitamente recipe_ids (Iterable[str]), alpha (float, con 0.3 come valore di default) e prior (float, con 0.1 come valore di default),
+        oltre a ricevere implicitamente l'istanza della classe DemandForecaster (self).
+        Costruttore del modello di domanda: per ogni ricetta mantiene una media mobile esponenziale (EWMA) dei panini ordinati per ogni ora del giorno
+        e una per l'intera giornata, in array a dimensione fissa (ricette × 24 ore).
+        In particolare: recipe_index assegna ad ogni ricetta una riga degli array, alpha è il peso dell'ultima osservazione, prior è la domanda
+        iniziale ipotizzata prima di avere dati (così all'inizio tutte le ricette hanno lo stesso peso).
+        Il decadimento delle fasce senza ordini è applicato in modo pigro in lettura (tramite i contatori di osservazioni), quindi registrare un ordine costa O(1)
+        e chiudere un'ora costa solo quanto le ricette effettivamente ordinate in quell'ora.
+        '''
+        self.alpha = alpha
+        self.prior = prior
+        self.recipe_ids: List[str] = list(recipe_ids)
+        self.recipe_index: Dict[str, int] = {recipe_id: i for i, recipe_id in enumerate(self.recipe_ids)}
+        size = len(self.recipe_ids)
+
+        self.hourly = array('d', [prior]) * (size * HOURS_PER_DAY)
+        self.hourly_stamp = array('l', [0]) * (size * HOURS_PER_DAY)
+        self.hour_observations = array('l', [0]) * HOURS_PER_DAY
+
+        self.daily = array('d', [prior]) * size
+        self.daily_stamp = array('l', [0]) * size
+        self.day_observations = 0
+
+        self._hour_counts: Dict[int, float] = {}
+        self._day_counts: Dict[int, float] = {}
+        self.total_orders = 0
+
+    def record_order(self, recipe_id: str, quantity: int = 1) -> None:
+        '''
+        Come parametri riceve esplicitamente recipe_id (stringa) e quantity (int, con 1 come valore di default) oltre all'istanza della classe DemandForecaster (self implicito)
+        e ha tipo di ritorno None (non restituisce nulla).
+        Registra un ordine nell'ora corrente in O(1): accumula la quantità nei contatori dell'ora e del giorno in corso.
+        Le ricette sconosciute al modello vengono ignorate.
+        '''
+        index = self.recipe_index.get(recipe_id)
+        if index is None:
+            return
+        self._hour_counts[index] = self._hour_counts.get(index, 0.0) + quantity
+        self._day_counts[index] = self._day_counts.get(index, 0.0) + quantity
+        self.total_orders += 1
+
+    def _decayed(self, values: array, stamps: array, slot: int, observations: int) -> float:
+        '''
+        Funzione privata che come parametri riceve esplicitamente l'array dei valori, l'array dei timbri, l'indice della cella e il numero di osservazioni della fascia
+        oltre all'istanza della classe DemandForecaster (self implicito) e ha tipo di ritorno float.
+        Restituisce il valore EWMA della cella aggiornato con il decadimento delle osservazioni senza ordini avvenute dopo l'ultimo aggiornamento.
+        '''
+        missed = observations - stamps[slot]
+        if missed <= 0:
+            return values[slot]
+        return values[slot] * (1.0 - self.alpha) ** missed
+
+    def close_hour(self, hour: int) -> None:
+        '''
+        Come parametro riceve esplicitamente hour (int, ora del giorno appena trascorsa) oltre all'istanza della classe DemandForecaster (self implicito)
+        e ha tipo di ritorno None (non restituisce nulla).
+        Chiude l'ora corrente: aggiorna la media mobile delle sole ricette ordinate in quell'ora e conta un'osservazione per la fascia oraria,
+        così le ricette non ordinate decadono automaticamente alla lettura successiva.
+        '''
+        h = hour % HOURS_PER_DAY
+        observations = self.hour_observations[h]
+        for index, count in self._hour_counts.items():
+            slot = index * HOURS_PER_DAY + h
+            previous = self._decayed(self.hourly, self.hourly_stamp, slot, observations)
+            self.hourly[slot] = (1.0 - self.alpha) * previous + self.alpha * count
+            self.hourly_stamp[slot] = observations + 1
+        self.hour_observations[h] = observations + 1
+        self._hour_counts.clear()
+
+    def close_day(self) -> None:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe DemandForecaster e ha tipo di ritorno None (non restituisce nulla).
+        Chiude la giornata aggiornando la media mobile giornaliera delle ricette ordinate, con la stessa logica di close_hour().
+        '''
+        observations = self.day_observations
+        for index, count in self._day_counts.items():
+            previous = self._decayed(self.daily, self.daily_stamp, index, observations)
+            self.daily[index] = (1.0 - self.alpha) * previous + self.alpha * count
+            self.daily_stamp[index] = observations + 1
+        self.day_observations = observations + 1
+        self._day_counts.clear()
+
+    def forecast(self, recipe_id: str, hour: int) -> float:
+        '''
+        Come parametri riceve esplicitamente recipe_id (stringa) e hour (int) oltre all'istanza della classe DemandForecaster (self implicito)
+        e ha tipo di ritorno float.
+        Restituisce in O(1) i panini attesi per la ricetta nell'ora del giorno indicata (0.0 se la ricetta non è nel modello).
+        '''
+        index = self.recipe_index.get(recipe_id)
+        if index is None:
+            return 0.0
+        h = hour % HOURS_PER_DAY
+        return self._decayed(self.hourly, self.hourly_stamp, index * HOURS_PER_DAY + h, self.hour_observations[h])
+
+    def forecast_day(self, recipe_id: str) -> float:
+        '''
+        Come parametro riceve esplicitamente recipe_id (stringa) oltre all'istanza della classe DemandForecaster (self implicito) e ha tipo di ritorno float.
+        Restituisce in O(1) i panini attesi per la ricetta nell'intera giornata.
+        '''
+        index = self.recipe_index.get(recipe_id)
+        if index is None:
+            return 0.0
+        return self._decayed(self.daily, self.daily_stamp, index, self.day_observations)
+
+    def forecast_window(self, start_hour: int, end_hour: int, recipe_ids: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        '''
+        Come parametri riceve esplicitamente start_hour e end_hour (int, estremi inclusi) e recipe_ids (Optional[Iterable[str]], di default tutte le ricette)
+        oltre all'istanza della classe DemandForecaster (self implicito) e ha tipo di ritorno Dict[str, float].
+        Restituisce per ogni ricetta la somma dei panini attesi nelle ore dell'intervallo; è il formato usato come demand_weights dal RestockPlanner.
+        '''
+        if recipe_ids is None:
+            recipe_ids = self.recipe_ids
+        hours = range(start_hour, end_hour + 1)
+        return {recipe_id: sum(self.forecast(recipe_id, hour) for hour in hours) for recipe_id in recipe_ids}
+
+    def to_dict(self) -> Dict[str, Any]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe DemandForecaster e ha tipo di ritorno Dict[str, Any].
+        Restituisce lo stato del modello in un dizionario serializzabile in JSON (usato da safe_save()).
+        I contatori dell'ora e del giorno in corso non vengono salvati.
+        '''
+        return {
+            'alpha': self.alpha,
+            'prior': self.prior,
+            'recipe_ids': self.recipe_ids,
+            'hourly': self.hourly.tolist(),
+            'hourly_stamp': self.hourly_stamp.tolist(),
+            'hour_observations': self.hour_observations.tolist(),
+            'daily': self.daily.tolist(),
+            'daily_stamp': self.daily_stamp.tolist(),
+            'day_observations': self.day_observations,
+            'total_orders': self.total_orders
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], recipe_ids: Iterable[str]) -> 'DemandForecaster':
+        '''
+        Come parametri riceve esplicitamente data (Dict[str, Any], prodotto da to_dict()) e recipe_ids (Iterable[str], ricette del catalogo attuale)
+        oltre alla classe DemandForecaster (cls implicito) e ha tipo di ritorno DemandForecaster.
+        Ricostruisce il modello salvato sulle ricette del catalogo attuale: le righe vengono associate per id, quindi ricette nuove partono dal prior (senza decadimento)
+        e ricette non più presenti vengono scartate. In caso di dati incompleti o corrotti restituisce un modello nuovo.
+        '''
+        model = cls(recipe_ids, data.get('alpha', 0.3), data.get('prior', 0.1))
+        try:
+            saved_ids = data['recipe_ids']
+            hour_observations = data['hour_observations']
+            for h in range(HOURS_PER_DAY):
+                model.hour_observations[h] = hour_observations[h]
+            model.day_observations = data['day_observations']
+            model.total_orders = data.get('total_orders', 0)
+            for index in range(len(model.recipe_ids)):
+                model.daily_stamp[index] = model.day_observations
+                for h in range(HOURS_PER_DAY):
+                    model.hourly_stamp[index * HOURS_PER_DAY + h] = model.hour_observations[h]
+
+            for saved_index, recipe_id in enumerate(saved_ids):
+                index = model.recipe_index.get(recipe_id)
+                if index is None:
+                    continue
+                src = saved_index * HOURS_PER_DAY
+                dst = index * HOURS_PER_DAY
+                model.hourly[dst:dst + HOURS_PER_DAY] = array('d', data['hourly'][src:src + HOURS_PER_DAY])
+                model.hourly_stamp[dst:dst + HOURS_PER_DAY] = array('l', data['hourly_stamp'][src:src + HOURS_PER_DAY])
+                model.daily[index] = data['daily'][saved_index]
+                model.daily_stamp[index] = data['daily_stamp'][saved_index]
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            print(f"⚠️ Modello di domanda salvato non valido ({e}), ripartendo da zero")
+            return cls(recipe_ids, model.alpha, model.prior)
+        return model
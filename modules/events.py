@@ -0,0 +1,160 @@
+import random #importazione del modulo random per l'estrazione pesata degli eventi e per gli importi casuali dei loro effetti
+from typing import Dict, Any, List, Optional, Sequence #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+Any corrisponde ad un tipo generico (cioè accetta qualsiasi valore)
+List corrisponde ad una lista
+Optional corrisponde ad un valore che può essere None
+Sequence corrisponde ad una qualsiasi sequenza indicizzabile (lista, tupla, ...)
+'''
+from .modifiers import Modifier, MUL #importazione del modificatore tipato dal modulo locale: i moltiplicatori degli eventi attivi entrano nella pila dei modificatori del GameEngine
+
+DEFAULT_EVENTS = {
+    "rush_hour": {"category": "positive", "message": "🚀 ORA DI PUNTA! +150% clienti per 3 ore", "multipliers": {"customer_chance": 2.5}},
+    "food_critic": {"category": "positive", "money": [150, 400], "money_description": "Recensione stellata", "reputation": 15,
+                    "message": "🎩 Critico gastronomico del Gambero Rosso! +€{amount:.2f} | +15 reputazione"},
+    "health_inspection": {"category": "negative", "money": [-350, -100], "money_description": "Multa sanitaria", "reputation": -15,
+                          "message": "🚨 Ispezione sanitaria da parte dei NAS! -€{amount:.2f} | -15 reputazione"},
+    "employee_sick": {"category": "negative", "message": "🤒 Dipendente malato! -50% capacità cucina per 3 ore",
+                      "multipliers": {"kitchen_capacity": 0.5}, "expire_message": "💪 Il dipendente è guarito! Capacità cucina ripristinata a {capacity}"},
+    "lucky_day": {"category": "positive", "money": [200, 500], "money_description": "Giornata fortunata", "message": "🍀 GIORNATA FORTUNATA! +€{amount:.2f}"},
+    "broken_equipment": {"category": "negative", "money": [-600, -250], "money_description": "Riparazione", "message": "🔧 ATTREZZATURA GUASTA! -€{amount:.2f}"},
+    "weather_bad": {"category": "negative", "message": "🌧️ MALTEMPO! -50% clienti per 3 ore", "multipliers": {"customer_chance": 0.5}},
+    "theft": {"category": "negative", "money": [-250, -100], "money_description": "Furto avvenuto!", "message": "🦹 FURTO! -€{amount:.2f}"}
+} # eventi usati se config.json non ha la sezione events.definitions (stessi effetti delle versioni precedenti)
+
+
+class AliasTable:
+    def __init__(self, items: Sequence[Any], weights: Sequence[float]):
+        '''
+        Come parametri riceve esplicitamente gli elementi (Sequence) e i loro pesi (Sequence[float]) oltre all'istanza della classe AliasTable (self implicito).
+        Tabella per l'estrazione pesata con il metodo alias (Vose): la costruzione costa O(n), ogni estrazione O(1) indipendentemente dal numero di elementi.
+        Elementi con peso non positivo non vengono mai estratti; se nessun peso è positivo la tabella è vuota.
+        '''
+        pairs = [(item, float(weight)) for item, weight in zip(items, weights) if weight > 0]
+        self.items = [item for item, _ in pairs]
+        n = len(pairs)
+        self.probability = [1.0] * n
+        self.alias = list(range(n))
+        if not n:
+            return
+
+        total = sum(weight for _, weight in pairs)
+        scaled = [weight * n / total for _, weight in pairs]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.probability[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def sample(self) -> Optional[Any]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe AliasTable e ha tipo di ritorno Optional[Any].
+        Estrae un elemento in tempo costante (una colonna a caso, poi l'elemento o il suo alias); restituisce None se la tabella è vuota.
+        '''
+        if not self.items:
+            return None
+        column = random.randrange(len(self.items))
+        return self.items[column] if random.random() < self.probability[column] else self.items[self.alias[column]]
+
+
+class EventRegistry:
+    def __init__(self, definitions: Dict[str, Dict[str, Any]], enabled: Dict[str, bool], probabilities: Dict[str, float]):
+        '''
+        Come parametri riceve esplicitamente le definizioni degli eventi (Dict, nome -> descrittore), i flag di abilitazione (Dict[str, bool], eventi non elencati sono abilitati)
+        e le probabilità delle categorie (Dict[str, float]) oltre all'istanza della classe EventRegistry (self implicito).
+        Registro degli eventi guidato dai dati: ogni evento è un descrittore con category, weight (peso nella categoria, default 1) e gli effetti
+        (money, money_description, reputation, multipliers, message, expire_message), applicati in modo generico.
+        I multipliers non modificano lo stato direttamente: diventano modificatori (vedi modifiers()) attivi finché dura l'evento.
+        Le tabelle alias per categoria e quella delle categorie sono costruite una volta sola, così scegliere un evento costa O(1) anche con centinaia di eventi.
+        '''
+        self.events = {name: definition for name, definition in definitions.items() if enabled.get(name, True)}
+        self.category_table = AliasTable(list(probabilities), list(probabilities.values()))
+        self.tables: Dict[str, AliasTable] = {}
+        for category in probabilities:
+            names = [name for name, definition in self.events.items() if definition.get("category", "neutral") == category]
+            self.tables[category] = AliasTable(names, [self.events[name].get("weight", 1.0) for name in names])
+
+    @classmethod
+    def from_config(cls, events_config: Dict[str, Any]) -> 'EventRegistry':
+        '''
+        Come parametro riceve esplicitamente la sezione events di config.json (Dict[str, Any]) e ha tipo di ritorno EventRegistry.
+        Crea il registro dalle definizioni in events.definitions (o da DEFAULT_EVENTS se mancano), con i flag di special_events e le probabilità delle categorie.
+        '''
+        return cls(
+            events_config.get("definitions", DEFAULT_EVENTS),
+            events_config.get("special_events", {}),
+            events_config.get("probabilities", {"positive": 0.4, "negative": 0.4, "neutral": 0.2})
+        )
+
+    def pick(self) -> Optional[str]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe EventRegistry e ha tipo di ritorno Optional[str].
+        Estrae una categoria secondo le probabilità e poi un evento della categoria secondo i pesi; restituisce None se la categoria estratta non ha eventi abilitati.
+        '''
+        table = self.tables.get(self.category_table.sample())
+        return table.sample() if table else None
+
+    def apply(self, engine: Any, name: str) -> List[str]:
+        '''
+        Come parametri riceve esplicitamente il GameEngine e il nome dell'evento (stringa) oltre all'istanza della classe EventRegistry (self implicito) e ha tipo di ritorno List[str].
+        Applica gli effetti immediati dell'evento (denaro, reputazione) e restituisce i messaggi da mostrare.
+        '''
+        definition = self.events.get(name)
+        if definition is None:
+            return []
+
+        amount = 0.0
+        if "money" in definition:
+            low, high = definition["money"]
+            value = random.uniform(low, high)
+            description = definition.get("money_description", name.replace('_', ' ').title())
+            if value >= 0:
+                engine.finance.add_money(value, description)
+            else:
+                engine.finance.subtract_money(-value, description)
+            amount = abs(value)
+
+        if "reputation" in definition:
+            engine.reputation = max(0, min(100, engine.reputation + definition["reputation"]))
+
+        return [definition["message"].format(amount=amount)] if "message" in definition else []
+
+    def expire(self, engine: Any, name: str) -> List[str]:
+        '''
+        Come parametri riceve esplicitamente il GameEngine e il nome dell'evento (stringa) oltre all'istanza della classe EventRegistry (self implicito) e ha tipo di ritorno List[str].
+        Restituisce i messaggi da mostrare alla fine dell'evento (i suoi modificatori vengono rimossi dal GameEngine).
+        '''
+        definition = self.events.get(name)
+        if definition is None:
+            return []
+        return [definition["expire_message"].format(capacity=engine.kitchen_capacity)] if "expire_message" in definition else []
+
+    def modifiers(self, name: str) -> List[Modifier]:
+        '''
+        Come parametro riceve esplicitamente il nome dell'evento (stringa) oltre all'istanza della classe EventRegistry (self implicito) e ha tipo di ritorno List[Modifier].
+        Restituisce i modificatori moltiplicativi dell'evento (vuota per eventi sconosciuti o senza multipliers).
+        '''
+        definition = self.events.get(name) or {}
+        return [Modifier(target, MUL, factor) for target, factor in definition.get("multipliers", {}).items()]
+
+    def multipliers(self, active_events: Dict[str, int]) -> Dict[str, float]:
+        '''
+        Come parametro riceve esplicitamente gli eventi attivi (Dict[str, int], nome -> ore rimanenti) oltre all'istanza della classe EventRegistry (self implicito)
+        e ha tipo di ritorno Dict[str, float].
+        Restituisce i moltiplicatori (clienti e capacità cucina) come prodotto di quelli degli eventi attivi; eventi sconosciuti vengono ignorati.
+        '''
+        result = {"customer_chance": 1.0, "kitchen_capacity": 1.0}
+        for name in active_events:
+            definition = self.events.get(name)
+            if definition:
+                for key, factor in definition.get("multipliers", {}).items():
+                    result[key] = result.get(key, 1.0) * factor
+        return result
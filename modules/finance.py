@@ -14,39 +14,55 @@ from datetime import datetime #classe datetime importata dal modulo datetime usa
 Importa la classe datetime dal modulo datetime che è usata per generare timestamp (salvataggi, scadenze tasse, costi giornalieri), 
 '''
 import os # importazione del modulo necessario per effettuare operazioni sul sistema operativo. Utilizzato per verificare l'esistenza del file di salvataggio (os.path.exists) prima di tentare il caricamento.
+from .money import to_cents, to_euros #importazione delle conversioni tra euro e centesimi interi dal modulo locale
+from .finance_history import FinanceHistory #importazione dello storico giornaliero a buffer circolari dal modulo locale
+from .settings import EconomySettings, ConfigError #importazione della sezione economy compilata dal modulo locale (capacità dello storico validata, quando Finance è creata senza GameEngine)
+
+MONEY_STATS = ('revenue', 'expenses', 'profit') # campi di daily_stats che sono importi (in centesimi in memoria, in euro nel salvataggio)
+REPORT_PERIODS = {'daily': 1, 'weekly': 7, 'monthly': 30, 'all': None} # giorni coperti da ogni periodo di get_financial_report() (None = tutta la partita)
 
 class Finance:
-    def __init__(self, initial_balance: float = 500.0, config_file: str = 'data/config.json', save_file: str = 'data/savestate.json', load_saved: bool = False):
+    def __init__(self, initial_balance: float = 500.0, config_file: str = 'data/config.json', save_file: str = 'data/savestate.json', load_saved: bool = False, config: Optional[Dict[str, Any]] = None, history_days: Optional[int] = None):
         '''
         Come parametri riceve esplicitamente initial_balance (float, con 500.0 come valore di default), config_file (stringa, con 'data/config.json' come valore di default), 
-        save_file (stringa, con 'data/savestate.json' valore di default) e load_saved (bool, con False come valore di default), oltre a ricevere implicitamente l'istanza della classe Finance (self).
+        save_file (stringa, con 'data/savestate.json' valore di default), load_saved (bool, con False come valore di default), config (Optional[Dict[str, Any]], configurazione già letta,
+        con None come valore di default) e history_days (Optional[int], giorni dello storico: il GameEngine passa settings.economy.history_days, se None viene compilata
+        la sezione economy della configurazione), oltre a ricevere implicitamente l'istanza della classe Finance (self).
         Costruttore della classe Finance che inizializza le strutture dati principali:
         config_file e save_file: percorsi dei file di configurazione e salvataggio, lock: threading.Lock() per garantire thread-safety nelle operazioni finanziarie, config: 
-        carica la configurazione dal file JSON tramite load_config(), state: se load_saved=True carica lo stato salvato, altrimenti crea un nuovo stato con _create_new_state(),
-        transactions e daily_transactions: liste e dizionari per registrare le transazioni, game_engine: riferimento opzionale al GameEngine e stats: dizionario con statistiche globali (profitti, perdite, record)     
-        Inoltre, chiama _setup_daily_costs() per inizializzare i costi giornalieri fissi e il moltiplicatore di profitto in base alla difficoltà.
+        carica la configurazione dal file JSON tramite load_config() (solo se config non è fornito, così il GameEngine non la fa rileggere), state: se load_saved=True carica lo stato salvato, altrimenti crea un nuovo stato con _create_new_state(),
+        transactions e daily_transactions: liste e dizionari per registrare le transazioni, game_engine: riferimento opzionale al GameEngine e stats: dizionario con statistiche globali (profitti, perdite, record),
+        dirty: True se lo stato è cambiato dall'ultimo salvataggio e autosave: se False lo stato non viene scritto ad ogni transazione (lo salva il GameEngine nella sua sezione).
+        Tutti gli importi in memoria (saldo, daily_stats, stats, transazioni, costi giornalieri) sono centesimi interi: i conti sono esatti e la conversione in euro
+        avviene solo ai confini (get_balance(), add_money()/subtract_money(), report, messaggi e salvataggio).
+        Inoltre, chiama _setup_daily_costs() per inizializzare i costi giornalieri fissi e il moltiplicatore di profitto in base alla difficoltà
+        e crea history (FinanceHistory), lo storico dei giorni chiusi da apply_daily_costs() usato dai report.
         '''
         self.config_file = config_file
         self.save_file = save_file
         self.lock = threading.Lock()
-        self.config = self.load_config()
+        self.config = config if config is not None else self.load_config()
+        self.history_days = history_days if history_days is not None else self._compile_history_days()
         if load_saved:
             self.state = self.load_or_create_state(initial_balance)
         else:
             self.state = self._create_new_state(initial_balance)
-            print(f"✅ Nuovo stato finanziario creato (saldo iniziale: €{initial_balance:.2f})")
+            print(f"✅ Nuovo stato finanziario creato (saldo iniziale: €{to_euros(self.state['balance']):.2f})")
         self.transactions: List[Dict] = []
         self.daily_transactions: Dict[str, List] = {}
         self.game_engine = None
+        self.dirty = False
+        self.autosave = True
         self._setup_daily_costs()
+        self.history = self._history_from_save(self.state.pop('finance_history', None))
         
         self.stats = {
-            'total_profit': 0.0,
-            'total_expenses': 0.0,
-            'total_revenue': 0.0,
+            'total_profit': 0,
+            'total_expenses': 0,
+            'total_revenue': 0,
             'days_in_business': 0,
-            'best_day_profit': 0.0,
-            'worst_day_loss': 0.0,
+            'best_day_profit': 0,
+            'worst_day_loss': 0,
             'last_updated': datetime.now().isoformat()
         }
         
@@ -144,13 +160,13 @@ class Finance:
         Come parametro riceve esplicitamente initial_balance (float) oltre a ricevere implicitamente l'istanza della classe Finance
         e ha tipo di ritorno Dict[str, Any].
         Tenta di caricare lo stato finanziario salvato da savestate.json.
-        In particolare, se il file esiste, lo legge e converte eventuali datetime da stringa ISO inizializzando campi mancanti e
+        In particolare, se il file esiste, lo legge, converte gli importi in centesimi con _state_from_save() ed eventuali datetime da stringa ISO inizializzando campi mancanti e
         in caso di errore (FileNotFoundError o JSONDecodeError) crea un nuovo stato con _create_new_state().
         '''
         try:
             if os.path.exists(self.save_file):
                 with open(self.save_file, 'r', encoding='utf-8') as f:
-                    state = json.load(f)
+                    state = self._state_from_save(json.load(f))
                 print(f'Stato caricato correttamente: {self.save_file}')
                 
                 if 'last_daily_charge' in state:
@@ -169,20 +185,66 @@ class Finance:
             print(f"Errore nel caricamento stato: {e}. Creando nuovo stato... ")
             return self._create_new_state(initial_balance)
 
+    def load_state(self, state: Dict[str, Any]) -> None:
+        '''
+        Come parametro riceve esplicitamente lo stato letto da un salvataggio (Dict[str, Any], importi in euro) oltre all'istanza della classe Finance (self implicito)
+        e ha tipo di ritorno None (non restituisce nulla).
+        Sostituisce lo stato finanziario con quello salvato, convertendo gli importi in centesimi (usato dal GameEngine in load_game()).
+        '''
+        self.state = self._state_from_save(state)
+        self.history = self._history_from_save(self.state.pop('finance_history', None))
+
+    def _compile_history_days(self) -> int:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe Finance e ha tipo di ritorno int.
+        Compila e valida la sezione economy della configurazione con EconomySettings (gli stessi controlli e default di compile_settings())
+        e restituisce history_days; se la sezione non è valida solleva ConfigError.
+        '''
+        errors: List[str] = []
+        economy = EconomySettings.compile(self.config.get('economy'), 'economy', errors)
+        if errors:
+            raise ConfigError("Configurazione non valida:\n" + "\n".join(f" - {error}" for error in errors))
+        return economy.history_days
+
+    def _history_from_save(self, data: Optional[Dict[str, Any]]) -> FinanceHistory:
+        '''
+        Funzione privata che come parametro riceve esplicitamente i dati salvati dello storico (Optional[Dict[str, Any]], None per una partita senza storico)
+        oltre all'istanza della classe Finance (self implicito) e ha tipo di ritorno FinanceHistory.
+        Crea lo storico giornaliero con una colonna per ogni costo fisso e la capacità history_days, ripristinando i dati salvati se presenti.
+        '''
+        if data:
+            return FinanceHistory.from_dict(data, self.daily_costs.keys(), self.history_days)
+        return FinanceHistory(self.daily_costs.keys(), self.history_days)
+
+    def _state_from_save(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        '''
+        Funzione privata che come parametro riceve esplicitamente lo stato nel formato di salvataggio (Dict[str, Any]) oltre all'istanza della classe Finance (self implicito)
+        e ha tipo di ritorno Dict[str, Any].
+        Restituisce una copia dello stato con saldo e importi di daily_stats convertiti da euro a centesimi; è l'inverso della conversione di get_save_state().
+        '''
+        state = dict(state)
+        state['balance'] = to_cents(state.get('balance', 0.0))
+        daily_stats = dict(state.get('daily_stats') or {})
+        for key in MONEY_STATS:
+            daily_stats[key] = to_cents(daily_stats.get(key, 0.0))
+        daily_stats.setdefault('orders_completed', 0)
+        state['daily_stats'] = daily_stats
+        return state
+
     def _create_new_state(self, initial_balance: float) -> Dict[str, Any]:
         '''
         Funzione privata che come parametro riceve esplicitamente initial_balance (float) oltre a ricevere implicitamente l'istanza della classe Finance
         e ha tipo di ritorno Dict[str, Any].
         Crea un nuovo stato finanziario da zero per una nuova partita.
-        In particolare, inizializza bilancio, upgrade sbloccati, statistiche giornaliere, contatori giorni e timestamp last_daily_charge.
+        In particolare, inizializza bilancio (convertito in centesimi), upgrade sbloccati, statistiche giornaliere, contatori giorni e timestamp last_daily_charge.
         '''
         return {
-            'balance': initial_balance,
+            'balance': to_cents(initial_balance),
             'unlocked_upgrades': [],
             'daily_stats': {
-                'revenue': 0.0,
-                'expenses': 0.0,
-                'profit': 0.0,
+                'revenue': 0,
+                'expenses': 0,
+                'profit': 0,
                 'orders_completed': 0
             },
             'days_in_operation': 0,
@@ -195,17 +257,17 @@ class Finance:
         '''
         Funzione privata che come parametro riceve implicitamente solo l'istanza della classe Finance e ha tipo di ritorno None (non restituisce nulla).
         Inizializza i costi giornalieri fissi (affitto, stipendi, utenze, ecc.) prelevandoli dalla configurazione.
-        In particolare, crea il dizionario daily_costs, imposta il moltiplicatore di profitto in base alla difficoltà definita nella config (quella di default è "easy").
+        In particolare, crea il dizionario daily_costs (in centesimi), imposta il moltiplicatore di profitto in base alla difficoltà definita nella config (quella di default è "easy").
         '''
         economy_config = self.config.get('economy', {})
         
         self.daily_costs = {
-            'rent': economy_config.get('rent', 20.0),
-            'employee_salary': economy_config.get('employee_salary', 30.0),
-            'utilities': economy_config.get('utility_price', 20.0),
-            'tax': economy_config.get('daily_tax', 75.0),
-            'insurance':  10.0,
-            'waste_disposal': 5.0
+            'rent': to_cents(economy_config.get('rent', 20.0)),
+            'employee_salary': to_cents(economy_config.get('employee_salary', 30.0)),
+            'utilities': to_cents(economy_config.get('utility_price', 20.0)),
+            'tax': to_cents(economy_config.get('daily_tax', 75.0)),
+            'insurance': to_cents(10.0),
+            'waste_disposal': to_cents(5.0)
         }
         
         difficulty =  self.config.get('gameplay', {}).get('starting_difficulty', 'easy')
@@ -215,15 +277,31 @@ class Finance:
     def get_balance(self) -> float:
         '''
         Come parametro riceve implicitamente solo l'istanza della classe Finance e ha tipo di ritorno float.
-        Restituisce il bilancio corrente arrotondato a 2 decimali.
+        Restituisce il bilancio corrente in euro (convertito dai centesimi, quindi già con al massimo 2 decimali).
         In particolare è protetto da lock per thread-safety.
         '''
         with self.lock:
-            return round(self.state['balance'], 2)
-        
+            return to_euros(self.state['balance'])
+
+    def get_balance_cents(self) -> int:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe Finance e ha tipo di ritorno int.
+        Restituisce il bilancio corrente in centesimi, senza conversioni (ad esempio per sommare esattamente i saldi di più partite).
+        '''
+        with self.lock:
+            return self.state['balance']
+
     def add_money(self, amount: float, description: str = 'Deposito') -> Tuple[bool, str]:
         '''
-        Come parametro riceve esplicitamente amount (float) e description (stringa, con valore di default 'Deposito') oltre a ricevere implicitamente l'istanza della classe Finance
+        Come parametro riceve esplicitamente amount (float, in euro) e description (stringa, con valore di default 'Deposito') oltre a ricevere implicitamente l'istanza della classe Finance
+        e ha tipo di ritorno Tuple[bool, str].
+        Aggiunge denaro al bilancio convertendo l'importo in centesimi e chiamando add_cents().
+        '''
+        return self.add_cents(to_cents(amount), description)
+
+    def add_cents(self, amount: int, description: str = 'Deposito') -> Tuple[bool, str]:
+        '''
+        Come parametro riceve esplicitamente amount (int, in centesimi) e description (stringa, con valore di default 'Deposito') oltre a ricevere implicitamente l'istanza della classe Finance
         e ha tipo di ritorno Tuple[bool, str].
         Aggiunge denaro al bilancio.
         In particolare verifica che amount sia positivo, entra in sezione protetta da lock, aggiorna il bilancio,
@@ -251,11 +329,19 @@ class Finance:
             self.stats['total_revenue'] += amount
             self.stats['total_profit'] += amount
             self._save_state()
-        return True, f"+{amount:.2f}: {description}. Nuovo saldo: {self.state['balance']:.2f}"
+        return True, f"+{to_euros(amount):.2f}: {description}. Nuovo saldo: {to_euros(self.state['balance']):.2f}"
     
     def subtract_money(self, amount: float, description: str = 'Pagamento') -> Tuple[bool, str]:
         '''
-        Come parametro riceve esplicitamente amount (float) e description (stringa, con valore di default 'Pagamento') oltre a ricevere implicitamente l'istanza della classe Finance
+        Come parametro riceve esplicitamente amount (float, in euro) e description (stringa, con valore di default 'Pagamento') oltre a ricevere implicitamente l'istanza della classe Finance
+        e ha tipo di ritorno Tuple[bool, str].
+        Sottrae denaro dal bilancio convertendo l'importo in centesimi e chiamando subtract_cents().
+        '''
+        return self.subtract_cents(to_cents(amount), description)
+
+    def subtract_cents(self, amount: int, description: str = 'Pagamento') -> Tuple[bool, str]:
+        '''
+        Come parametro riceve esplicitamente amount (int, in centesimi) e description (stringa, con valore di default 'Pagamento') oltre a ricevere implicitamente l'istanza della classe Finance
         e ha tipo di ritorno Tuple[bool, str].
         Sottrae denaro dal bilancio.
         In particolare verifica che amount sia positivo e che ci siano fondi sufficienti, entra in sezione protetta da lock,
@@ -266,7 +352,7 @@ class Finance:
         
         with self.lock:
             if self.state['balance'] < amount:
-                return False, f"Errore: Fondi insufficienti. Richiesto: {amount:.2f}, Disponibile: {self.state['balance']:.2f}"
+                return False, f"Errore: Fondi insufficienti. Richiesto: {to_euros(amount):.2f}, Disponibile: {to_euros(self.state['balance']):.2f}"
             
             old_balance = self.state['balance']
             self.state['balance'] -= amount         
@@ -287,8 +373,16 @@ class Finance:
             self.stats['total_profit'] -= amount
             
             self._save_state()
-        return True, f"-{amount:.2f}: {description}. Nuovo saldo: {self.state['balance']:.2f}"
+        return True, f"-{to_euros(amount):.2f}: {description}. Nuovo saldo: {to_euros(self.state['balance']):.2f}"
     
+    def record_order_completed(self) -> None:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe Finance e ha tipo di ritorno None (non restituisce nulla).
+        Conta un ordine completato nelle statistiche del giorno (usato per il valore medio degli ordini e per lo storico giornaliero).
+        '''
+        with self.lock:
+            self.state['daily_stats']['orders_completed'] += 1
+
     def buy_ingredient(self, cost_total: float, name: str, qty: int):
         '''
         Come parametro riceve esplicitamente cost_total (float), name (str) e qty (int) oltre a ricevere implicitamente l'istanza della classe Finance.
@@ -297,35 +391,44 @@ class Finance:
         success, _ = self.subtract_money(cost_total, f"Buy {name} x{qty}")
         return success
 
+    def buy_ingredients_batch(self, cost_total: float, items_count: int) -> bool:
+        '''
+        Come parametro riceve esplicitamente cost_total (float) e items_count (int) oltre a ricevere implicitamente l'istanza della classe Finance.
+        Addebita con un'unica transazione il costo di un rifornimento di più ingredienti (usato dal RestockPlanner),
+        così viene registrata una sola transazione e il salvataggio avviene una volta sola.
+        '''
+        success, _ = self.subtract_money(cost_total, f"Rifornimento automatico ({items_count} ingredienti)")
+        return success
+
     
-    def process_sale(self, recipe_price: float, ingredient_cost: float, recipe_name: str = "Vendita") -> Tuple[bool, str, Dict]:
+    def process_sale(self, recipe_price: int, ingredient_cost: int, recipe_name: str = "Vendita") -> Tuple[bool, str, Dict]:
         '''
-        Come parametro riceve esplicitamente recipe_price (float), ingredient_cost (float) e recipe_name (stringa, valore di default "Vendita") oltre a ricevere implicitamente l'istanza della classe Finance
+        Come parametro riceve esplicitamente recipe_price (int, in centesimi), ingredient_cost (int, in centesimi) e recipe_name (stringa, valore di default "Vendita") oltre a ricevere implicitamente l'istanza della classe Finance
         e ha tipo di ritorno Tuple[bool, str, Dict].
         Gestisce la vendita di una ricetta calcolando profitto lordo e netto.
-        In particolare applica il moltiplicatore di profitto della difficoltà, aggiunge o sottrae denaro in base al profitto netto e
-        restituisce successo, messaggio e dettagli (ovvero profitti, margini, ecc...).
+        In particolare applica il moltiplicatore di profitto della difficoltà (il ricavo corretto è arrotondato al centesimo), aggiunge o sottrae denaro in base al profitto netto e
+        restituisce successo, messaggio e dettagli (ovvero profitti, margini, ecc..., importi in centesimi).
         '''
         if recipe_price < 0 or ingredient_cost < 0:
             return False, "Errore: Prezzo o costo non validi", {}
         
         gross_profit = recipe_price - ingredient_cost
         
-        adjusted_revenue = recipe_price * self.profit_multiplier
+        adjusted_revenue = round(recipe_price * self.profit_multiplier)
         net_profit = adjusted_revenue - ingredient_cost
         
         if net_profit >= 0:
-            success, msg = self.add_money(net_profit, f"Vendita: {recipe_name}")
+            success, msg = self.add_cents(net_profit, f"Vendita: {recipe_name}")
         else:
-            success, msg = self.subtract_money(abs(net_profit), f"Perdita: {recipe_name}")
+            success, msg = self.subtract_cents(-net_profit, f"Perdita: {recipe_name}")
         
         if success:
             details = {
-                'gross_profit': round(gross_profit, 2),
-                'net_profit': round(net_profit, 2),
+                'gross_profit': gross_profit,
+                'net_profit': net_profit,
                 'profit_multiplier': self.profit_multiplier,
-                'adjusted_revenue': round(adjusted_revenue, 2),
-                'ingredient_cost': round(ingredient_cost, 2),
+                'adjusted_revenue': adjusted_revenue,
+                'ingredient_cost': ingredient_cost,
                 'is_profitable': net_profit >= 0
             }
             return True, msg, details
@@ -337,8 +440,8 @@ class Finance:
         Come parametro riceve implicitamente solo l'istanza della classe Finance e ha tipo di ritorno Tuple[bool, str, Dict].
         Applica i costi giornalieri fissi per i giorni trascorsi dall'ultimo processamento.
         In particolare, nella sezione protetta da lock calcola i giorni passati, verifica fondi per costi critici (affitto, utenze), applica tutti i costi possibili,
-        gestisce fallimento se fondi insufficienti per critici, aggiorna statistiche e salva lo stato.
-        Restituisce successo, messaggio e dettagli (cioè costi applicati, giorni passati, ecc...).
+        gestisce fallimento se fondi insufficienti per critici, aggiorna statistiche, registra il giorno chiuso nello storico (history) e salva lo stato.
+        Restituisce successo, messaggio e dettagli (cioè costi applicati in centesimi, giorni passati, ecc...).
         '''
         with self.lock:
             total_daily_cost = sum(self.daily_costs.values())
@@ -349,7 +452,7 @@ class Finance:
             days_passed = current_game_day - last_processed_day
             
             if days_passed <= 0:
-                return True, "Costi giornalieri già applicati", {'total_cost': 0.0}
+                return True, "Costi giornalieri già applicati", {'total_cost': 0}
             
             total_cost_for_period = total_daily_cost * days_passed
             
@@ -369,7 +472,7 @@ class Finance:
                 self._save_state()
                 
                 return False, f"FALLIMENTO: Ristorante fallito! Fondi insufficienti per i costi critici!", {
-                    'total_cost': 0.0,
+                    'total_cost': 0,
                     'days_passed': days_passed,
                     'cost_breakdown': {},
                     'failed_costs': list(critical_costs),
@@ -378,7 +481,7 @@ class Finance:
                 }
             
             cost_details = {}
-            total_cost = 0.0
+            total_cost = 0
             failed_costs = []
             
             for cost_name in critical_costs:
@@ -414,16 +517,20 @@ class Finance:
             self.state['last_processed_game_day'] = current_game_day
             self.stats['days_in_business'] = self.state['days_in_operation']
             
-            daily_profit = self.state['daily_stats']['profit']
+            daily_stats = self.state['daily_stats']
+            self.history.record_day(current_game_day, daily_stats['revenue'], daily_stats['expenses'], daily_stats['profit'],
+                                    daily_stats['orders_completed'], cost_details)
+
+            daily_profit = daily_stats['profit']
             if daily_profit > self.stats['best_day_profit']:
                 self.stats['best_day_profit'] = daily_profit
             if daily_profit < self.stats['worst_day_loss']:
                 self.stats['worst_day_loss'] = daily_profit
             
             self.state['daily_stats'] = {
-                'revenue': 0.0,
-                'expenses': 0.0,
-                'profit': 0.0,
+                'revenue': 0,
+                'expenses': 0,
+                'profit': 0,
                 'orders_completed': 0
             }
             
@@ -434,9 +541,9 @@ class Finance:
                 success = False
             else:
                 if days_passed == 1:
-                    message = f"Costi giornalieri applicati: {total_cost:.2f}€"
+                    message = f"Costi giornalieri applicati: {to_euros(total_cost):.2f}€"
                 else:
-                    message = f"Costi giornalieri applicati per {days_passed} giorni: {total_cost:.2f}€"
+                    message = f"Costi giornalieri applicati per {days_passed} giorni: {to_euros(total_cost):.2f}€"
                 success = True
             
             details = {
@@ -450,51 +557,67 @@ class Finance:
             
             return success, message, details
         
-    def get_financial_report(self, period: str = 'daily') -> Dict[str, Any]:
+    def get_financial_report(self, period: Any = 'daily') -> Dict[str, Any]:
         '''
-        Come parametro riceve esplicitamente period (stringa, con valore di default 'daily') oltre all'istanza della classe Finance (self implicito)
-        e ha tipo di ritorno Dict[str, Any].
+        Come parametro riceve esplicitamente period (stringa tra 'daily', 'weekly', 'monthly' e 'all' oppure int, numero di giorni, con 'daily' come valore di default)
+        oltre all'istanza della classe Finance (self implicito) e ha tipo di ritorno Dict[str, Any].
         Genera un report finanziario completo.
         In particolare include bilancio corrente, giorni attività, statistiche giornaliere, metriche (margine profitto, valore medio ordine),
-        statistiche globali e proiezioni (profitto medio giornaliero e settimanale).
+        statistiche globali, l'andamento degli ultimi giorni chiusi del periodo letto dallo storico (somme, medie e costi per categoria)
+        e proiezioni (profitto medio giornaliero e settimanale), con tutti gli importi convertiti da centesimi a euro.
+        Il costo è O(1) per 'all' e O(giorni del periodo) altrimenti: lo storico non viene mai riscorso per intero.
         '''
         with self.lock:
+            daily_stats = self.state['daily_stats']
             report = {
                 'period': period,
                 'generated_at': datetime.now().isoformat(),
-                'current_balance': self.state['balance'],
+                'current_balance': to_euros(self.state['balance']),
                 'days_in_operation': self.state['days_in_operation'],
-                'daily_stats': self.state['daily_stats'].copy()
+                'daily_stats': {key: to_euros(value) if key in MONEY_STATS else value for key, value in daily_stats.items()}
             }
             
-            if self.state['daily_stats']['revenue'] > 0:
-                profit_margin = (self.state['daily_stats']['profit'] / 
-                                self.state['daily_stats']['revenue'] * 100)
+            if daily_stats['revenue'] > 0:
+                profit_margin = daily_stats['profit'] / daily_stats['revenue'] * 100
             else:
                 profit_margin = 0.0
             
             report['metrics'] = {
                 'profit_margin_percent': round(profit_margin, 1),
-                'avg_order_value': round(
-                    self.state['daily_stats']['revenue'] / 
-                    max(self.state['daily_stats']['orders_completed'], 1), 2
-                ),
-                'break_even_point': round(sum(self.daily_costs.values()) / max(profit_margin/100, 0.01), 2)
+                'avg_order_value': round(to_euros(daily_stats['revenue']) / max(daily_stats['orders_completed'], 1), 2),
+                'break_even_point': round(to_euros(sum(self.daily_costs.values())) / max(profit_margin/100, 0.01), 2)
             }
             
             report['global_stats'] = {
-                'total_revenue': self.stats['total_revenue'],
-                'total_expenses': self.stats['total_expenses'],
-                'total_profit': self.stats['total_profit'],
-                'best_day_profit': self.stats['best_day_profit'],
-                'worst_day_loss': self.stats['worst_day_loss']
+                'total_revenue': to_euros(self.stats['total_revenue']),
+                'total_expenses': to_euros(self.stats['total_expenses']),
+                'total_profit': to_euros(self.stats['total_profit']),
+                'best_day_profit': to_euros(self.stats['best_day_profit']),
+                'worst_day_loss': to_euros(self.stats['worst_day_loss'])
             }
             
+            window = self.history.window(period if isinstance(period, int) else REPORT_PERIODS.get(period, 1))
+            days = window['days']
+            report['history'] = {
+                'days': days,
+                'first_day': window['first_day'],
+                'last_day': window['last_day'],
+                'revenue': to_euros(window['revenue']),
+                'expenses': to_euros(window['expenses']),
+                'profit': to_euros(window['profit']),
+                'orders_completed': window['orders'],
+                'avg_daily_profit': round(to_euros(window['profit']) / days, 2) if days else 0.0,
+                'costs_by_category': {category: to_euros(amount) for category, amount in window['costs'].items()},
+                'best_day': self.history.best and [self.history.best[0], to_euros(self.history.best[1])],
+                'worst_day': self.history.worst and [self.history.worst[0], to_euros(self.history.worst[1])]
+            }
+
             if self.state['days_in_operation'] > 0:
-                avg_daily_profit = self.stats['total_profit'] / self.state['days_in_operation']
+                avg_daily_profit = to_euros(self.stats['total_profit']) / self.state['days_in_operation']
                 report['projections'] = {
                     'avg_daily_profit': round(avg_daily_profit, 2),
-                    'weekly_projection': round(avg_daily_profit * 7, 2)
+                    'weekly_projection': round(avg_daily_profit * 7, 2),
+                    'recent_weekly_projection': round(to_euros(self.history.moving_average('profit', 7)) * 7, 2)
                 }
             
             return report
@@ -506,39 +629,51 @@ class Finance:
         '''
         return self.state['unlocked_upgrades'].copy()
     
-    def _save_state(self) -> None:
+    def get_save_state(self) -> Dict[str, Any]:
         '''
-        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe Finance e ha tipo di ritorno None (non restituisce nulla).
-        Salva lo stato finanziario su disco in savestate.json.
-        In particolare converte eventuali datetime in stringa ISO, crea un dizionario con tutti i campi necessari,
-        scrive il JSON con indentazione e aggiorna il timestamp delle statistiche e in caso di errore stampa il messaggio.
+        Come parametro riceve implicitamente solo l'istanza della classe Finance e ha tipo di ritorno Dict[str, Any].
+        Restituisce lo stato finanziario da salvare in un dizionario serializzabile in JSON (usato da _save_state() e dalla sezione "finance" di GameEngine.safe_save()).
+        In particolare converte gli importi da centesimi a euro (il formato del salvataggio resta quello delle versioni precedenti) ed eventuali datetime in stringa ISO;
+        lo storico giornaliero (finance_history) è salvato in centesimi.
         '''
-        try:
-            last_daily = self.state.get('last_daily_charge')
-            last_daily_str = last_daily.isoformat() if isinstance(last_daily, datetime) else last_daily
+        last_daily = self.state.get('last_daily_charge')
+        last_daily_str = last_daily.isoformat() if isinstance(last_daily, datetime) else last_daily
+        daily_stats = self.state.get('daily_stats', {})
 
-            save_state = {
-                'balance': self.state.get('balance', 0.0),
-                'unlocked_upgrades': self.state.get('unlocked_upgrades', []),
-                'daily_stats': self.state.get('daily_stats', {
-                    'revenue': 0.0,
-                    'expenses': 0.0,
-                    'profit': 0.0,
-                    'orders_completed': 0
-                }),
-                'days_in_operation': self.state.get('days_in_operation', 0),
-                'last_processed_game_day': self.state.get('last_processed_game_day', 0),
-                'consecutive_negative_days': self.state.get('consecutive_negative_days', 0),
-                'game_over': self.state.get('game_over', False),
-                'bankruptcy_day': self.state.get('bankruptcy_day'),
-                'bankruptcy_reason': self.state.get('bankruptcy_reason'),
-                'last_daily_charge': last_daily_str  
-            }
+        return {
+            'balance': to_euros(self.state.get('balance', 0)),
+            'unlocked_upgrades': self.state.get('unlocked_upgrades', []),
+            'daily_stats': {
+                'revenue': to_euros(daily_stats.get('revenue', 0)),
+                'expenses': to_euros(daily_stats.get('expenses', 0)),
+                'profit': to_euros(daily_stats.get('profit', 0)),
+                'orders_completed': daily_stats.get('orders_completed', 0)
+            },
+            'days_in_operation': self.state.get('days_in_operation', 0),
+            'last_processed_game_day': self.state.get('last_processed_game_day', 0),
+            'consecutive_negative_days': self.state.get('consecutive_negative_days', 0),
+            'game_over': self.state.get('game_over', False),
+            'bankruptcy_day': self.state.get('bankruptcy_day'),
+            'bankruptcy_reason': self.state.get('bankruptcy_reason'),
+            'last_daily_charge': last_daily_str,
+            'finance_history': self.history.to_dict()
+        }
 
-            with open(self.save_file, 'w', encoding='utf-8') as f:
-                json.dump(save_state, f, indent=2, ensure_ascii=False)
+    def _save_state(self) -> None:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe Finance e ha tipo di ritorno None (non restituisce nulla).
+        Segna lo stato finanziario come modificato (dirty) e, se autosave è attivo, lo salva su disco in savestate.json.
+        In particolare scrive il JSON di get_save_state() con indentazione e aggiorna il timestamp delle statistiche e in caso di errore stampa il messaggio.
+        Quando la Finance appartiene a un GameEngine (autosave False) la scrittura è rimandata al prossimo safe_save(), che riscrive solo la sezione "finance".
+        '''
+        self.dirty = True
+        self.stats['last_updated'] = datetime.now().isoformat()
+        if not self.autosave:
+            return
 
-            self.stats['last_updated'] = datetime.now().isoformat()
+        try:
+            with open(self.save_file, 'w', encoding='utf-8') as f:
+                json.dump(self.get_save_state(), f, indent=2, ensure_ascii=False)
 
         except Exception as e:
             print(f"Errore nel salvataggio stato finanziario: {e}")
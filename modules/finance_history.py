@@ -0,0 +1,158 @@
+from array import array #importazione della classe array: colonne a dimensione fissa di interi a 64 bit, una per grandezza giornaliera
+from typing import Dict, Any, List, Optional, Iterable #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+Any corrisponde ad un tipo generico (cioè accetta qualsiasi valore)
+List corrisponde ad una lista
+Optional corrisponde ad un valore che può essere None
+Iterable corrisponde ad un qualsiasi oggetto iterabile (lista, chiavi di un dizionario, ...)
+'''
+
+FIELDS = ("revenue", "expenses", "profit", "orders") # grandezze registrate per ogni giorno (importi in centesimi, ordini come conteggio)
+
+
+class FinanceHistory:
+    def __init__(self, categories: Iterable[str], capacity: int):
+        '''
+        Come parametri riceve esplicitamente le categorie dei costi giornalieri (Iterable[str], ad esempio le chiavi di Finance.daily_costs)
+        e capacity (int, giorni tenuti in memoria, economy.history_days della configurazione compilata) oltre all'istanza della classe FinanceHistory (self implicito).
+        Storico giornaliero delle finanze a memoria costante: ogni grandezza (incassi, spese, profitto, ordini e ogni categoria di costo) è un buffer circolare
+        di capacity interi, quindi in una campagna lunghissima vengono tenuti solo gli ultimi capacity giorni.
+        Accanto ai buffer mantiene aggregati cumulativi aggiornati ad ogni giorno (totali dall'inizio, giorni registrati, giorno migliore e peggiore),
+        così i report su tutta la partita costano O(1) e quelli su una finestra di giorni O(finestra), senza mai riscorrere tutto lo storico.
+        '''
+        self.capacity = max(1, capacity)
+        self.categories = list(categories)
+        self.days = array('q', [0]) * self.capacity
+        self.columns: Dict[str, array] = {field: array('q', [0]) * self.capacity for field in FIELDS}
+        self.costs: Dict[str, array] = {category: array('q', [0]) * self.capacity for category in self.categories}
+        self.start = 0 # posizione del giorno più vecchio nei buffer
+        self.size = 0 # giorni attualmente nei buffer (al massimo capacity)
+        self.recorded = 0 # giorni registrati dall'inizio della partita, compresi quelli usciti dai buffer
+        self.first_day: Optional[int] = None # primo giorno registrato (anche se già uscito dai buffer)
+        self.totals: Dict[str, int] = {field: 0 for field in FIELDS}
+        self.cost_totals: Dict[str, int] = {category: 0 for category in self.categories}
+        self.best: Optional[List[int]] = None # [giorno, profitto] del giorno con profitto più alto
+        self.worst: Optional[List[int]] = None # [giorno, profitto] del giorno con profitto più basso
+
+    def __len__(self) -> int:
+        return self.size
+
+    def record_day(self, day: int, revenue: int, expenses: int, profit: int, orders: int, costs: Optional[Dict[str, int]] = None) -> None:
+        '''
+        Come parametri riceve esplicitamente il giorno di gioco (int), incassi, spese e profitto del giorno (int, in centesimi), gli ordini completati (int)
+        e costs (Optional[Dict[str, int]], costi fissi addebitati per categoria in centesimi) oltre all'istanza della classe FinanceHistory (self implicito)
+        e ha tipo di ritorno None (non restituisce nulla).
+        Aggiunge il giorno ai buffer in O(1): se sono pieni sovrascrive il giorno più vecchio. Aggiorna totali, giorno migliore e peggiore.
+        '''
+        costs = costs or {}
+        slot = (self.start + self.size) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+
+        self.days[slot] = day
+        for field, value in zip(FIELDS, (revenue, expenses, profit, orders)):
+            self.columns[field][slot] = value
+            self.totals[field] += value
+        for category, column in self.costs.items():
+            amount = costs.get(category, 0)
+            column[slot] = amount
+            self.cost_totals[category] += amount
+
+        self.recorded += 1
+        if self.first_day is None:
+            self.first_day = day
+        if self.best is None or profit > self.best[1]:
+            self.best = [day, profit]
+        if self.worst is None or profit < self.worst[1]:
+            self.worst = [day, profit]
+
+    def _slots(self, days: Optional[int]) -> List[int]:
+        '''
+        Funzione privata che come parametro riceve esplicitamente days (Optional[int], numero di giorni più recenti, None per tutti quelli nei buffer)
+        oltre all'istanza della classe FinanceHistory (self implicito) e ha tipo di ritorno List[int].
+        Restituisce le posizioni nei buffer degli ultimi days giorni, dal più vecchio al più recente.
+        '''
+        count = self.size if days is None else max(0, min(days, self.size))
+        return [(self.start + i) % self.capacity for i in range(self.size - count, self.size)]
+
+    def window(self, days: Optional[int] = None) -> Dict[str, Any]:
+        '''
+        Come parametro riceve esplicitamente days (Optional[int], ampiezza della finestra in giorni, None per tutta la partita) oltre all'istanza della classe FinanceHistory (self implicito)
+        e ha tipo di ritorno Dict[str, Any].
+        Restituisce numero di giorni, primo e ultimo giorno, somme di incassi, spese, profitto, ordini e costi per categoria (importi in centesimi).
+        Con days None usa gli aggregati cumulativi (O(1), anche per i giorni già usciti dai buffer); altrimenti somma solo i giorni della finestra (O(days)).
+        '''
+        if days is None:
+            last_day = self.days[(self.start + self.size - 1) % self.capacity] if self.size else None
+            return dict(self.totals, costs=dict(self.cost_totals), days=self.recorded, first_day=self.first_day, last_day=last_day)
+
+        slots = self._slots(days)
+        result: Dict[str, Any] = {field: sum(self.columns[field][slot] for slot in slots) for field in FIELDS}
+        result["costs"] = {category: sum(column[slot] for slot in slots) for category, column in self.costs.items()}
+        result["days"] = len(slots)
+        result["first_day"] = self.days[slots[0]] if slots else None
+        result["last_day"] = self.days[slots[-1]] if slots else None
+        return result
+
+    def series(self, field: str, days: Optional[int] = None) -> List[int]:
+        '''
+        Come parametri riceve esplicitamente il nome della grandezza (stringa, tra FIELDS o una categoria di costo) e days (Optional[int], None per tutti i giorni nei buffer)
+        oltre all'istanza della classe FinanceHistory (self implicito) e ha tipo di ritorno List[int].
+        Restituisce i valori giornalieri degli ultimi days giorni in ordine cronologico (per grafici e tendenze).
+        '''
+        column = self.columns[field] if field in self.columns else self.costs[field]
+        return [column[slot] for slot in self._slots(days)]
+
+    def moving_average(self, field: str, days: int) -> float:
+        '''
+        Come parametri riceve esplicitamente il nome della grandezza (stringa) e l'ampiezza della media mobile in giorni (int) oltre all'istanza della classe FinanceHistory (self implicito)
+        e ha tipo di ritorno float.
+        Restituisce la media della grandezza sugli ultimi days giorni registrati (meno se non ce ne sono abbastanza, 0.0 se lo storico è vuoto).
+        '''
+        values = self.series(field, days)
+        return sum(values) / len(values) if values else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe FinanceHistory e ha tipo di ritorno Dict[str, Any].
+        Restituisce lo storico in forma serializzabile in JSON: i giorni nei buffer in ordine cronologico (una lista per grandezza) e gli aggregati cumulativi.
+        '''
+        slots = self._slots(None)
+        return {
+            "days": [self.days[slot] for slot in slots],
+            "columns": {field: [column[slot] for slot in slots] for field, column in self.columns.items()},
+            "costs": {category: [column[slot] for slot in slots] for category, column in self.costs.items()},
+            "recorded": self.recorded,
+            "first_day": self.first_day,
+            "totals": dict(self.totals),
+            "cost_totals": dict(self.cost_totals),
+            "best": self.best,
+            "worst": self.worst
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], categories: Iterable[str], capacity: int) -> 'FinanceHistory':
+        '''
+        Come parametri riceve esplicitamente i dati salvati da to_dict() (Dict[str, Any]), le categorie dei costi (Iterable[str]) e capacity (int)
+        e ha tipo di ritorno FinanceHistory.
+        Ricostruisce lo storico; se la capacità è diminuita tiene solo i giorni più recenti, mentre gli aggregati cumulativi restano quelli salvati.
+        '''
+        history = cls(categories, capacity)
+        days = data.get("days", [])
+        columns = data.get("columns", {})
+        costs = data.get("costs", {})
+        for i in range(max(0, len(days) - history.capacity), len(days)):
+            history.record_day(days[i], *(columns.get(field, [0] * len(days))[i] for field in FIELDS),
+                               {category: values[i] for category, values in costs.items() if i < len(values)})
+
+        history.recorded = data.get("recorded", history.recorded)
+        history.first_day = data.get("first_day", history.first_day)
+        history.totals.update(data.get("totals", {}))
+        history.cost_totals.update({category: total for category, total in data.get("cost_totals", {}).items() if category in history.cost_totals})
+        history.best = data.get("best", history.best)
+        history.worst = data.get("worst", history.worst)
+        return history
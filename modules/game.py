@@ -4,29 +4,59 @@ import time #importazione del modulo time per aggiungere piccoli ritardi durante
 import random #importazione del modulo random per generare eventi casuali, ordini clienti, ricette segrete sbloccate e intervalli tra eventi
 import threading #importazione del modulo necessario per gestire thread
 from datetime import datetime #classe datetime importata dal modulo datetime usata per timestamp di salvataggio e gestione orari di gioco
-from typing import Optional, Dict, Any, List #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+from typing import Optional, Dict, Any, List, Tuple, Iterable, TextIO #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
 '''
 Tipi importati:
 Optional corrisponde ad un valore che può essere None
 Any corrisponde ad un tipo generico (cioè accetta qualsiasi valore)
 List corrisponde ad una lista
 Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+Tuple corrisponde ad una tupla (sequenza immutabile di valori)
+Iterable corrisponde ad un qualsiasi oggetto iterabile (lista, file aperto, generatore, ...)
+TextIO corrisponde ad un file di testo aperto (o un oggetto con write(), come io.StringIO)
 '''
 from .inventory import Inventory #importazione della classe Inventory dal modulo locale per gestire magazzino e ingredienti
 from .recipes import Recipe #importazione della classe Recipe dal modulo locale per gestire ricette, preparazione e costi
 from .finance import Finance #importazione della classe Finance dal modulo locale per gestire bilancio, transazioni e upgrade finanziari
+from .money import to_euros #importazione della conversione da centesimi a euro dal modulo locale, per mostrare e registrare gli importi di Finance
+from .restock import RestockPlanner #importazione della classe RestockPlanner dal modulo locale per il rifornimento automatico ottimizzato sul budget
+from .demand import DemandForecaster #importazione della classe DemandForecaster dal modulo locale per la previsione della domanda per ricetta e ora
+from .achievements import AchievementEngine #importazione della classe AchievementEngine dal modulo locale per gli achievement definiti in config.json
+from .events import EventRegistry #importazione della classe EventRegistry dal modulo locale per il registro degli eventi definito in config.json
+from .settings import compile_settings, Settings, ConfigError #importazione della compilazione della configurazione dal modulo locale (sezioni tipate e validate all'avvio)
+from .modifiers import ModifierStack, Modifier, ADD, MUL, UPGRADE_MAX_LEVELS #importazione della pila dei modificatori dal modulo locale per capacità, probabilità clienti e profitto calcolati una volta sola, e dei livelli massimi degli upgrade
+from .orders import Order, RecipeCodes #importazione degli ordini compatti e della codifica intera delle ricette dal modulo locale
+from .kitchen import SchedulingPolicy, get_policy #importazione delle politiche di schedulazione della cucina dal modulo locale
+from .metrics import OrderMetrics #importazione della classe OrderMetrics dal modulo locale per gli istogrammi di latenza degli ordini
+from .savegame import SaveStore #importazione della classe SaveStore dal modulo locale per il salvataggio incrementale a sezioni
+from .snapshot import SnapshotStore #importazione della classe SnapshotStore dal modulo locale per il salvataggio opzionale in un'istantanea binaria compatta
+from .sqlite_store import SQLiteStore #importazione della classe SQLiteStore dal modulo locale per il salvataggio opzionale su database SQLite con storico della partita
+from .observable import ObservableState #importazione della classe ObservableState dal modulo locale per notificare alla GUI i cambiamenti di stato
+from .memprofile import MemoryProfiler #importazione della classe MemoryProfiler dal modulo locale per la strumentazione facoltativa della memoria a fine giornata
+from .script import ScriptRunner #importazione della classe ScriptRunner dal modulo locale per eseguire script di comandi senza console interattiva
+
+SAVE_SECTIONS = ("game", "orders", "finance", "inventory", "demand", "metrics") # sezioni del salvataggio, ognuna scritta in un file separato solo quando è cambiata
 
 
 class GameEngine:
-    def __init__(self, load_saved: bool = False):
+    def __init__(self, load_saved: bool = False, persistent: bool = True):
         '''
-        Come parametro riceve esplicitamente load_saved (bool, con False come valore di default) oltre a ricevere implicitamente l'istanza della classe GameEngine (self).
-        Costruttore della classe GameEngine (motore principale del gioco) che si occupa di caricare la configurazione con load_config(), inizializzare tutti i componenti principali (inventory, recipes, finance),
+        Come parametri riceve esplicitamente load_saved (bool, con False come valore di default) e persistent (bool, con True come valore di default)
+        oltre a ricevere implicitamente l'istanza della classe GameEngine (self).
+        Costruttore della classe GameEngine (motore principale del gioco) che si occupa di caricare la configurazione con load_config() e compilarla con compile_settings()
+        in sezioni tipate (settings; se non è valida stampa l'elenco degli errori e solleva ConfigError prima di iniziare qualsiasi simulazione), inizializzare tutti i componenti principali (inventory, recipes, finance),
         impostare variabili di stato (giorno, ora, coda ordini, capacità cucina, eventi, reputazione, upgrade, achievement, ricette sbloccate),
         configurare costi upgrade, impostare lock per thread-safety, flag di esecuzione e modalità GUI.
         Alla fine imposta _load_saved per il caricamento successivo.
+        Con persistent False la partita vive solo in memoria (ad esempio le sessioni del server di simulazione): niente storico SQLite,
+        safe_save() pubblica solo lo stato e l'inventario non riscrive ingredients.json, così più partite possono convivere nello stesso processo.
         '''
         self.config = self.load_config()
+        try:
+            self.settings: Settings = compile_settings(self.config)
+        except ConfigError as e:
+            print(f"❌ {e}")
+            raise
         self.inventory: Optional[Inventory] = None
         self.recipes: Optional[Recipe] = None
         self.finance: Optional[Finance] = None
@@ -36,8 +66,9 @@ class GameEngine:
         self.difficulty: str = "easy"
 
         self.current_game_day: int = 1
-        self.current_hour: int = self.config["time"]["working_start"]
-        self.order_queue: List[Dict] = []
+        self.current_hour: int = self.settings.time.working_start
+        self.order_queue: List[Order] = []
+        self.recipe_codes = RecipeCodes()
         self.orders_completed_today: int = 0
         self.orders_completed_total: int = 0
         self.orders_preparing: List[Dict] = []
@@ -48,20 +79,22 @@ class GameEngine:
         self.kitchen_capacity: int = 1
         self.current_preparation_count: int = 0
 
-        self.max_concurrent_orders = self.config["gameplay"]["max_concurrent_orders"]
-        self.base_patience = self.config["gameplay"]["customer_patience"]
-        self.max_burgers_per_order = self.config["gameplay"]["max_burgers_per_order"]
-
-        self.events_enabled = self.config["events"]["enabled"]
-        self.event_min_interval = self.config["events"]["min_interval"]
-        self.event_max_interval = self.config["events"]["max_interval"]
-        self.event_duration = self.config["events"]["event_duration"]
-        self.special_events = self.config["events"]["special_events"]
-        self.event_probabilities = self.config["events"]["probabilities"]
-
-        self.working_start = self.config["time"]["working_start"]
-        self.working_end = self.config["time"]["working_end"]
-        self.max_days = self.config["time"]["days"]
+        self.max_concurrent_orders = self.settings.gameplay.max_concurrent_orders
+        self.base_patience = self.settings.gameplay.customer_patience
+        self.max_burgers_per_order = self.settings.gameplay.max_burgers_per_order
+
+        self.events_enabled = self.settings.events.enabled
+        self.event_min_interval = self.settings.events.min_interval
+        self.event_max_interval = self.settings.events.max_interval
+        self.event_duration = self.settings.events.event_duration
+        self.special_events = self.settings.events.special_events
+        self.event_probabilities = self.settings.events.probabilities
+        self.event_registry = EventRegistry.from_config(self.config["events"])
+        self.modifiers = ModifierStack()
+
+        self.working_start = self.settings.time.working_start
+        self.working_end = self.settings.time.working_end
+        self.max_days = self.settings.time.days
         self.game_won = False
 
 
@@ -70,17 +103,30 @@ class GameEngine:
             "new_employee": 0
         }
         
-        self.upgrade_base_costs = self.config["gameplay"]["unlock"]
+        self.upgrade_base_costs = self.settings.gameplay.unlock
         self.upgrade_current_costs = self.upgrade_base_costs.copy()
         self.kitchen_base_capacity = 1 
         self.unlocked_upgrades = []
-        self.upgrade_costs = self.config["gameplay"]["unlock"]
-        self.reputation = self.config["gameplay"]["initial_reputation"]
+        self.upgrade_costs = self.settings.gameplay.unlock
+        self.reputation = self.settings.gameplay.initial_reputation
         self.active_events: Dict[str, int] = {}
         self.hours_since_last_event: int = 0
         self.next_event_interval: int = random.randint(self.event_min_interval, self.event_max_interval)
 
         self.save_file: str = "data/savestate.json"
+        self.save_store = SaveStore("data/savestate")
+        self.history_store: Optional[SQLiteStore] = None
+        self.persistent = persistent
+        persistence_config = self.config.get("persistence", {})
+        backend = persistence_config.get("backend", "json") if persistent else None
+        if backend == "sqlite":
+            self.history_store = SQLiteStore(persistence_config.get("sqlite_path", "data/fantaburger.db"), persistence_config.get("slot", "default"))
+            self.save_store = self.history_store
+        elif backend == "snapshot":
+            self.save_store = SnapshotStore(persistence_config.get("snapshot_path", "data/savestate.fbs"))
+        self._history_orders: List[Tuple] = []
+        self._history_transactions_seen = 0
+        self._dirty_sections = set(SAVE_SECTIONS)
         self.lock = threading.Lock()
         self.running = False
         self.game_over = False
@@ -88,29 +134,64 @@ class GameEngine:
         self._load_saved = load_saved
         self._ending_day = False
         self.achievements_unlocked: List[str] = []
+        self.achievements = AchievementEngine.from_config(self.config.get("achievements", {}))
         self.unlocked_recipes: List[str] = []
-        self.order_timeout = self.config["gameplay"]["order_timeout"]
+        self.order_timeout = self.settings.gameplay.order_timeout
         self.next_order_id = 1 
 
+        restock_config = self.config.get("restock", {})
+        self.auto_restock_hourly = restock_config.get("auto_hourly", False)
+        self.restock_target_units = restock_config.get("target_units", 5)
+        self._restock_planner: Optional[RestockPlanner] = None
+
+        demand_config = self.config.get("demand", {})
+        self.demand_alpha = demand_config.get("alpha", 0.3)
+        self.demand_prior = demand_config.get("prior", 0.1)
+        self._demand_forecaster: Optional[DemandForecaster] = None
+
+        self.kitchen_policy: SchedulingPolicy = get_policy(self.config.get("kitchen", {}).get("policy", "fifo"))
+        self.orders_expired_total = 0
+        self.simulate_delays = True
+        self.order_metrics = OrderMetrics()
+        self.observable = ObservableState()
+
+        self.memory_profiler: Optional[MemoryProfiler] = None
+        profiling_config = self.config.get("profiling", {})
+        if profiling_config.get("memory", False):
+            self.enable_memory_profiling(profiling_config.get("top", 10), profiling_config.get("alert_mb", 0.0), profiling_config.get("alert_growth_kb", 0.0))
+
+    def enable_memory_profiling(self, top: int = 10, alert_mb: float = 0.0, alert_growth_kb: float = 0.0) -> MemoryProfiler:
+        '''
+        Come parametri riceve esplicitamente top (int, punti del codice riportati), alert_mb (float, soglia di memoria allocata da modules/, 0 = nessuna)
+        e alert_growth_kb (float, soglia di crescita giornaliera, 0 = nessuna) oltre all'istanza della classe GameEngine (self implicito) e ha tipo di ritorno MemoryProfiler.
+        Attiva la strumentazione della memoria: da adesso end_day() registra un'istantanea tracemalloc al giorno (vedi MemoryProfiler.record_day()).
+        '''
+        self.memory_profiler = MemoryProfiler(self, top, alert_mb, alert_growth_kb)
+        self.memory_profiler.start()
+        return self.memory_profiler
+
     def load_config(self) -> Dict[str, Any]:
         '''
         Come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno Dict[str, Any].
-        Carica la configurazione dal file config.json tentando di leggere e parsare il JSON; in caso di errore viene stampato messaggio e sollevata eccezione (il gioco non può proseguire senza config valida).
+        Carica la configurazione dal file config.json tentando di leggere e parsare il JSON; se il file non è leggibile o il JSON non è valido viene stampato messaggio
+        e sollevata ConfigError (il gioco non può proseguire senza config valida), la stessa eccezione degli errori di validazione gestita da CLI e GUI.
         '''
         try:
             with open('data/config.json', 'r', encoding='utf-8') as f:
                 return json.load(f)
-        except Exception as e:
+        except json.JSONDecodeError as e:
             print(f"Errore caricamento config: {e}")
-            raise
+            raise ConfigError(f"data/config.json non è un JSON valido: {e}") from e
+        except OSError as e:
+            print(f"Errore caricamento config: {e}")
+            raise ConfigError(f"Impossibile leggere data/config.json: {e}") from e
 
     def start_new_game(self) -> None:
         '''
         Come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno None (non restituisce nulla).
         Avvia una nuova partita in modalità console.
         In particolare, stampa banner, chiede nome giocatore e ristorante, selezione difficoltà,
-        inizializza inventory, recipes, finance, imposta valori iniziali (giorno, ora, ricette base, capacità),
-        applica impostazioni difficoltà, salva stato iniziale e mostra riepilogo iniziale.
+        inizializza la partita con new_game() e mostra riepilogo iniziale.
         '''
         print("\n" + "="*60)
         print("NUOVA PARTITA".center(60))
@@ -120,7 +201,7 @@ class GameEngine:
         self.restaurant_name = input("Inserisci il nome del ristorante: ").strip() or "FantaBurger"
 
         print("\nDifficoltà disponibili:")
-        levels = list(self.config["difficulty"]["levels"].keys())
+        levels = list(self.settings.difficulty)
         for i, level in enumerate(levels, 1):
             print(f"{i}. {level.capitalize()}")
 
@@ -134,10 +215,37 @@ class GameEngine:
         print(f"\nBenvenuto {self.player_name}!")
         print(f"Gestirai '{self.restaurant_name}' in modalità {self.difficulty.upper()}.")
 
+        self.new_game(self.player_name, self.restaurant_name, self.difficulty)
+
+        print(f"\n✅ Partita avviata!")
+        print(f"💰 Saldo iniziale: €{self.settings.economy.initial_balance:.2f}")
+        print(f"👨‍🍳 Capacità cucina: {self.kitchen_capacity} panino/ora")
+        print("\nPremi INVIO per iniziare...")
+
+    def new_game(self, player_name: str, restaurant_name: str, difficulty: str) -> None:
+        '''
+        Come parametri riceve esplicitamente il nome del giocatore, il nome del ristorante e la difficoltà (stringhe) oltre all'istanza della classe GameEngine (self implicito)
+        e ha tipo di ritorno None (non restituisce nulla).
+        Inizializza una nuova partita senza interazione con l'utente (usata dalla console, dalla GUI e dagli strumenti di simulazione).
+        In particolare, inizializza inventory, recipes, finance, imposta valori iniziali (giorno, ora, ricette base, capacità),
+        applica impostazioni difficoltà e salva lo stato iniziale.
+        '''
+        self.player_name = player_name
+        self.restaurant_name = restaurant_name
+        self.difficulty = difficulty
+
         self.inventory = Inventory(load_saved=False)
-        self.recipes = Recipe(inventory=self.inventory)
-        self.finance = Finance(initial_balance=self.config["economy"]["initial_balance"], load_saved=False)
+        self.recipes = Recipe(inventory=self.inventory, config=self.config)
+        self.recipe_codes = RecipeCodes(self.recipes.get_all_recipes())
+        self.finance = Finance(initial_balance=self.settings.economy.initial_balance, load_saved=False, config=self.config,
+                               history_days=self.settings.economy.history_days)
         self.finance.game_engine = self
+        self.finance.autosave = False
+        self.inventory.autosave = self.persistent
+        self._history_orders = []
+        self._history_transactions_seen = 0
+        if self.history_store:
+            self.history_store.reset_slot()
 
         self.current_game_day = 1
         self.current_hour = self.working_start
@@ -145,6 +253,8 @@ class GameEngine:
         self.orders_preparing = []
         self.orders_completed_today = 0
         self.orders_completed_total = 0
+        self.orders_expired_total = 0
+        self.order_metrics = OrderMetrics()
         self.kitchen_capacity = 1
         self.current_preparation_count = 0
         self.unlocked_upgrades = []
@@ -153,7 +263,9 @@ class GameEngine:
         self.next_event_interval = random.randint(self.event_min_interval, self.event_max_interval)
         self.game_over = False
         self.achievements_unlocked = []
+        self.achievements = AchievementEngine.from_config(self.config.get("achievements", {}))
         self.unlocked_recipes = self.get_base_recipes()
+        self._demand_forecaster = None
         self.upgrade_counts = {
             "upgrade_kitchen": 0,
             "new_employee": 0
@@ -161,12 +273,8 @@ class GameEngine:
         self.kitchen_capacity = 1 
 
         self._apply_difficulty_settings()
-        self.safe_save()
-
-        print(f"\n✅ Partita avviata!")
-        print(f"💰 Saldo iniziale: €{self.config['economy']['initial_balance']:.2f}")
-        print(f"👨‍🍳 Capacità cucina: {self.kitchen_capacity} panino/ora")
-        print("\nPremi INVIO per iniziare...")
+        self._rebuild_modifiers()
+        self.safe_save(full=True)
 
     def get_base_recipes(self) -> List[str]:
         '''
@@ -186,30 +294,91 @@ class GameEngine:
         '''
         Funzione privata che come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno None (non restituisce nulla).
         Applica i modificatori della difficoltà selezionata.
-        In particolare, imposta il moltiplicatore di profitto nel finance e modifica la pazienza base clienti in base alla difficoltà.
+        In particolare, aggiorna la sorgente "difficulty" della pila dei modificatori (frequenza clienti e profitto, che finisce nel finance) e modifica la pazienza base clienti in base alla difficoltà.
         '''
-        diff_settings = self.config["difficulty"]["levels"].get(self.difficulty, {})
-        if self.finance:
-            self.finance.profit_multiplier = diff_settings.get("profit", 1.0)
+        self._refresh_difficulty_modifiers()
 
         multiplier = {"easy": 1.3, "normal": 1.0, "hard": 0.7, "ultimate": 0.5, "nightmare": 0.3}.get(self.difficulty, 1.0)
         self.base_patience = int(self.base_patience * multiplier)
 
+    def _refresh_difficulty_modifiers(self) -> None:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno None (non restituisce nulla).
+        Imposta i modificatori della difficoltà (moltiplicatori di frequenza clienti e di profitto) nella pila dei modificatori.
+        '''
+        level = self.settings.difficulty.get(self.difficulty)
+        self.modifiers.set_source("difficulty", [
+            Modifier("customer_chance", MUL, level.customer_frequency if level else 1.0),
+            Modifier("profit", MUL, level.profit if level else 1.0)
+        ])
+        self._sync_modifiers()
+
+    def _refresh_upgrade_modifiers(self) -> None:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno None (non restituisce nulla).
+        Imposta la capacità aggiunta dagli upgrade (un panino/ora per ogni livello di upgrade_kitchen e new_employee) e aggiorna kitchen_capacity, la capacità base mostrata e salvata.
+        '''
+        levels = self.upgrade_counts.get("upgrade_kitchen", 0) + self.upgrade_counts.get("new_employee", 0)
+        self.modifiers.set_source("upgrades", [Modifier("kitchen_capacity", ADD, levels)])
+        self.kitchen_capacity = self.get_base_kitchen_capacity()
+
+    def _set_event_modifiers(self, event: str, active: bool) -> None:
+        '''
+        Funzione privata che come parametri riceve esplicitamente il nome dell'evento (stringa) e active (bool) oltre all'istanza della classe GameEngine (self implicito)
+        e ha tipo di ritorno None (non restituisce nulla).
+        Aggiunge (active True) o rimuove i modificatori dell'evento dalla pila dei modificatori.
+        '''
+        if active:
+            self.modifiers.set_source(f"event:{event}", self.event_registry.modifiers(event))
+        else:
+            self.modifiers.remove_source(f"event:{event}")
+        self._sync_modifiers()
+
+    def _rebuild_modifiers(self) -> None:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno None (non restituisce nulla).
+        Ricostruisce da zero la pila dei modificatori (upgrade, difficoltà, eventi attivi); usata da new_game() e load_game().
+        '''
+        self.modifiers.clear()
+        self._refresh_upgrade_modifiers()
+        self._refresh_difficulty_modifiers()
+        for event in self.active_events:
+            self._set_event_modifiers(event, True)
+
+    def _sync_modifiers(self) -> None:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno None (non restituisce nulla).
+        Copia nel finance il moltiplicatore di profitto effettivo, letto da process_sale() ad ogni vendita.
+        '''
+        if self.finance:
+            self.finance.profit_multiplier = self.modifiers.get("profit")
+
+    def get_effective_capacity(self) -> int:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno int.
+        Restituisce i panini/ora preparabili adesso (capacità base con upgrade, moltiplicata dagli eventi attivi), letta dalla cache della pila dei modificatori.
+        '''
+        return int(self.modifiers.get("kitchen_capacity"))
+
     def load_game(self) -> bool:
         '''
         Come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno bool.
-        Carica una partita salvata da savestate.json.
-        In particolare, verifica esistenza file, carica stato, ripristina tutti i valori (giocatore, ristorante, giorno, reputazione, upgrade, ordini, eventi, achievement, ricette sbloccate),
-        ricrea inventory, recipes e finance con stato salvato, applica impostazioni difficoltà e mostra riepilogo caricamento.
+        Carica una partita salvata dal backend configurato (salvataggio a sezioni in data/savestate/, istantanea binaria o database SQLite) oppure, se non esiste, dal vecchio savestate.json.
+        In particolare, verifica esistenza del salvataggio, carica stato, ripristina tutti i valori (giocatore, ristorante, giorno, reputazione, upgrade, ordini, eventi, achievement, ricette sbloccate),
+        ricrea inventory, recipes e finance con stato salvato (gli ordini salvati come dizionari tornano oggetti Order con Order.from_dict()) (senza rileggere config.json, né ingredients.json se l'istantanea contiene l'inventario), applica impostazioni difficoltà e mostra riepilogo caricamento.
         Restituisce True se riuscito, False altrimenti.
         '''
-        if not os.path.exists(self.save_file):
+        sectioned = self.save_store.exists()
+        if not sectioned and not os.path.exists(self.save_file):
             print("Nessun salvataggio trovato!")
             return False
 
         try:
-            with open(self.save_file, 'r', encoding='utf-8') as f:
-                state = json.load(f)
+            if sectioned:
+                state = self._merge_save_sections(self.save_store.read_sections())
+            else:
+                with open(self.save_file, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
 
 
             self.player_name = state.get("player_name", "Giocatore")
@@ -219,7 +388,6 @@ class GameEngine:
             self.reputation = state.get("reputation", 50.0)
             self.kitchen_capacity = state.get("kitchen_capacity", 1)
             self.unlocked_upgrades = state.get("unlocked_upgrades", [])
-            self.order_queue = state.get("order_queue", [])
             self.active_events = state.get("active_events", {})
             self.hours_since_last_event = state.get("hours_since_last_event", 0)
             self.next_event_interval = state.get(
@@ -227,14 +395,20 @@ class GameEngine:
                 random.randint(self.event_min_interval, self.event_max_interval)
             )
             self.orders_completed_total = state.get("orders_completed_total", 0)
+            self.orders_expired_total = state.get("orders_expired_total", 0)
+            self.order_metrics = OrderMetrics.from_dict(state.get("order_metrics") or {})
             self.achievements_unlocked = state.get("achievements_unlocked", [])
+            self.achievements = AchievementEngine.from_config(self.config.get("achievements", {}), self.achievements_unlocked)
 
-            self.inventory = Inventory(load_saved=True)
+            self.inventory = Inventory(load_saved=True, data=state.get("inventory_data"))
             inv_state = state.get("inventory_state")
             if inv_state:
                 self.inventory.state = inv_state
 
-            self.recipes = Recipe(inventory=self.inventory)
+            self.recipes = Recipe(inventory=self.inventory, config=self.config)
+            self.recipe_codes = RecipeCodes(self.recipes.get_all_recipes())
+            self.order_queue = [Order.from_dict(order, self.recipe_codes) for order in state.get("order_queue", [])]
+            self.next_order_id = state.get("next_order_id", max((order.id for order in self.order_queue), default=0) + 1)
 
             unlocked = state.get("unlocked_recipes", self.get_base_recipes())
             cleaned = []
@@ -245,9 +419,17 @@ class GameEngine:
                     cleaned.append(r)
             self.unlocked_recipes = cleaned
 
-            self.finance = Finance(initial_balance=0.0, load_saved=True)
-            self.finance.state = state
+            demand_state = state.get("demand_model")
+            if demand_state:
+                self._demand_forecaster = DemandForecaster.from_dict(demand_state, self.recipes.get_all_recipes().keys())
+
+            self.finance = Finance(initial_balance=state.get("balance", 0.0), load_saved=not sectioned, config=self.config,
+                                   history_days=self.settings.economy.history_days)
+            self.finance.load_state(state)
             self.finance.game_engine = self
+            self.finance.autosave = False
+            self._history_orders = []
+            self._history_transactions_seen = len(self.finance.transactions)
 
             self.current_hour = state.get("current_hour", self.working_start)
             self.orders_preparing = []
@@ -261,9 +443,8 @@ class GameEngine:
                 "new_employee": 0
             })
             
-            self.kitchen_capacity = 1  
-            self.kitchen_capacity += self.upgrade_counts.get("upgrade_kitchen", 0)
-            self.kitchen_capacity += self.upgrade_counts.get("new_employee", 0)
+            self._rebuild_modifiers()
+            self._dirty_sections = set(SAVE_SECTIONS)
 
             print(f"\n✅ Partita caricata!")
             print(f"👤 Giocatore: {self.player_name}")
@@ -282,18 +463,69 @@ class GameEngine:
 
 
 
-    def safe_save(self) -> None:
+    def _record_order_history(self, order: Order, status: str) -> None:
         '''
-        Come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno None (non restituisce nulla).
-        Salva in modo sicuro lo stato completo del gioco su savestate.json.
-        In particolare, crea un dizionario con tutti i dati rilevanti (giocatore, giorno, reputazione, upgrade, ordini, eventi, statistiche finance e inventory),
-        scrive il JSON con indentazione e gestisce eccezioni stampando errore.
+        Funzione privata che come parametri riceve esplicitamente l'ordine (Order) e il suo stato finale ('completed', 'expired' o 'dropped')
+        oltre all'istanza della classe GameEngine (self implicito) e ha tipo di ritorno None (non restituisce nulla).
+        Se lo storico SQLite è attivo accoda la riga dell'ordine concluso, scritta sul database insieme alle altre da _flush_history().
         '''
-        if not self.finance:
+        if self.history_store:
+            self._history_orders.append((
+                self.current_game_day, order.id, self.recipe_codes.decode(order.recipe), order.quantity, status,
+                self._order_arrival_time(order), order.first_unit_time, order.completed_time
+            ))
+
+    def _flush_history(self) -> None:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno None (non restituisce nulla).
+        Scrive sullo storico SQLite (se attivo) gli ordini conclusi e le nuove transazioni di Finance dall'ultima chiamata, con un solo inserimento a blocchi per ora di gioco.
+        '''
+        if not self.history_store or not self.finance:
             return
+        transactions = [
+            (self.current_game_day, self.current_hour, t.get("type"), to_euros(t.get("amount", 0)), t.get("description"), to_euros(t.get("new_balance", 0)))
+            for t in self.finance.transactions[self._history_transactions_seen:]
+        ]
+        self._history_transactions_seen = len(self.finance.transactions)
+        orders, self._history_orders = self._history_orders, []
+        self.history_store.record_hour(transactions, orders)
 
-        try:
-            save_state = {
+    def _record_day_history(self, day_stats: Dict[str, Any], daily_costs: int) -> None:
+        '''
+        Funzione privata che come parametri riceve esplicitamente le statistiche finanziarie del giorno prima dei costi fissi (Dict[str, Any]) e il totale dei costi fissi applicati (int),
+        entrambi in centesimi come in Finance
+        oltre all'istanza della classe GameEngine (self implicito) e ha tipo di ritorno None (non restituisce nulla).
+        Se lo storico SQLite è attivo scrive le ultime righe in sospeso e la riga riassuntiva del giorno (interrogabile poi con history_store.get_daily_stats()).
+        '''
+        if not self.history_store:
+            return
+        self._flush_history()
+        self.history_store.record_day(self.current_game_day, {
+            "revenue": to_euros(day_stats.get("revenue", 0)),
+            "expenses": to_euros(day_stats.get("expenses", 0) + daily_costs),
+            "profit": to_euros(day_stats.get("profit", 0) - daily_costs),
+            "orders_completed": self.orders_completed_today,
+            "balance": self.finance.get_balance(),
+            "reputation": round(self.reputation, 1)
+        })
+
+    def mark_dirty(self, *sections: str) -> None:
+        '''
+        Come parametri riceve esplicitamente i nomi delle sezioni (stringhe, tra quelle di SAVE_SECTIONS) oltre all'istanza della classe GameEngine (self implicito)
+        e ha tipo di ritorno None (non restituisce nulla).
+        Segna le sezioni come modificate, così il prossimo safe_save() le riscrive.
+        '''
+        self._dirty_sections.update(sections)
+
+    def _build_save_section(self, name: str) -> Dict[str, Any]:
+        '''
+        Funzione privata che come parametro riceve esplicitamente il nome della sezione (stringa) oltre all'istanza della classe GameEngine (self implicito)
+        e ha tipo di ritorno Dict[str, Any].
+        Restituisce i dati della sezione con le stesse chiavi del vecchio savestate.json, così unendo le sezioni si ottiene lo stato completo
+        (gli ordini vengono convertiti nei dizionari del formato di salvataggio con Order.to_dict()).
+        '''
+        if name == "game":
+            return {
                 "player_name": self.player_name,
                 "restaurant_name": self.restaurant_name,
                 "difficulty": self.difficulty,
@@ -301,38 +533,115 @@ class GameEngine:
                 "reputation": round(self.reputation, 1),
                 "kitchen_capacity": self.kitchen_capacity,
                 "unlocked_upgrades": self.unlocked_upgrades,
-                "order_queue": self.order_queue,
                 "active_events": self.active_events,
                 "current_hour": self.current_hour,
                 "hours_since_last_event": self.hours_since_last_event,
                 "next_event_interval": self.next_event_interval,
                 "last_save": datetime.now().isoformat(),
-                "balance": self.finance.state.get('balance', 0.0),
-                "daily_stats": self.finance.state.get('daily_stats', {}),
-                "days_in_operation": self.finance.state.get('days_in_operation', 0),
-                "last_processed_game_day": self.finance.state.get('last_processed_game_day', 0),
-                "upgrade_counts": self.upgrade_counts, 
-                "game_over": self.finance.state.get('game_over', False),
+                "upgrade_counts": self.upgrade_counts,
                 "orders_completed_total": self.orders_completed_total,
+                "orders_expired_total": self.orders_expired_total,
                 "achievements_unlocked": self.achievements_unlocked,
-                "unlocked_recipes": self.unlocked_recipes,
-                "inventory_state": getattr(self.inventory, 'state', {})
+                "unlocked_recipes": self.unlocked_recipes
             }
+        if name == "orders":
+            with self.lock:
+                return {"order_queue": [order.to_dict(self.recipe_codes) for order in self.order_queue], "next_order_id": self.next_order_id}
+        if name == "finance":
+            return self.finance.get_save_state()
+        if name == "inventory":
+            section = {"inventory_state": getattr(self.inventory, 'state', {})}
+            if getattr(self.save_store, 'embeds_inventory', False):
+                section["inventory_data"] = self.inventory.data
+            return section
+        if name == "demand":
+            return {"demand_model": self._demand_forecaster.to_dict() if self._demand_forecaster else None}
+        if name == "metrics":
+            return {"order_metrics": self.order_metrics.to_dict()}
+        raise ValueError(f"Sezione di salvataggio sconosciuta: {name}")
+
+    def _merge_save_sections(self, sections: Dict[str, Any]) -> Dict[str, Any]:
+        '''
+        Funzione privata che come parametro riceve esplicitamente le sezioni lette dal salvataggio (Dict[str, Any]) oltre all'istanza della classe GameEngine (self implicito)
+        e ha tipo di ritorno Dict[str, Any].
+        Unisce le sezioni in un unico stato nel formato del vecchio savestate.json; la sezione finance viene unita per prima,
+        così le chiavi del motore (ad esempio unlocked_upgrades) hanno la precedenza come nel formato precedente.
+        '''
+        state = {}
+        for name in ("finance",) + tuple(name for name in SAVE_SECTIONS if name != "finance"):
+            state.update(sections.get(name) or {})
+        return state
+
+    def safe_save(self, full: bool = False) -> None:
+        '''
+        Come parametro riceve esplicitamente full (bool, con False come valore di default) oltre all'istanza della classe GameEngine (self implicito)
+        e ha tipo di ritorno None (non restituisce nulla).
+        Salva in modo sicuro lo stato del gioco nel salvataggio a sezioni (data/savestate/).
+        In particolare, riscrive sempre la piccola sezione "game" (giocatore, giorno, ora, reputazione, upgrade, eventi, contatori) e solo le altre sezioni
+        segnate come modificate con mark_dirty() (coda ordini, inventario, modello di domanda, metriche) o dal flag dirty di Finance; con full=True, o se il salvataggio
+        non esiste ancora, scrive tutte le sezioni. Gestisce eccezioni stampando errore.
+        Se il motore non è persistente (persistent False) non scrive nulla e si limita a pubblicare lo stato.
+        '''
+        if not self.finance:
+            return
+        if not self.persistent:
+            self._dirty_sections.clear()
+            self.publish_state()
+            return
 
-            with open(self.save_file, 'w', encoding='utf-8') as f:
-                json.dump(save_state, f, indent=2, ensure_ascii=False)
+        try:
+            if full or not self.save_store.exists():
+                dirty = set(SAVE_SECTIONS)
+            else:
+                dirty = self._dirty_sections | {"game"}
+                if self.finance.dirty:
+                    dirty.add("finance")
+
+            sections = {name: self._build_save_section(name) for name in SAVE_SECTIONS if name in dirty}
+            self.save_store.write_sections(sections)
+            self._dirty_sections.clear()
+            self.finance.dirty = False
 
         except Exception as e:
             print(f"⚠️ Errore salvataggio: {e}")
 
+        self.publish_state()
+
+    def get_observed_state(self) -> Dict[str, Any]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno Dict[str, Any].
+        Restituisce i valori mostrati dalla GUI (giorno, ora, saldo, reputazione, capacità, fine partita), già arrotondati come vengono visualizzati,
+        così piccole variazioni invisibili non generano notifiche. Il saldo è letto direttamente dallo stato di Finance senza prendere il suo lock.
+        '''
+        return {
+            "day": self.current_game_day,
+            "hour": self.current_hour,
+            "balance": to_euros(self.finance.state.get('balance', 0)),
+            "reputation": round(self.reputation, 1),
+            "capacity": self.kitchen_capacity,
+            "game_over": self.game_over,
+            "game_won": self.game_won
+        }
+
+    def publish_state(self) -> Dict[str, Any]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno Dict[str, Any].
+        Pubblica lo stato osservato su observable: i sottoscrittori (ad esempio la GUI) ricevono solo i valori cambiati dall'ultima pubblicazione.
+        Viene chiamata alla fine di advance_hour() e di safe_save(). Restituisce il dizionario dei valori cambiati.
+        '''
+        if not self.finance:
+            return {}
+        return self.observable.update(**self.get_observed_state())
+
     def check_achievement(self, name: str):
         '''
         Come parametro riceve esplicitamente il nome dell'achievment (stringa) oltre all'istanza della classe GameEngine (self implicito).
         Controlla e sblocca un achievement se non già ottenuto.
-        In particolare, aggiunge il nome alla lista achievements_unlocked, stampa messaggio colorato e chiama callback GUI se presente.
+        In particolare, lo segna nell'insieme degli achievement ottenuti (AchievementEngine), aggiunge il nome alla lista achievements_unlocked (salvata),
+        stampa messaggio colorato e chiama callback GUI se presente.
         Restituisce True se sbloccato nuovo, False se già presente.
         '''
-        if name not in self.achievements_unlocked:
+        if self.achievements.unlock(name):
             self.achievements_unlocked.append(name)
             print(f"\033[33m🏆 ACHIEVEMENT SBLOCCATO: {name.upper()}!\033[0m")
             if hasattr(self, 'on_achievement_unlocked'):
@@ -340,12 +649,21 @@ class GameEngine:
             return True
         return False
 
+    def update_achievement_counter(self, counter: str, value: float, key: Optional[str] = None) -> None:
+        '''
+        Come parametri riceve esplicitamente il nome del contatore (stringa), il suo nuovo valore (float) e key (Optional[str], ad esempio l'id della ricetta)
+        oltre all'istanza della classe GameEngine (self implicito) e ha tipo di ritorno None (non restituisce nulla).
+        Comunica al motore degli achievement che il contatore è cambiato e sblocca con check_achievement() gli achievement le cui regole sono ora soddisfatte.
+        '''
+        for name in self.achievements.update(counter, value, key):
+            self.check_achievement(name)
+
     def check_and_trigger_events(self) -> None:
         '''
         Come parametro riceve implicitamente solo l'istanza della classe GameEngine e non restituisce nulla.
         Controlla e attiva eventi casuali se abilitati.
-        In particolare, incrementa contatore ore, se raggiunto intervallo casuale sceglie il tipo di evento,
-        seleziona un evento specifico disponibile, lo attiva per durata configurata e applica l' effetto immediato.
+        In particolare, incrementa contatore ore, se raggiunto intervallo casuale estrae dal registro degli eventi (EventRegistry, tabelle alias precalcolate) prima il tipo di evento
+        e poi un evento abilitato di quel tipo, lo attiva per durata configurata e applica l' effetto immediato.
         Infine, resetta contatore e genera un nuovo intervallo.
         '''
         if not self.events_enabled:
@@ -354,33 +672,10 @@ class GameEngine:
         self.hours_since_last_event += 1
 
         if self.hours_since_last_event >= self.next_event_interval:
-            event_type = random.choices(
-                ["positive", "negative", "neutral"],
-                weights=[
-                    self.event_probabilities["positive"],
-                    self.event_probabilities["negative"],
-                    self.event_probabilities["neutral"]
-                ]
-            )[0]
-
-            available = []
-            for event_name, enabled in self.special_events.items():
-                if not enabled:
-                    continue
-
-                if event_name in ["lucky_day", "food_critic", "rush_hour"]:
-                    cat = "positive"
-                elif event_name in ["broken_equipment", "health_inspection", "weather_bad", "employee_sick", "theft"]:
-                    cat = "negative"
-                else:
-                    cat = "neutral"
-
-                if cat == event_type:
-                    available.append(event_name)
-
-            if available:
-                event = random.choice(available)
+            event = self.event_registry.pick()
+            if event:
                 self.active_events[event] = self.event_duration
+                self._set_event_modifiers(event, True)
                 self.apply_event_effect(event)
 
                 self.hours_since_last_event = 0
@@ -427,55 +722,21 @@ class GameEngine:
         '''
         Come parametro riceve esplicitamente il nome dell'evento (stringa) oltre all'istanza della classe GameEngine (self implicito).
         Applica l'effetto immediato di un evento speciale.
-        In particolare, stampa banner evento e effetto specifico (bonus denaro, penalità, modifica capacità, reputazione, clienti).
+        In particolare, stampa banner evento e applica gli effetti descritti nella sua definizione (bonus denaro, penalità, modifica capacità, reputazione) tramite EventRegistry.apply().
         '''
         event_display = event_name.replace('_', ' ').title()
         print(f"\n{'⚡'*20}")
         print(f"EVENTO: {event_display}")
         print(f"{'⚡'*20}")
 
-        if event_name == "rush_hour":
-            print("   🚀 ORA DI PUNTA! +150% clienti per 3 ore")
-
-        elif event_name == "food_critic":
-            bonus = random.uniform(150, 400)
-            self.finance.add_money(bonus, "Recensione stellata")
-            self.reputation = min(100, self.reputation + 15)
-            print(f"   🎩 Critico gastronomico del Gambero Rosso! +€{bonus:.2f} | +15 reputazione")
-
-        elif event_name == "health_inspection":
-            penalty = random.uniform(100, 350)
-            self.finance.subtract_money(penalty, "Multa sanitaria")
-            self.reputation = max(0, self.reputation - 15)
-            print(f"   🚨 Ispezione sanitaria da parte dei NAS! -€{penalty:.2f} | -15 reputazione")
-
-        elif event_name == "employee_sick":
-            print("   🤒 Dipendente malato! -50% capacità cucina per 3 ore")
-            self.kitchen_capacity = max(1, self.kitchen_capacity // 2)
-
-        elif event_name == "lucky_day":
-            bonus = random.uniform(200, 500)
-            self.finance.add_money(bonus, "Giornata fortunata")
-            print(f"   🍀 GIORNATA FORTUNATA! +€{bonus:.2f}")
-
-        elif event_name == "broken_equipment":
-            penalty = random.uniform(250, 600)
-            self.finance.subtract_money(penalty, "Riparazione")
-            print(f"   🔧 ATTREZZATURA GUASTA! -€{penalty:.2f}")
-
-        elif event_name == "weather_bad":
-            print("   🌧️ MALTEMPO! -50% clienti per 3 ore")
-            
-        elif event_name == "theft":
-            stole = random.uniform(100, 250)
-            self.finance.subtract_money(stole, "Furto avvenuto!")
-            print(f"   🦹 FURTO! -€{stole:.2f}")
+        for message in self.event_registry.apply(self, event_name):
+            print(f"   {message}")
 
     def update_active_events(self) -> None:
         '''
         Come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno None.
         Aggiorna la durata degli eventi attivi e rimuove quelli scaduti.
-        In particolare, decrementa contatore, se arriva a 0 rimuove evento e ripristina effetti 
+        In particolare, decrementa contatore, se arriva a 0 rimuove evento e i suoi modificatori
         (per esempio se un dipendente guarisce, la capacità in cucina si normalizza).
         '''
         expired = []
@@ -486,49 +747,82 @@ class GameEngine:
 
         for event in expired:
             del self.active_events[event]
-            if event == "employee_sick":
-                self.kitchen_capacity = self.get_base_kitchen_capacity()
-                print(f"   💪 Il dipendente è guarito! Capacità cucina ripristinata a {self.kitchen_capacity}")
+            self._set_event_modifiers(event, False)
+            for message in self.event_registry.expire(self, event):
+                print(f"   {message}")
 
     def get_base_kitchen_capacity(self) -> int:
         '''
         Come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno int.
-        Calcola la capacità base della cucina considerando gli upgrade sbloccati.
+        Calcola la capacità base della cucina considerando i livelli degli upgrade acquistati (cucina e dipendenti), senza gli effetti degli eventi.
         '''
-        base = 1
-        if "upgrade_kitchen" in self.unlocked_upgrades:
-            base += 1
-        return base
+        return 1 + self.upgrade_counts.get("upgrade_kitchen", 0) + self.upgrade_counts.get("new_employee", 0)
 
     def get_event_multipliers(self) -> Dict[str, float]:
         '''
         Come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno Dict[str, float].
-        Restituisce i moltiplicatori attivi causati dagli eventi (clienti e capacità cucina).
+        Restituisce i moltiplicatori attivi causati dagli eventi (clienti e capacità cucina), presi dalle definizioni degli eventi e moltiplicati tra loro se più eventi sono attivi.
         '''
-        multipliers = {"customer_chance": 1.0, "kitchen_capacity": 1.0}
-        for event in self.active_events:
-            if event == "rush_hour":
-                multipliers["customer_chance"] = 2.5
-            elif event == "weather_bad":
-                multipliers["customer_chance"] = 0.5
-            elif event == "employee_sick":
-                multipliers["kitchen_capacity"] = 0.5
-        return multipliers
+        return self.event_registry.multipliers(self.active_events)
+
+    def get_sim_time(self) -> int:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno int.
+        Restituisce il tempo simulato assoluto in ore dall'inizio della partita (giorno e ora correnti), usato per i timestamp degli ordini.
+        '''
+        return (self.current_game_day - 1) * 24 + self.current_hour
+
+    def _order_arrival_time(self, order: Order) -> int:
+        '''
+        Funzione privata che come parametro riceve esplicitamente l'ordine (Order) oltre all'istanza della classe GameEngine (self implicito) e ha tipo di ritorno int.
+        Restituisce il tempo simulato di arrivo dell'ordine; per ordini di salvataggi precedenti (senza arrival_time) lo ricava da arrival_hour nel giorno corrente.
+        '''
+        arrival_time = order.arrival_time
+        if arrival_time is None:
+            arrival_time = (self.current_game_day - 1) * 24 + order.arrival_hour
+        return arrival_time
+
+    def get_latency_report(self, day: Optional[int] = None, recipe_id: Optional[str] = None) -> Dict[str, Any]:
+        '''
+        Come parametri riceve esplicitamente day (Optional[int]) e recipe_id (Optional[str]) oltre all'istanza della classe GameEngine (self implicito)
+        e ha tipo di ritorno Dict[str, Any].
+        Restituisce il riepilogo delle latenze degli ordini (attesa in coda, tempo di completamento, timeout) per giorno, per ricetta o totale.
+        '''
+        return self.order_metrics.get_summary(day, recipe_id)
+
+    def set_kitchen_policy(self, name: str) -> None:
+        '''
+        Come parametro riceve esplicitamente il nome della politica di schedulazione (stringa: fifo, edf, profit, expiry) oltre all'istanza della classe GameEngine (self implicito).
+        Cambia la politica con cui la cucina sceglie l'ordine di servizio della coda.
+        '''
+        self.kitchen_policy = get_policy(name)
+
+    def get_unit_profit(self, recipe_id: str) -> float:
+        '''
+        Come parametro riceve esplicitamente l'id della ricetta (stringa) oltre all'istanza della classe GameEngine (self implicito) e ha tipo di ritorno float.
+        Restituisce il guadagno atteso per un panino: prezzo × moltiplicatore di profitto della difficoltà meno il costo degli ingredienti
+        (calcolato una volta e poi letto dalla price_cache delle ricette).
+        '''
+        recipe = self.recipes.get_recipe(recipe_id)
+        if not recipe:
+            return 0.0
+        multiplier = self.finance.profit_multiplier if self.finance else 1.0
+        return recipe.get('price', 0.0) * multiplier - self.recipes.calculate_recipe_cost(recipe_id)
 
     def process_kitchen_work(self) -> List[str]:
         '''
         Come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno List[str].
         Processa la preparazione ordini nella cucina.
-        In particolare, applica la capacità effettiva (dovuta a possibili eventi), prepara fino a capacità panini/ora,
-        consuma ingredienti, vende, aggiorna profitto, gestisce completamento ordini e reputazione.
+        In particolare, applica la capacità effettiva (dovuta a possibili eventi), rimuove gli ordini scaduti, ordina la coda con la politica
+        di schedulazione attiva (kitchen_policy) e prepara fino a capacità panini/ora in un solo passaggio sulla coda, al massimo units_per_visit unità per ordine
+        (la politica FIFO ne prepara una, le altre completano l'ordine prima di passare al successivo) e saltando gli ordini senza ingredienti. Consuma ingredienti, vende, aggiorna profitto, gestisce completamento ordini e reputazione.
         Restituisce lista di messaggi da mostrare.
         '''
         messages = []
         self.current_preparation_count = 0
         self.orders_preparing = []
 
-        multipliers = self.get_event_multipliers()
-        effective_capacity = int(self.kitchen_capacity * multipliers["kitchen_capacity"])
+        effective_capacity = self.get_effective_capacity()
 
         print(f"\n👨‍🍳 CUCINA: Capacità {effective_capacity} panini/ora")
 
@@ -536,95 +830,109 @@ class GameEngine:
             messages.append(" 😴 Cucina inattiva (evento negativo)")
             return messages
 
-        i = 0
-        while i < len(self.order_queue):
-            order = self.order_queue[i]
-            hours_waited = self.current_hour - order["arrival_hour"]
-            if hours_waited > self.order_timeout:
-                messages.append(f" ⏰ Ordine #{order['id']} scaduto dopo {hours_waited}h! -5 reputazione")
+        deadline = self.current_hour - self.order_timeout
+        expired = [order for order in self.order_queue if order.arrival_hour < deadline]
+        if expired:
+            for order in expired:
+                messages.append(f" ⏰ Ordine #{order.id} scaduto dopo {self.current_hour - order.arrival_hour}h! -5 reputazione")
                 self.reputation = max(0, self.reputation - 5)
-                del self.order_queue[i]
-            else:
-                i += 1
+                self.orders_expired_total += 1
+                self.order_metrics.record_timeout(self.recipe_codes.decode(order.recipe), self.current_game_day)
+                self._record_order_history(order, "expired")
+            self.order_queue[:] = [order for order in self.order_queue if order.arrival_hour >= deadline]
+            self.mark_dirty("orders", "metrics")
 
         if not self.order_queue:
             messages.append(" 😴 Nessun ordine in coda")
             return messages
 
         prepared = 0
-        i = 0
+        removed_ids = set()
+        now = self.get_sim_time()
+        units_per_visit = self.kitchen_policy.units_per_visit
+
+        for order in self.kitchen_policy.prioritize(self.order_queue, self):
+            if prepared >= effective_capacity:
+                break
 
-        while prepared < effective_capacity and i < len(self.order_queue):
-            order = self.order_queue[i]
-            recipe_data = self.recipes.get_recipe(order["recipe_id"])
+            recipe_id = self.recipe_codes.decode(order.recipe)
+            recipe_data = self.recipes.get_recipe(recipe_id)
 
             if not recipe_data or not isinstance(recipe_data, dict):
-                messages.append(f" ❌ Ordine #{order['id']} rimosso: ricetta non valida")
-                del self.order_queue[i]
+                messages.append(f" ❌ Ordine #{order.id} rimosso: ricetta non valida")
+                removed_ids.add(order.id)
                 continue
 
             recipe = recipe_data
-
+            recipe_name = recipe.get('name', 'Panino')
             ingredients = recipe.get('ingredients', {})
-            can_prepare, reason = self.inventory.check_availability(ingredients)
-
-            if not can_prepare:
-                messages.append(f" ⚠️ Ordine #{order['id']} ({recipe.get('name', 'Sconosciuto')}): {reason}")
-                i += 1
-                continue
 
-            success, prep_msg, details = self.recipes.prepare_recipe(order["recipe_id"], 1)
+            made = 0
+            while prepared < effective_capacity and order.remaining > 0 and made != units_per_visit:
+                can_prepare, reason = self.inventory.check_availability(ingredients)
 
-            if not success:
-                messages.append(f" ❌ Preparazione fallita Ordine #{order['id']}: {prep_msg}")
-                i += 1
-                continue
+                if not can_prepare:
+                    messages.append(f" ⚠️ Ordine #{order.id} ({recipe.get('name', 'Sconosciuto')}): {reason}")
+                    break
 
-            sale_success, sale_msg, sale_details = self.finance.process_sale(
-                details.get('total_price', 0.0),
-                details.get('total_cost', 0.0),
-                details.get('recipe_name', recipe.get('name', 'Panino'))
-            )
+                success, prep_msg, details = self.recipes.prepare_recipe(recipe_id, 1)
 
-            if not sale_success:
-                messages.append(f" ❌ Vendita fallita Ordine #{order['id']}: {sale_msg}")
-                i += 1
-                continue
-
-            profit = sale_details.get('net_profit', 0.0)
-            recipe_name = recipe.get('name', 'Panino')
-            messages.append(f" ✅ Preparato 1x {recipe_name} (Ordine #{order['id']}) — Guadagno: €{profit:.2f}")
+                if not success:
+                    messages.append(f" ❌ Preparazione fallita Ordine #{order.id}: {prep_msg}")
+                    break
 
-            order["remaining"] -= 1
-            prepared += 1
-            self.current_preparation_count += 1
+                sale_success, sale_msg, sale_details = self.finance.process_sale(
+                    details.get('total_price_cents', 0),
+                    details.get('total_cost_cents', 0),
+                    details.get('recipe_name', recipe_name)
+                )
 
-            self.orders_preparing.append({
-                "order_id": order["id"],
-                "recipe": recipe_name,
-                "profit": profit
-            })
+                if not sale_success:
+                    messages.append(f" ❌ Vendita fallita Ordine #{order.id}: {sale_msg}")
+                    break
 
-            if order["remaining"] <= 0:
-                messages.append(f" 🎉 Ordine #{order['id']} COMPLETATO! +5 reputazione")
+                profit = to_euros(sale_details.get('net_profit', 0))
+                messages.append(f" ✅ Preparato 1x {recipe_name} (Ordine #{order.id}) — Guadagno: €{profit:.2f}")
+
+                if order.first_unit_time is None:
+                    order.first_unit_time = now
+                    self.order_metrics.record_first_unit(recipe_id, self.current_game_day, now - self._order_arrival_time(order))
+
+                order.remaining -= 1
+                prepared += 1
+                made += 1
+                self.current_preparation_count += 1
+
+                self.orders_preparing.append({
+                    "order_id": order.id,
+                    "recipe": recipe_name,
+                    "profit": profit
+                })
+
+            if order.remaining <= 0:
+                order.completed_time = now
+                self.order_metrics.record_completion(recipe_id, self.current_game_day, now - self._order_arrival_time(order))
+                self._record_order_history(order, "completed")
+                messages.append(f" 🎉 Ordine #{order.id} COMPLETATO! +5 reputazione")
                 self.orders_completed_today += 1
                 self.orders_completed_total += 1
+                self.finance.record_order_completed()
                 self.reputation = min(100, self.reputation + 5.0)
 
-                if self.orders_completed_total == 1:
-                    self.check_achievement("prima_vendita!")
-                if self.orders_completed_total == 10:
-                    self.check_achievement("masto_paninaro!")
-                if "perfetto" in order["recipe_id"].lower():
-                    self.check_achievement("è perfetto!")
-                if self.orders_completed_today >= 5:
-                    self.check_achievement("comm si veloce!")
-                if self.reputation >= 100:
-                    self.check_achievement("attiraclienti!")
-
-                del self.order_queue[i]
-            else:
-                i += 1
+                self.update_achievement_counter("orders_completed_total", self.orders_completed_total)
+                self.update_achievement_counter("recipe_completed", 1, recipe_id)
+                self.update_achievement_counter("orders_completed_today", self.orders_completed_today)
+                self.update_achievement_counter("reputation", self.reputation)
+
+                removed_ids.add(order.id)
+
+        if removed_ids:
+            self.order_queue[:] = [order for order in self.order_queue if order.id not in removed_ids]
+
+        if prepared or removed_ids:
+            self.mark_dirty("orders", "metrics")
+        if prepared:
+            self.mark_dirty("inventory")
 
         if prepared == 0:
             messages.append(" 😴 Nessun panino preparato questa ora")
@@ -636,7 +944,8 @@ class GameEngine:
         Come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno List[str].
         Simula l'arrivo di nuovi ordini clienti.
         In particolare, calcola probabilità in base a difficoltà, reputazione ed eventi attivi,
-        genera numero ordini casuale, crea ogni ordine in thread separato con piccolo ritardo per realismo,
+        genera numero ordini casuale, crea ogni ordine in thread separato con piccolo ritardo per realismo
+        (oppure in sequenza e senza ritardi se simulate_delays è False, per simulazioni veloci e riproducibili),
         aggiunge alla coda con id progressivo.
         Restituisce lista di messaggi da mostrare.
         '''
@@ -649,13 +958,9 @@ class GameEngine:
         if self.current_hour >= self.working_end:
             return messages
 
-        diff_settings = self.config["difficulty"]["levels"][self.difficulty]
-        base_chance = diff_settings.get("customer_frequency", 1.0) * 0.25
-
         rep_modifier = max(0.5, self.reputation / 100)
-        event_mult = self.get_event_multipliers()["customer_chance"]
 
-        final_chance = base_chance * rep_modifier * event_mult
+        final_chance = self.modifiers.get("customer_chance") * rep_modifier
 
         r = random.random()
         if r < final_chance * 0.5:
@@ -672,6 +977,9 @@ class GameEngine:
         if num_orders == 0:
             return messages
 
+        demand = self.get_demand_forecaster()
+        arrival_time = self.get_sim_time()
+
         def create_order(client_id: int):
             try:
                 available = []
@@ -697,30 +1005,28 @@ class GameEngine:
 
                     order_id = self.next_order_id
                     self.next_order_id += 1
-                    order = {
-                        "id": order_id,
-                        "recipe_id": recipe['id'],
-                        "recipe_name": recipe['name'],
-                        "quantity": qty,
-                        "remaining": qty,
-                        "arrival_hour": self.current_hour
-                    }
-                    self.order_queue.append(order)
+                    self.order_queue.append(Order(order_id, self.recipe_codes.encode(recipe['id']), qty, self.current_hour, arrival_time))
+                    demand.record_order(recipe['id'], qty)
+                    self.mark_dirty("orders")
 
                 print(f"   📞 CLIENTE {client_id}: Ordine #{order_id} - {qty}x {recipe['name']}")
 
             except Exception as e:
                 print(f"   Errore cliente {client_id}: {e}")
 
-        threads = []
-        for i in range(1, num_orders + 1):
-            t = threading.Thread(target=create_order, args=(i,), daemon=True)
-            t.start()
-            threads.append(t)
-            time.sleep(0.15 + random.random() * 0.4)
+        if self.simulate_delays:
+            threads = []
+            for i in range(1, num_orders + 1):
+                t = threading.Thread(target=create_order, args=(i,), daemon=True)
+                t.start()
+                threads.append(t)
+                time.sleep(0.15 + random.random() * 0.4)
 
-        for t in threads:
-            t.join()
+            for t in threads:
+                t.join()
+        else:
+            for i in range(1, num_orders + 1):
+                create_order(i)
 
         messages.append(f"   📞 Arrivati {num_orders} nuovo/i ordine/i concorrenti!")
         return messages
@@ -737,7 +1043,7 @@ class GameEngine:
         if self.order_queue:
             messages.append(f"\n📋 CODA ORDINI ({len(self.order_queue)} in attesa):")
             for i, order in enumerate(self.order_queue[:6]):
-                messages.append(f"   {i+1}. Ordine #{order['id']}: {order['remaining']}/{order['quantity']}x {order['recipe_name']}")
+                messages.append(f"   {i+1}. Ordine #{order.id}: {order.remaining}/{order.quantity}x {self.recipe_codes.name(order.recipe)}")
             if len(self.order_queue) > 6:
                 messages.append(f"   ... e altri {len(self.order_queue)-6} ordini")
         else:
@@ -749,11 +1055,14 @@ class GameEngine:
         '''
         Come parametro riceve esplicitamente il percorso dell'ingrediente (stringa) e quantità (int) oltre all'istanza della classe GameEngine (self implicito).
         Gestisce l'acquisto di ingredienti.
-        In particolare, calcola costo totale, verifica fondi, sottrae denaro con finance, aggiunge a inventory e aggiorna contatori totali.
+        In particolare, verifica che l'ingrediente esista, calcola costo totale, verifica fondi, sottrae denaro con finance, aggiunge a inventory e aggiorna contatori totali.
         Restituisce True e messaggio di successo o ppure False ed errore.
         '''
         if not self.inventory:
             return False, "Inventory missing"
+
+        if not self.inventory.get_ingredient(ingredient_path):
+            return False, "Ingrediente non trovato"
         
         unit = self.inventory.get_unit_cost(ingredient_path)
         cost = unit * qty
@@ -764,17 +1073,118 @@ class GameEngine:
         ok = self.finance.buy_ingredient(cost, ingredient_path, qty)
         if ok:
             self.inventory.add_ingredient(ingredient_path, qty)
+            self.mark_dirty("inventory")
             self.total_ingredients_purchased += qty
             self.total_spent_on_ingredients += cost
             return True, f"Acquistato {qty}x {ingredient_path} per €{cost:.2f}"
         return False, "Errore pagamento"
 
+    def get_restock_planner(self) -> RestockPlanner:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno RestockPlanner.
+        Restituisce il pianificatore di rifornimento, creandolo al primo uso o ricreandolo se inventory, recipes o finance sono stati sostituiti
+        (nuova partita o caricamento).
+        '''
+        planner = self._restock_planner
+        if (planner is None or planner.inventory is not self.inventory
+                or planner.recipes is not self.recipes or planner.finance is not self.finance):
+            planner = RestockPlanner(self.inventory, self.recipes, self.finance, self.restock_target_units)
+            self._restock_planner = planner
+        return planner
+
+    def get_demand_forecaster(self) -> DemandForecaster:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno DemandForecaster.
+        Restituisce il modello di previsione della domanda, creandolo al primo uso sulle ricette del catalogo.
+        '''
+        if self._demand_forecaster is None:
+            self._demand_forecaster = DemandForecaster(self.recipes.get_all_recipes().keys(), self.demand_alpha, self.demand_prior)
+        return self._demand_forecaster
+
+    def get_demand_weights(self) -> Dict[str, float]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno Dict[str, float].
+        Restituisce i panini attesi per ogni ricetta sbloccata nelle ore lavorative rimanenti della giornata
+        (o nell'intera giornata successiva se quella corrente è finita), da usare come pesi per rifornimento e cucina.
+        '''
+        start = self.current_hour + 1
+        if start > self.working_end:
+            start = self.working_start
+        return self.get_demand_forecaster().forecast_window(start, self.working_end, self.unlocked_recipes)
+
+    def auto_restock(self, budget: Optional[float] = None):
+        '''
+        Come parametro riceve esplicitamente budget (Optional[float], se None usa il saldo meno i costi giornalieri) oltre all'istanza della classe GameEngine (self implicito).
+        Esegue il rifornimento automatico ottimizzato sul budget per le sole ricette sbloccate, pesate con la domanda prevista,
+        con un unico addebito in finance e un unico aggiornamento dell'inventario.
+        Restituisce successo, messaggio e costo totale speso.
+        '''
+        if not self.inventory or not self.recipes or not self.finance:
+            return False, "Partita non inizializzata", 0.0
+        result = self.get_restock_planner().restock(budget, self.unlocked_recipes, self.get_demand_weights())
+        if result[0]:
+            self.mark_dirty("inventory")
+        return result
+
+    def buy_upgrade(self, upgrade_id: str) -> Tuple[bool, str]:
+        '''
+        Come parametro riceve esplicitamente l'id dell'upgrade (stringa: "upgrade_kitchen", "new_employee" o "new_recipe") oltre all'istanza della classe GameEngine (self implicito)
+        e ha tipo di ritorno Tuple[bool, str].
+        Acquista un upgrade senza interazione con l'utente (usata dalla GUI tramite il SimulationWorker).
+        In particolare, calcola il costo attuale (aumento del 15% per livello), verifica livello massimo e fondi, sottrae il denaro,
+        sblocca una ricetta segreta casuale oppure aumenta il livello e ricalcola la capacità cucina, controlla gli achievement e salva.
+        Restituisce True e il messaggio da mostrare, oppure False e il motivo del rifiuto.
+        '''
+        current_count = 0 if upgrade_id == "new_recipe" else self.upgrade_counts.get(upgrade_id, 0)
+        actual_cost = self.upgrade_costs.get(upgrade_id, 0) * (1.0 + current_count * 0.15)
+
+        if upgrade_id == "new_recipe":
+            if upgrade_id in self.unlocked_upgrades:
+                return False, "Questa ricetta è già sbloccata!"
+        elif upgrade_id not in UPGRADE_MAX_LEVELS:
+            return False, f"Upgrade sconosciuto: {upgrade_id}"
+        elif current_count >= UPGRADE_MAX_LEVELS[upgrade_id]:
+            return False, f"Hai raggiunto il livello massimo per questo upgrade! ({current_count}/{UPGRADE_MAX_LEVELS[upgrade_id]})"
+
+        balance = self.finance.get_balance()
+        if balance < actual_cost:
+            return False, f"Fondi insufficienti!\nNecessari: €{actual_cost:.2f}\nDisponibili: €{balance:.2f}"
+
+        success, msg = self.finance.subtract_money(actual_cost, f"Upgrade {upgrade_id}")
+        if not success:
+            return False, f"Errore transazione: {msg}"
+
+        if upgrade_id == "new_recipe":
+            self.unlocked_upgrades.append(upgrade_id)
+            available = [rid for rid in self.recipes.get_secret_recipes() if rid not in self.unlocked_recipes]
+            if not available:
+                self.safe_save()
+                return True, "Nessuna altra ricetta segreta disponibile!"
+
+            new = random.choice(available)
+            self.unlocked_recipes.append(new)
+            name = self.recipes.get_recipe(new).get("name", new)
+            print(f"\033[33m📚 Nuova ricetta sbloccata: {name}!\033[0m")
+            message = f"📚 Nuova ricetta sbloccata:\n{name}!"
+        else:
+            self.upgrade_counts[upgrade_id] = current_count + 1
+
+            self._refresh_upgrade_modifiers()
+
+            self.update_achievement_counter(upgrade_id, self.upgrade_counts[upgrade_id])
+
+            message = (f"Livello: {self.upgrade_counts[upgrade_id]}/{UPGRADE_MAX_LEVELS[upgrade_id]}\n"
+                       f"Nuova capacità cucina: {self.kitchen_capacity} panini/ora")
+
+        self.safe_save()
+        return True, message
+
     def show_upgrade_menu(self) -> None:
         '''
         Come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno None.
         Mostra il menu upgrade in modalità console.
         In particolare, stampa lista upgrade con costo attuale (aumento progressivo), livello corrente e massimo,
-        permette acquisto con conferma, gestisce fondi insufficienti e aggiorna capacità e achievement.
+        legge la scelta e la acquista con buy_upgrade() (la stessa usata dalla GUI), stampando il messaggio restituito o il motivo del rifiuto.
         '''
         print("\n" + "🔧" * 20)
         print("UPGRADE DISPONIBILI")
@@ -786,7 +1196,7 @@ class GameEngine:
                 "id": "upgrade_kitchen", 
                 "base_cost": self.upgrade_costs.get("upgrade_kitchen", 0),
                 "current_count": self.upgrade_counts.get("upgrade_kitchen", 0),
-                "max_level": 5  
+                "max_level": UPGRADE_MAX_LEVELS["upgrade_kitchen"]
             },
             {
                 "desc": "📚 Nuova ricetta",
@@ -800,7 +1210,7 @@ class GameEngine:
                 "id": "new_employee",
                 "base_cost": self.upgrade_costs.get("new_employee", 0),
                 "current_count": self.upgrade_counts.get("new_employee", 0),
-                "max_level": 3 
+                "max_level": UPGRADE_MAX_LEVELS["new_employee"]
             }
         ]
 
@@ -842,63 +1252,14 @@ class GameEngine:
             return
 
         upgrade = upgrades_info[choice - 1]
-        upgrade_id = upgrade["id"]
-        current_count = upgrade["current_count"]
-        max_level = upgrade["max_level"]
-        
-        cost_multiplier = 1.0 + (current_count * 0.15)
-        actual_cost = upgrade["base_cost"] * cost_multiplier
-
-        if upgrade_id == "new_recipe":
-            if upgrade_id in self.unlocked_upgrades:
-                print("⚠️ Questa ricetta è già sbloccata!")
-                return
-                
-        else:
-            if current_count >= max_level:
-                print(f"❌ Hai raggiunto il livello massimo per questo upgrade! ({current_count}/{max_level})")
-                return
-
-        if self.finance.get_balance() < actual_cost:
-            print(f"❌ Fondi insufficienti! Servono €{actual_cost:.2f}")
-            return
-
-        success, msg = self.finance.subtract_money(actual_cost, f"Upgrade {upgrade_id}")
+        success, msg = self.buy_upgrade(upgrade["id"])
         if not success:
-            print(f"❌ Errore transazione: {msg}")
+            print(f"❌ {msg}")
             return
 
-        if upgrade_id == "new_recipe":
-            self.unlocked_upgrades.append(upgrade_id)
-            all_secret = self.recipes.get_secret_recipes()
-            available = [rid for rid in all_secret if rid not in self.unlocked_recipes]
-            
-            if not available:
-                print("ℹ️ Nessuna altra ricetta segreta disponibile!")
-                return
-                
-            new = random.choice(available)
-            self.unlocked_recipes.append(new)
-            name = self.recipes.get_recipe(new).get("name", new)
-            print(f"\033[33m📚 Nuova ricetta sbloccata: {name}!\033[0m")
-            
-        else:
-            self.upgrade_counts[upgrade_id] = current_count + 1
-            
-            self.kitchen_capacity = 1  
-            self.kitchen_capacity += self.upgrade_counts.get("upgrade_kitchen", 0)
-            self.kitchen_capacity += self.upgrade_counts.get("new_employee", 0)
-            
-            print(f"✅ {upgrade['desc']} ACQUISTATO!")
-            print(f"   Livello: {self.upgrade_counts[upgrade_id]}/{max_level}")
-            print(f"   Capacità cucina ora: {self.kitchen_capacity} panini/ora")
-            
-            if upgrade_id == "upgrade_kitchen" and self.upgrade_counts[upgrade_id] >= 3:
-                self.check_achievement("non_è_la_centralina!")
-            elif upgrade_id == "new_employee" and self.upgrade_counts[upgrade_id] >= 2:
-                self.check_achievement("piccola_squadra!")
-
-        self.safe_save()
+        print(f"✅ {upgrade['desc']} ACQUISTATO!")
+        for line in msg.splitlines():
+            print(f"   {line}")
 
     def advance_hour(self) -> None:
         '''
@@ -915,10 +1276,12 @@ class GameEngine:
                 
         self.check_game_over()
         if self.game_over:
+            self.publish_state()
             return
 
         if self.current_hour > self.working_end:
             self.end_day()
+            self.publish_state()
             return
  
         print(f"\n{'='*50}")
@@ -941,9 +1304,17 @@ class GameEngine:
         
         self.check_and_trigger_events()
 
+        if self.auto_restock_hourly:
+            success, msg, _ = self.auto_restock()
+            if success:
+                print(f"\n🚚 {msg}")
+
         order_messages = self.simulate_new_orders()
+        self.get_demand_forecaster().close_hour(self.current_hour)
+        self.mark_dirty("demand")
         
         preparation_messages = self.process_kitchen_work()
+        self._flush_history()
 
         if preparation_messages:
             print("\n👨‍🍳 PREPARAZIONE:")
@@ -961,10 +1332,10 @@ class GameEngine:
 
         daily_stats = self.finance.state['daily_stats']
         print(f"\n💼 FINANZE OGGI:")
-        print(f"   Incassi: €{daily_stats.get('revenue', 0):.2f}")
-        print(f"   Spese: €{daily_stats.get('expenses', 0):.2f}")
-        print(f"   Profitto: €{daily_stats.get('profit', 0):.2f}")
-        print(f"   Tassa Giornaliera: €{self.finance.daily_costs.get('daily_tax', 75.0):.2f}")
+        print(f"   Incassi: €{to_euros(daily_stats.get('revenue', 0)):.2f}")
+        print(f"   Spese: €{to_euros(daily_stats.get('expenses', 0)):.2f}")
+        print(f"   Profitto: €{to_euros(daily_stats.get('profit', 0)):.2f}")
+        print(f"   Tassa Giornaliera: €{to_euros(self.finance.daily_costs.get('tax', 0)):.2f}")
 
         if self.current_hour % 3 == 0 or self.current_hour == self.working_start:
             print(f"\n📦 INVENTARIO (scorte basse):")
@@ -979,7 +1350,8 @@ class GameEngine:
         if not self.gui_mode:
             print(f"\n{'='*50}")
             print("INVIO=continua, U=upgrade, S=shop, I=inventario, Q=esci")
-        
+
+        self.publish_state()
         
     def end_day(self) -> None:
         '''
@@ -987,6 +1359,7 @@ class GameEngine:
         Gestisce la fine della giornata di lavoro.
         In particolare, applica costi giornalieri con finance, controlla game over/vittoria,
         incrementa giorno, resetta ora e statistiche giornaliere, salva stato e mostra banner nuovo giorno.
+        Se la strumentazione della memoria è attiva (memory_profiler) registra anche l'istantanea di fine giornata.
         '''  
         try:
             print(f"\n{'='*60}")
@@ -995,9 +1368,21 @@ class GameEngine:
             
             self._ending_day = True  
             
+            day_stats = dict(self.finance.state['daily_stats'])
             success, msg, details = self.finance.apply_daily_costs()
             if success:
                 print(f"✅ {msg}")
+
+            self.get_demand_forecaster().close_day()
+
+            for order in self.order_queue:
+                self.order_metrics.record_dropped(self.recipe_codes.decode(order.recipe), self.current_game_day)
+                self._record_order_history(order, "dropped")
+            self.mark_dirty("demand", "metrics")
+            self._record_day_history(day_stats, details.get('total_cost', 0))
+            self.print_latency_summary(self.current_game_day)
+            if self.memory_profiler:
+                self.memory_profiler.record_day(self.current_game_day)
                            
             self.check_game_over()
             if self.game_over:
@@ -1014,6 +1399,7 @@ class GameEngine:
             self.orders_preparing.clear()
             self.current_preparation_count = 0
             self.hours_since_last_event = 0
+            self.mark_dirty("orders")
                         
             print(f"\n{'🔔'*20}")
             print(f"📅 GIORNO {self.current_game_day} INIZIATO!".center(60))
@@ -1030,6 +1416,19 @@ class GameEngine:
         finally:
             self._ending_day = False
             
+    def print_latency_summary(self, day: int) -> None:
+        '''
+        Come parametro riceve esplicitamente il giorno (int) oltre all'istanza della classe GameEngine (self implicito) e ha tipo di ritorno None.
+        Stampa nel report di fine giornata le latenze degli ordini del giorno: attesa in coda, tempo di completamento e tasso di timeout.
+        '''
+        summary = self.get_latency_report(day=day)
+        wait = summary['queue_wait']
+        complete = summary['time_to_complete']
+        print(f"\n⏱️ LATENZA ORDINI (giorno {day}):")
+        print(f"   Attesa in coda: media {wait['mean']:.1f}h | p90 {wait['p90']:.0f}h | max {wait['max']:.0f}h")
+        print(f"   Completamento: media {complete['mean']:.1f}h | p90 {complete['p90']:.0f}h | completati {summary['completed']}")
+        print(f"   Scaduti: {summary['timeouts']} | Abbandonati a fine giornata: {summary['dropped']} | Tasso timeout: {summary['timeout_rate_percent']:.1f}%")
+
     def check_game_over(self) -> None:
         '''
         Come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno None.
@@ -1139,10 +1538,8 @@ class GameEngine:
 
             if cmd == "auto":
                 budget = min(200, balance)
-                success, msg, cost = self.inventory.auto_restock_low_items(budget)
-                if success:
-                    self.finance.subtract_money(cost, "Rifornimento automatico")
-                    print(f"✅ {msg}")
+                success, msg, cost = self.auto_restock(budget)
+                print(f"✅ {msg}" if success else f"ℹ️ {msg}")
                 continue
 
             parts = cmd.split()
@@ -1203,6 +1600,15 @@ class GameEngine:
         print(f"👨‍🍳 Capacità cucina: {self.kitchen_capacity} panini/ora")
         print("="*50)
 
+    def run_script(self, commands: Iterable[str], output: Optional[TextIO] = None, stop_on_error: bool = False) -> List[Tuple[int, str, bool, str]]:
+        '''
+        Come parametri riceve esplicitamente i comandi (Iterable[str], un file aperto o una lista di righe), output (Optional[TextIO], None per scartare l'output del gioco)
+        e stop_on_error (bool) oltre all'istanza della classe GameEngine (self implicito) e ha tipo di ritorno List[Tuple[int, str, bool, str]].
+        Alternativa non interattiva a run(): esegue uno script di comandi (new, advance, day, buy, upgrade, restock, save, expect, ...) direttamente sui metodi del motore
+        con ScriptRunner, senza menu né input(). Restituisce numero di riga, comando, esito e messaggio di ogni comando eseguito.
+        '''
+        return ScriptRunner(self).run(commands, output, stop_on_error)
+
     def run(self) -> None:
         '''
         Come parametro riceve implicitamente solo l'istanza della classe GameEngine e ha tipo di ritorno None.
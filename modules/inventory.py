@@ -12,15 +12,18 @@ List corrisponde ad una lista
 from datetime import datetime # Classe datetime importata dal modulo datetime usata per salvare timestamp dell' ultimo salvataggio o aggiornamento 
 
 class Inventory:
-    def __init__(self, ingredients_file: str = 'data/ingredients.json', load_saved: bool = False):
+    def __init__(self, ingredients_file: str = 'data/ingredients.json', load_saved: bool = False, data: Optional[Dict[str, Any]] = None):
         '''
-        Come parametro riceve esplicitamente il file JSON su cui sono salvati gli ingredienti (stringa, con default 'data/ingredients.json') 
-        e load_saved (bool, con False come valore di default), oltre a ricevere implicitamente l'stanza della classe Inventory (self).
+        Come parametro riceve esplicitamente il file JSON su cui sono salvati gli ingredienti (stringa, con default 'data/ingredients.json'), 
+        load_saved (bool, con False come valore di default) e data (Optional[Dict[str, Any]], inventario già letto da un salvataggio, con None come valore di default),
+        oltre a ricevere implicitamente l'stanza della classe Inventory (self).
         Costruttore della classe Inventory che si occupa di inizializzare le strutture dati principali:
         In particolare: ingredients_file: percorso del file JSON, data: dizionario che conterrà la struttura completa dell'inventario, flat_cache: cache piatta per 
-        accesso rapido per nome, lock: threading.Lock() per garantire thread-safety, last_save_time: timestamp dell'ultimo salvataggio e stats: dizionario con statistiche 
+        accesso rapido per nome, lock: threading.Lock() per garantire thread-safety, last_save_time: timestamp dell'ultimo salvataggio, autosave: se False gli acquisti
+        non riscrivono il file JSON (partite tenute solo in memoria, vedi GameEngine persistent) e stats: dizionario con statistiche 
         riassuntive (cioè totale ingredienti, valore, ultimo aggiornamento)        
-        Infine, in base al valore di load_saved: se True: chiama load_data() (carica i dati salvati dalla partita precedente), invece
+        Infine, se data è fornito lo usa direttamente senza leggere il file (caricamento da istantanea), altrimenti in base al valore di load_saved:
+        se True: chiama load_data() (carica i dati salvati dalla partita precedente), invece
         se False: chiama load_default_data() (carica i valori di default e resetta le quantità)  
         Alla fine costruisce la cache piatta chiamando build_flat_cache().
         '''
@@ -29,6 +32,7 @@ class Inventory:
         self.flat_cache: Dict[str, Dict] = {}
         self.lock = threading.Lock()
         self.last_save_time = datetime.now()
+        self.autosave = True
         
         self.stats = {
             'total_ingredients': 0,
@@ -36,7 +40,10 @@ class Inventory:
             'last_updated': datetime.now().isoformat()
         }
         
-        if load_saved:
+        if data is not None:
+            self.data = data
+            self.data.setdefault("ingredients", {})
+        elif load_saved:
             self.load_data()
         else:
             self.load_default_data()
@@ -370,7 +377,7 @@ class Inventory:
         Funzione che come parametro riceve implicitamente l'istanza della classe Inventory, il percorso dell'ingrediente (str), la quantità (int) e ha tipo di ritorno bool.
         Aggiunge una quantità specifica a un ingrediente. 
         In particolare, verifica quantità positiva e esistenza ingrediente. 
-        Successivamente, entra in sezione protetta da lock: aumenta current_quantity, salva su disco, aggiorna statistiche e 
+        Successivamente, entra in sezione protetta da lock e aumenta current_quantity; fuori dal lock (save_data() lo riacquisisce) salva su disco se autosave è attivo, aggiorna statistiche e 
         restituisce True se l'operazione è riuscita, altrimenti False.
         '''
         if quantity <= 0:
@@ -379,7 +386,8 @@ class Inventory:
         ingredient = self.get_ingredient(ingredient_path)
         if not ingredient:
             return False
-                
+
+        added = False
         with self.lock:
             try:
                 parts = ingredient_path.split('.')
@@ -389,15 +397,41 @@ class Inventory:
                             
                     if (category in self.data['ingredients'] and ingredient_name in self.data['ingredients'][category]):
                         self.data['ingredients'][category][ingredient_name]['current_quantity'] += quantity
-                    
-                        self.save_data()
-                        self._update_stats()
-                        
-                        display_name = ingredient.get('display_name', ingredient_path)
-                    
-                        return True
+                        added = True
                 
             except Exception as e:
                 return False
-                
-        return False
+
+        if added:
+            if self.autosave:
+                self.save_data()
+            self._update_stats()
+        return added
+
+    def add_ingredients_batch(self, quantities: Dict[str, int]) -> int:
+        '''
+        Funzione che come parametro riceve implicitamente l'istanza della classe Inventory, un dizionario percorso -> quantità (Dict[str, int]) e ha tipo di ritorno int.
+        Aggiunge in un colpo solo le quantità di più ingredienti (usata dal rifornimento automatico).
+        In particolare, aggiorna tutte le current_quantity in un'unica sezione protetta da lock, ignorando percorsi inesistenti o quantità non positive,
+        poi salva su disco (se autosave è attivo) e aggiorna le statistiche una sola volta invece che per ogni ingrediente.
+        Restituisce il numero di ingredienti aggiornati.
+        '''
+        updated = 0
+        with self.lock:
+            ingredients = self.data.get('ingredients', {})
+            for ingredient_path, quantity in quantities.items():
+                if quantity <= 0:
+                    continue
+                parts = ingredient_path.split('.')
+                if len(parts) != 2:
+                    continue
+                category, ingredient_name = parts
+                if category in ingredients and ingredient_name in ingredients[category]:
+                    ingredients[category][ingredient_name]['current_quantity'] += quantity
+                    updated += 1
+
+        if updated:
+            self._update_stats()
+            if self.autosave:
+                self.save_data()
+        return updated
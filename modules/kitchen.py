@@ -0,0 +1,107 @@
+from typing import List, Any #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+List corrisponde ad una lista
+Any corrisponde ad un tipo generico (cioè accetta qualsiasi valore)
+'''
+from .orders import Order #importazione della classe degli ordini in coda dal modulo locale
+
+
+class SchedulingPolicy:
+    '''
+    Classe base delle politiche di schedulazione della cucina.
+    Una politica riceve la coda ordini e restituisce gli stessi ordini nell'ordine in cui la cucina deve servirli;
+    la cucina poi prepara le unità di ogni ordine fino ad esaurire la capacità oraria, saltando gli ordini senza ingredienti.
+    units_per_visit limita le unità preparate per ordine in ogni ora (None = l'ordine viene completato prima di passare al successivo).
+    Ogni politica ordina con sorted() e una chiave calcolata una sola volta per ordine, quindi costa O(n log n) per ora.
+    '''
+    name = "base"
+    description = ""
+    units_per_visit = None
+
+    def sort_key(self, order: Order, engine: Any):
+        '''
+        Come parametri riceve esplicitamente l'ordine (Order) e il motore di gioco (GameEngine) oltre all'istanza della politica (self implicito).
+        Restituisce la chiave di ordinamento dell'ordine (valori più piccoli vengono serviti prima); le sottoclassi la ridefiniscono,
+        di default l'ordine di arrivo (ora di arrivo e poi id).
+        '''
+        return (order.arrival_hour, order.id)
+
+    def prioritize(self, orders: List[Order], engine: Any) -> List[Order]:
+        '''
+        Come parametri riceve esplicitamente la coda ordini (List[Order]) e il motore di gioco (GameEngine) oltre all'istanza della politica (self implicito)
+        e ha tipo di ritorno List[Order].
+        Restituisce una nuova lista con gli ordini nell'ordine di servizio, senza modificare la coda originale.
+        '''
+        return sorted(orders, key=lambda order: self.sort_key(order, engine))
+
+
+class FIFOPolicy(SchedulingPolicy):
+    '''
+    Politica FIFO: serve gli ordini nell'ordine di arrivo con un solo passaggio sulla coda e un panino per ordine,
+    quindi la capacità oraria viene divisa tra gli ordini in attesa (comportamento storico del gioco).
+    '''
+    name = "fifo"
+    description = "Primo arrivato, primo servito"
+    units_per_visit = 1
+
+    def prioritize(self, orders: List[Order], engine: Any) -> List[Order]:
+        return list(orders)
+
+
+class EarliestDeadlinePolicy(SchedulingPolicy):
+    '''
+    Politica EDF (earliest deadline first): serve prima gli ordini più vicini alla scadenza (arrival_hour + order_timeout),
+    a parità di scadenza in ordine di arrivo.
+    '''
+    name = "edf"
+    description = "Prima la scadenza più vicina"
+
+    def sort_key(self, order: Order, engine: Any):
+        return (order.arrival_hour + engine.order_timeout, order.id)
+
+
+class MaxProfitPolicy(SchedulingPolicy):
+    '''
+    Politica a profitto massimo: serve prima gli ordini con il guadagno unitario più alto
+    (prezzo × moltiplicatore di difficoltà − costo ingredienti), a parità di guadagno quelli con meno unità rimanenti.
+    '''
+    name = "profit"
+    description = "Prima i panini più redditizi"
+
+    def sort_key(self, order: Order, engine: Any):
+        return (-engine.get_unit_profit(engine.recipe_codes.decode(order.recipe)), order.remaining, order.id)
+
+
+class MinExpiryLossPolicy(SchedulingPolicy):
+    '''
+    Politica a minima perdita per scadenza: ogni ordine scaduto costa reputazione indipendentemente dalla sua dimensione,
+    quindi tra gli ordini con la stessa scadenza serve prima quelli con meno unità rimanenti (si salvano più ordini con la stessa capacità),
+    e a parità anche di unità quelli più redditizi.
+    '''
+    name = "expiry"
+    description = "Minimizza gli ordini scaduti"
+
+    def sort_key(self, order: Order, engine: Any):
+        deadline = order.arrival_hour + engine.order_timeout
+        return (deadline, order.remaining, -engine.get_unit_profit(engine.recipe_codes.decode(order.recipe)), order.id)
+
+
+KITCHEN_POLICIES = {
+    FIFOPolicy.name: FIFOPolicy,
+    EarliestDeadlinePolicy.name: EarliestDeadlinePolicy,
+    MaxProfitPolicy.name: MaxProfitPolicy,
+    MinExpiryLossPolicy.name: MinExpiryLossPolicy
+} # registro delle politiche disponibili, indicizzate per nome (usato dalla chiave "kitchen.policy" di config.json)
+
+
+def get_policy(name: str) -> SchedulingPolicy:
+    '''
+    Come parametro riceve esplicitamente il nome della politica (stringa) e ha tipo di ritorno SchedulingPolicy.
+    Restituisce una nuova istanza della politica richiesta; se il nome non è registrato stampa un avviso e usa FIFO.
+    '''
+    policy_class = KITCHEN_POLICIES.get(name)
+    if policy_class is None:
+        print(f"⚠️ Politica cucina '{name}' sconosciuta, uso '{FIFOPolicy.name}'")
+        policy_class = FIFOPolicy
+    return policy_class()
@@ -0,0 +1,189 @@
+import os #importazione del modulo necessario per operazioni sul sistema operativo (percorso della cartella modules/ per filtrare le allocazioni)
+import tracemalloc #importazione del modulo tracemalloc: istantanee delle allocazioni Python con il punto del codice che le ha fatte
+from typing import Dict, Any, List, Optional, Tuple #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+Any corrisponde ad un tipo generico (cioè accetta qualsiasi valore)
+List corrisponde ad una lista
+Optional corrisponde ad un valore che può essere None
+Tuple corrisponde ad una tupla (sequenza immutabile di valori)
+'''
+
+MODULES_DIR = os.path.dirname(os.path.abspath(__file__)) # cartella modules/: le allocazioni sono attribuite al punto più recente del codice in questa cartella
+DEFAULT_FRAMES = 4 # profondità delle tracce: basta a risalire da json, datetime, ... fino alla riga di modules/ che li ha chiamati; tracce più profonde rallentano molto le istantanee
+
+
+def collect_counts(engine: Any) -> Dict[str, int]:
+    '''
+    Come parametro riceve esplicitamente engine (GameEngine) e ha tipo di ritorno Dict[str, int].
+    Restituisce il numero di elementi delle strutture che possono crescere durante la partita, per sottosistema:
+    coda e preparazione ordini, ordini da scrivere nello storico, transazioni di Finance, giorni dello storico finanziario, conteggi e cache delle ricette,
+    cache dell'inventario, giorni e ricette delle metriche di latenza, conteggi aperti del modello di domanda, eventi attivi, achievement sbloccati e sottoscrittori.
+    I componenti non ancora creati (partita non iniziata) sono saltati.
+    '''
+    counts = {
+        "orders.queue": len(engine.order_queue),
+        "orders.preparing": len(engine.orders_preparing),
+        "orders.history_pending": len(engine._history_orders),
+        "metrics.days": len(engine.order_metrics.by_day),
+        "metrics.recipes": len(engine.order_metrics.by_recipe),
+        "events.active": len(engine.active_events),
+        "achievements.unlocked": len(engine.achievements_unlocked),
+        "observable.subscribers": len(engine.observable.subscribers)
+    }
+    if engine.finance:
+        counts["finance.transactions"] = len(engine.finance.transactions)
+        counts["finance.daily_transactions"] = sum(len(items) for items in engine.finance.daily_transactions.values())
+        counts["finance.history_days"] = len(engine.finance.history)
+    if engine.recipes:
+        counts["recipes.recipe_counts"] = len(getattr(engine.recipes, "recipe_counts", {}))
+        counts["recipes.recipe_cache"] = len(engine.recipes.recipe_cache)
+        counts["recipes.price_cache"] = len(engine.recipes.price_cache)
+    if engine.inventory:
+        counts["inventory.flat_cache"] = len(engine.inventory.flat_cache)
+    if engine._demand_forecaster is not None:
+        counts["demand.open_counts"] = len(engine._demand_forecaster._hour_counts) + len(engine._demand_forecaster._day_counts)
+    return counts
+
+
+class MemoryProfiler:
+    def __init__(self, engine: Any, top: int = 10, alert_mb: float = 0.0, alert_growth_kb: float = 0.0, frames: int = DEFAULT_FRAMES):
+        '''
+        Come parametri riceve esplicitamente engine (GameEngine), top (int, punti del codice riportati per giorno), alert_mb (float, memoria totale allocata da modules/ oltre cui scatta l'allarme, 0 = nessuno),
+        alert_growth_kb (float, crescita giornaliera oltre cui scatta l'allarme, 0 = nessuno) e frames (int, profondità delle tracce) oltre all'istanza della classe MemoryProfiler (self implicito).
+        Strumentazione della memoria facoltativa (attivata con profiling.memory in config.json o da tools/memory_profile.py): a fine giornata il GameEngine chiama record_day(),
+        che prende un'istantanea tracemalloc, la confronta con quella del giorno precedente e attribuisce la crescita al punto più recente del codice in modules/
+        (riga e sottosistema, cioè il file), insieme ai conteggi di collect_counts(). Ogni superamento delle soglie viene stampato e aggiunto ad alerts (per le prove di carico in CI).
+        Le istantanee costano tempo e memoria: da non attivare nelle partite normali.
+        '''
+        self.engine = engine
+        self.top = top
+        self.alert_bytes = int(alert_mb * 1024 * 1024)
+        self.alert_growth_bytes = int(alert_growth_kb * 1024)
+        self.frames = frames
+        self.reports: List[Dict[str, Any]] = []
+        self.alerts: List[str] = []
+        self._first: Optional[tracemalloc.Snapshot] = None
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._previous_counts: Dict[str, int] = {}
+        self._owns_tracing = False
+
+    def start(self) -> None:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe MemoryProfiler e ha tipo di ritorno None (non restituisce nulla).
+        Avvia tracemalloc (se non è già attivo) e prende l'istantanea di partenza: la crescita del primo giorno è misurata da qui.
+        '''
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._owns_tracing = True
+        self._first = self._previous = self._take_snapshot()
+        self._previous_counts = collect_counts(self.engine)
+
+    def stop(self) -> None:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe MemoryProfiler e ha tipo di ritorno None (non restituisce nulla).
+        Ferma tracemalloc se era stato avviato da start() e libera le istantanee.
+        '''
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+        self._first = self._previous = None
+
+    def _take_snapshot(self) -> tracemalloc.Snapshot:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe MemoryProfiler e ha tipo di ritorno tracemalloc.Snapshot.
+        Prende un'istantanea con le sole allocazioni che hanno almeno un punto della traccia in modules/, escluse quelle del profiler stesso (istantanee e report).
+        '''
+        return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(True, os.path.join(MODULES_DIR, "*"), all_frames=True),
+                                                          tracemalloc.Filter(False, os.path.abspath(__file__), all_frames=True)])
+
+    @staticmethod
+    def _site(traceback: tracemalloc.Traceback) -> Tuple[str, int]:
+        '''
+        Funzione privata che come parametro riceve la traccia di un'allocazione e ha tipo di ritorno Tuple[str, int].
+        Restituisce file (relativo a modules/) e riga del punto più recente della traccia che si trova in modules/.
+        '''
+        for frame in reversed(traceback):
+            if frame.filename.startswith(MODULES_DIR):
+                return os.path.relpath(frame.filename, MODULES_DIR), frame.lineno
+        return traceback[-1].filename, traceback[-1].lineno
+
+    def compare(self, old: tracemalloc.Snapshot, new: tracemalloc.Snapshot) -> Tuple[Dict[str, List[int]], List[Tuple[str, int, int]]]:
+        '''
+        Come parametri riceve esplicitamente due istantanee (la più vecchia e la più recente) oltre all'istanza della classe MemoryProfiler (self implicito)
+        e ha tipo di ritorno Tuple[Dict[str, List[int]], List[Tuple[str, int, int]]].
+        Restituisce per sottosistema [byte attuali, crescita in byte, crescita in blocchi] e i top punti del codice ("file:riga", crescita in byte, crescita in blocchi)
+        ordinati per crescita decrescente.
+        '''
+        subsystems: Dict[str, List[int]] = {}
+        sites: Dict[str, List[int]] = {}
+        for diff in new.compare_to(old, "traceback"):
+            filename, lineno = self._site(diff.traceback)
+            subsystem = subsystems.setdefault(os.path.splitext(filename)[0], [0, 0, 0])
+            subsystem[0] += diff.size
+            subsystem[1] += diff.size_diff
+            subsystem[2] += diff.count_diff
+            site = sites.setdefault(f"{filename}:{lineno}", [0, 0])
+            site[0] += diff.size_diff
+            site[1] += diff.count_diff
+        top = sorted(((name, size, count) for name, (size, count) in sites.items() if size > 0), key=lambda item: -item[1])[:self.top]
+        return subsystems, top
+
+    def record_day(self, day: int) -> Dict[str, Any]:
+        '''
+        Come parametro riceve esplicitamente il giorno appena concluso (int) oltre all'istanza della classe MemoryProfiler (self implicito) e ha tipo di ritorno Dict[str, Any].
+        Prende l'istantanea di fine giornata e registra in reports: memoria allocata da modules/ e crescita dal giorno precedente (totale, per sottosistema, top punti del codice),
+        conteggi delle strutture e loro variazione. Controlla le soglie e stampa un riepilogo di una riga più gli eventuali allarmi.
+        '''
+        if self._previous is None:
+            self.start()
+        snapshot = self._take_snapshot()
+        subsystems, top = self.compare(self._previous, snapshot)
+        counts = collect_counts(self.engine)
+        traced = sum(values[0] for values in subsystems.values())
+        growth = sum(values[1] for values in subsystems.values())
+        report = {
+            "day": day,
+            "traced_bytes": traced,
+            "growth_bytes": growth,
+            "subsystems": {name: {"bytes": values[0], "growth_bytes": values[1], "growth_blocks": values[2]} for name, values in sorted(subsystems.items())},
+            "top_sites": top,
+            "counts": counts,
+            "counts_growth": {name: value - self._previous_counts.get(name, 0) for name, value in counts.items()}
+        }
+        self.reports.append(report)
+        self._previous = snapshot
+        self._previous_counts = counts
+
+        growing = sorted(((name, values[1]) for name, values in subsystems.items() if values[1] > 0), key=lambda item: -item[1])[:3]
+        print(f"🧠 Memoria giorno {day}: {traced / 1024:.0f} KB da modules/ ({growth / 1024:+.1f} KB)"
+              + (" | crescita: " + ", ".join(f"{name} {size / 1024:+.1f} KB" for name, size in growing) if growing else ""))
+
+        if self.alert_bytes and traced > self.alert_bytes:
+            self._alert(f"giorno {day}: {traced / 1048576:.1f} MB allocati da modules/ (soglia {self.alert_bytes / 1048576:.1f} MB)")
+        if self.alert_growth_bytes and len(self.reports) > 1 and growth > self.alert_growth_bytes:
+            where = top[0][0] if top else "?"
+            self._alert(f"giorno {day}: crescita {growth / 1024:.1f} KB (soglia {self.alert_growth_bytes / 1024:.0f} KB), soprattutto in {where}")
+        return report
+
+    def _alert(self, message: str) -> None:
+        self.alerts.append(message)
+        print(f"⚠️ ALLARME MEMORIA {message}")
+
+    def summary(self) -> Dict[str, Any]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe MemoryProfiler e ha tipo di ritorno Dict[str, Any].
+        Restituisce il confronto tra l'istantanea di partenza e l'ultima (crescita totale per sottosistema e top punti del codice su tutta la partita),
+        i giorni registrati, la crescita media giornaliera e gli allarmi.
+        '''
+        if self._first is None or not self.reports:
+            return {"days": 0, "subsystems": {}, "top_sites": [], "avg_growth_bytes": 0, "alerts": list(self.alerts)}
+        subsystems, top = self.compare(self._first, self._previous)
+        return {
+            "days": len(self.reports),
+            "subsystems": {name: {"bytes": values[0], "growth_bytes": values[1], "growth_blocks": values[2]} for name, values in sorted(subsystems.items())},
+            "top_sites": top,
+            "avg_growth_bytes": sum(values[1] for values in subsystems.values()) / len(self.reports),
+            "alerts": list(self.alerts)
+        }
@@ -0,0 +1,272 @@
+from array import array #importazione della classe array dal modulo standard array: contatori a dimensione fissa per i bucket degli istogrammi
+from collections import OrderedDict #importazione di OrderedDict per tenere solo gli ultimi giorni di statistiche (finestra a memoria costante)
+from typing import Dict, Any, List, Optional, Sequence #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+Any corrisponde ad un tipo generico (cioè accetta qualsiasi valore)
+List corrisponde ad una lista
+Optional corrisponde ad un valore che può essere None
+Sequence corrisponde ad una sequenza indicizzabile (lista o tupla)
+'''
+
+DEFAULT_BUCKETS = (0, 1, 2, 3, 4, 6, 8, 12) # limiti superiori (inclusi) dei bucket in ore simulate; i valori oltre l'ultimo finiscono nel bucket di overflow
+
+
+class LatencyHistogram:
+    def __init__(self, bounds: Sequence[int] = DEFAULT_BUCKETS):
+        '''
+        Come parametro riceve esplicitamente bounds (Sequence[int], limiti superiori dei bucket in ore) oltre all'istanza della classe LatencyHistogram (self implicito).
+        Istogramma a bucket fissi: occupa sempre la stessa memoria qualunque sia il numero di valori registrati.
+        In particolare mantiene i contatori per bucket (più uno di overflow), il numero di valori, la somma e il massimo.
+        '''
+        self.bounds = tuple(bounds)
+        self.counts = array('l', [0]) * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        '''
+        Come parametro riceve esplicitamente il valore da registrare (float, ore simulate) oltre all'istanza della classe LatencyHistogram (self implicito).
+        Incrementa il bucket corrispondente e aggiorna conteggio, somma e massimo.
+        '''
+        index = len(self.bounds)
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def mean(self) -> float:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe LatencyHistogram e ha tipo di ritorno float.
+        Restituisce la media dei valori registrati (0.0 se vuoto).
+        '''
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> float:
+        '''
+        Come parametro riceve esplicitamente p (float, tra 0 e 100) oltre all'istanza della classe LatencyHistogram (self implicito) e ha tipo di ritorno float.
+        Restituisce il limite superiore del bucket che contiene il percentile richiesto (per il bucket di overflow restituisce il massimo osservato).
+        '''
+        if not self.count:
+            return 0.0
+        target = self.count * p / 100.0
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target and bucket_count:
+                return float(self.bounds[i]) if i < len(self.bounds) else self.max
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe LatencyHistogram e ha tipo di ritorno Dict[str, Any].
+        Restituisce conteggio, media, p50, p90, massimo e i contatori per bucket.
+        '''
+        labels = [f"<={bound}h" for bound in self.bounds] + [f">{self.bounds[-1]}h"]
+        return {
+            'count': self.count,
+            'mean': round(self.mean(), 2),
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'max': self.max,
+            'buckets': dict(zip(labels, self.counts.tolist()))
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe LatencyHistogram e ha tipo di ritorno Dict[str, Any].
+        Restituisce lo stato serializzabile in JSON.
+        '''
+        return {'bounds': list(self.bounds), 'counts': self.counts.tolist(), 'count': self.count, 'total': self.total, 'max': self.max}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LatencyHistogram':
+        '''
+        Come parametro riceve esplicitamente data (Dict[str, Any], prodotto da to_dict()) e ha tipo di ritorno LatencyHistogram.
+        Ricostruisce l'istogramma salvato.
+        '''
+        histogram = cls(data.get('bounds', DEFAULT_BUCKETS))
+        counts = data.get('counts', [])
+        if len(counts) == len(histogram.counts):
+            histogram.counts = array('l', counts)
+            histogram.count = data.get('count', 0)
+            histogram.total = data.get('total', 0.0)
+            histogram.max = data.get('max', 0.0)
+        return histogram
+
+
+class SLAStats:
+    def __init__(self, bounds: Sequence[int] = DEFAULT_BUCKETS):
+        '''
+        Come parametro riceve esplicitamente bounds (Sequence[int]) oltre all'istanza della classe SLAStats (self implicito).
+        Raggruppa le metriche di servizio di un insieme di ordini (una ricetta, un giorno o il totale):
+        istogramma dell'attesa in coda (arrivo -> primo panino), istogramma del tempo di completamento (arrivo -> ordine completato),
+        ordini scaduti (timeout) e ordini abbandonati a fine giornata.
+        '''
+        self.queue_wait = LatencyHistogram(bounds)
+        self.time_to_complete = LatencyHistogram(bounds)
+        self.timeouts = 0
+        self.dropped = 0
+
+    def timeout_rate(self) -> float:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SLAStats e ha tipo di ritorno float.
+        Restituisce la percentuale di ordini chiusi senza essere completati (scaduti o abbandonati) sul totale degli ordini chiusi.
+        '''
+        closed = self.time_to_complete.count + self.timeouts + self.dropped
+        return (self.timeouts + self.dropped) / closed * 100 if closed else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SLAStats e ha tipo di ritorno Dict[str, Any].
+        Restituisce il riepilogo di attese, completamenti, timeout e tasso di timeout.
+        '''
+        return {
+            'queue_wait': self.queue_wait.summary(),
+            'time_to_complete': self.time_to_complete.summary(),
+            'completed': self.time_to_complete.count,
+            'timeouts': self.timeouts,
+            'dropped': self.dropped,
+            'timeout_rate_percent': round(self.timeout_rate(), 1)
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SLAStats e ha tipo di ritorno Dict[str, Any].
+        Restituisce lo stato serializzabile in JSON.
+        '''
+        return {
+            'queue_wait': self.queue_wait.to_dict(),
+            'time_to_complete': self.time_to_complete.to_dict(),
+            'timeouts': self.timeouts,
+            'dropped': self.dropped
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SLAStats':
+        '''
+        Come parametro riceve esplicitamente data (Dict[str, Any], prodotto da to_dict()) e ha tipo di ritorno SLAStats.
+        Ricostruisce le statistiche salvate.
+        '''
+        stats = cls()
+        stats.queue_wait = LatencyHistogram.from_dict(data.get('queue_wait', {}))
+        stats.time_to_complete = LatencyHistogram.from_dict(data.get('time_to_complete', {}))
+        stats.timeouts = data.get('timeouts', 0)
+        stats.dropped = data.get('dropped', 0)
+        return stats
+
+
+class OrderMetrics:
+    def __init__(self, bounds: Sequence[int] = DEFAULT_BUCKETS, history_days: int = 30):
+        '''
+        Come parametri riceve esplicitamente bounds (Sequence[int]) e history_days (int, con 30 come valore di default) oltre all'istanza della classe OrderMetrics (self implicito).
+        Raccoglie le latenze degli ordini in tempo simulato: totale, per ricetta e per giorno.
+        In particolare i giorni sono tenuti in un OrderedDict limitato a history_days, quindi la memoria resta costante anche in campagne lunghissime.
+        '''
+        self.bounds = tuple(bounds)
+        self.history_days = history_days
+        self.total = SLAStats(self.bounds)
+        self.by_recipe: Dict[str, SLAStats] = {}
+        self.by_day: 'OrderedDict[int, SLAStats]' = OrderedDict()
+
+    def _targets(self, recipe_id: str, day: int) -> List[SLAStats]:
+        '''
+        Funzione privata che come parametri riceve esplicitamente l'id della ricetta (stringa) e il giorno (int) oltre all'istanza della classe OrderMetrics (self implicito)
+        e ha tipo di ritorno List[SLAStats].
+        Restituisce le statistiche da aggiornare (totale, ricetta e giorno), creando quelle mancanti ed eliminando i giorni più vecchi oltre history_days.
+        '''
+        recipe_stats = self.by_recipe.get(recipe_id)
+        if recipe_stats is None:
+            recipe_stats = self.by_recipe[recipe_id] = SLAStats(self.bounds)
+
+        day_stats = self.by_day.get(day)
+        if day_stats is None:
+            day_stats = self.by_day[day] = SLAStats(self.bounds)
+            while len(self.by_day) > self.history_days:
+                self.by_day.popitem(last=False)
+
+        return [self.total, recipe_stats, day_stats]
+
+    def record_first_unit(self, recipe_id: str, day: int, wait_hours: float) -> None:
+        '''
+        Come parametri riceve esplicitamente l'id della ricetta, il giorno e l'attesa in coda (ore simulate) oltre all'istanza della classe OrderMetrics (self implicito).
+        Registra l'attesa tra l'arrivo dell'ordine e la preparazione del suo primo panino.
+        '''
+        for stats in self._targets(recipe_id, day):
+            stats.queue_wait.add(wait_hours)
+
+    def record_completion(self, recipe_id: str, day: int, hours: float) -> None:
+        '''
+        Come parametri riceve esplicitamente l'id della ricetta, il giorno e il tempo di completamento (ore simulate) oltre all'istanza della classe OrderMetrics (self implicito).
+        Registra il tempo tra l'arrivo dell'ordine e il suo completamento.
+        '''
+        for stats in self._targets(recipe_id, day):
+            stats.time_to_complete.add(hours)
+
+    def record_timeout(self, recipe_id: str, day: int) -> None:
+        '''
+        Come parametri riceve esplicitamente l'id della ricetta e il giorno oltre all'istanza della classe OrderMetrics (self implicito).
+        Registra un ordine scaduto per timeout.
+        '''
+        for stats in self._targets(recipe_id, day):
+            stats.timeouts += 1
+
+    def record_dropped(self, recipe_id: str, day: int) -> None:
+        '''
+        Come parametri riceve esplicitamente l'id della ricetta e il giorno oltre all'istanza della classe OrderMetrics (self implicito).
+        Registra un ordine ancora in coda a fine giornata (abbandonato alla chiusura).
+        '''
+        for stats in self._targets(recipe_id, day):
+            stats.dropped += 1
+
+    def get_summary(self, day: Optional[int] = None, recipe_id: Optional[str] = None) -> Dict[str, Any]:
+        '''
+        Come parametri riceve esplicitamente day (Optional[int]) e recipe_id (Optional[str]) oltre all'istanza della classe OrderMetrics (self implicito)
+        e ha tipo di ritorno Dict[str, Any].
+        Restituisce il riepilogo delle latenze del giorno indicato, della ricetta indicata oppure (senza parametri) il totale con il dettaglio per ricetta.
+        Se il giorno o la ricetta non hanno dati restituisce un riepilogo vuoto.
+        '''
+        if day is not None:
+            return self.by_day.get(day, SLAStats(self.bounds)).summary()
+        if recipe_id is not None:
+            return self.by_recipe.get(recipe_id, SLAStats(self.bounds)).summary()
+        summary = self.total.summary()
+        summary['by_recipe'] = {rid: stats.summary() for rid, stats in self.by_recipe.items()}
+        return summary
+
+    def to_dict(self) -> Dict[str, Any]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe OrderMetrics e ha tipo di ritorno Dict[str, Any].
+        Restituisce lo stato serializzabile in JSON (usato da safe_save()).
+        '''
+        return {
+            'bounds': list(self.bounds),
+            'history_days': self.history_days,
+            'total': self.total.to_dict(),
+            'by_recipe': {rid: stats.to_dict() for rid, stats in self.by_recipe.items()},
+            'by_day': {str(day): stats.to_dict() for day, stats in self.by_day.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'OrderMetrics':
+        '''
+        Come parametro riceve esplicitamente data (Dict[str, Any], prodotto da to_dict()) e ha tipo di ritorno OrderMetrics.
+        Ricostruisce le metriche salvate; in caso di dati corrotti restituisce metriche vuote.
+        '''
+        metrics = cls(data.get('bounds', DEFAULT_BUCKETS), data.get('history_days', 30))
+        try:
+            metrics.total = SLAStats.from_dict(data.get('total', {}))
+            metrics.by_recipe = {rid: SLAStats.from_dict(stats) for rid, stats in data.get('by_recipe', {}).items()}
+            for day in sorted(data.get('by_day', {}), key=int):
+                metrics.by_day[int(day)] = SLAStats.from_dict(data['by_day'][day])
+        except (AttributeError, TypeError, ValueError) as e:
+            print(f"⚠️ Metriche ordini salvate non valide ({e}), ripartendo da zero")
+            return cls(metrics.bounds, metrics.history_days)
+        return metrics
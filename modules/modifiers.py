@@ -0,0 +1,113 @@
+from typing import Dict, List, Optional, Iterable #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+List corrisponde ad una lista
+Optional corrisponde ad un valore che può essere None
+Iterable corrisponde a qualsiasi oggetto su cui si può iterare
+'''
+
+BASE_VALUES = {
+    "kitchen_capacity": 1.0,
+    "customer_chance": 0.25,
+    "profit": 1.0
+} # valori di partenza delle grandezze modificabili: panini/ora, probabilità di un nuovo cliente per tentativo, moltiplicatore dei ricavi
+
+ADD = "add" # modificatore additivo: sommato al valore di base
+MUL = "mul" # modificatore moltiplicativo: applicato dopo tutte le somme
+
+UPGRADE_MAX_LEVELS = {"upgrade_kitchen": 5, "new_employee": 3} # livello massimo degli upgrade di capacità acquistabili (un modificatore ADD di kitchen_capacity per livello)
+
+
+class Modifier:
+    def __init__(self, target: str, operation: str, value: float):
+        '''
+        Come parametri riceve esplicitamente target (stringa, una chiave di BASE_VALUES), operation (ADD o MUL) e value (float)
+        oltre all'istanza della classe Modifier (self implicito).
+        Singolo modificatore tipato: ad esempio Modifier("kitchen_capacity", ADD, 2) per due livelli di upgrade o Modifier("customer_chance", MUL, 2.5) per l'ora di punta.
+        '''
+        if operation not in (ADD, MUL):
+            raise ValueError(f"Operazione del modificatore sconosciuta: {operation}")
+        self.target = target
+        self.operation = operation
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"Modifier({self.target!r}, {self.operation!r}, {self.value!r})"
+
+
+class ModifierStack:
+    def __init__(self, base: Optional[Dict[str, float]] = None):
+        '''
+        Come parametro riceve esplicitamente base (Optional[Dict[str, float]], valori di partenza, di default BASE_VALUES) oltre all'istanza della classe ModifierStack (self implicito).
+        Pila dei modificatori raggruppati per sorgente (ad esempio "upgrades", "difficulty", "event:rush_hour"): ogni sorgente può essere sostituita o rimossa in blocco.
+        Il valore di ogni grandezza è (base + somma degli additivi) × prodotto dei moltiplicativi; i valori sono calcolati solo quando la pila cambia
+        e poi letti dalla cache, così il ciclo orario legge numeri già pronti.
+        '''
+        self.base = dict(BASE_VALUES if base is None else base)
+        self.sources: Dict[str, List[Modifier]] = {}
+        self.version = 0
+        self._cache: Optional[Dict[str, float]] = None
+
+    def set_source(self, source: str, modifiers: Iterable[Modifier]) -> None:
+        '''
+        Come parametri riceve esplicitamente il nome della sorgente (stringa) e i suoi modificatori (Iterable[Modifier]) oltre all'istanza della classe ModifierStack (self implicito)
+        e ha tipo di ritorno None (non restituisce nulla).
+        Sostituisce tutti i modificatori della sorgente e invalida la cache; una sorgente senza modificatori viene rimossa.
+        '''
+        modifiers = list(modifiers)
+        if modifiers:
+            self.sources[source] = modifiers
+        else:
+            self.sources.pop(source, None)
+        self._invalidate()
+
+    def remove_source(self, source: str) -> None:
+        '''
+        Come parametro riceve esplicitamente il nome della sorgente (stringa) oltre all'istanza della classe ModifierStack (self implicito) e ha tipo di ritorno None (non restituisce nulla).
+        Rimuove i modificatori della sorgente (se presente) e invalida la cache.
+        '''
+        if self.sources.pop(source, None) is not None:
+            self._invalidate()
+
+    def clear(self, prefix: str = "") -> None:
+        '''
+        Come parametro riceve esplicitamente prefix (stringa, con "" come valore di default) oltre all'istanza della classe ModifierStack (self implicito)
+        e ha tipo di ritorno None (non restituisce nulla).
+        Rimuove tutte le sorgenti il cui nome inizia con prefix (tutte, senza prefisso).
+        '''
+        for source in [source for source in self.sources if source.startswith(prefix)]:
+            del self.sources[source]
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe ModifierStack e ha tipo di ritorno None (non restituisce nulla).
+        Segna la cache come da ricalcolare e incrementa version (chi tiene copie dei valori può confrontarla per sapere se sono ancora valide).
+        '''
+        self._cache = None
+        self.version += 1
+
+    def values(self) -> Dict[str, float]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe ModifierStack e ha tipo di ritorno Dict[str, float].
+        Restituisce i valori effettivi di tutte le grandezze, ricalcolandoli solo se la pila è cambiata dall'ultima chiamata.
+        '''
+        if self._cache is None:
+            added = dict(self.base)
+            factors = {target: 1.0 for target in added}
+            for modifiers in self.sources.values():
+                for modifier in modifiers:
+                    if modifier.operation == ADD:
+                        added[modifier.target] = added.get(modifier.target, 0.0) + modifier.value
+                    else:
+                        factors[modifier.target] = factors.get(modifier.target, 1.0) * modifier.value
+            self._cache = {target: added.get(target, 0.0) * factors.get(target, 1.0) for target in set(added) | set(factors)}
+        return self._cache
+
+    def get(self, target: str) -> float:
+        '''
+        Come parametro riceve esplicitamente target (stringa) oltre all'istanza della classe ModifierStack (self implicito) e ha tipo di ritorno float.
+        Restituisce il valore effettivo della grandezza dalla cache (0.0 per grandezze senza base né modificatori).
+        '''
+        return self.values().get(target, 0.0)
@@ -0,0 +1,17 @@
+CENTS_PER_EURO = 100 # centesimi in un euro: gli importi di Finance sono interi in centesimi
+
+
+def to_cents(amount: float) -> int:
+    '''
+    Come parametro riceve esplicitamente un importo in euro (float, ad esempio letto da config.json, recipes.json o inserito dall'utente) e ha tipo di ritorno int.
+    Converte l'importo in centesimi interi arrotondando al centesimo più vicino; è l'unico punto in cui un importo in virgola mobile entra nei conti di Finance.
+    '''
+    return round(amount * CENTS_PER_EURO)
+
+
+def to_euros(cents: int) -> float:
+    '''
+    Come parametro riceve esplicitamente un importo in centesimi (int) e ha tipo di ritorno float.
+    Converte i centesimi in euro per GUI, messaggi, report e salvataggi; il risultato ha già al massimo due decimali, quindi non serve round().
+    '''
+    return cents / CENTS_PER_EURO
@@ -0,0 +1,72 @@
+import threading #importazione del modulo necessario per gestire thread: fornisce Lock() per aggiornare i valori osservati in modo thread-safe
+from typing import Dict, Any, List, Callable #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+Any corrisponde ad un tipo generico (cioè accetta qualsiasi valore)
+List corrisponde ad una lista
+Callable corrisponde ad una funzione (o qualsiasi oggetto chiamabile)
+'''
+
+
+class ObservableState:
+    def __init__(self):
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe ObservableState.
+        Costruttore dello stato osservabile: conserva l'ultimo valore pubblicato di ogni chiave (values) e la lista dei sottoscrittori (subscribers).
+        Chi modifica lo stato chiama update() con i valori correnti; i sottoscrittori ricevono solo le chiavi effettivamente cambiate,
+        quindi se nulla cambia non viene fatto alcun lavoro.
+        '''
+        self.values: Dict[str, Any] = {}
+        self.subscribers: List[Callable[[Dict[str, Any]], None]] = []
+        self.lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        '''
+        Come parametro riceve esplicitamente callback (funzione che riceve il dizionario delle chiavi cambiate) oltre all'istanza della classe ObservableState (self implicito)
+        e ha tipo di ritorno None (non restituisce nulla).
+        Registra il sottoscrittore (una sola volta anche se chiamato più volte). La callback viene chiamata nel thread che ha fatto update(),
+        quindi una GUI deve limitarsi a memorizzare i cambiamenti e applicarli nel proprio thread.
+        '''
+        with self.lock:
+            if callback not in self.subscribers:
+                self.subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        '''
+        Come parametro riceve esplicitamente callback (funzione registrata con subscribe()) oltre all'istanza della classe ObservableState (self implicito)
+        e ha tipo di ritorno None (non restituisce nulla).
+        Rimuove il sottoscrittore se presente.
+        '''
+        with self.lock:
+            if callback in self.subscribers:
+                self.subscribers.remove(callback)
+
+    def update(self, **values: Any) -> Dict[str, Any]:
+        '''
+        Come parametri riceve esplicitamente i valori correnti come argomenti con nome oltre all'istanza della classe ObservableState (self implicito)
+        e ha tipo di ritorno Dict[str, Any].
+        Confronta i valori con gli ultimi pubblicati e notifica ai sottoscrittori solo quelli cambiati (le callback sono chiamate fuori dal lock).
+        Restituisce il dizionario delle chiavi cambiate (vuoto se non è cambiato nulla).
+        '''
+        with self.lock:
+            changed = {key: value for key, value in values.items() if key not in self.values or self.values[key] != value}
+            if not changed:
+                return changed
+            self.values.update(changed)
+            subscribers = list(self.subscribers)
+
+        for callback in subscribers:
+            try:
+                callback(changed)
+            except Exception as e:
+                print(f"⚠️ Errore notifica stato: {e}")
+        return changed
+
+    def snapshot(self) -> Dict[str, Any]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe ObservableState e ha tipo di ritorno Dict[str, Any].
+        Restituisce una copia degli ultimi valori pubblicati.
+        '''
+        with self.lock:
+            return dict(self.values)
@@ -0,0 +1,114 @@
+from typing import Dict, Any, List, Optional #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+Any corrisponde ad un tipo generico (cioè accetta qualsiasi valore)
+List corrisponde ad una lista
+Optional corrisponde ad un valore che può essere None
+'''
+
+
+class RecipeCodes:
+    def __init__(self, recipes: Optional[Dict[str, Dict[str, Any]]] = None):
+        '''
+        Come parametro riceve esplicitamente recipes (Optional[Dict], id ricetta -> dati della ricetta, ad esempio Recipe.get_all_recipes()) oltre all'istanza della classe RecipeCodes (self implicito).
+        Tabella di codifica delle ricette: ogni id ricetta riceve un codice intero progressivo (nell'ordine del catalogo) e il suo nome viene memorizzato una volta sola,
+        così gli ordini tengono solo il codice e il nome viene risolto quando serve mostrarlo o salvarlo.
+        '''
+        self.ids: List[str] = []
+        self.names: List[str] = []
+        self.codes: Dict[str, int] = {}
+        for recipe_id, recipe in (recipes or {}).items():
+            self.encode(recipe_id, recipe.get("name", recipe_id))
+
+    def encode(self, recipe_id: str, name: Optional[str] = None) -> int:
+        '''
+        Come parametri riceve esplicitamente l'id della ricetta (stringa) e name (Optional[str], nome da memorizzare se l'id è nuovo)
+        oltre all'istanza della classe RecipeCodes (self implicito) e ha tipo di ritorno int.
+        Restituisce il codice della ricetta; un id sconosciuto (ad esempio da un salvataggio con ricette non più nel catalogo) riceve un nuovo codice.
+        '''
+        code = self.codes.get(recipe_id)
+        if code is None:
+            code = len(self.ids)
+            self.codes[recipe_id] = code
+            self.ids.append(recipe_id)
+            self.names.append(name or recipe_id)
+        return code
+
+    def decode(self, code: int) -> str:
+        '''
+        Come parametro riceve esplicitamente il codice (int) oltre all'istanza della classe RecipeCodes (self implicito) e ha tipo di ritorno str.
+        Restituisce l'id della ricetta con quel codice.
+        '''
+        return self.ids[code]
+
+    def name(self, code: int) -> str:
+        '''
+        Come parametro riceve esplicitamente il codice (int) oltre all'istanza della classe RecipeCodes (self implicito) e ha tipo di ritorno str.
+        Restituisce il nome della ricetta con quel codice (da mostrare all'utente).
+        '''
+        return self.names[code]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class Order:
+    __slots__ = ("id", "recipe", "quantity", "remaining", "arrival_hour", "arrival_time", "first_unit_time", "completed_time")
+
+    def __init__(self, order_id: int, recipe: int, quantity: int, arrival_hour: int, arrival_time: Optional[int] = None,
+                 remaining: Optional[int] = None, first_unit_time: Optional[int] = None, completed_time: Optional[int] = None):
+        '''
+        Come parametri riceve esplicitamente l'id dell'ordine (int), il codice della ricetta (int, vedi RecipeCodes), la quantità (int), l'ora di arrivo (int)
+        e opzionalmente tempo simulato di arrivo, unità rimanenti (default la quantità), tempo della prima unità e del completamento
+        oltre all'istanza della classe Order (self implicito).
+        Ordine in coda con __slots__: nessun dizionario per istanza e nessuna copia del nome della ricetta, quindi code di centinaia di migliaia di ordini
+        occupano una frazione della memoria dei dizionari usati in precedenza. Il formato JSON del salvataggio resta quello dei dizionari (vedi to_dict() e from_dict()).
+        '''
+        self.id = order_id
+        self.recipe = recipe
+        self.quantity = quantity
+        self.remaining = quantity if remaining is None else remaining
+        self.arrival_hour = arrival_hour
+        self.arrival_time = arrival_time
+        self.first_unit_time = first_unit_time
+        self.completed_time = completed_time
+
+    def to_dict(self, codes: RecipeCodes) -> Dict[str, Any]:
+        '''
+        Come parametro riceve esplicitamente la tabella di codifica delle ricette (RecipeCodes) oltre all'istanza della classe Order (self implicito) e ha tipo di ritorno Dict[str, Any].
+        Converte l'ordine nel dizionario del formato di salvataggio (stesse chiavi delle versioni precedenti, con id e nome della ricetta risolti dal codice).
+        '''
+        return {
+            "id": self.id,
+            "recipe_id": codes.decode(self.recipe),
+            "recipe_name": codes.name(self.recipe),
+            "quantity": self.quantity,
+            "remaining": self.remaining,
+            "arrival_hour": self.arrival_hour,
+            "arrival_time": self.arrival_time,
+            "first_unit_time": self.first_unit_time,
+            "completed_time": self.completed_time
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], codes: RecipeCodes) -> 'Order':
+        '''
+        Come parametri riceve esplicitamente il dizionario dell'ordine letto dal salvataggio (Dict[str, Any]) e la tabella di codifica delle ricette (RecipeCodes)
+        e ha tipo di ritorno Order.
+        Ricostruisce l'ordine dal formato di salvataggio; i campi aggiunti nelle versioni successive (tempi, rimanenti) sono facoltativi.
+        '''
+        quantity = data.get("quantity", 1)
+        return cls(
+            data["id"],
+            codes.encode(data["recipe_id"], data.get("recipe_name")),
+            quantity,
+            data["arrival_hour"],
+            data.get("arrival_time"),
+            data.get("remaining", quantity),
+            data.get("first_unit_time"),
+            data.get("completed_time")
+        )
+
+    def __repr__(self) -> str:
+        return f"Order(id={self.id}, recipe={self.recipe}, remaining={self.remaining}/{self.quantity}, arrival_hour={self.arrival_hour})"
@@ -11,15 +11,18 @@ Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave:
 '''
 from datetime import datetime #classe datetime importata dal modulo datetime usata per salvare timestamp dell'ultimo aggiornamento delle statistiche ricette
 from .inventory import Inventory #importazione della classe Inventory dal modulo locale per collegare la gestione ricette all'inventario reale (
+from .money import to_cents, to_euros #importazione delle conversioni tra euro e centesimi interi dal modulo locale
+from .settings import ConfigError #importazione dell'errore di configurazione dal modulo locale, sollevato se config.json non è un JSON valido
 
 class Recipe:
-    def __init__(self, recipes_file: str = 'data/recipes.json', inventory: Optional[Inventory] = None, config_file: str = 'data/config.json'):
+    def __init__(self, recipes_file: str = 'data/recipes.json', inventory: Optional[Inventory] = None, config_file: str = 'data/config.json', config: Optional[Dict[str, Any]] = None):
         '''
-        Come parametro riceve esplicitamente recipes_file (stringa, con valore di default 'data/recipes.json'), inventory (Optional[Inventory], con None come valore di default) 
-        e config_file (stringa, con 'data/config.json' come valore di default), oltre a ricevere implicitamente l'istanza della classe Recipe (self).
+        Come parametro riceve esplicitamente recipes_file (stringa, con valore di default 'data/recipes.json'), inventory (Optional[Inventory], con None come valore di default),
+        config_file (stringa, con 'data/config.json' come valore di default) e config (Optional[Dict[str, Any]], configurazione già letta, con None come valore di default),
+        oltre a ricevere implicitamente l'istanza della classe Recipe (self).
         Costruttore della classe Recipe che si occupa di inizializzare le strutture dati principali:
         In particolare, recipes_file e config_file: percorsi dei file JSON delle ricette e della configurazione, lock: threading.Lock() per garantire thread-safety, 
-        inventory: riferimento all'istanza Inventory, recipes: carica le ricette dal file tramite load_recipes(), config: carica la configurazione tramite load_config(),
+        inventory: riferimento all'istanza Inventory, recipes: carica le ricette dal file tramite load_recipes(), config: carica la configurazione tramite load_config() se non è fornita,
         recipe_cache e price_cache: cache per accesso rapido a ricette e costi, stats: dizionario con statistiche globali (preparazioni, incassi, ecc...)
         Alla fine chiama _build_cache() per costruire la cache delle ricette.
         '''
@@ -28,7 +31,7 @@ class Recipe:
         self.lock = threading.Lock()
         self.inventory = inventory
         self.recipes = self.load_recipes()
-        self.config = self.load_config()
+        self.config = config if config is not None else self.load_config()
         self.recipe_cache = {} 
         self.price_cache = {}
         self.stats = {
@@ -64,7 +67,8 @@ class Recipe:
         Come parametro riceve implicitamente solo l'istanza della classe Recipe.
         Carica la configurazione dal file config.json.
         In particolare tenta di leggere e parsare il JSON in modalità lettura ('r') ; in caso contrario stampa errore.
-        In caso di eccezione (FileNotFoundError, JSONDecodeError, ecc...) stampa errore e utilizza una configurazione predefinita semplice.
+        Se il file manca stampa errore e utilizza una configurazione predefinita semplice; se il JSON non è valido stampa errore e solleva ConfigError
+        (invece di proseguire con una configurazione vuota che fallirebbe più avanti durante la partita).
         '''
         try:
             with open(self.config_file, 'r', encoding='utf-8') as f:
@@ -74,7 +78,7 @@ class Recipe:
             return {'gameplay': {'max_burgers_per_order': 3}, 'difficulty': {'levels': {'easy': {'profit': 1.0}}}}
         except json.JSONDecodeError as e:
             print(f'Errore JSON in {self.config_file}: {e}')
-            return {}
+            raise ConfigError(f"{self.config_file} non è un JSON valido: {e}") from e
             
     def _build_cache(self) -> None:
         '''
@@ -231,7 +235,7 @@ class Recipe:
         e ha tipo di ritorno Tuple[bool, str, Dict].
         Prepara una ricetta consumando gli ingredienti necessari.
         In particolare verifica l'inventaario, se ha quantità positiva, se la ricetta esiste, la disponibilità degli ingredienti (scalati per quantità).
-        Consuma manualmente gli ingredienti, calcola costi, prezzi e profitti, aggiorna statistiche come preparazione, incassi e ricetta più popolare.
+        Consuma manualmente gli ingredienti, calcola costi, prezzi e profitti in centesimi interi (passati così a Finance.process_sale()), aggiorna statistiche come preparazione, incassi e ricetta più popolare.
         Restituisce successo, messaggio e dettagli preparazione.
         '''
         if not self.inventory:
@@ -260,14 +264,12 @@ class Recipe:
         except Exception as e:
             return False, f"Errore consumo: {e}", {}
 
-        cost_per_unit = recipe.get('cost', 0.0)
-        price_per_unit = recipe.get('price', 0.0)
-        total_cost = cost_per_unit * quantity
-        total_price = price_per_unit * quantity
+        total_cost = to_cents(recipe.get('cost', 0.0)) * quantity
+        total_price = to_cents(recipe.get('price', 0.0)) * quantity
         profit = total_price - total_cost
 
         self.stats['total_preparations'] += quantity
-        self.stats['total_revenue'] += total_price
+        self.stats['total_revenue'] += to_euros(total_price)
         self.stats['last_updated'] = datetime.now().isoformat()
 
         if not hasattr(self, 'recipe_counts'):
@@ -283,10 +285,12 @@ class Recipe:
             'recipe_id': recipe_id,
             'recipe_name': recipe.get('name', recipe_id),
             'quantity': quantity,
-            'total_cost': round(total_cost, 2),
-            'total_price': round(total_price, 2),
-            'total_profit': round(profit, 2),
-            'profit_per_unit': round(profit / quantity, 2) if quantity > 0 else 0.0
+            'total_cost': to_euros(total_cost),
+            'total_price': to_euros(total_price),
+            'total_profit': to_euros(profit),
+            'profit_per_unit': round(to_euros(profit) / quantity, 2),
+            'total_cost_cents': total_cost,
+            'total_price_cents': total_price
         }
 
         return True, f"Preparati {quantity}x {recipe.get('name', recipe_id)}", details
@@ -0,0 +1,166 @@
+import heapq #importazione del modulo heapq per la coda di priorità (min-heap) usata dall'euristica greedy del pianificatore
+from typing import Dict, List, Optional, Tuple #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+List corrisponde ad una lista
+Optional corrisponde ad un valore che può essere None
+Tuple corrisponde ad una tupla
+'''
+from .inventory import Inventory #importazione della classe Inventory dal modulo locale per leggere scorte e costi degli ingredienti
+from .recipes import Recipe #importazione della classe Recipe dal modulo locale per leggere gli ingredienti richiesti da ogni ricetta
+from .finance import Finance #importazione della classe Finance dal modulo locale per leggere il saldo ed eseguire il pagamento
+from .money import to_euros #importazione della conversione da centesimi a euro dal modulo locale (i costi giornalieri di Finance sono in centesimi)
+
+
+class RestockPlanner:
+    def __init__(self, inventory: Inventory, recipes: Recipe, finance: Optional[Finance] = None, target_units: int = 5):
+        '''
+        Come parametri riceve esplicitamente inventory (Inventory), recipes (Recipe), finance (Optional[Finance], con None come valore di default)
+        e target_units (int, con 5 come valore di default), oltre a ricevere implicitamente l'istanza della classe RestockPlanner (self).
+        Costruttore del pianificatore di rifornimento che sceglie quanto comprare di ogni ingrediente per massimizzare
+        le unità di ricette vendibili entro un budget (problema di zaino risolto con un'euristica greedy).
+        In particolare target_units indica quante unità al massimo pianificare per ogni ricetta (orizzonte del rifornimento).
+        Alla fine chiama refresh() per precalcolare i fabbisogni delle ricette.
+        '''
+        self.inventory = inventory
+        self.recipes = recipes
+        self.finance = finance
+        self.target_units = max(1, int(target_units))
+        self._ingredients_by_path: Dict[str, Dict] = {}
+        self._requirements: Dict[str, List[Tuple[str, int]]] = {}
+        self.refresh()
+
+    def refresh(self) -> None:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe RestockPlanner e ha tipo di ritorno None (non restituisce nulla).
+        Precalcola le strutture usate dal pianificatore, in particolare: un indice percorso -> dati ingrediente (riferimenti ai dati vivi
+        dell'inventario, quindi quantità e costi sono sempre aggiornati) e, per ogni ricetta, la lista (percorso, quantità) degli ingredienti.
+        Le ricette che usano ingredienti inesistenti vengono escluse perché non potrebbero mai essere preparate.
+        Va richiamata solo se il catalogo cambia (per esempio dopo un nuovo build_flat_cache()).
+        '''
+        self._ingredients_by_path = {item['path']: item['data'] for item in self.inventory.flat_cache.values()}
+        self._requirements = {}
+
+        for recipe_id, recipe in self.recipes.get_all_recipes().items():
+            needs = [(path, qty) for path, qty in recipe.get('ingredients', {}).items() if qty > 0]
+            if needs and all(path in self._ingredients_by_path for path, _ in needs):
+                self._requirements[recipe_id] = needs
+
+    def get_default_budget(self) -> float:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe RestockPlanner e ha tipo di ritorno float.
+        Restituisce il budget di default: il saldo attuale (finance.get_balance()) meno i costi giornalieri fissi,
+        così il rifornimento non mette a rischio il pagamento di fine giornata. Senza Finance collegato restituisce 0.0.
+        '''
+        if not self.finance:
+            return 0.0
+        reserve = to_euros(sum(self.finance.daily_costs.values()))
+        return max(0.0, self.finance.get_balance() - reserve)
+
+    def plan(self, budget: Optional[float] = None, recipe_ids: Optional[List[str]] = None, demand_weights: Optional[Dict[str, float]] = None) -> Dict:
+        '''
+        Come parametri riceve esplicitamente budget (Optional[float]), recipe_ids (Optional[List[str]], le ricette da considerare, di default tutte)
+        e demand_weights (Optional[Dict[str, float]], peso della domanda attesa per ricetta, di default uniforme) oltre all'istanza della classe RestockPlanner (self implicito)
+        e ha tipo di ritorno Dict.
+        Calcola il piano di acquisto senza modificare nulla; se Finance è collegato il budget non può superare il saldo attuale.
+        In particolare, ad ogni passo sceglie dalla coda di priorità la ricetta con il minor costo marginale (pesato per la domanda) per renderne vendibile
+        un'unità in più, considerando le scorte attuali e quelle già impegnate dalle altre ricette. Poiché il costo marginale può solo crescere,
+        le priorità vengono ricalcolate in modo pigro (solo quando la ricetta esce dalla coda).
+        Restituisce un dizionario con gli acquisti (percorso -> quantità), il costo totale e le unità vendibili pianificate per ricetta.
+        '''
+        if budget is None:
+            budget = self.get_default_budget()
+        elif self.finance:
+            budget = min(budget, self.finance.get_balance())
+        if recipe_ids is None:
+            recipe_ids = list(self._requirements.keys())
+
+        stock = {path: data.get('current_quantity', 0) for path, data in self._ingredients_by_path.items()}
+        costs = {path: data.get('current_cost', data.get('base_cost', 0.0)) for path, data in self._ingredients_by_path.items()}
+        committed: Dict[str, int] = {}
+        units: Dict[str, int] = {}
+
+        def marginal_cost(recipe_id: str) -> float:
+            cost = 0.0
+            for path, need in self._requirements[recipe_id]:
+                used = committed.get(path, 0)
+                missing_before = max(0, used - stock[path])
+                missing_after = max(0, used + need - stock[path])
+                cost += (missing_after - missing_before) * costs[path]
+            return cost
+
+        heap = []
+        for recipe_id in recipe_ids:
+            if recipe_id not in self._requirements:
+                continue
+            weight = demand_weights.get(recipe_id, 0.0) if demand_weights is not None else 1.0
+            if weight <= 0:
+                continue
+            heapq.heappush(heap, (marginal_cost(recipe_id) / weight, recipe_id, weight))
+
+        spent = 0.0
+        while heap:
+            priority, recipe_id, weight = heapq.heappop(heap)
+            cost = marginal_cost(recipe_id)
+            if cost / weight > priority + 1e-9:
+                heapq.heappush(heap, (cost / weight, recipe_id, weight))
+                continue
+            if spent + cost > budget + 1e-9:
+                continue
+
+            spent += cost
+            for path, need in self._requirements[recipe_id]:
+                committed[path] = committed.get(path, 0) + need
+            units[recipe_id] = units.get(recipe_id, 0) + 1
+
+            if units[recipe_id] < self.target_units:
+                heapq.heappush(heap, (marginal_cost(recipe_id) / weight, recipe_id, weight))
+
+        purchases = {}
+        total_cost = 0.0
+        for path, used in committed.items():
+            qty = used - stock[path]
+            if qty > 0:
+                purchases[path] = qty
+                total_cost += qty * costs[path]
+
+        return {
+            'purchases': purchases,
+            'total_cost': round(total_cost, 2),
+            'planned_units': units,
+            'budget': round(budget, 2)
+        }
+
+    def execute(self, plan: Dict) -> Tuple[bool, str, float]:
+        '''
+        Come parametro riceve esplicitamente plan (Dict, prodotto da plan()) oltre all'istanza della classe RestockPlanner (self implicito)
+        e ha tipo di ritorno Tuple[bool, str, float].
+        Esegue il piano come un'unica transazione: un solo addebito con finance.buy_ingredients_batch() e un solo aggiornamento
+        dell'inventario con inventory.add_ingredients_batch().
+        Restituisce True/False, messaggio dettagliato e costo totale speso.
+        '''
+        purchases = plan.get('purchases', {})
+        total_cost = plan.get('total_cost', 0.0)
+
+        if not purchases:
+            return False, "Nessun riordine utile con il budget disponibile", 0.0
+
+        if self.finance and total_cost > 0:
+            if not self.finance.buy_ingredients_batch(total_cost, len(purchases)):
+                return False, "Errore pagamento rifornimento", 0.0
+
+        self.inventory.add_ingredients_batch(purchases)
+
+        names = [self._ingredients_by_path[path].get('display_name', path) for path in purchases]
+        units = sum(plan.get('planned_units', {}).values())
+        msg = f"Riforniti: {', '.join(names)} | Spesa: €{total_cost:.2f} | Panini vendibili: {units}"
+        return True, msg, total_cost
+
+    def restock(self, budget: Optional[float] = None, recipe_ids: Optional[List[str]] = None, demand_weights: Optional[Dict[str, float]] = None) -> Tuple[bool, str, float]:
+        '''
+        Come parametri riceve esplicitamente budget, recipe_ids e demand_weights (come plan()) oltre all'istanza della classe RestockPlanner (self implicito)
+        e ha tipo di ritorno Tuple[bool, str, float].
+        Calcola il piano con plan() e lo esegue subito con execute().
+        '''
+        return self.execute(self.plan(budget, recipe_ids, demand_weights))
@@ -0,0 +1,102 @@
+import json #importazione del modulo standard Python necessario per leggere e scrivere le sezioni del salvataggio in formato JSON
+import os #importazione del modulo necessario per operazioni sul sistema operativo: creazione cartella, sostituzione atomica dei file
+from datetime import datetime #classe datetime importata dal modulo datetime usata per il timestamp di ogni sezione nel manifest
+from typing import Dict, Any, List, Optional #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+Any corrisponde ad un tipo generico (cioè accetta qualsiasi valore)
+List corrisponde ad una lista
+Optional corrisponde ad un valore che può essere None
+'''
+
+SAVE_FORMAT_VERSION = 1 # versione del formato a sezioni, scritta nel manifest
+
+
+class SaveStore:
+    MANIFEST = "manifest.json"
+
+    def __init__(self, directory: str = 'data/savestate'):
+        '''
+        Come parametro riceve esplicitamente la cartella del salvataggio (stringa, con 'data/savestate' come valore di default)
+        oltre all'istanza della classe SaveStore (self implicito).
+        Salvataggio a sezioni: ogni sezione (game, orders, finance, ...) è un file JSON compatto separato e il manifest.json
+        elenca le sezioni con versione e timestamp. Così si riscrivono solo le sezioni cambiate e il costo del salvataggio
+        dipende da cosa è cambiato, non dalla dimensione totale dello stato.
+        '''
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, self.MANIFEST)
+        self._manifest: Optional[Dict[str, Any]] = None
+
+    def exists(self) -> bool:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SaveStore e ha tipo di ritorno bool.
+        Restituisce True se esiste un salvataggio a sezioni (cioè il manifest).
+        '''
+        return os.path.exists(self.manifest_path)
+
+    def load_manifest(self) -> Dict[str, Any]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SaveStore e ha tipo di ritorno Dict[str, Any].
+        Restituisce il manifest (letto dal disco solo la prima volta); se manca o è corrotto restituisce un manifest vuoto.
+        '''
+        if self._manifest is None:
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    self._manifest = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._manifest = {'format_version': SAVE_FORMAT_VERSION, 'sections': {}}
+        return self._manifest
+
+    def _write_json(self, path: str, data: Any) -> None:
+        '''
+        Funzione privata che come parametri riceve esplicitamente il percorso (stringa) e i dati da scrivere oltre all'istanza della classe SaveStore (self implicito).
+        Scrive il JSON compatto in un file temporaneo e lo sostituisce atomicamente a quello vecchio (os.replace),
+        così un'interruzione durante il salvataggio non lascia mai una sezione a metà.
+        '''
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def write_sections(self, sections: Dict[str, Any]) -> List[str]:
+        '''
+        Come parametro riceve esplicitamente sections (Dict[str, Any], nome sezione -> dati) oltre all'istanza della classe SaveStore (self implicito)
+        e ha tipo di ritorno List[str].
+        Scrive solo le sezioni ricevute, poi aggiorna il manifest (per ultimo, così punta sempre a sezioni complete).
+        Restituisce i nomi delle sezioni scritte.
+        '''
+        if not sections:
+            return []
+
+        os.makedirs(self.directory, exist_ok=True)
+        manifest = self.load_manifest()
+        now = datetime.now().isoformat()
+
+        for name, data in sections.items():
+            filename = f"{name}.json"
+            self._write_json(os.path.join(self.directory, filename), data)
+            entry = manifest['sections'].get(name, {'version': 0})
+            manifest['sections'][name] = {'file': filename, 'version': entry['version'] + 1, 'saved_at': now}
+
+        manifest['format_version'] = SAVE_FORMAT_VERSION
+        manifest['last_save'] = now
+        self._write_json(self.manifest_path, manifest)
+        return list(sections)
+
+    def read_sections(self) -> Dict[str, Any]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SaveStore e ha tipo di ritorno Dict[str, Any].
+        Legge tutte le sezioni elencate nel manifest e le restituisce come dizionario nome sezione -> dati.
+        Sezioni mancanti o corrotte vengono segnalate e saltate.
+        '''
+        self._manifest = None
+        manifest = self.load_manifest()
+        sections = {}
+        for name, entry in manifest.get('sections', {}).items():
+            try:
+                with open(os.path.join(self.directory, entry['file']), 'r', encoding='utf-8') as f:
+                    sections[name] = json.load(f)
+            except (OSError, KeyError, json.JSONDecodeError) as e:
+                print(f"⚠️ Sezione di salvataggio '{name}' non leggibile: {e}")
+        return sections
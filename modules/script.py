@@ -0,0 +1,194 @@
+import contextlib #importazione del modulo contextlib per deviare l'output dei print() del gioco durante l'esecuzione dello script
+import operator #importazione del modulo operator per i confronti del comando expect
+import random #importazione del modulo random per il comando seed (il motore usa il generatore globale)
+import shlex #importazione del modulo shlex per dividere le righe dello script in parole (anche tra virgolette, per i nomi con spazi)
+from typing import Dict, Any, List, Tuple, Callable, Iterable, Optional, TextIO #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+Any corrisponde ad un tipo generico (cioè accetta qualsiasi valore)
+List corrisponde ad una lista
+Tuple corrisponde ad una tupla (sequenza immutabile di valori)
+Callable corrisponde ad una funzione (o qualsiasi oggetto chiamabile)
+Iterable corrisponde ad un qualsiasi oggetto iterabile (lista, file aperto, generatore, ...)
+Optional corrisponde ad un valore che può essere None
+TextIO corrisponde ad un file di testo aperto (o un oggetto con write(), come io.StringIO)
+'''
+from .kitchen import KITCHEN_POLICIES #importazione del registro delle politiche cucina dal modulo locale, per validare il comando policy
+
+COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {"==": operator.eq, "!=": operator.ne, "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge} # operatori del comando expect
+NO_GAME_COMMANDS = ("new", "load", "seed") # comandi eseguibili prima che esista una partita
+
+
+class _NullOutput: # destinazione dell'output scartato: accetta le scritture dei print() senza conservarle
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+class ScriptRunner:
+    def __init__(self, engine: Any):
+        '''
+        Come parametro riceve esplicitamente engine (GameEngine) oltre all'istanza della classe ScriptRunner (self implicito).
+        Esecutore di script di comandi: ogni riga è un comando eseguito direttamente sui metodi del GameEngine, senza menu, input() né attese,
+        così scenari di regressione e partite preparate girano alla massima velocità. Imposta gui_mode (nessuna attesa di INVIO a fine partita)
+        e disattiva i ritardi della generazione ordini. Comandi (una riga ciascuno, # inizia un commento):
+          seed N                                  fissa il seme del generatore casuale
+          new [difficoltà] [giocatore] [ristorante] nuova partita (default normal)
+          load                                    carica la partita salvata
+          advance [N]                             avanza di N ore (default 1) fermandosi a fine partita
+          day                                     avanza fino all'inizio del giorno successivo (o alla fine della partita)
+          buy percorso quantità                   acquista un ingrediente ("categoria.nome")
+          upgrade id                              acquista un upgrade (upgrade_kitchen, new_employee, new_recipe)
+          restock [budget]                        rifornimento automatico (default: saldo meno i costi giornalieri)
+          policy nome                             cambia la politica della cucina
+          save                                    salva la partita
+          expect chiave operatore valore          controlla un valore dello stato (ad esempio expect balance > 100)
+        '''
+        self.engine = engine
+        engine.gui_mode = True
+        engine.simulate_delays = False
+        self.handlers: Dict[str, Callable[..., Tuple[bool, str]]] = {
+            "seed": self._seed,
+            "new": self._new,
+            "load": self._load,
+            "advance": self._advance,
+            "day": self._day,
+            "buy": self._buy,
+            "upgrade": self._upgrade,
+            "restock": self._restock,
+            "policy": self._policy,
+            "save": self._save,
+            "expect": self._expect
+        }
+
+    def run(self, commands: Iterable[str], output: Optional[TextIO] = None, stop_on_error: bool = False) -> List[Tuple[int, str, bool, str]]:
+        '''
+        Come parametri riceve esplicitamente i comandi (Iterable[str], ad esempio un file aperto o una lista di righe), output (Optional[TextIO], dove finiscono i print() del gioco:
+        None per scartarli, io.StringIO per catturarli, sys.stdout per vederli) e stop_on_error (bool, fermarsi al primo comando fallito)
+        oltre all'istanza della classe ScriptRunner (self implicito) e ha tipo di ritorno List[Tuple[int, str, bool, str]].
+        Esegue i comandi in ordine e restituisce, per ognuno, numero di riga, comando, esito e messaggio; righe vuote e commenti sono ignorati.
+        '''
+        results = []
+        with contextlib.redirect_stdout(output if output is not None else _NullOutput()):
+            for number, line in enumerate(commands, 1):
+                ok_message = self.execute(line)
+                if ok_message is None:
+                    continue
+                results.append((number, line.strip(), *ok_message))
+                if stop_on_error and not ok_message[0]:
+                    break
+        return results
+
+    def execute(self, line: str) -> Optional[Tuple[bool, str]]:
+        '''
+        Come parametro riceve esplicitamente una riga dello script (stringa) oltre all'istanza della classe ScriptRunner (self implicito)
+        e ha tipo di ritorno Optional[Tuple[bool, str]].
+        Esegue il comando della riga e restituisce esito e messaggio (None per righe vuote e commenti); comandi sconosciuti, argomenti errati
+        ed eccezioni del motore diventano un risultato (False, messaggio) invece di interrompere lo script.
+        '''
+        try:
+            words = shlex.split(line, comments=True)
+        except ValueError as e:
+            return False, f"Riga non valida: {e}"
+        if not words:
+            return None
+
+        name, args = words[0].lower(), words[1:]
+        handler = self.handlers.get(name)
+        if handler is None:
+            return False, f"Comando sconosciuto: {name}"
+        if name not in NO_GAME_COMMANDS and not self.engine.finance:
+            return False, "Nessuna partita in corso (usa new o load)"
+        try:
+            return handler(*args)
+        except (TypeError, ValueError) as e:
+            return False, f"Argomenti non validi per {name}: {e}"
+        except Exception as e:
+            return False, f"Errore: {e}"
+
+    def _seed(self, seed: str) -> Tuple[bool, str]:
+        random.seed(int(seed))
+        return True, f"Seme {seed}"
+
+    def _new(self, difficulty: str = "normal", player_name: str = "Script", restaurant_name: str = "FantaBurger") -> Tuple[bool, str]:
+        '''
+        Funzione privata che come parametri riceve difficoltà, nome del giocatore e del ristorante (stringhe, facoltative) oltre all'istanza della classe ScriptRunner (self implicito)
+        e ha tipo di ritorno Tuple[bool, str]. Inizia una nuova partita se la difficoltà esiste in config.json.
+        '''
+        engine = self.engine
+        if difficulty not in engine.settings.difficulty:
+            return False, f"Difficoltà sconosciuta: {difficulty}"
+        engine.new_game(player_name, restaurant_name, difficulty)
+        engine.running = True
+        return True, f"Nuova partita ({difficulty})"
+
+    def _load(self) -> Tuple[bool, str]:
+        if not self.engine.load_game():
+            return False, "Nessun salvataggio caricabile"
+        self.engine.running = True
+        return True, f"Partita caricata (giorno {self.engine.current_game_day})"
+
+    def _advance(self, hours: str = "1") -> Tuple[bool, str]:
+        '''
+        Funzione privata che come parametro riceve hours (stringa con il numero di ore, default "1") oltre all'istanza della classe ScriptRunner (self implicito)
+        e ha tipo di ritorno Tuple[bool, str]. Avanza ora per ora fermandosi a fine partita, come il comando advance del SimulationWorker.
+        '''
+        engine = self.engine
+        for _ in range(int(hours)):
+            if engine.game_over or engine.game_won:
+                return False, "Partita terminata"
+            engine.advance_hour()
+        return True, f"Giorno {engine.current_game_day} – Ora {engine.current_hour:02d}:00"
+
+    def _day(self) -> Tuple[bool, str]:
+        engine = self.engine
+        day = engine.current_game_day
+        while engine.current_game_day == day:
+            if engine.game_over or engine.game_won:
+                return False, "Partita terminata"
+            engine.advance_hour()
+        return True, f"Giorno {engine.current_game_day} – Ora {engine.current_hour:02d}:00"
+
+    def _buy(self, ingredient_path: str, qty: str) -> Tuple[bool, str]:
+        return self.engine.purchase_ingredient(ingredient_path, int(qty))
+
+    def _upgrade(self, upgrade_id: str) -> Tuple[bool, str]:
+        return self.engine.buy_upgrade(upgrade_id)
+
+    def _restock(self, budget: Optional[str] = None) -> Tuple[bool, str]:
+        success, msg, _ = self.engine.auto_restock(float(budget) if budget is not None else None)
+        return success, msg
+
+    def _policy(self, name: str) -> Tuple[bool, str]:
+        if name not in KITCHEN_POLICIES:
+            return False, f"Politica cucina sconosciuta: {name} (disponibili: {', '.join(KITCHEN_POLICIES)})"
+        self.engine.set_kitchen_policy(name)
+        return True, f"Politica cucina: {name}"
+
+    def _save(self) -> Tuple[bool, str]:
+        self.engine.safe_save()
+        return True, "Partita salvata"
+
+    def _expect(self, key: str, comparison: str, expected: str) -> Tuple[bool, str]:
+        '''
+        Funzione privata che come parametri riceve la chiave dello stato, l'operatore (==, !=, <, <=, >, >=) e il valore atteso (stringhe)
+        oltre all'istanza della classe ScriptRunner (self implicito) e ha tipo di ritorno Tuple[bool, str].
+        Confronta un valore di get_observed_state() (day, hour, balance, reputation, capacity, game_over, game_won) o un contatore della partita
+        (orders_completed_total, orders_expired_total, queue_length) con il valore atteso, letto come numero o come true/false.
+        '''
+        engine = self.engine
+        state = dict(engine.get_observed_state(), orders_completed_total=engine.orders_completed_total,
+                     orders_expired_total=engine.orders_expired_total, queue_length=len(engine.order_queue))
+        if key not in state:
+            return False, f"Chiave sconosciuta: {key} (disponibili: {', '.join(state)})"
+        if comparison not in COMPARISONS:
+            return False, f"Operatore sconosciuto: {comparison}"
+        value = {"true": True, "false": False}.get(expected.lower())
+        if value is None:
+            value = float(expected)
+        if COMPARISONS[comparison](state[key], value):
+            return True, f"{key} = {state[key]}"
+        return False, f"Atteso {key} {comparison} {expected}, trovato {state[key]}"
@@ -0,0 +1,517 @@
+import asyncio #importazione del modulo asyncio: un unico ciclo di eventi accetta le connessioni HTTP e smista le richieste di tutte le sessioni
+import itertools #importazione del modulo itertools per generare gli id progressivi delle sessioni
+import json #importazione del modulo standard Python necessario per leggere i corpi JSON delle richieste e scrivere le risposte
+import random #importazione del modulo random: il motore usa il generatore globale, quindi ogni sessione ne conserva uno stato proprio
+import sys #importazione del modulo sys per scrivere gli errori del server su stderr (lo stdout del gioco può essere silenziato)
+import threading #importazione del modulo necessario per gestire thread: il lock che protegge lo scambio dello stato del generatore casuale
+import time #importazione del modulo time per l'ultimo utilizzo delle sessioni e l'uptime del server
+import tracemalloc #importazione del modulo tracemalloc per stimare la memoria occupata da una sessione all'avvio
+from collections import OrderedDict #importazione di OrderedDict: sessioni in ordine di ultimo utilizzo, la prima è quella da liberare per prima (LRU)
+from concurrent.futures import ThreadPoolExecutor #importazione dell'esecutore che esegue i passi di simulazione fuori dal ciclo di eventi
+from urllib.parse import urlsplit, parse_qs #importazione delle funzioni per separare percorso e parametri della query string
+from typing import Dict, Any, Optional, Tuple, Callable, Set #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+Any corrisponde ad un tipo generico (cioè accetta qualsiasi valore)
+Optional corrisponde ad un valore che può essere None
+Tuple corrisponde ad una tupla (sequenza immutabile di valori)
+Callable corrisponde ad una funzione (o qualsiasi oggetto chiamabile)
+Set corrisponde ad un insieme (elementi unici, ricerca in tempo costante)
+'''
+from .game import GameEngine #importazione della classe principale GameEngine dal modulo locale: ogni sessione è una partita in memoria
+from .finance import REPORT_PERIODS #importazione dei periodi dei report finanziari dal modulo locale, per validare il parametro period
+
+MAX_BODY_BYTES = 64 * 1024 # dimensione massima del corpo di una richiesta
+MAX_HEADER_BYTES = 16 * 1024 # dimensione massima di riga di richiesta e intestazioni
+MAX_PURCHASE = 10_000 # unità massime di un singolo acquisto
+SAMPLE_HOURS = 12 # ore giocate dalla partita campione con cui si stima la memoria di una sessione
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 431: "Request Header Fields Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+RANDOM_LOCK = threading.Lock() # protegge lo scambio dello stato del generatore globale di random durante un passo di simulazione
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        '''
+        Come parametri riceve esplicitamente il codice HTTP (int) e il messaggio di errore (stringa) oltre all'istanza della classe HTTPError (self implicito).
+        Errore di una richiesta: handle_request() lo trasforma nella risposta {"error": message} con quel codice.
+        '''
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class Session:
+    __slots__ = ("id", "engine", "random_state", "lock", "last_used", "requests")
+
+    def __init__(self, session_id: str, seed: Optional[int] = None):
+        '''
+        Come parametri riceve esplicitamente l'id della sessione (stringa) e seed (Optional[int], seme della partita, None per un seme casuale)
+        oltre all'istanza della classe Session (self implicito).
+        Partita ospitata dal server: il GameEngine, lo stato del generatore casuale della partita (scambiato con quello globale ad ogni passo,
+        così partite con lo stesso seme e gli stessi comandi sono identiche qualunque sia l'ordine con cui il server alterna le sessioni),
+        il lock asyncio che serializza le richieste sulla stessa partita, l'istante dell'ultimo utilizzo e il numero di richieste servite.
+        '''
+        self.id = session_id
+        self.engine: Optional[GameEngine] = None
+        self.random_state = random.Random(seed).getstate()
+        self.lock = asyncio.Lock()
+        self.last_used = time.monotonic()
+        self.requests = 0
+
+
+class SimulationServer:
+    def __init__(self, max_sessions: int = 1000, memory_mb: float = 512.0, idle_timeout: float = 900.0, max_pending: int = 256, max_hours: int = 168):
+        '''
+        Come parametri riceve esplicitamente max_sessions (int, sessioni contemporanee al massimo), memory_mb (float, memoria destinata alle sessioni in MB),
+        idle_timeout (float, secondi di inattività dopo cui una sessione viene rimossa), max_pending (int, passi di simulazione in attesa al massimo)
+        e max_hours (int, ore al massimo per una singola richiesta advance) oltre all'istanza della classe SimulationServer (self implicito).
+        Server HTTP/JSON locale che ospita molte partite (GameEngine non persistenti) nello stesso processo.
+        Un unico ciclo asyncio gestisce connessioni keep-alive e richieste; le letture (istantanea, report) sono brevi e vengono servite direttamente,
+        mentre i passi di simulazione (creazione, advance, buy, upgrade) vanno a un esecutore con un solo thread, così il ciclo di eventi resta reattivo.
+        Un solo thread basta perché il motore è Python puro (il GIL non permette passi in parallelo) e serve comunque a serializzare lo scambio del generatore casuale;
+        per più core si avviano più server. Quando ci sono già max_pending passi in attesa le nuove richieste ricevono 503 invece di allungare la coda.
+        Le sessioni sono in ordine di ultimo utilizzo: oltre la capacità (il minimo tra max_sessions e memory_mb diviso la memoria stimata di una sessione)
+        viene rimossa la sessione inattiva usata meno di recente, e un'attività periodica rimuove quelle inattive da più di idle_timeout secondi.
+        '''
+        self.max_sessions = max(1, max_sessions)
+        self.memory_bytes = int(memory_mb * 1024 * 1024)
+        self.idle_timeout = idle_timeout
+        self.max_pending = max(1, max_pending)
+        self.max_hours = max(1, max_hours)
+        self.capacity = self.max_sessions
+        self.session_bytes = 0
+        self.sessions: "OrderedDict[str, Session]" = OrderedDict()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SimulationStep")
+        self.pending = 0
+        self._steps: Set[asyncio.Future] = set() # passi accodati o in esecuzione nell'esecutore, annullati da close()
+        self.started = time.monotonic()
+        self.stats = {"requests": 0, "created": 0, "deleted": 0, "evicted": 0, "expired": 0, "rejected": 0, "errors": 0}
+        self._ids = itertools.count(1)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._expiry_task: Optional[asyncio.Task] = None
+        self.session_handlers: Dict[Tuple[str, Optional[str]], Callable] = {
+            ("GET", None): self._snapshot,
+            ("DELETE", None): self._delete,
+            ("GET", "snapshot"): self._snapshot,
+            ("GET", "report"): self._report,
+            ("POST", "advance"): self._advance,
+            ("POST", "buy"): self._buy,
+            ("POST", "upgrade"): self._upgrade
+        }
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> None:
+        '''
+        Come parametri riceve esplicitamente indirizzo (stringa) e porta (int, 0 per una porta libera) oltre all'istanza della classe SimulationServer (self implicito)
+        e ha tipo di ritorno None (non restituisce nulla).
+        Stima la memoria di una sessione, calcola la capacità, apre il socket in ascolto e avvia la rimozione periodica delle sessioni inattive.
+        '''
+        loop = asyncio.get_running_loop()
+        self.session_bytes = await loop.run_in_executor(self.executor, self.estimate_session_bytes)
+        self.capacity = max(1, min(self.max_sessions, self.memory_bytes // max(self.session_bytes, 1)))
+        self._server = await asyncio.start_server(self._handle_connection, host, port, limit=MAX_HEADER_BYTES)
+        self._expiry_task = asyncio.create_task(self._expire_idle())
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1] if self._server else 0
+
+    async def serve_forever(self) -> None:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SimulationServer e ha tipo di ritorno None (non restituisce nulla).
+        Serve le richieste finché il task non viene annullato (ad esempio con Ctrl+C), poi chiude il server.
+        '''
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SimulationServer e ha tipo di ritorno None (non restituisce nulla).
+        Chiude il socket in ascolto, ferma la rimozione periodica, annulla i passi ancora in coda (quello in esecuzione termina), ferma l'esecutore e libera tutte le sessioni.
+        '''
+        if self._expiry_task:
+            self._expiry_task.cancel()
+        if self._server:
+            self._server.close()
+        for step in list(self._steps):
+            step.cancel()
+        self.executor.shutdown(wait=False)
+        self.sessions.clear()
+
+    def estimate_session_bytes(self) -> int:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SimulationServer e ha tipo di ritorno int.
+        Stima con tracemalloc la memoria occupata da una sessione: crea una partita campione, la gioca per SAMPLE_HOURS ore (coda ordini, metriche e storico
+        crescono con il gioco) e misura i byte ancora allocati. Il generatore casuale globale viene ripristinato, quindi la stima non cambia le altre partite.
+        '''
+        with RANDOM_LOCK:
+            saved = random.getstate()
+            tracemalloc.start()
+            try:
+                engine = self._create_engine("Stima", "FantaBurger", "normal")
+                for _ in range(SAMPLE_HOURS):
+                    engine.advance_hour()
+                size = tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+                random.setstate(saved)
+        return size
+
+    async def handle_request(self, method: str, target: str, body: bytes = b"") -> Tuple[int, Dict[str, Any]]:
+        '''
+        Come parametri riceve esplicitamente il metodo HTTP (stringa), il percorso con l'eventuale query string (stringa) e il corpo della richiesta (bytes)
+        oltre all'istanza della classe SimulationServer (self implicito) e ha tipo di ritorno Tuple[int, Dict[str, Any]].
+        Smista la richiesta e restituisce codice HTTP e risposta JSON; i parametri sono quelli della query string aggiornati con quelli del corpo JSON.
+        Percorsi: POST /sessions (nuova partita), GET /sessions, GET /stats, GET|DELETE /sessions/<id>, GET /sessions/<id>/snapshot,
+        GET /sessions/<id>/report, POST /sessions/<id>/advance, /buy, /upgrade. Gli errori diventano {"error": messaggio} con il codice adatto.
+        '''
+        self.stats["requests"] += 1
+        try:
+            url = urlsplit(target)
+            params: Dict[str, Any] = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            if body:
+                try:
+                    data = json.loads(body)
+                except ValueError:
+                    raise HTTPError(400, "Corpo JSON non valido")
+                if not isinstance(data, dict):
+                    raise HTTPError(400, "Il corpo JSON deve essere un oggetto")
+                params.update(data)
+
+            parts = [part for part in url.path.split("/") if part]
+            if parts == ["stats"] and method == "GET":
+                return 200, self.get_stats()
+            if parts == ["sessions"]:
+                if method == "POST":
+                    return 201, await self._create(params)
+                if method == "GET":
+                    return 200, {"sessions": list(self.sessions)}
+                raise HTTPError(405, f"Metodo {method} non ammesso su /sessions")
+            if len(parts) in (2, 3) and parts[0] == "sessions":
+                action = parts[2] if len(parts) == 3 else None
+                handler = self.session_handlers.get((method, action))
+                if handler is None:
+                    if any(key[1] == action for key in self.session_handlers):
+                        raise HTTPError(405, f"Metodo {method} non ammesso su {url.path}")
+                    raise HTTPError(404, f"Azione sconosciuta: {action}")
+                return 200, await handler(self._get_session(parts[1]), params)
+            raise HTTPError(404, f"Percorso sconosciuto: {url.path}")
+
+        except HTTPError as e:
+            return e.status, {"error": e.message}
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"❌ Errore richiesta {method} {target}: {e}", file=sys.stderr)
+            return 500, {"error": f"Errore interno: {e}"}
+
+    def get_stats(self) -> Dict[str, Any]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SimulationServer e ha tipo di ritorno Dict[str, Any].
+        Restituisce lo stato del server: sessioni attive, capacità, memoria stimata per sessione, passi in attesa, contatori e uptime.
+        '''
+        return dict(self.stats, sessions=len(self.sessions), capacity=self.capacity, session_bytes=self.session_bytes,
+                    pending=self.pending, uptime_s=round(time.monotonic() - self.started, 1))
+
+    def _get_session(self, session_id: str) -> Session:
+        '''
+        Funzione privata che come parametro riceve esplicitamente l'id della sessione (stringa) oltre all'istanza della classe SimulationServer (self implicito)
+        e ha tipo di ritorno Session.
+        Restituisce la sessione e la sposta in fondo all'ordine LRU (usata più di recente); solleva HTTPError 404 se non esiste o è stata rimossa.
+        '''
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise HTTPError(404, f"Sessione {session_id} inesistente o rimossa per inattività")
+        self.sessions.move_to_end(session_id)
+        session.last_used = time.monotonic()
+        session.requests += 1
+        return session
+
+    def _make_room(self) -> None:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe SimulationServer e ha tipo di ritorno None (non restituisce nulla).
+        Se le sessioni hanno raggiunto la capacità rimuove quelle inattive (senza richieste in corso) usate meno di recente;
+        solleva HTTPError 503 se sono tutte occupate.
+        '''
+        while len(self.sessions) >= self.capacity:
+            victim = next((session_id for session_id, session in self.sessions.items() if not session.lock.locked()), None)
+            if victim is None:
+                self.stats["rejected"] += 1
+                raise HTTPError(503, "Capacità sessioni esaurita e nessuna sessione inattiva da liberare")
+            del self.sessions[victim]
+            self.stats["evicted"] += 1
+
+    async def _expire_idle(self) -> None:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe SimulationServer e ha tipo di ritorno None (non restituisce nulla).
+        Attività periodica: rimuove le sessioni inattive da più di idle_timeout secondi. Le sessioni sono in ordine di ultimo utilizzo,
+        quindi si ferma alla prima usata di recente invece di scorrerle tutte.
+        '''
+        interval = max(1.0, self.idle_timeout / 4)
+        while True:
+            await asyncio.sleep(interval)
+            deadline = time.monotonic() - self.idle_timeout
+            for session_id, session in list(self.sessions.items()):
+                if session.last_used > deadline:
+                    break
+                if not session.lock.locked():
+                    del self.sessions[session_id]
+                    self.stats["expired"] += 1
+
+    async def _step(self, session: Session, function: Callable, *args: Any) -> Any:
+        '''
+        Funzione privata che come parametri riceve esplicitamente la sessione (Session), la funzione da eseguire e i suoi argomenti
+        oltre all'istanza della classe SimulationServer (self implicito) e ha tipo di ritorno Any (il risultato della funzione).
+        Esegue un passo di simulazione nell'esecutore con il generatore casuale della sessione; va chiamata tenendo session.lock.
+        Solleva HTTPError 503 se ci sono già max_pending passi in attesa.
+        '''
+        if self.pending >= self.max_pending:
+            self.stats["rejected"] += 1
+            raise HTTPError(503, "Troppi passi di simulazione in coda, riprova più tardi")
+        self.pending += 1
+        step = asyncio.get_running_loop().run_in_executor(self.executor, self._run_seeded, session, function, args)
+        self._steps.add(step)
+        try:
+            return await step
+        finally:
+            self._steps.discard(step)
+            self.pending -= 1
+
+    @staticmethod
+    def _run_seeded(session: Session, function: Callable, args: tuple) -> Any:
+        '''
+        Funzione privata (eseguita nel thread dell'esecutore) che come parametri riceve la sessione, la funzione e i suoi argomenti e ha tipo di ritorno Any.
+        Sostituisce lo stato del generatore globale di random con quello della sessione, esegue la funzione e salva nella sessione lo stato aggiornato.
+        '''
+        with RANDOM_LOCK:
+            saved = random.getstate()
+            random.setstate(session.random_state)
+            try:
+                return function(*args)
+            finally:
+                session.random_state = random.getstate()
+                random.setstate(saved)
+
+    @staticmethod
+    def _create_engine(player_name: str, restaurant_name: str, difficulty: str) -> GameEngine:
+        '''
+        Funzione privata (eseguita nel thread dell'esecutore) che come parametri riceve nome del giocatore, nome del ristorante e difficoltà (stringhe)
+        e ha tipo di ritorno GameEngine.
+        Crea una partita solo in memoria (persistent False), senza ritardi nella generazione ordini e senza attese di fine partita (gui_mode).
+        Solleva HTTPError 400 se la difficoltà non esiste in config.json.
+        '''
+        engine = GameEngine(persistent=False)
+        if difficulty not in engine.settings.difficulty:
+            raise HTTPError(400, f"Difficoltà sconosciuta: {difficulty} (disponibili: {', '.join(engine.settings.difficulty)})")
+        engine.gui_mode = True
+        engine.simulate_delays = False
+        engine.new_game(player_name, restaurant_name, difficulty)
+        engine.running = True
+        return engine
+
+    @staticmethod
+    def _build_snapshot(session: Session) -> Dict[str, Any]:
+        '''
+        Funzione privata che come parametro riceve la sessione (Session) e ha tipo di ritorno Dict[str, Any].
+        Costruisce l'istantanea della partita: i valori osservati del GameEngine, coda ordini, contatori, upgrade, ricette sbloccate,
+        eventi attivi e quantità e costo di ogni ingrediente (con il percorso "categoria.nome" da usare per buy).
+        '''
+        engine = session.engine
+        ingredients = {}
+        for category, items in engine.inventory.data.get("ingredients", {}).items():
+            if isinstance(items, dict):
+                for name, data in items.items():
+                    if isinstance(data, dict):
+                        ingredients[f"{category}.{name}"] = {"quantity": data.get("current_quantity", 0), "cost": data.get("current_cost", data.get("base_cost", 0.0))}
+
+        snapshot = engine.get_observed_state()
+        snapshot.update({
+            "session": session.id,
+            "days": engine.max_days,
+            "queue_length": len(engine.order_queue),
+            "orders_completed_total": engine.orders_completed_total,
+            "orders_expired_total": engine.orders_expired_total,
+            "upgrade_counts": dict(engine.upgrade_counts),
+            "unlocked_upgrades": list(engine.unlocked_upgrades),
+            "unlocked_recipes": list(engine.unlocked_recipes),
+            "active_events": dict(engine.active_events),
+            "ingredients": ingredients
+        })
+        return snapshot
+
+    @staticmethod
+    def _int_param(params: Dict[str, Any], name: str, default: int, low: int, high: int) -> int:
+        '''
+        Funzione privata che come parametri riceve i parametri della richiesta, il nome del parametro, il valore di default e i limiti (int) e ha tipo di ritorno int.
+        Legge un parametro intero (anche come stringa della query string); solleva HTTPError 400 se non è un intero tra low e high.
+        '''
+        value = params.get(name, default)
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            raise HTTPError(400, f"Il parametro {name} deve essere un intero")
+        if not low <= value <= high:
+            raise HTTPError(400, f"Il parametro {name} deve essere tra {low} e {high}")
+        return value
+
+    async def _create(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        '''
+        Funzione privata che come parametro riceve i parametri della richiesta (player, restaurant, difficulty, seed facoltativi) oltre all'istanza della classe SimulationServer (self implicito)
+        e ha tipo di ritorno Dict[str, Any].
+        Crea una nuova partita, liberando spazio se la capacità è raggiunta, e restituisce id e istantanea della sessione.
+        '''
+        seed = params.get("seed")
+        if seed is not None and not isinstance(seed, int):
+            seed = self._int_param(params, "seed", 0, -2**63, 2**63 - 1)
+        session = Session(str(next(self._ids)), seed)
+        async with session.lock:
+            session.engine = await self._step(session, self._create_engine, str(params.get("player", "Giocatore")),
+                                              str(params.get("restaurant", "FantaBurger")), str(params.get("difficulty", "normal")))
+            self._make_room()
+            self.sessions[session.id] = session
+            self.stats["created"] += 1
+            return {"session": session.id, "state": self._build_snapshot(session)}
+
+    async def _delete(self, session: Session, params: Dict[str, Any]) -> Dict[str, Any]:
+        '''
+        Funzione privata che come parametri riceve la sessione e i parametri della richiesta oltre all'istanza della classe SimulationServer (self implicito)
+        e ha tipo di ritorno Dict[str, Any]. Rimuove la sessione (dopo le eventuali richieste ancora in corso su di essa).
+        '''
+        async with session.lock:
+            if self.sessions.pop(session.id, None) is not None:
+                self.stats["deleted"] += 1
+        return {"deleted": session.id}
+
+    async def _snapshot(self, session: Session, params: Dict[str, Any]) -> Dict[str, Any]:
+        '''
+        Funzione privata che come parametri riceve la sessione e i parametri della richiesta oltre all'istanza della classe SimulationServer (self implicito)
+        e ha tipo di ritorno Dict[str, Any]. Restituisce l'istantanea della partita, costruita direttamente nel ciclo di eventi.
+        '''
+        async with session.lock:
+            return self._build_snapshot(session)
+
+    async def _report(self, session: Session, params: Dict[str, Any]) -> Dict[str, Any]:
+        '''
+        Funzione privata che come parametri riceve la sessione e i parametri della richiesta (period: 'daily', 'weekly', 'monthly', 'all' o numero di giorni)
+        oltre all'istanza della classe SimulationServer (self implicito) e ha tipo di ritorno Dict[str, Any].
+        Restituisce il report finanziario del periodo e il riepilogo delle latenze degli ordini.
+        '''
+        period = params.get("period", "daily")
+        if period not in REPORT_PERIODS:
+            period = self._int_param(params, "period", 1, 1, 100_000)
+        async with session.lock:
+            return {"finance": session.engine.finance.get_financial_report(period), "latency": session.engine.get_latency_report()}
+
+    async def _advance(self, session: Session, params: Dict[str, Any]) -> Dict[str, Any]:
+        '''
+        Funzione privata che come parametri riceve la sessione e i parametri della richiesta (hours, default 1, al massimo max_hours)
+        oltre all'istanza della classe SimulationServer (self implicito) e ha tipo di ritorno Dict[str, Any].
+        Avanza la partita di hours ore fermandosi a fine partita, come il comando advance del SimulationWorker, e restituisce esito e istantanea.
+        '''
+        hours = self._int_param(params, "hours", 1, 1, self.max_hours)
+        async with session.lock:
+            ok, message = await self._step(session, self._advance_engine, session, hours)
+            return {"ok": ok, "message": message, "state": self._build_snapshot(session)}
+
+    @staticmethod
+    def _advance_engine(session: Session, hours: int) -> Tuple[bool, str]:
+        '''
+        Funzione privata (eseguita nel thread dell'esecutore) che come parametri riceve la sessione e le ore da giocare e ha tipo di ritorno Tuple[bool, str].
+        '''
+        engine = session.engine
+        for _ in range(hours):
+            if engine.game_over or engine.game_won:
+                break
+            engine.advance_hour()
+        if engine.game_over or engine.game_won:
+            return False, "Partita terminata"
+        return True, f"Giorno {engine.current_game_day} – Ora {engine.current_hour:02d}:00"
+
+    async def _buy(self, session: Session, params: Dict[str, Any]) -> Dict[str, Any]:
+        '''
+        Funzione privata che come parametri riceve la sessione e i parametri della richiesta (ingredient: percorso "categoria.nome", quantity: unità, default 1)
+        oltre all'istanza della classe SimulationServer (self implicito) e ha tipo di ritorno Dict[str, Any].
+        Acquista l'ingrediente con GameEngine.purchase_ingredient() e restituisce esito, messaggio e istantanea.
+        '''
+        ingredient = params.get("ingredient")
+        if not isinstance(ingredient, str):
+            raise HTTPError(400, "Parametro ingredient mancante")
+        quantity = self._int_param(params, "quantity", 1, 1, MAX_PURCHASE)
+        async with session.lock:
+            ok, message = await self._step(session, session.engine.purchase_ingredient, ingredient, quantity)
+            return {"ok": ok, "message": message, "state": self._build_snapshot(session)}
+
+    async def _upgrade(self, session: Session, params: Dict[str, Any]) -> Dict[str, Any]:
+        '''
+        Funzione privata che come parametri riceve la sessione e i parametri della richiesta (upgrade: "upgrade_kitchen", "new_employee" o "new_recipe")
+        oltre all'istanza della classe SimulationServer (self implicito) e ha tipo di ritorno Dict[str, Any].
+        Acquista l'upgrade con GameEngine.buy_upgrade() e restituisce esito, messaggio e istantanea.
+        '''
+        upgrade_id = params.get("upgrade")
+        if not isinstance(upgrade_id, str):
+            raise HTTPError(400, "Parametro upgrade mancante")
+        async with session.lock:
+            ok, message = await self._step(session, session.engine.buy_upgrade, upgrade_id)
+            return {"ok": ok, "message": message, "state": self._build_snapshot(session)}
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        '''
+        Funzione privata che come parametri riceve gli stream della connessione oltre all'istanza della classe SimulationServer (self implicito)
+        e ha tipo di ritorno None (non restituisce nulla).
+        Serve le richieste HTTP/1.1 di una connessione una dopo l'altra (keep-alive, salvo "Connection: close" o HTTP/1.0 senza keep-alive):
+        legge riga di richiesta, intestazioni e corpo (Content-Length), risponde con JSON e chiude la connessione su richieste malformate o troppo grandi.
+        '''
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._send(writer, 431, {"error": "Intestazioni troppo grandi"}, False)
+                    break
+
+                lines = head.decode("latin-1").split("\r\n")
+                request = lines[0].split(" ")
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    if value:
+                        headers[name.strip().lower()] = value.strip()
+                try:
+                    length = int(headers.get("content-length", 0))
+                except ValueError:
+                    length = -1
+                if len(request) != 3 or length < 0:
+                    await self._send(writer, 400, {"error": "Richiesta HTTP malformata"}, False)
+                    break
+                if length > MAX_BODY_BYTES:
+                    await self._send(writer, 413, {"error": f"Corpo oltre {MAX_BODY_BYTES} byte"}, False)
+                    break
+
+                method, target, version = request
+                body = await reader.readexactly(length) if length else b""
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection == "keep-alive" or (version == "HTTP/1.1" and connection != "close")
+                status, payload = await self.handle_request(method, target, body)
+                await self._send(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, status: int, payload: Dict[str, Any], keep_alive: bool) -> None:
+        '''
+        Funzione privata che come parametri riceve lo stream di scrittura, il codice HTTP, la risposta (dizionario) e keep_alive (bool) e ha tipo di ritorno None.
+        Scrive la risposta JSON con Content-Length e attende che il buffer di uscita si svuoti.
+        '''
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, 'OK')}\r\nContent-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
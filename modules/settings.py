@@ -0,0 +1,226 @@
+from typing import Dict, Any, List, Tuple #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+Any corrisponde ad un tipo generico (cioè accetta qualsiasi valore)
+List corrisponde ad una lista
+Tuple corrisponde ad una tupla (sequenza immutabile di valori)
+'''
+from .modifiers import BASE_VALUES #importazione delle grandezze modificabili dal modulo locale, per validare i moltiplicatori degli eventi
+
+REQUIRED = object() # valore sentinella: il campo deve essere presente in config.json
+
+
+class ConfigError(ValueError):
+    '''
+    Errore sollevato quando config.json non è valido; il messaggio elenca tutti i problemi trovati, uno per riga.
+    '''
+
+
+class SettingsSection:
+    __slots__ = ()
+    FIELDS: Tuple[Tuple[str, type, Any], ...] = () # (nome, tipo, valore di default oppure REQUIRED)
+
+    def __init__(self, **values: Any):
+        '''
+        Come parametri riceve esplicitamente i valori dei campi (per nome) oltre all'istanza della sezione (self implicito).
+        Classe base delle sezioni della configurazione compilate: oggetti con __slots__ i cui attributi sono letti direttamente nel codice di gioco,
+        senza ricerche annidate nel dizionario di config.json.
+        '''
+        for name in self.__slots__:
+            setattr(self, name, values.get(name))
+
+    @classmethod
+    def compile(cls, data: Any, path: str, errors: List[str]) -> 'SettingsSection':
+        '''
+        Come parametri riceve esplicitamente i dati della sezione letti da config.json, il percorso della sezione (stringa, per i messaggi) e la lista degli errori
+        e ha tipo di ritorno SettingsSection.
+        Controlla presenza e tipo di ogni campo di FIELDS (gli interi sono accettati dove serve un float e convertiti), applica i default
+        e poi le regole di validate(); gli errori vengono aggiunti a errors invece di fermarsi al primo.
+        '''
+        if data is None:
+            errors.append(f"{path}: sezione mancante")
+            data = {}
+        elif not isinstance(data, dict):
+            errors.append(f"{path}: deve essere un oggetto")
+            data = {}
+        values = {}
+        for name, kind, default in cls.FIELDS:
+            value = data.get(name, default)
+            if value is REQUIRED:
+                errors.append(f"{path}.{name}: campo mancante")
+                continue
+            if kind is float and isinstance(value, int) and not isinstance(value, bool):
+                value = float(value)
+            if value is not None and (not isinstance(value, kind) or (kind is not bool and isinstance(value, bool))):
+                errors.append(f"{path}.{name}: atteso {kind.__name__}, trovato {type(value).__name__}")
+                continue
+            values[name] = value
+        section = cls(**values)
+        if len(values) == len(cls.FIELDS):
+            section.validate(path, errors)
+        return section
+
+    def validate(self, path: str, errors: List[str]) -> None:
+        '''
+        Come parametri riceve esplicitamente il percorso della sezione (stringa) e la lista degli errori oltre all'istanza della sezione (self implicito)
+        e ha tipo di ritorno None (non restituisce nulla).
+        Regole di validazione della sezione oltre al tipo dei campi (chiamata solo se tutti i campi sono presenti e del tipo giusto); di default nessuna.
+        '''
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)})"
+
+
+class EconomySettings(SettingsSection):
+    __slots__ = ("initial_balance", "rent", "daily_tax", "employee_salary", "utility_price", "history_days")
+    FIELDS = (
+        ("initial_balance", float, REQUIRED),
+        ("rent", float, 20.0),
+        ("daily_tax", float, 75.0),
+        ("employee_salary", float, 30.0),
+        ("utility_price", float, 20.0),
+        ("history_days", int, 365)
+    )
+
+    def validate(self, path: str, errors: List[str]) -> None:
+        for name in self.__slots__:
+            if getattr(self, name) < 0:
+                errors.append(f"{path}.{name}: non può essere negativo")
+        if self.history_days < 1:
+            errors.append(f"{path}.history_days: deve essere almeno 1")
+
+
+class GameplaySettings(SettingsSection):
+    __slots__ = ("initial_reputation", "max_concurrent_orders", "order_timeout", "customer_patience", "max_burgers_per_order", "starting_difficulty", "unlock")
+    FIELDS = (
+        ("initial_reputation", float, REQUIRED),
+        ("max_concurrent_orders", int, REQUIRED),
+        ("order_timeout", int, REQUIRED),
+        ("customer_patience", int, REQUIRED),
+        ("max_burgers_per_order", int, REQUIRED),
+        ("starting_difficulty", str, "easy"),
+        ("unlock", dict, REQUIRED)
+    )
+
+    def validate(self, path: str, errors: List[str]) -> None:
+        if not 0 <= self.initial_reputation <= 100:
+            errors.append(f"{path}.initial_reputation: deve essere tra 0 e 100")
+        if self.max_concurrent_orders < 1:
+            errors.append(f"{path}.max_concurrent_orders: deve essere almeno 1")
+        if self.order_timeout < 0:
+            errors.append(f"{path}.order_timeout: non può essere negativo")
+        if self.max_burgers_per_order < 1:
+            errors.append(f"{path}.max_burgers_per_order: deve essere almeno 1")
+        for name, cost in self.unlock.items():
+            if isinstance(cost, bool) or not isinstance(cost, (int, float)) or cost < 0:
+                errors.append(f"{path}.unlock.{name}: deve essere un numero non negativo")
+
+
+class TimeSettings(SettingsSection):
+    __slots__ = ("working_start", "working_end", "days")
+    FIELDS = (
+        ("working_start", int, REQUIRED),
+        ("working_end", int, REQUIRED),
+        ("days", int, REQUIRED)
+    )
+
+    def validate(self, path: str, errors: List[str]) -> None:
+        if not 0 <= self.working_start < self.working_end <= 24:
+            errors.append(f"{path}: serve 0 <= working_start < working_end <= 24")
+        if self.days < 1:
+            errors.append(f"{path}.days: deve essere almeno 1")
+
+
+class EventSettings(SettingsSection):
+    __slots__ = ("enabled", "min_interval", "max_interval", "event_duration", "special_events", "probabilities", "definitions")
+    FIELDS = (
+        ("enabled", bool, REQUIRED),
+        ("min_interval", int, REQUIRED),
+        ("max_interval", int, REQUIRED),
+        ("event_duration", int, REQUIRED),
+        ("special_events", dict, {}),
+        ("probabilities", dict, REQUIRED),
+        ("definitions", dict, None)
+    )
+
+    def validate(self, path: str, errors: List[str]) -> None:
+        if not 1 <= self.min_interval <= self.max_interval:
+            errors.append(f"{path}: serve 1 <= min_interval <= max_interval")
+        if self.event_duration < 1:
+            errors.append(f"{path}.event_duration: deve essere almeno 1")
+        weights = list(self.probabilities.values())
+        if any(isinstance(w, bool) or not isinstance(w, (int, float)) or w < 0 for w in weights) or sum(w for w in weights if isinstance(w, (int, float))) <= 0:
+            errors.append(f"{path}.probabilities: servono pesi non negativi con somma positiva")
+
+        for name, definition in (self.definitions or {}).items():
+            where = f"{path}.definitions.{name}"
+            if not isinstance(definition, dict):
+                errors.append(f"{where}: deve essere un oggetto")
+                continue
+            if definition.get("category", "neutral") not in self.probabilities:
+                errors.append(f"{where}.category: categoria sconosciuta '{definition.get('category')}'")
+            money = definition.get("money")
+            if money is not None and not (isinstance(money, list) and len(money) == 2 and all(isinstance(v, (int, float)) for v in money) and money[0] <= money[1]):
+                errors.append(f"{where}.money: atteso [minimo, massimo]")
+            for target in definition.get("multipliers", {}):
+                if target not in BASE_VALUES:
+                    errors.append(f"{where}.multipliers.{target}: grandezza sconosciuta")
+
+
+class DifficultyLevel(SettingsSection):
+    __slots__ = ("customer_frequency", "order_complexity", "profit", "event_frequency")
+    FIELDS = (
+        ("customer_frequency", float, 1.0),
+        ("order_complexity", float, 1.0),
+        ("profit", float, 1.0),
+        ("event_frequency", float, 1.0)
+    )
+
+    def validate(self, path: str, errors: List[str]) -> None:
+        for name in self.__slots__:
+            if getattr(self, name) <= 0:
+                errors.append(f"{path}.{name}: deve essere positivo")
+
+
+class Settings:
+    __slots__ = ("economy", "gameplay", "time", "events", "difficulty")
+
+    def __init__(self, economy: EconomySettings, gameplay: GameplaySettings, time: TimeSettings, events: EventSettings, difficulty: Dict[str, DifficultyLevel]):
+        '''
+        Come parametri riceve esplicitamente le sezioni compilate (economia, gameplay, orari, eventi e livelli di difficoltà per nome)
+        oltre all'istanza della classe Settings (self implicito).
+        Configurazione compilata da compile_settings(): le sezioni sono oggetti con attributi tipati, letti direttamente dal GameEngine.
+        '''
+        self.economy = economy
+        self.gameplay = gameplay
+        self.time = time
+        self.events = events
+        self.difficulty = difficulty
+
+
+def compile_settings(config: Dict[str, Any]) -> Settings:
+    '''
+    Come parametro riceve esplicitamente la configurazione letta da config.json (Dict[str, Any]) e ha tipo di ritorno Settings.
+    Compila e valida una volta sola le sezioni economy, gameplay, time, events e difficulty.levels; se ci sono errori solleva ConfigError con l'elenco completo,
+    così una configurazione sbagliata blocca l'avvio invece di fallire durante la partita.
+    '''
+    errors: List[str] = []
+    economy = EconomySettings.compile(config.get("economy"), "economy", errors)
+    gameplay = GameplaySettings.compile(config.get("gameplay"), "gameplay", errors)
+    time = TimeSettings.compile(config.get("time"), "time", errors)
+    events = EventSettings.compile(config.get("events"), "events", errors)
+
+    levels = config.get("difficulty", {}).get("levels") if isinstance(config.get("difficulty"), dict) else None
+    difficulty = {}
+    if not isinstance(levels, dict) or not levels:
+        errors.append("difficulty.levels: serve almeno un livello di difficoltà")
+    else:
+        for name, data in levels.items():
+            difficulty[name] = DifficultyLevel.compile(data, f"difficulty.levels.{name}", errors)
+        if isinstance(gameplay.starting_difficulty, str) and gameplay.starting_difficulty not in difficulty:
+            errors.append(f"gameplay.starting_difficulty: livello sconosciuto '{gameplay.starting_difficulty}'")
+
+    if errors:
+        raise ConfigError("Configurazione non valida:\n" + "\n".join(f" - {error}" for error in errors))
+    return Settings(economy, gameplay, time, events, difficulty)
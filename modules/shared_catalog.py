@@ -0,0 +1,213 @@
+import json #importazione del modulo standard Python necessario per serializzare configurazione e nomi nell'intestazione del blocco condiviso
+import multiprocessing #importazione del modulo multiprocessing per il pool di processi che giocano i lotti di partite
+import os #importazione del modulo necessario per conoscere il numero di CPU disponibili
+import struct #importazione del modulo struct per il prefisso binario a lunghezza fissa del blocco condiviso
+from array import array #importazione della classe array per scrivere le colonne numeriche del catalogo nel blocco condiviso
+from multiprocessing.shared_memory import SharedMemory #importazione della classe SharedMemory: blocco di memoria con nome, agganciabile da altri processi senza copie
+from typing import Dict, Any, List, Optional, Sequence, Tuple #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+Any corrisponde ad un tipo generico (cioè accetta qualsiasi valore)
+List corrisponde ad una lista
+Optional corrisponde ad un valore che può essere None
+Sequence corrisponde ad una qualsiasi sequenza indicizzabile (lista, tupla, ...)
+Tuple corrisponde ad una tupla (sequenza immutabile di valori)
+'''
+from .batch import BatchCatalog, BatchSimulator #importazione del catalogo e del simulatore a lotti dal modulo locale
+
+CATALOG_MAGIC = b"FBCT" # firma iniziale del blocco condiviso
+CATALOG_VERSION = 3 # versione del formato del blocco, controllata quando un processo si aggancia
+PREFIX = struct.Struct("<4sHI") # firma, versione, lunghezza dell'intestazione JSON
+ALIGNMENT = 8 # allineamento in byte dell'inizio di ogni colonna (la dimensione di un double e di un intero a 64 bit)
+
+
+def _align(size: int) -> int:
+    '''
+    Funzione privata che come parametro riceve una dimensione in byte (int) e ha tipo di ritorno int.
+    Arrotonda la dimensione al multiplo successivo di ALIGNMENT.
+    '''
+    return (size + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class SharedCatalog:
+    def __init__(self, shm: SharedMemory, owner: bool):
+        '''
+        Come parametri riceve esplicitamente il blocco di memoria condivisa (SharedMemory) e owner (bool, True per il processo che lo ha creato)
+        oltre all'istanza della classe SharedCatalog (self implicito).
+        Catalogo immutabile (configurazione, ingredienti, ricette) scritto una volta in un blocco di memoria condivisa e letto dai processi worker senza riparsare
+        config.json, ingredients.json e recipes.json. Il blocco contiene un prefisso fisso, un'intestazione JSON (configurazione e nomi) e colonne numeriche
+        allineate: quantità iniziali, prezzi e costi in centesimi e la matrice sparsa dei requisiti delle ricette (offset per ricetta, indici degli ingredienti, quantità).
+        Le colonne sono esposte come memoryview di sola lettura sul blocco (nessuna copia per processo); solo le tuple dei requisiti vengono ricostruite.
+        Va creato con create() o agganciato con attach() e chiuso con close() (o usato come context manager).
+        '''
+        self.shm = shm
+        self.owner = owner
+        view = shm.buf.toreadonly()
+        magic, version, header_length = PREFIX.unpack_from(view)
+        if magic != CATALOG_MAGIC:
+            view.release()
+            raise ValueError(f"il blocco condiviso {shm.name} non è un catalogo FantaBurger")
+        if version != CATALOG_VERSION:
+            view.release()
+            raise ValueError(f"versione del catalogo condiviso non supportata: {version}")
+
+        header = json.loads(bytes(view[PREFIX.size:PREFIX.size + header_length]))
+        start = _align(PREFIX.size + header_length)
+        self._views: List[memoryview] = [view]
+        columns = {}
+        for name, typecode, offset, count in header["columns"]:
+            column = view[start + offset:start + offset + count * array(typecode).itemsize].cast(typecode)
+            self._views.append(column)
+            columns[name] = column
+
+        offsets = columns["requirement_offsets"].tolist()
+        ingredients = columns["requirement_ingredients"].tolist()
+        quantities = columns["requirement_quantities"].tolist()
+        requirements = [tuple(zip(ingredients[offsets[r]:offsets[r + 1]], quantities[offsets[r]:offsets[r + 1]])) for r in range(len(header["recipe_ids"]))]
+
+        self.config: Dict[str, Any] = header["config"]
+        self.catalog: Optional[BatchCatalog] = BatchCatalog(header["ingredient_paths"], columns["initial_quantities"], header["recipe_ids"],
+                                                            columns["prices"], columns["costs"], requirements, header["base_recipes"], header["secret_recipes"])
+
+    @classmethod
+    def create(cls, catalog: BatchCatalog, config: Dict[str, Any], name: Optional[str] = None) -> 'SharedCatalog':
+        '''
+        Come parametri riceve esplicitamente il catalogo (BatchCatalog), la configurazione (Dict[str, Any]) e name (Optional[str], nome del blocco, se None lo sceglie il sistema)
+        e ha tipo di ritorno SharedCatalog.
+        Crea il blocco di memoria condivisa della dimensione esatta e vi scrive una volta sola configurazione, nomi e colonne del catalogo.
+        Il processo che lo crea ne è il proprietario: close() lo rimuove dal sistema.
+        '''
+        offsets, ingredients, quantities = [0], [], []
+        for requirement in catalog.requirements:
+            for ingredient, quantity in requirement:
+                ingredients.append(ingredient)
+                quantities.append(quantity)
+            offsets.append(len(ingredients))
+        columns: List[Tuple[str, array]] = [
+            ("initial_quantities", array('q', catalog.initial_quantities)),
+            ("prices", array('q', catalog.prices)),
+            ("costs", array('q', catalog.costs)),
+            ("requirement_offsets", array('q', offsets)),
+            ("requirement_ingredients", array('q', ingredients)),
+            ("requirement_quantities", array('q', quantities))
+        ]
+
+        layout, position = [], 0
+        for column_name, column in columns:
+            layout.append([column_name, column.typecode, position, len(column)])
+            position += _align(len(column) * column.itemsize)
+        header = json.dumps({
+            "config": config,
+            "ingredient_paths": catalog.ingredient_paths,
+            "recipe_ids": catalog.recipe_ids,
+            "base_recipes": catalog.base_recipes,
+            "secret_recipes": catalog.secret_recipes,
+            "columns": layout
+        }, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        start = _align(PREFIX.size + len(header))
+
+        shm = SharedMemory(name=name, create=True, size=start + position)
+        try:
+            PREFIX.pack_into(shm.buf, 0, CATALOG_MAGIC, CATALOG_VERSION, len(header))
+            shm.buf[PREFIX.size:PREFIX.size + len(header)] = header
+            for (_, _, offset, _), (_, column) in zip(layout, columns):
+                data = column.tobytes()
+                shm.buf[start + offset:start + offset + len(data)] = data
+            return cls(shm, owner=True)
+        except Exception:
+            shm.close()
+            shm.unlink()
+            raise
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedCatalog':
+        '''
+        Come parametro riceve esplicitamente il nome del blocco condiviso (stringa) e ha tipo di ritorno SharedCatalog.
+        Aggancia in sola lettura un catalogo creato da create() in un altro processo; solleva ValueError se il blocco non è un catalogo di questa versione.
+        '''
+        shm = SharedMemory(name=name)
+        try:
+            return cls(shm, owner=False)
+        except Exception:
+            shm.close()
+            raise
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def size(self) -> int:
+        return self.shm.size
+
+    def close(self) -> None:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SharedCatalog e ha tipo di ritorno None (non restituisce nulla).
+        Rilascia le viste sul blocco e lo chiude; se questo processo lo ha creato lo rimuove anche dal sistema.
+        Dopo la chiusura il catalogo non è più utilizzabile.
+        '''
+        if self.shm is None:
+            return
+        self.catalog = None
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+        self.shm = None
+
+    def __enter__(self) -> 'SharedCatalog':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+_worker_catalog: Optional[SharedCatalog] = None # catalogo agganciato dal processo worker, una volta sola all'avvio del processo
+
+
+def _attach_worker(name: str) -> None:
+    '''
+    Funzione privata che come parametro riceve il nome del blocco condiviso (stringa) e ha tipo di ritorno None (non restituisce nulla).
+    Inizializzatore dei processi del pool: aggancia il catalogo condiviso invece di rileggere i file JSON.
+    '''
+    global _worker_catalog
+    _worker_catalog = SharedCatalog.attach(name)
+
+
+def _play_chunk(task: Tuple[List[int], str, Optional[int], bool]) -> List[Dict[str, Any]]:
+    '''
+    Funzione privata che come parametro riceve un lotto di lavoro (semi, difficoltà, giorni, acquisto degli upgrade) e ha tipo di ritorno List[Dict[str, Any]].
+    Gioca i semi del lotto con un BatchSimulator sul catalogo condiviso del processo worker e ne restituisce i risultati.
+    '''
+    seeds, difficulty, days, upgrades = task
+    return BatchSimulator(seeds, difficulty, _worker_catalog.config, _worker_catalog.catalog, upgrades).run(days)
+
+
+def run_parallel(seeds: Sequence[int], difficulty: str = "easy", processes: Optional[int] = None, days: Optional[int] = None,
+                 config: Optional[Dict[str, Any]] = None, catalog: Optional[BatchCatalog] = None, start_method: Optional[str] = None,
+                 upgrades: bool = False) -> List[Dict[str, Any]]:
+    '''
+    Come parametri riceve esplicitamente i semi (Sequence[int]), la difficoltà (stringa), processes (Optional[int], default il numero di CPU), days (Optional[int]),
+    config e catalog (se None letti da data/), start_method (Optional[str], "fork", "spawn" o "forkserver", default quello della piattaforma)
+    e upgrades (bool, come per il BatchSimulator)
+    e ha tipo di ritorno List[Dict[str, Any]].
+    Gioca le partite dei semi su un pool di processi: il catalogo viene scritto una volta in memoria condivisa, ogni worker lo aggancia all'avvio
+    e gioca lotti di semi con il BatchSimulator. Restituisce i risultati nello stesso ordine dei semi (identici a quelli di un unico BatchSimulator).
+    '''
+    if config is None:
+        with open('data/config.json', 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    catalog = catalog or BatchCatalog.from_files()
+    seeds = list(seeds)
+    processes = processes or os.cpu_count() or 1
+    chunk_size = max(1, -(-len(seeds) // (processes * 4)))
+    tasks = [(seeds[i:i + chunk_size], difficulty, days, upgrades) for i in range(0, len(seeds), chunk_size)]
+
+    context = multiprocessing.get_context(start_method)
+    with SharedCatalog.create(catalog, config) as shared:
+        with context.Pool(processes, initializer=_attach_worker, initargs=(shared.name,)) as pool:
+            chunks = pool.map(_play_chunk, tasks)
+    return [result for chunk in chunks for result in chunk]
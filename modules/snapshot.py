@@ -0,0 +1,228 @@
+import json #importazione del modulo standard Python necessario per serializzare l'intestazione dell'istantanea
+import os #importazione del modulo necessario per operazioni sul sistema operativo: creazione cartella, sostituzione atomica del file
+import struct #importazione del modulo struct per il prefisso binario a lunghezza fissa dell'istantanea
+import sys #importazione del modulo sys per conoscere l'ordine dei byte della macchina (gli array sono scritti sempre little-endian)
+import zlib #importazione del modulo zlib per comprimere l'intestazione JSON dell'istantanea
+from array import array #importazione della classe array: sequenze compatte di numeri, convertite in byte e ricostruite senza parsing
+from typing import Dict, Any, List, Tuple #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+Any corrisponde ad un tipo generico (cioè accetta qualsiasi valore)
+List corrisponde ad una lista
+Tuple corrisponde ad una tupla (sequenza immutabile di valori)
+'''
+
+SNAPSHOT_MAGIC = b"FBSN" # firma iniziale del file di istantanea
+SNAPSHOT_VERSION = 1 # versione del formato binario, controllata in lettura
+PREFIX = struct.Struct("<4sHI") # firma, versione, lunghezza dell'intestazione compressa
+
+ORDER_INT_FIELDS = ("id", "quantity", "remaining", "arrival_hour", "arrival_time", "first_unit_time", "completed_time") # campi interi degli ordini salvati come array (None diventa -1)
+ORDER_NULLABLE_FIELDS = ("first_unit_time", "completed_time") # campi interi degli ordini che possono valere None
+ORDER_FIELDS = frozenset(ORDER_INT_FIELDS + ("recipe_id", "recipe_name")) # gli ordini con esattamente questi campi vengono impacchettati, gli altri restano nell'intestazione JSON
+ITEM_LEVEL_FIELDS = ("current_quantity", "current_cost") # valori variabili di ogni ingrediente salvati come array di double (NaN se assenti)
+
+
+def _ingredient_items(section: Dict[str, Any]) -> List[Dict[str, Any]]:
+    '''
+    Funzione privata che come parametro riceve una sezione dell'albero ingredienti (Dict[str, Any]) e ha tipo di ritorno List[Dict[str, Any]].
+    Restituisce gli ingredienti (dizionari con display_name) in ordine di visita, come Inventory.build_flat_cache(); scrittura e lettura usano lo stesso ordine.
+    '''
+    items = []
+    for value in section.values():
+        if isinstance(value, dict):
+            if "display_name" in value:
+                items.append(value)
+            else:
+                items.extend(_ingredient_items(value))
+    return items
+
+
+def _strip_levels(section: Dict[str, Any]) -> Dict[str, Any]:
+    '''
+    Funzione privata che come parametro riceve una sezione dell'albero ingredienti (Dict[str, Any]) e ha tipo di ritorno Dict[str, Any].
+    Restituisce una copia della sezione senza quantità e costi correnti (che finiscono negli array), senza modificare i dati dell'inventario.
+    '''
+    stripped = {}
+    for key, value in section.items():
+        if isinstance(value, dict):
+            if "display_name" in value:
+                stripped[key] = {k: v for k, v in value.items() if k not in ITEM_LEVEL_FIELDS}
+            else:
+                stripped[key] = _strip_levels(value)
+        else:
+            stripped[key] = value
+    return stripped
+
+
+def _packable_order(order: Dict[str, Any]) -> bool:
+    '''
+    Funzione privata che come parametro riceve un ordine (Dict[str, Any]) e ha tipo di ritorno bool.
+    Restituisce True se l'ordine ha esattamente i campi di ORDER_FIELDS con valori interi (o None dove ammesso), cioè se può essere salvato negli array.
+    '''
+    if set(order) != ORDER_FIELDS:
+        return False
+    for field in ORDER_INT_FIELDS:
+        value = order[field]
+        if value is None and field in ORDER_NULLABLE_FIELDS:
+            continue
+        if type(value) is not int or value < 0:
+            return False
+    return True
+
+
+def _pack(typecode: str, values: List) -> bytes:
+    '''
+    Funzione privata che come parametri riceve il codice di tipo dell'array (stringa) e i valori (lista) e ha tipo di ritorno bytes.
+    Converte i valori in byte little-endian.
+    '''
+    packed = array(typecode, values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack(typecode: str, data: memoryview) -> array:
+    '''
+    Funzione privata che come parametri riceve il codice di tipo dell'array (stringa) e i byte little-endian (memoryview) e ha tipo di ritorno array.
+    Ricostruisce l'array dai byte con una sola copia.
+    '''
+    unpacked = array(typecode)
+    unpacked.frombytes(data)
+    if sys.byteorder == "big":
+        unpacked.byteswap()
+    return unpacked
+
+
+def encode_snapshot(sections: Dict[str, Any]) -> bytes:
+    '''
+    Come parametro riceve esplicitamente le sezioni del salvataggio (Dict[str, Any], nome sezione -> dati) e ha tipo di ritorno bytes.
+    Codifica le sezioni nel formato binario: prefisso fisso (firma, versione, lunghezza), intestazione JSON compressa con zlib e blocchi di array numerici.
+    Quantità e costi degli ingredienti e gli ordini in coda diventano array (double e interi a 64 bit) invece di testo; il resto resta nell'intestazione.
+    '''
+    header_sections = dict(sections)
+    blocks: List[Tuple[str, str, bytes]] = []
+
+    inventory = sections.get("inventory") or {}
+    inventory_data = inventory.get("inventory_data")
+    if isinstance(inventory_data, dict):
+        items = _ingredient_items(inventory_data.get("ingredients", {}))
+        for field in ITEM_LEVEL_FIELDS:
+            blocks.append((f"inventory.{field}", "d", _pack("d", [float(item.get(field, float("nan"))) for item in items])))
+        header_sections["inventory"] = dict(inventory, inventory_data=dict(inventory_data, ingredients=_strip_levels(inventory_data.get("ingredients", {}))))
+
+    orders = sections.get("orders") or {}
+    queue = orders.get("order_queue")
+    if queue and all(_packable_order(order) for order in queue):
+        recipes = {}
+        for order in queue:
+            recipes.setdefault(order["recipe_id"], order["recipe_name"])
+        recipe_index = {recipe_id: i for i, recipe_id in enumerate(recipes)}
+        for field in ORDER_INT_FIELDS:
+            blocks.append((f"orders.{field}", "q", _pack("q", [-1 if order[field] is None else order[field] for order in queue])))
+        blocks.append(("orders.recipe", "q", _pack("q", [recipe_index[order["recipe_id"]] for order in queue])))
+        header_sections["orders"] = dict(orders, order_queue=None, order_recipes=[[recipe_id, name] for recipe_id, name in recipes.items()])
+
+    header = {
+        "sections": header_sections,
+        "blocks": [[name, typecode, len(data)] for name, typecode, data in blocks]
+    }
+    compressed = zlib.compress(json.dumps(header, separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+    return b"".join([PREFIX.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(compressed)), compressed] + [data for _, _, data in blocks])
+
+
+def decode_snapshot(data: bytes) -> Dict[str, Any]:
+    '''
+    Come parametro riceve esplicitamente il contenuto del file di istantanea (bytes) e ha tipo di ritorno Dict[str, Any].
+    Decodifica il formato di encode_snapshot() restituendo le sezioni del salvataggio; solleva ValueError se firma o versione non sono riconosciute.
+    '''
+    magic, version, header_length = PREFIX.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("non è un'istantanea FantaBurger")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"versione dell'istantanea non supportata: {version}")
+
+    view = memoryview(data)
+    offset = PREFIX.size
+    header = json.loads(zlib.decompress(view[offset:offset + header_length]))
+    offset += header_length
+
+    blocks = {}
+    for name, typecode, length in header["blocks"]:
+        blocks[name] = _unpack(typecode, view[offset:offset + length])
+        offset += length
+
+    sections = header["sections"]
+    if "inventory.current_quantity" in blocks:
+        items = _ingredient_items(sections["inventory"]["inventory_data"].get("ingredients", {}))
+        for field in ITEM_LEVEL_FIELDS:
+            for item, value in zip(items, blocks[f"inventory.{field}"]):
+                if value == value:
+                    item[field] = int(value) if field == "current_quantity" and value.is_integer() else value
+
+    if "orders.recipe" in blocks:
+        orders = sections["orders"]
+        recipes = orders.pop("order_recipes")
+        columns = [blocks[f"orders.{field}"] for field in ORDER_INT_FIELDS]
+        queue = []
+        for i, recipe in enumerate(blocks["orders.recipe"]):
+            order = {field: (None if column[i] == -1 and field in ORDER_NULLABLE_FIELDS else column[i])
+                     for field, column in zip(ORDER_INT_FIELDS, columns)}
+            order["recipe_id"], order["recipe_name"] = recipes[recipe]
+            queue.append(order)
+        orders["order_queue"] = queue
+    return sections
+
+
+class SnapshotStore:
+    embeds_inventory = True # il GameEngine include l'intero inventario nella sezione inventory, così il caricamento non rilegge ingredients.json
+
+    def __init__(self, path: str = 'data/savestate.fbs'):
+        '''
+        Come parametro riceve esplicitamente il percorso del file (stringa, con 'data/savestate.fbs' come valore di default)
+        oltre all'istanza della classe SnapshotStore (self implicito).
+        Backend di salvataggio alternativo a SaveStore (stessa interfaccia: exists, write_sections, read_sections) che scrive l'intero stato
+        in un unico file binario compatto (vedi encode_snapshot()); il caricamento è una sola lettura del file senza altri parsing.
+        Le sezioni non cambiate vengono tenute in memoria dall'ultima scrittura o lettura, così ogni salvataggio riscrive un'istantanea completa.
+        '''
+        self.path = path
+        self.sections: Dict[str, Any] = {}
+
+    def exists(self) -> bool:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SnapshotStore e ha tipo di ritorno bool.
+        Restituisce True se il file di istantanea esiste.
+        '''
+        return os.path.exists(self.path)
+
+    def write_sections(self, sections: Dict[str, Any]) -> List[str]:
+        '''
+        Come parametro riceve esplicitamente sections (Dict[str, Any], nome sezione -> dati) oltre all'istanza della classe SnapshotStore (self implicito)
+        e ha tipo di ritorno List[str].
+        Aggiorna le sezioni ricevute e riscrive l'istantanea completa in un file temporaneo, sostituito atomicamente a quello vecchio (os.replace).
+        Restituisce i nomi delle sezioni scritte.
+        '''
+        if not sections:
+            return []
+        self.sections.update(sections)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(encode_snapshot(self.sections))
+        os.replace(tmp_path, self.path)
+        return list(sections)
+
+    def read_sections(self) -> Dict[str, Any]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SnapshotStore e ha tipo di ritorno Dict[str, Any].
+        Legge il file con una sola lettura e restituisce le sezioni decodificate; se il file è corrotto o di un'altra versione lo segnala e restituisce un dizionario vuoto.
+        '''
+        try:
+            with open(self.path, 'rb') as f:
+                self.sections = decode_snapshot(f.read())
+        except (OSError, ValueError, KeyError, struct.error, zlib.error) as e:
+            print(f"⚠️ Istantanea di salvataggio non leggibile: {e}")
+            self.sections = {}
+        return dict(self.sections)
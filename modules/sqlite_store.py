@@ -0,0 +1,233 @@
+import json #importazione del modulo standard Python necessario per serializzare le sezioni del salvataggio in formato JSON dentro il database
+import sqlite3 #importazione del modulo standard sqlite3: database SQLite su file, senza dipendenze esterne
+import threading #importazione del modulo necessario per gestire thread: fornisce Lock() perché la connessione è condivisa tra il thread della GUI e il SimulationWorker
+from datetime import datetime #classe datetime importata dal modulo datetime usata per i timestamp di salvataggio
+from typing import Dict, Any, List, Optional, Iterable, Tuple #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+Any corrisponde ad un tipo generico (cioè accetta qualsiasi valore)
+List corrisponde ad una lista
+Optional corrisponde ad un valore che può essere None
+Iterable corrisponde a qualsiasi oggetto su cui si può iterare
+Tuple corrisponde ad una tupla (sequenza immutabile di valori)
+'''
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sections (
+    slot TEXT NOT NULL,
+    name TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    saved_at TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (slot, name)
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    slot TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    hour INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    amount REAL NOT NULL,
+    description TEXT,
+    new_balance REAL
+);
+CREATE INDEX IF NOT EXISTS transactions_by_day ON transactions (slot, day);
+CREATE TABLE IF NOT EXISTS orders (
+    id INTEGER PRIMARY KEY,
+    slot TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    order_id INTEGER NOT NULL,
+    recipe_id TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    arrival_time INTEGER,
+    first_unit_time INTEGER,
+    completed_time INTEGER
+);
+CREATE INDEX IF NOT EXISTS orders_by_day ON orders (slot, day);
+CREATE TABLE IF NOT EXISTS daily_stats (
+    slot TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    revenue REAL NOT NULL,
+    expenses REAL NOT NULL,
+    profit REAL NOT NULL,
+    orders_completed INTEGER NOT NULL,
+    orders_expired INTEGER NOT NULL,
+    balance REAL NOT NULL,
+    reputation REAL NOT NULL,
+    PRIMARY KEY (slot, day)
+);
+""" # schema del database: sezioni del salvataggio per slot e tabelle di storico (transazioni, ordini, statistiche giornaliere) indicizzate per slot e giorno
+
+HISTORY_TABLES = ("transactions", "orders", "daily_stats") # tabelle di storico svuotate da reset_slot() all'inizio di una nuova partita
+
+
+class SQLiteStore:
+    def __init__(self, path: str = 'data/fantaburger.db', slot: str = 'default'):
+        '''
+        Come parametri riceve esplicitamente path (stringa, percorso del database, con 'data/fantaburger.db' come valore di default) e slot (stringa, nome dello slot di salvataggio,
+        con 'default' come valore di default), oltre a ricevere implicitamente l'istanza della classe SQLiteStore (self).
+        Backend di salvataggio alternativo a SaveStore (stessa interfaccia: exists, write_sections, read_sections) che conserva anche lo storico della partita:
+        transazioni, ordini conclusi e statistiche di ogni giorno, così si possono interrogare i giorni passati senza rileggere un file intero.
+        Il database usa il journal WAL (scritture che non bloccano le letture) con synchronous=NORMAL; più partite convivono nello stesso file come slot diversi.
+        La connessione è condivisa tra thread (check_same_thread=False) e protetta da lock.
+        '''
+        self.path = path
+        self.slot = slot
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def exists(self) -> bool:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SQLiteStore e ha tipo di ritorno bool.
+        Restituisce True se lo slot corrente contiene un salvataggio.
+        '''
+        with self.lock:
+            row = self.conn.execute("SELECT 1 FROM sections WHERE slot = ? LIMIT 1", (self.slot,)).fetchone()
+        return row is not None
+
+    def write_sections(self, sections: Dict[str, Any]) -> List[str]:
+        '''
+        Come parametro riceve esplicitamente sections (Dict[str, Any], nome sezione -> dati) oltre all'istanza della classe SQLiteStore (self implicito)
+        e ha tipo di ritorno List[str].
+        Scrive le sezioni ricevute nello slot corrente in un'unica transazione (inserimento o aggiornamento con versione incrementata).
+        Restituisce i nomi delle sezioni scritte.
+        '''
+        if not sections:
+            return []
+        now = datetime.now().isoformat()
+        rows = [(self.slot, name, now, json.dumps(data, separators=(',', ':'), ensure_ascii=False)) for name, data in sections.items()]
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT INTO sections (slot, name, version, saved_at, data) VALUES (?, ?, 1, ?, ?) "
+                "ON CONFLICT (slot, name) DO UPDATE SET version = version + 1, saved_at = excluded.saved_at, data = excluded.data",
+                rows
+            )
+        return list(sections)
+
+    def read_sections(self) -> Dict[str, Any]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SQLiteStore e ha tipo di ritorno Dict[str, Any].
+        Legge tutte le sezioni dello slot corrente e le restituisce come dizionario nome sezione -> dati; sezioni corrotte vengono segnalate e saltate.
+        '''
+        with self.lock:
+            rows = self.conn.execute("SELECT name, data FROM sections WHERE slot = ?", (self.slot,)).fetchall()
+        sections = {}
+        for name, data in rows:
+            try:
+                sections[name] = json.loads(data)
+            except json.JSONDecodeError as e:
+                print(f"⚠️ Sezione di salvataggio '{name}' non leggibile: {e}")
+        return sections
+
+    def reset_slot(self) -> None:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SQLiteStore e ha tipo di ritorno None (non restituisce nulla).
+        Cancella lo storico dello slot corrente (chiamata all'inizio di una nuova partita); le sezioni vengono sovrascritte dal primo salvataggio.
+        '''
+        with self.lock, self.conn:
+            for table in HISTORY_TABLES:
+                self.conn.execute(f"DELETE FROM {table} WHERE slot = ?", (self.slot,))
+
+    def record_hour(self, transactions: Iterable[Tuple], orders: Iterable[Tuple]) -> None:
+        '''
+        Come parametri riceve esplicitamente transactions (righe giorno, ora, tipo, importo, descrizione, nuovo saldo) e orders (righe giorno, id ordine, ricetta,
+        quantità, stato, arrivo, prima unità, completamento) oltre all'istanza della classe SQLiteStore (self implicito) e ha tipo di ritorno None (non restituisce nulla).
+        Inserisce lo storico accumulato in un'ora di gioco con due executemany in un'unica transazione, invece di una scrittura per ogni evento.
+        '''
+        transactions = [(self.slot,) + tuple(row) for row in transactions]
+        orders = [(self.slot,) + tuple(row) for row in orders]
+        if not transactions and not orders:
+            return
+        with self.lock, self.conn:
+            if transactions:
+                self.conn.executemany(
+                    "INSERT INTO transactions (slot, day, hour, type, amount, description, new_balance) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    transactions
+                )
+            if orders:
+                self.conn.executemany(
+                    "INSERT INTO orders (slot, day, order_id, recipe_id, quantity, status, arrival_time, first_unit_time, completed_time) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    orders
+                )
+
+    def record_day(self, day: int, stats: Dict[str, Any]) -> None:
+        '''
+        Come parametri riceve esplicitamente day (int) e stats (Dict[str, Any] con revenue, expenses, profit, orders_completed, balance, reputation)
+        oltre all'istanza della classe SQLiteStore (self implicito) e ha tipo di ritorno None (non restituisce nulla).
+        Salva (o sostituisce) la riga delle statistiche del giorno; gli ordini scaduti vengono contati direttamente dalla tabella orders.
+        '''
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO daily_stats (slot, day, revenue, expenses, profit, orders_completed, orders_expired, balance, reputation) "
+                "VALUES (?, ?, ?, ?, ?, ?, (SELECT COUNT(*) FROM orders WHERE slot = ? AND day = ? AND status = 'expired'), ?, ?)",
+                (self.slot, day, stats['revenue'], stats['expenses'], stats['profit'], stats['orders_completed'],
+                 self.slot, day, stats['balance'], stats['reputation'])
+            )
+
+    def get_daily_stats(self, first_day: int = 1, last_day: Optional[int] = None) -> List[Dict[str, Any]]:
+        '''
+        Come parametri riceve esplicitamente first_day (int, con 1 come valore di default) e last_day (Optional[int], di default nessun limite)
+        oltre all'istanza della classe SQLiteStore (self implicito) e ha tipo di ritorno List[Dict[str, Any]].
+        Restituisce le statistiche dei giorni nell'intervallo (estremi inclusi) in ordine di giorno, usando la chiave primaria (slot, giorno).
+        '''
+        last_day = last_day if last_day is not None else 2 ** 31
+        with self.lock:
+            cursor = self.conn.execute(
+                "SELECT day, revenue, expenses, profit, orders_completed, orders_expired, balance, reputation FROM daily_stats "
+                "WHERE slot = ? AND day BETWEEN ? AND ? ORDER BY day",
+                (self.slot, first_day, last_day)
+            )
+            columns = [c[0] for c in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def get_transactions(self, day: int) -> List[Dict[str, Any]]:
+        '''
+        Come parametro riceve esplicitamente day (int) oltre all'istanza della classe SQLiteStore (self implicito) e ha tipo di ritorno List[Dict[str, Any]].
+        Restituisce le transazioni del giorno in ordine di registrazione (tramite l'indice per slot e giorno).
+        '''
+        with self.lock:
+            cursor = self.conn.execute(
+                "SELECT hour, type, amount, description, new_balance FROM transactions WHERE slot = ? AND day = ? ORDER BY id",
+                (self.slot, day)
+            )
+            columns = [c[0] for c in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def get_order_summary(self, first_day: int = 1, last_day: Optional[int] = None) -> Dict[str, Dict[str, int]]:
+        '''
+        Come parametri riceve esplicitamente first_day (int, con 1 come valore di default) e last_day (Optional[int], di default nessun limite)
+        oltre all'istanza della classe SQLiteStore (self implicito) e ha tipo di ritorno Dict[str, Dict[str, int]].
+        Restituisce per ogni ricetta il numero di ordini per stato (completed, expired, dropped) nei giorni indicati, calcolato da SQLite con GROUP BY.
+        '''
+        last_day = last_day if last_day is not None else 2 ** 31
+        summary: Dict[str, Dict[str, int]] = {}
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT recipe_id, status, COUNT(*) FROM orders WHERE slot = ? AND day BETWEEN ? AND ? GROUP BY recipe_id, status",
+                (self.slot, first_day, last_day)
+            ).fetchall()
+        for recipe_id, status, count in rows:
+            summary.setdefault(recipe_id, {})[status] = count
+        return summary
+
+    def list_slots(self) -> List[str]:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SQLiteStore e ha tipo di ritorno List[str].
+        Restituisce i nomi degli slot che contengono un salvataggio.
+        '''
+        with self.lock:
+            return [row[0] for row in self.conn.execute("SELECT DISTINCT slot FROM sections ORDER BY slot")]
+
+    def close(self) -> None:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SQLiteStore e ha tipo di ritorno None (non restituisce nulla).
+        Chiude la connessione al database.
+        '''
+        with self.lock:
+            self.conn.close()
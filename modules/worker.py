@@ -0,0 +1,205 @@
+import queue #importazione del modulo standard queue: code thread-safe per i comandi verso il worker e i risultati verso la GUI
+import threading #importazione del modulo necessario per gestire thread: il worker gira in un unico thread di lunga durata
+import time #importazione del modulo time per cadenzare l'avanzamento automatico (auto-play) con time.monotonic()
+from types import MappingProxyType #importazione di MappingProxyType: vista in sola lettura di un dizionario, usata per le istantanee immutabili dello stato
+from typing import Dict, Any, Tuple, Callable, Optional #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+'''
+Tipi importati:
+Dict corrisponde ad un dizionario (struttura dati formata da una coppia chiave: valore)
+Any corrisponde ad un tipo generico (cioè accetta qualsiasi valore)
+Tuple corrisponde ad una tupla (sequenza immutabile di valori)
+Callable corrisponde ad una funzione (o qualsiasi oggetto chiamabile)
+Optional corrisponde ad un valore che può essere None
+'''
+
+
+class SimulationWorker:
+    def __init__(self, engine: Any, autoplay_speed: float = 2.0, on_result: Optional[Callable[[], None]] = None):
+        '''
+        Come parametri riceve esplicitamente engine (GameEngine), autoplay_speed (float, ore di gioco al secondo in auto-play, con 2.0 come valore di default)
+        e on_result (Optional[Callable], chiamata dal thread del worker dopo aver accodato un risultato, così la GUI sa quando chiamare dispatch_results()),
+        oltre a ricevere implicitamente l'istanza della classe SimulationWorker (self).
+        Costruttore del worker di simulazione: un unico thread di lunga durata è l'unico a modificare il GameEngine.
+        La GUI invia comandi (advance, buy, upgrade, save, autoplay) con submit() sulla coda commands; il worker li esegue in ordine, dopo ognuno pubblica
+        in snapshot un'istantanea immutabile dello stato (che la GUI può leggere senza lock) e mette l'eventuale callback con il risultato nella coda results,
+        che la GUI svuota nel proprio thread con dispatch_results(). In auto-play, quando non arrivano comandi, il worker avanza di un'ora ogni 1/autoplay_speed secondi.
+        '''
+        self.engine = engine
+        self.commands: "queue.Queue[Tuple[str, tuple, Optional[Callable]]]" = queue.Queue()
+        self.results: "queue.Queue[Tuple[Callable, Any]]" = queue.Queue()
+        self.autoplay = False
+        self.autoplay_speed = autoplay_speed
+        self.on_result = on_result
+        self.handlers: Dict[str, Callable] = {
+            "advance": self._advance,
+            "buy": self._buy,
+            "upgrade": self._upgrade,
+            "save": self._save,
+            "autoplay": self._set_autoplay
+        }
+        self.snapshot: MappingProxyType = self._build_snapshot()
+        self.thread = threading.Thread(target=self._run, name="SimulationWorker", daemon=True)
+        self.thread.start()
+
+    def submit(self, command: str, *args: Any, callback: Optional[Callable[[Any], None]] = None) -> None:
+        '''
+        Come parametri riceve esplicitamente il nome del comando (stringa), i suoi argomenti e callback (Optional, funzione che riceve il risultato)
+        oltre all'istanza della classe SimulationWorker (self implicito) e ha tipo di ritorno None (non restituisce nulla).
+        Accoda un comando per il worker e ritorna subito, quindi chi chiama (la GUI) non si blocca mai.
+        '''
+        self.commands.put((command, args, callback))
+
+    def stop(self) -> None:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SimulationWorker e ha tipo di ritorno None (non restituisce nulla).
+        Chiede al worker di terminare dopo aver eseguito i comandi già accodati.
+        '''
+        self.commands.put(("stop", (), None))
+
+    def dispatch_results(self) -> int:
+        '''
+        Come parametro riceve implicitamente solo l'istanza della classe SimulationWorker e ha tipo di ritorno int.
+        Da chiamare nel thread della GUI: esegue le callback dei comandi completati con il loro risultato, nell'ordine in cui sono stati eseguiti.
+        Restituisce il numero di callback eseguite.
+        '''
+        dispatched = 0
+        while True:
+            try:
+                callback, result = self.results.get_nowait()
+            except queue.Empty:
+                return dispatched
+            callback(result)
+            dispatched += 1
+
+    def _run(self) -> None:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe SimulationWorker e ha tipo di ritorno None (non restituisce nulla).
+        Ciclo del thread worker: attende il prossimo comando (in auto-play solo fino alla prossima ora programmata) e lo esegue;
+        se scade l'attesa in auto-play avanza di un'ora. Se il worker è in ritardo sulla cadenza non recupera le ore perse, riparte da adesso.
+        '''
+        next_tick = time.monotonic()
+        while True:
+            timeout = None
+            if self.autoplay:
+                timeout = max(0.0, next_tick - time.monotonic())
+
+            try:
+                command, args, callback = self.commands.get(timeout=timeout)
+            except queue.Empty:
+                self._execute("advance", (1,), None)
+                next_tick = max(next_tick + 1.0 / self.autoplay_speed, time.monotonic())
+                continue
+
+            if command == "stop":
+                self.autoplay = False
+                return
+
+            was_autoplay = self.autoplay
+            self._execute(command, args, callback)
+            if self.autoplay and not was_autoplay:
+                next_tick = time.monotonic() + 1.0 / self.autoplay_speed
+
+    def _execute(self, command: str, args: tuple, callback: Optional[Callable]) -> None:
+        '''
+        Funzione privata che come parametri riceve esplicitamente il nome del comando, i suoi argomenti e la callback oltre all'istanza della classe SimulationWorker (self implicito)
+        e ha tipo di ritorno None (non restituisce nulla).
+        Esegue il comando, pubblica la nuova istantanea e accoda il risultato per la GUI; gli errori diventano un risultato (False, messaggio) invece di fermare il thread.
+        '''
+        handler = self.handlers.get(command)
+        try:
+            if handler is None:
+                result = (False, f"Comando sconosciuto: {command}")
+            else:
+                result = handler(*args)
+        except Exception as e:
+            print(f"❌ Errore comando {command}: {e}")
+            result = (False, f"Errore: {e}")
+
+        self.snapshot = self._build_snapshot()
+        if callback:
+            self.results.put((callback, result))
+            if self.on_result:
+                self.on_result()
+
+    def _advance(self, hours: int = 1) -> Tuple[bool, str]:
+        '''
+        Funzione privata che come parametro riceve esplicitamente hours (int, con 1 come valore di default) oltre all'istanza della classe SimulationWorker (self implicito)
+        e ha tipo di ritorno Tuple[bool, str].
+        Avanza il gioco di hours ore fermandosi (e disattivando l'auto-play) a fine partita.
+        '''
+        engine = self.engine
+        for _ in range(hours):
+            if engine.game_over or engine.game_won:
+                break
+            engine.advance_hour()
+        if engine.game_over or engine.game_won:
+            self.autoplay = False
+            return False, "Partita terminata"
+        return True, f"Giorno {engine.current_game_day} – Ora {engine.current_hour:02d}:00"
+
+    def _buy(self, ingredient_path: str, qty: int) -> Tuple[bool, str]:
+        '''
+        Funzione privata che come parametri riceve esplicitamente il percorso dell'ingrediente (stringa) e la quantità (int) oltre all'istanza della classe SimulationWorker (self implicito)
+        e ha tipo di ritorno Tuple[bool, str].
+        Acquista l'ingrediente con GameEngine.purchase_ingredient() e, se riuscito, salva.
+        '''
+        success, msg = self.engine.purchase_ingredient(ingredient_path, qty)
+        if success:
+            self.engine.safe_save()
+        return success, msg
+
+    def _upgrade(self, upgrade_id: str) -> Tuple[bool, str]:
+        '''
+        Funzione privata che come parametro riceve esplicitamente l'id dell'upgrade (stringa) oltre all'istanza della classe SimulationWorker (self implicito)
+        e ha tipo di ritorno Tuple[bool, str]. Acquista l'upgrade con GameEngine.buy_upgrade().
+        '''
+        return self.engine.buy_upgrade(upgrade_id)
+
+    def _save(self) -> Tuple[bool, str]:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe SimulationWorker e ha tipo di ritorno Tuple[bool, str].
+        Salva la partita con GameEngine.safe_save().
+        '''
+        self.engine.safe_save()
+        return True, "Partita salvata"
+
+    def _set_autoplay(self, enabled: bool, speed: Optional[float] = None) -> Tuple[bool, str]:
+        '''
+        Funzione privata che come parametri riceve esplicitamente enabled (bool) e speed (Optional[float], ore di gioco al secondo) oltre all'istanza della classe SimulationWorker (self implicito)
+        e ha tipo di ritorno Tuple[bool, str].
+        Attiva o disattiva l'avanzamento automatico ed eventualmente ne cambia la velocità (valori non positivi vengono ignorati).
+        '''
+        if speed is not None and speed > 0:
+            self.autoplay_speed = speed
+        self.autoplay = enabled and not (self.engine.game_over or self.engine.game_won)
+        return self.autoplay, f"Auto-play {'attivo' if self.autoplay else 'fermo'} ({self.autoplay_speed:g} ore/s)"
+
+    def _build_snapshot(self) -> MappingProxyType:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe SimulationWorker e ha tipo di ritorno MappingProxyType.
+        Costruisce l'istantanea immutabile dello stato letta dalla GUI: i valori osservati del GameEngine, gli ingredienti per categoria
+        (tuple di nome, nome visualizzato, costo, quantità), livelli e costi degli upgrade, upgrade sbloccati, lunghezza della coda e stato dell'auto-play.
+        '''
+        engine = self.engine
+        ingredients = {}
+        if engine.inventory:
+            for category, items in engine.inventory.data.get("ingredients", {}).items():
+                if not isinstance(items, dict):
+                    continue
+                ingredients[category] = tuple(
+                    (name, data.get("display_name", name.replace("_", " ").title()),
+                     data.get("current_cost", data.get("base_cost", 0.0)), data.get("current_quantity", 0))
+                    for name, data in items.items() if isinstance(data, dict)
+                )
+
+        snapshot = engine.get_observed_state() if engine.finance else {}
+        snapshot.update({
+            "ingredients": MappingProxyType(ingredients),
+            "upgrade_counts": MappingProxyType(dict(engine.upgrade_counts)),
+            "upgrade_costs": MappingProxyType(dict(engine.upgrade_costs)),
+            "unlocked_upgrades": tuple(engine.unlocked_upgrades),
+            "queue_length": len(engine.order_queue),
+            "autoplay": self.autoplay,
+            "autoplay_speed": self.autoplay_speed
+        })
+        return MappingProxyType(snapshot)
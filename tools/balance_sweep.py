@@ -0,0 +1,328 @@
+"""
+Sweep dei parametri di bilanciamento: per ogni difficoltà prova combinazioni di valori della configurazione (frequenza clienti, profitto, timeout degli ordini, ...),
+valuta ogni combinazione giocando le stesse partite a seme fisso con il BatchSimulator (senza console né attese, su più processi con --processes)
+e riporta le combinazioni il cui tasso di vittoria è più vicino all'obiettivo della difficoltà.
+Ricerca a griglia (grid), casuale (random) o adattiva (adaptive: campioni casuali e poi nuovi campioni sempre più vicini ai migliori trovati).
+Le partite simulate acquistano upgrade ogni mattina con la politica deterministica del BatchSimulator (--no-upgrades per giocarle senza).
+I risultati sono salvati in una cache JSON dopo ogni combinazione, con chiave l'hash di parametri, difficoltà, semi, giorni, upgrade e dati di data/:
+uno sweep interrotto riparte da dove si era fermato e sweep successivi riusano le combinazioni già giocate.
+
+Parametri (--param, ripetibile): nome=min:max:passo oppure nome=v1,v2,v3. Un nome senza punti è un campo del livello di difficoltà
+(difficulty.levels.<difficoltà>.nome), altrimenti è un percorso della config (ad esempio gameplay.order_timeout o time.days).
+Anche i costi degli upgrade si possono variare (ad esempio gameplay.unlock.upgrade_kitchen=50,100,200): cambiano quando e quanti upgrade acquista la politica.
+
+Uso: python tools/balance_sweep.py [--difficulty easy normal] [--target easy=0.9 normal=0.75] [--tolerance 0.05] [--search grid|random|adaptive]
+     [--param customer_frequency=0.8:2.4:0.4] [--games 200] [--days 7] [--samples 30] [--rounds 3] [--processes 4] [--no-upgrades] [--cache sweep_cache.json] [--output bilanciamento.json]
+"""
+
+import argparse # importazione del modulo argparse per leggere i parametri da riga di comando
+import copy # importazione del modulo copy per applicare i valori di ogni combinazione a una copia della configurazione
+import hashlib # importazione del modulo hashlib per calcolare le chiavi della cache
+import itertools # importazione del modulo itertools per il prodotto cartesiano della ricerca a griglia
+import json # importazione del modulo json per leggere la configurazione e scrivere cache e risultati
+import os # importazione del modulo necessario per operazioni sul sistema operativo (percorsi, numero di CPU e sostituzione atomica della cache)
+import random # importazione del modulo random per i campioni delle ricerche casuale e adattiva
+import statistics # importazione del modulo statistics per le medie delle metriche
+import sys # importazione del modulo sys per impostare il codice di uscita
+import time # importazione del modulo time per misurare la durata dello sweep
+from typing import Dict, Any, List, Optional # importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+
+from simulation import PROJECT_ROOT # importazione della radice del progetto (aggiunta anche al path di ricerca dei moduli)
+from modules.batch import BatchCatalog, BatchSimulator # importazione del catalogo e del simulatore a lotti
+from modules.shared_catalog import run_parallel # importazione dell'esecuzione su più processi con catalogo in memoria condivisa
+
+DEFAULT_TARGETS = {"easy": 0.9, "normal": 0.75, "hard": 0.6, "ultimate": 0.4, "nightmare": 0.2} # tassi di vittoria obiettivo di default
+DEFAULT_PARAMS = ("customer_frequency=0.8:2.4:0.4", "profit=0.5:1.1:0.1", "gameplay.order_timeout=2:4:1") # parametri provati se non ne viene indicato nessuno
+INERT_PARAMS = ("event_frequency", "order_complexity") # campi dei livelli che il gioco non legge: accettati con un avviso, cambiarli non sposta i risultati
+UPGRADE_PARAMS = ("gameplay.unlock",) # costi degli upgrade: spostano i risultati solo se le partite simulate acquistano upgrade
+DATA_FILES = ("data/config.json", "data/ingredients.json", "data/recipes.json") # file che entrano nella chiave della cache
+TOP_PER_ROUND = 3 # combinazioni migliori attorno a cui la ricerca adattiva prende nuovi campioni
+
+
+class Param:
+    def __init__(self, spec: str):
+        '''
+        Come parametro riceve esplicitamente la specifica da riga di comando (stringa nome=min:max:passo oppure nome=v1,v2,...) oltre all'istanza della classe Param (self implicito).
+        Parametro dello sweep: percorso nella config (con {difficulty} al posto del livello per i campi senza punti) e valori ammessi,
+        interi se tutti i numeri della specifica sono interi (ad esempio order_timeout).
+        '''
+        name, sep, values = spec.partition("=")
+        if not sep or not name or not values:
+            raise ValueError(f"parametro non valido: {spec} (atteso nome=min:max:passo o nome=v1,v2,...)")
+        self.name = name
+        self.path = name if "." in name else f"difficulty.levels.{{difficulty}}.{name}"
+        self.integer = not any("." in part for part in values.replace(",", ":").split(":"))
+        cast = int if self.integer else float
+        self.is_range = ":" in values
+        if self.is_range:
+            self.low, self.high, self.step = (cast(part) for part in values.split(":"))
+            if self.step <= 0 or self.high < self.low:
+                raise ValueError(f"intervallo non valido: {spec}")
+            count = int(round((self.high - self.low) / self.step)) + 1
+            self.values = [self.snap(self.low + i * self.step) for i in range(count)]
+        else:
+            self.values = [cast(part) for part in values.split(",")]
+            self.low, self.high, self.step = min(self.values), max(self.values), 0
+
+    def snap(self, value: float) -> Any:
+        '''
+        Come parametro riceve esplicitamente un valore dell'intervallo (float) oltre all'istanza della classe Param (self implicito) e ha tipo di ritorno Any.
+        Restituisce il valore arrotondato al passo più vicino (intero per i parametri interi): i campioni casuali cadono sulla stessa griglia
+        della ricerca grid, quindi restano leggibili e ritrovano in cache le combinazioni già giocate.
+        '''
+        value = self.low + round((value - self.low) / self.step) * self.step
+        return int(round(value)) if self.integer else round(value, 6)
+
+    def sample(self, rng: random.Random, center: Optional[Any] = None, radius: float = 1.0) -> Any:
+        '''
+        Come parametri riceve esplicitamente il generatore casuale (random.Random), center (valore attorno a cui campionare, None = tutto l'intervallo)
+        e radius (float, frazione dell'intervallo) oltre all'istanza della classe Param (self implicito) e ha tipo di ritorno Any.
+        Restituisce un valore casuale: tra quelli elencati per i parametri a lista, nell'intervallo (o nel suo intorno di center) per quelli a intervallo.
+        '''
+        if not self.is_range:
+            return rng.choice(self.values)
+        low, high = self.low, self.high
+        if center is not None:
+            span = (self.high - self.low) * radius
+            low, high = max(self.low, center - span), min(self.high, center + span)
+        return self.snap(rng.uniform(low, high))
+
+
+def set_path(config: Dict[str, Any], path: str, value: Any) -> None:
+    '''
+    Come parametri riceve la configurazione (Dict[str, Any]), il percorso puntato (stringa) e il valore e ha tipo di ritorno None (non restituisce nulla).
+    Imposta il valore nel percorso; le sezioni intermedie devono esistere (un errore di battitura nel nome diventa un KeyError invece di un campo ignorato).
+    '''
+    *sections, key = path.split(".")
+    for section in sections:
+        config = config[section]
+    config[key] = value
+
+
+def point_key(difficulty: str, point: Dict[str, Any], games: int, seed: int, days: Optional[int], upgrades: bool, data_hash: str) -> str:
+    '''
+    Come parametri riceve difficoltà, valori della combinazione, partite, primo seme, giorni, acquisto degli upgrade e hash dei file di data/ e ha tipo di ritorno str.
+    Restituisce la chiave della cache: cambia se cambia uno qualsiasi degli ingredienti del risultato, compresi config e catalogo di partenza.
+    '''
+    text = json.dumps({"difficulty": difficulty, "point": point, "games": games, "seed": seed, "days": days, "upgrades": upgrades, "data": data_hash}, sort_keys=True)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class Sweep:
+    def __init__(self, params: List[Param], args: argparse.Namespace, cache_path: str):
+        '''
+        Come parametri riceve esplicitamente i parametri dello sweep (List[Param]), gli argomenti da riga di comando (argparse.Namespace) e il percorso della cache (stringa)
+        oltre all'istanza della classe Sweep (self implicito).
+        Legge una volta configurazione e catalogo di data/, calcola l'hash dei dati per le chiavi e carica la cache esistente.
+        '''
+        self.params = params
+        self.args = args
+        self.cache_path = cache_path
+        digest = hashlib.sha256()
+        for name in DATA_FILES:
+            with open(name, 'rb') as f:
+                digest.update(f.read())
+        self.data_hash = digest.hexdigest()
+        with open('data/config.json', 'r', encoding='utf-8') as f:
+            self.config = json.load(f)
+        self.catalog = BatchCatalog.from_files()
+        self.cache: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(cache_path):
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                self.cache = json.load(f).get("points", {})
+        self.played = 0
+        self.cached = 0
+
+    def _save_cache(self) -> None:
+        '''
+        Funzione privata che come parametro riceve implicitamente solo l'istanza della classe Sweep e ha tipo di ritorno None (non restituisce nulla).
+        Scrive la cache in un file temporaneo e lo sostituisce atomicamente a quello vecchio: un'interruzione non lascia mai una cache troncata.
+        '''
+        tmp_path = self.cache_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"points": self.cache}, f)
+        os.replace(tmp_path, self.cache_path)
+
+    def evaluate(self, difficulty: str, point: Dict[str, Any]) -> Dict[str, Any]:
+        '''
+        Come parametri riceve esplicitamente la difficoltà (stringa) e i valori della combinazione (Dict[str, Any], nome del parametro -> valore)
+        oltre all'istanza della classe Sweep (self implicito) e ha tipo di ritorno Dict[str, Any].
+        Restituisce il risultato dalla cache o gioca le partite dei semi fissi con la configurazione modificata e lo aggiunge alla cache:
+        tasso di vittoria, saldo e reputazione medi, giorni medi giocati.
+        '''
+        args = self.args
+        upgrades = not args.no_upgrades
+        key = point_key(difficulty, point, args.games, args.seed, args.days, upgrades, self.data_hash)
+        if key in self.cache:
+            self.cached += 1
+            return self.cache[key]
+
+        config = copy.deepcopy(self.config)
+        for param in self.params:
+            set_path(config, param.path.format(difficulty=difficulty), point[param.name])
+        seeds = range(args.seed, args.seed + args.games)
+        if args.processes > 1:
+            results = run_parallel(seeds, difficulty, args.processes, args.days, config, self.catalog, upgrades=upgrades)
+        else:
+            results = BatchSimulator(seeds, difficulty, config, self.catalog, upgrades).run(args.days)
+        entry = {
+            "difficulty": difficulty,
+            "point": point,
+            "win_rate": sum(r["game_won"] for r in results) / len(results),
+            "balance": round(statistics.mean(r["balance"] for r in results), 2),
+            "reputation": round(statistics.mean(r["reputation"] for r in results), 1),
+            "days_played": round(statistics.mean(r["days_played"] for r in results), 2)
+        }
+        self.cache[key] = entry
+        self.played += 1
+        self._save_cache()
+        return entry
+
+    def grid(self) -> List[Dict[str, Any]]:
+        return [dict(zip((p.name for p in self.params), values)) for values in itertools.product(*(p.values for p in self.params))]
+
+    def sample(self, rng: random.Random, count: int, centers: Optional[List[Dict[str, Any]]] = None, radius: float = 1.0) -> List[Dict[str, Any]]:
+        '''
+        Come parametri riceve esplicitamente il generatore casuale (random.Random), il numero di combinazioni (int), centers (Optional, combinazioni attorno a cui campionare
+        a turno) e radius (float, frazione dell'intervallo di ogni parametro) oltre all'istanza della classe Sweep (self implicito) e ha tipo di ritorno List[Dict[str, Any]].
+        Restituisce combinazioni casuali senza doppioni (al massimo count, meno se lo spazio dei valori è più piccolo).
+        '''
+        points, seen = [], set()
+        for attempt in range(count * 20):
+            if len(points) == count:
+                break
+            center = centers[attempt % len(centers)] if centers else None
+            point = {p.name: p.sample(rng, center[p.name] if center else None, radius) for p in self.params}
+            marker = json.dumps(point, sort_keys=True)
+            if marker not in seen:
+                seen.add(marker)
+                points.append(point)
+        return points
+
+    def run(self, difficulty: str, target: float) -> List[Dict[str, Any]]:
+        '''
+        Come parametri riceve esplicitamente la difficoltà (stringa) e il tasso di vittoria obiettivo (float) oltre all'istanza della classe Sweep (self implicito)
+        e ha tipo di ritorno List[Dict[str, Any]].
+        Esegue la ricerca scelta per la difficoltà e restituisce tutti i risultati valutati, ordinati per distanza dall'obiettivo.
+        Con la ricerca adattiva ogni turno campiona attorno alle migliori combinazioni trovate finora, in un intorno che si dimezza a ogni turno.
+        Il generatore delle ricerche casuali ha un seme fisso per difficoltà: rilanciando lo sweep vengono proposte le stesse combinazioni (già in cache).
+        '''
+        args = self.args
+        rng = random.Random(f"{args.search_seed}:{difficulty}")
+        evaluated: Dict[str, Dict[str, Any]] = {}
+
+        def play(points: List[Dict[str, Any]]) -> None:
+            for point in points:
+                evaluated.setdefault(json.dumps(point, sort_keys=True), self.evaluate(difficulty, point))
+
+        def ranked() -> List[Dict[str, Any]]:
+            return sorted(evaluated.values(), key=lambda entry: abs(entry["win_rate"] - target))
+
+        if args.search == "grid":
+            play(self.grid())
+        else:
+            play(self.sample(rng, args.samples))
+            if args.search == "adaptive":
+                for round_index in range(1, args.rounds + 1):
+                    centers = [entry["point"] for entry in ranked()[:TOP_PER_ROUND]]
+                    play(self.sample(rng, args.samples, centers, 0.5 ** round_index))
+        return ranked()
+
+
+def parse_targets(items: List[str]) -> Dict[str, float]:
+    targets = dict(DEFAULT_TARGETS)
+    for item in items:
+        difficulty, _, value = item.partition("=")
+        targets[difficulty] = float(value)
+    return targets
+
+
+def main():
+    '''
+    Funzione principale dello strumento: legge gli argomenti, esegue lo sweep per ogni difficoltà con la cache indicata, stampa le combinazioni migliori,
+    scrive i risultati se richiesto e restituisce il codice di uscita (1 se per una difficoltà nessuna combinazione rientra nella tolleranza, 2 se gli argomenti non sono validi).
+    '''
+    parser = argparse.ArgumentParser(description="Sweep dei parametri di bilanciamento delle difficoltà")
+    parser.add_argument("--difficulty", nargs="+", default=list(DEFAULT_TARGETS), help="difficoltà da bilanciare")
+    parser.add_argument("--target", nargs="*", default=[], help="tassi di vittoria obiettivo (difficoltà=tasso, default " + " ".join(f"{d}={t}" for d, t in DEFAULT_TARGETS.items()) + ")")
+    parser.add_argument("--tolerance", type=float, default=0.05, help="scarto massimo dall'obiettivo")
+    parser.add_argument("--param", action="append", default=None, help="parametro da variare (nome=min:max:passo o nome=v1,v2,...), ripetibile")
+    parser.add_argument("--search", choices=["grid", "random", "adaptive"], default="grid", help="strategia di ricerca")
+    parser.add_argument("--samples", type=int, default=30, help="combinazioni per turno delle ricerche random e adaptive")
+    parser.add_argument("--rounds", type=int, default=3, help="turni di affinamento della ricerca adaptive")
+    parser.add_argument("--search-seed", type=int, default=0, help="seme del generatore delle ricerche random e adaptive")
+    parser.add_argument("--games", type=int, default=200, help="partite per combinazione")
+    parser.add_argument("--seed", type=int, default=0, help="seme della prima partita")
+    parser.add_argument("--days", type=int, default=None, help="giorni per partita (default: config)")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="processi worker (1 = tutto nel processo corrente)")
+    parser.add_argument("--no-upgrades", action="store_true", help="partite simulate senza acquisto di upgrade")
+    parser.add_argument("--cache", default="sweep_cache.json", help="file della cache dei risultati")
+    parser.add_argument("--output", default=None, help="file JSON in cui scrivere le combinazioni migliori")
+    parser.add_argument("--show", type=int, default=5, help="combinazioni mostrate per difficoltà")
+    args = parser.parse_args()
+
+    try:
+        params = [Param(spec) for spec in args.param or DEFAULT_PARAMS]
+        targets = parse_targets(args.target)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+    for param in params:
+        if args.no_upgrades and any(param.path.startswith(upgrade) for upgrade in UPGRADE_PARAMS):
+            print(f"⚠️ {param.name}: con --no-upgrades le partite simulate non acquistano upgrade, i risultati non cambieranno")
+        if any(inert in param.path for inert in INERT_PARAMS):
+            print(f"⚠️ {param.name}: il gioco non usa questo campo, i risultati non cambieranno")
+
+    cache_path = os.path.abspath(args.cache)
+    output_path = os.path.abspath(args.output) if args.output else None
+    os.chdir(PROJECT_ROOT)
+    sweep = Sweep(params, args, cache_path)
+    unknown = [d for d in args.difficulty if d not in sweep.config["difficulty"]["levels"] or d not in targets]
+    if unknown:
+        print(f"❌ Difficoltà sconosciute o senza obiettivo: {', '.join(unknown)}")
+        return 2
+
+    best: Dict[str, Any] = {}
+    start = time.perf_counter()
+    try:
+        for difficulty in args.difficulty:
+            target = targets[difficulty]
+            try:
+                ranking = sweep.run(difficulty, target)
+            except KeyError as e:
+                print(f"❌ Percorso inesistente nella config: {e}")
+                return 2
+            print(f"\n🎯 {difficulty}: obiettivo {target:.0%} ± {args.tolerance:.0%} ({len(ranking)} combinazioni)")
+            widths = [max(len(p.name) + 2, 10) for p in params]
+            print("   " + "".join(f"{p.name:>{width}}" for p, width in zip(params, widths)) + f"{'vittorie':>10}{'saldo':>11}{'reput.':>8}")
+            for entry in ranking[:args.show]:
+                marker = "✅" if abs(entry["win_rate"] - target) <= args.tolerance else "  "
+                print(f"{marker} " + "".join(f"{entry['point'][p.name]:>{width}}" for p, width in zip(params, widths))
+                      + f"{entry['win_rate']:>10.1%}{entry['balance']:>11.2f}{entry['reputation']:>8.1f}")
+            top = ranking[0]
+            best[difficulty] = {
+                "target": target,
+                "win_rate": top["win_rate"],
+                "within_tolerance": abs(top["win_rate"] - target) <= args.tolerance,
+                "overrides": {p.path.format(difficulty=difficulty): top["point"][p.name] for p in params}
+            }
+    except KeyboardInterrupt:
+        print(f"\n⏸️ Sweep interrotto: {sweep.played} combinazioni salvate in {cache_path}, rilanciando riparte da qui")
+        return 1
+    elapsed = time.perf_counter() - start
+
+    print(f"\n⏱️ {sweep.played} combinazioni giocate ({sweep.played * args.games} partite) e {sweep.cached} lette dalla cache in {elapsed:.1f}s")
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(best, f, indent=4, ensure_ascii=False)
+        print(f"💾 Combinazioni migliori scritte in {output_path}")
+    missed = [d for d, entry in best.items() if not entry["within_tolerance"]]
+    if missed:
+        print(f"❌ Nessuna combinazione entro la tolleranza per: {', '.join(missed)}")
+        return 1
+    print("✅ Tutte le difficoltà hanno una combinazione entro la tolleranza")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Simulazione a lotti: gioca molte partite insieme con il BatchSimulator (stato per colonne, tutte le partite avanzano della stessa ora)
+e stampa partite al minuto, vittorie e medie delle metriche.
+Con --processes P le partite sono divise tra P processi che leggono il catalogo da un unico blocco di memoria condivisa (run_parallel).
+Con --check K rigioca i primi K semi con il GameEngine (play_headless, politica FIFO) e confronta le metriche partita per partita;
+esce con codice 1 se anche una sola partita differisce, così può essere usato come controllo contro le regressioni di uno dei due motori.
+Con --upgrades le partite (di entrambi i motori) acquistano upgrade ogni mattina con la politica di acquisto deterministica.
+
+Uso: python tools/batch_simulation.py [--games 10000] [--difficulty normal] [--days 7] [--check 20] [--processes 4] [--start-method spawn] [--upgrades]
+"""
+
+import argparse # importazione del modulo argparse per leggere i parametri da riga di comando
+import statistics # importazione del modulo statistics per calcolare le medie delle metriche
+import sys # importazione del modulo sys per impostare il codice di uscita
+import time # importazione del modulo time per misurare la durata della simulazione
+
+from simulation import isolated_workdir, play_headless # importazione delle funzioni di supporto per partite senza console
+from modules.batch import BatchSimulator # importazione del simulatore a lotti
+from modules.shared_catalog import run_parallel # importazione dell'esecuzione su più processi con catalogo in memoria condivisa
+
+COMPARED_METRICS = ("orders_completed", "orders_expired", "units_prepared", "reputation", "balance", "game_won", "days_played") # metriche confrontate con il GameEngine
+
+
+def main():
+    '''
+    Funzione principale dello strumento: legge gli argomenti, gioca games partite (semi da --seed in poi) con il BatchSimulator (su uno o più processi),
+    stampa throughput e medie, confronta i primi --check semi con il GameEngine e restituisce il codice di uscita.
+    '''
+    parser = argparse.ArgumentParser(description="Simulazione a lotti")
+    parser.add_argument("--games", type=int, default=10000, help="partite simulate insieme")
+    parser.add_argument("--seed", type=int, default=0, help="seme della prima partita")
+    parser.add_argument("--difficulty", default="normal", help="livello di difficoltà")
+    parser.add_argument("--days", type=int, default=None, help="giorni per partita (default: config)")
+    parser.add_argument("--check", type=int, default=20, help="partite da confrontare con il GameEngine (0 = nessuna)")
+    parser.add_argument("--processes", type=int, default=1, help="processi worker (1 = tutto nel processo corrente)")
+    parser.add_argument("--start-method", default=None, choices=["fork", "spawn", "forkserver"], help="avvio dei processi worker")
+    parser.add_argument("--upgrades", action="store_true", help="acquista upgrade ogni mattina (stessa politica per lotto e GameEngine)")
+    args = parser.parse_args()
+
+    seeds = range(args.seed, args.seed + args.games)
+    with isolated_workdir():
+        start = time.perf_counter()
+        if args.processes > 1:
+            results = run_parallel(seeds, args.difficulty, args.processes, args.days, start_method=args.start_method, upgrades=args.upgrades)
+        else:
+            results = BatchSimulator(seeds, args.difficulty, upgrades=args.upgrades).run(args.days)
+        elapsed = time.perf_counter() - start
+
+        print(f"🍔 {args.games} partite ({args.difficulty}, {args.processes} processi) in {elapsed:.2f}s: {args.games / elapsed * 60:,.0f} partite/minuto")
+        print(f"   Vittorie: {sum(r['game_won'] for r in results)}/{args.games}")
+        for metric in ("units_prepared", "orders_completed", "orders_expired", "reputation", "balance"):
+            print(f"   {metric:<18}{statistics.mean(r[metric] for r in results):>10.2f}")
+
+        mismatches = 0
+        checked = results[:args.check]
+        for batch in checked:
+            scalar = play_headless(batch["seed"], args.difficulty, "fifo", args.days, upgrades=args.upgrades)
+            differences = {metric: (scalar[metric], batch[metric]) for metric in COMPARED_METRICS if scalar[metric] != batch[metric]}
+            if differences:
+                mismatches += 1
+                print(f"❌ Seme {batch['seed']}: GameEngine ≠ lotto {differences}")
+        if checked:
+            print(f"{'✅' if not mismatches else '❌'} Confronto con il GameEngine: {len(checked) - mismatches}/{len(checked)} partite identiche")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
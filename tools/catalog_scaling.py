@@ -0,0 +1,116 @@
+"""
+Benchmark di scala sul catalogo: per ogni dimensione genera un catalogo sintetico (generate_catalog.py) in una copia di data/ e misura
+il tempo di caricamento (Inventory + Recipe, cioè lettura dei JSON, build_flat_cache() e _build_cache()), il tempo medio di check_availability()
+per ricetta e il tempo medio di un'ora di gioco (advance_hour() di un GameEngine creato sul catalogo generato).
+Stampa una tabella e un grafico a barre testuale per ogni misura; con --csv scrive i risultati in un file CSV da aprire con un foglio di calcolo
+o con qualsiasi strumento di grafici.
+
+Uso: python tools/catalog_scaling.py [--sizes 100 1000 10000 100000] [--recipe-ratio 0.1] [--hours 8] [--csv scala.csv]
+"""
+
+import argparse # importazione del modulo argparse per leggere i parametri da riga di comando
+import contextlib # importazione del modulo contextlib per silenziare l'output dei print() del gioco
+import csv # importazione del modulo csv per scrivere i risultati in formato CSV
+import io # importazione del modulo io per usare StringIO come destinazione dell'output silenziato
+import random # importazione del modulo random per fissare il seme della partita misurata
+import sys # importazione del modulo sys per impostare il codice di uscita
+import time # importazione del modulo time per misurare le durate
+from typing import Dict, Any, List # importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+
+from simulation import isolated_workdir # importazione della cartella di lavoro temporanea con una copia di data/
+from generate_catalog import generate_catalog, write_catalog, MAX_RECIPES # importazione del generatore di cataloghi sintetici
+from modules.game import GameEngine # importazione del motore di gioco per misurare l'ora di gioco
+from modules.inventory import Inventory # importazione della classe Inventory per misurare il caricamento degli ingredienti
+from modules.recipes import Recipe # importazione della classe Recipe per misurare il caricamento delle ricette
+
+COLUMNS = ("ingredients", "recipes", "load_ms", "availability_us", "hour_ms") # colonne della tabella e del CSV
+CHARTS = (("load_ms", "caricamento (ms)"), ("availability_us", "check_availability per ricetta (µs)"), ("hour_ms", "ora di gioco (ms)")) # misure mostrate nei grafici
+BAR_WIDTH = 40 # larghezza massima delle barre del grafico testuale
+
+
+def measure(ingredients: int, recipes: int, hours: int, seed: int) -> Dict[str, Any]:
+    '''
+    Come parametri riceve il numero di ingredienti e di ricette (int), le ore di gioco da misurare (int) e il seme (int) e ha tipo di ritorno Dict[str, Any].
+    Va chiamata dentro isolated_workdir(): scrive il catalogo generato in data/ della copia e restituisce le tre misure per quella dimensione.
+    '''
+    ingredients_data, recipes_data = generate_catalog(ingredients=ingredients, recipes=recipes, seed=seed)
+    write_catalog("data", ingredients_data, recipes_data)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        inventory = Inventory()
+        recipe_book = Recipe(inventory=inventory)
+        load_ms = (time.perf_counter() - start) * 1000
+
+        all_recipes = list(recipe_book.get_all_recipes().values())
+        start = time.perf_counter()
+        for recipe in all_recipes:
+            inventory.check_availability(recipe.get("ingredients", {}))
+        availability_us = (time.perf_counter() - start) * 1e6 / max(len(all_recipes), 1)
+
+        random.seed(seed)
+        game = GameEngine()
+        game.gui_mode = True
+        game.simulate_delays = False
+        game.new_game("Scala", "FantaBurger", "normal")
+        game.running = True
+        start = time.perf_counter()
+        for _ in range(hours):
+            game.advance_hour()
+        hour_ms = (time.perf_counter() - start) * 1000 / max(hours, 1)
+
+    return {"ingredients": ingredients, "recipes": recipes, "load_ms": load_ms, "availability_us": availability_us, "hour_ms": hour_ms}
+
+
+def print_chart(rows: List[Dict[str, Any]], key: str, title: str) -> None:
+    '''
+    Come parametri riceve le righe dei risultati (List[Dict[str, Any]]), la misura da rappresentare (stringa) e il titolo del grafico (stringa).
+    Stampa un grafico a barre orizzontali testuale della misura in funzione della dimensione del catalogo (barre proporzionali al valore massimo).
+    '''
+    peak = max((row[key] for row in rows), default=0) or 1
+    print(f"\n{title}")
+    for row in rows:
+        bar = "█" * max(1, round(row[key] / peak * BAR_WIDTH))
+        print(f"  {row['ingredients']:>7} ingr. | {bar} {row[key]:.2f}")
+
+
+def main():
+    '''
+    Funzione principale dello strumento: legge gli argomenti, misura ogni dimensione in una copia isolata di data/, stampa tabella e grafici,
+    scrive il CSV se richiesto e restituisce il codice di uscita.
+    '''
+    parser = argparse.ArgumentParser(description="Benchmark di scala sul catalogo")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000], help="numeri di ingredienti da misurare")
+    parser.add_argument("--recipe-ratio", type=float, default=0.1, help=f"ricette per ingrediente (al massimo {MAX_RECIPES} ricette)")
+    parser.add_argument("--hours", type=int, default=8, help="ore di gioco misurate per dimensione")
+    parser.add_argument("--seed", type=int, default=0, help="seme del catalogo e della partita")
+    parser.add_argument("--csv", default=None, help="file CSV in cui scrivere i risultati")
+    args = parser.parse_args()
+
+    rows = []
+    print(f"{'ingredienti':>11}{'ricette':>9}{'caricamento':>13}{'disponibilità':>15}{'ora':>11}")
+    with isolated_workdir():
+        for size in args.sizes:
+            recipes = min(MAX_RECIPES, max(1, int(size * args.recipe_ratio)))
+            try:
+                row = measure(size, recipes, args.hours, args.seed)
+            except ValueError as e:
+                print(f"❌ {size} ingredienti: {e}")
+                return 2
+            rows.append(row)
+            print(f"{row['ingredients']:>11}{row['recipes']:>9}{row['load_ms']:>11.1f}ms{row['availability_us']:>13.2f}µs{row['hour_ms']:>9.2f}ms")
+
+    for key, title in CHARTS:
+        print_chart(rows, key, title)
+
+    if args.csv:
+        with open(args.csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows({key: round(value, 3) if isinstance(value, float) else value for key, value in row.items()} for row in rows)
+        print(f"\n✅ Risultati scritti in {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""
+Generatore di cataloghi sintetici (ingredients.json e recipes.json) per i test di scala.
+Scrive cataloghi strutturalmente validi con lo stesso schema dei file di data/: ingredienti raggruppati per categoria (due livelli, chiavi uniche
+perché Inventory.build_flat_cache() indicizza per nome), una categoria "secret" con una frazione degli ingredienti e ricette con 'name', 'price'
+e 'ingredients' (percorso "categoria.nome" -> quantità); le ricette che usano un ingrediente "secret." sono segrete come in Recipe.get_secret_recipes().
+A parità di parametri e seme il catalogo generato è sempre lo stesso.
+
+Uso: python tools/generate_catalog.py --output /tmp/catalogo [--categories 10] [--ingredients 1000] [--recipes 200] [--secret-ratio 0.05] [--secret-recipes 0.1] [--seed 0]
+"""
+
+import argparse # importazione del modulo argparse per leggere i parametri da riga di comando
+import json # importazione del modulo json per scrivere i due file del catalogo
+import os # importazione del modulo os per creare la cartella di destinazione e comporre i percorsi
+import random # importazione del modulo random per generare quantità, costi e composizione delle ricette in modo riproducibile
+import sys # importazione del modulo sys per impostare il codice di uscita
+from typing import Dict, Any, Tuple # importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+
+MAX_INGREDIENTS = 100_000 # numero massimo di ingredienti generabili
+MAX_RECIPES = 10_000 # numero massimo di ricette generabili
+UNITS = ("pezzo", "fetta", "porzione", "cucchiaio") # unità di misura assegnate a rotazione
+
+
+def generate_catalog(categories: int = 10, ingredients: int = 1000, recipes: int = 200, secret_ratio: float = 0.05, secret_recipes: float = 0.1,
+                     min_ingredients: int = 3, max_ingredients: int = 8, seed: int = 0) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    '''
+    Come parametri riceve il numero di categorie normali, di ingredienti e di ricette (int), la frazione di ingredienti segreti e di ricette segrete (float, tra 0 e 1),
+    il numero minimo e massimo di ingredienti normali per ricetta (int) e il seme (int) e ha tipo di ritorno Tuple[Dict[str, Any], Dict[str, Any]].
+    Restituisce il contenuto di ingredients.json (con la chiave "ingredients") e di recipes.json.
+    Gli ingredienti segreti finiscono nella categoria "secret", gli altri sono distribuiti a rotazione sulle categorie; ogni ricetta segreta
+    aggiunge un ingrediente segreto a quelli normali. Il prezzo è il costo degli ingredienti con un ricarico casuale tra 1.6 e 2.5.
+    Solleva ValueError se i parametri sono fuori dai limiti.
+    '''
+    if not 1 <= ingredients <= MAX_INGREDIENTS:
+        raise ValueError(f"gli ingredienti devono essere tra 1 e {MAX_INGREDIENTS}")
+    if not 0 <= recipes <= MAX_RECIPES:
+        raise ValueError(f"le ricette devono essere tra 0 e {MAX_RECIPES}")
+    if categories < 1 or not 0 <= secret_ratio < 1 or not 0 <= secret_recipes <= 1 or not 1 <= min_ingredients <= max_ingredients:
+        raise ValueError("parametri non validi: servono categories >= 1, 0 <= secret_ratio < 1, 0 <= secret_recipes <= 1 e 1 <= min <= max ingredienti")
+
+    rng = random.Random(seed)
+    secret_count = int(ingredients * secret_ratio)
+    if recipes and secret_recipes > 0 and secret_count == 0:
+        secret_count = 1
+    normal_count = ingredients - secret_count
+    if normal_count < max_ingredients:
+        raise ValueError(f"servono almeno {max_ingredients} ingredienti non segreti")
+
+    data: Dict[str, Dict[str, Any]] = {f"cat_{c:03d}": {} for c in range(categories)}
+    if secret_count:
+        data["secret"] = {}
+    normal_paths, secret_paths, costs = [], [], {}
+    for i in range(ingredients):
+        secret = i >= normal_count
+        category = "secret" if secret else f"cat_{i % categories:03d}"
+        name = f"ing_{i:06d}"
+        quantity = rng.randint(20, 100)
+        cost = round(rng.uniform(0.1, 3.0), 2)
+        data[category][name] = {
+            "display_name": f"Ingrediente {i}",
+            "description": f"Ingrediente sintetico {i} ({category})",
+            "base_quantity": quantity,
+            "current_quantity": quantity,
+            "unit": UNITS[i % len(UNITS)],
+            "base_cost": cost,
+            "current_cost": cost,
+            "reorder_point": quantity // 4,
+            "restock_quantity": quantity // 2,
+            "category": category,
+            "critical": rng.random() < 0.2
+        }
+        path = f"{category}.{name}"
+        (secret_paths if secret else normal_paths).append(path)
+        costs[path] = cost
+
+    recipe_data: Dict[str, Any] = {}
+    secret_recipe_count = int(round(recipes * secret_recipes)) if secret_paths else 0
+    for r in range(recipes):
+        needed = {path: rng.randint(1, 2) for path in rng.sample(normal_paths, rng.randint(min_ingredients, max_ingredients))}
+        if r >= recipes - secret_recipe_count:
+            needed[rng.choice(secret_paths)] = 1
+        price = sum(costs[path] * qty for path, qty in needed.items()) * rng.uniform(1.6, 2.5)
+        recipe_data[f"ricetta_{r:05d}"] = {"name": f"Burger {r}", "price": round(price, 2), "ingredients": needed}
+    return {"ingredients": data}, recipe_data
+
+
+def write_catalog(directory: str, ingredients_data: Dict[str, Any], recipes_data: Dict[str, Any]) -> Tuple[str, str]:
+    '''
+    Come parametri riceve la cartella di destinazione (stringa) e il contenuto dei due file (dizionari) e ha tipo di ritorno Tuple[str, str].
+    Scrive ingredients.json e recipes.json nella cartella (creandola se serve) e restituisce i due percorsi.
+    '''
+    os.makedirs(directory, exist_ok=True)
+    ingredients_file = os.path.join(directory, "ingredients.json")
+    recipes_file = os.path.join(directory, "recipes.json")
+    with open(ingredients_file, 'w', encoding='utf-8') as f:
+        json.dump(ingredients_data, f, ensure_ascii=False)
+    with open(recipes_file, 'w', encoding='utf-8') as f:
+        json.dump(recipes_data, f, ensure_ascii=False)
+    return ingredients_file, recipes_file
+
+
+def main():
+    '''
+    Funzione principale dello strumento: legge gli argomenti, genera il catalogo, lo scrive nella cartella --output e restituisce il codice di uscita
+    (2 se i parametri non sono validi o se --output è la cartella data/ del progetto, che non viene mai sovrascritta).
+    '''
+    parser = argparse.ArgumentParser(description="Generatore di cataloghi sintetici")
+    parser.add_argument("--output", required=True, help="cartella in cui scrivere ingredients.json e recipes.json")
+    parser.add_argument("--categories", type=int, default=10, help="categorie di ingredienti (oltre a secret)")
+    parser.add_argument("--ingredients", type=int, default=1000, help=f"ingredienti totali (massimo {MAX_INGREDIENTS})")
+    parser.add_argument("--recipes", type=int, default=200, help=f"ricette (massimo {MAX_RECIPES})")
+    parser.add_argument("--secret-ratio", type=float, default=0.05, help="frazione di ingredienti nella categoria secret")
+    parser.add_argument("--secret-recipes", type=float, default=0.1, help="frazione di ricette con un ingrediente segreto")
+    parser.add_argument("--min-ingredients", type=int, default=3, help="ingredienti normali minimi per ricetta")
+    parser.add_argument("--max-ingredients", type=int, default=8, help="ingredienti normali massimi per ricetta")
+    parser.add_argument("--seed", type=int, default=0, help="seme del generatore")
+    args = parser.parse_args()
+
+    project_data = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+    if os.path.abspath(args.output) == project_data:
+        print("❌ --output non può essere la cartella data/ del progetto")
+        return 2
+    try:
+        ingredients_data, recipes_data = generate_catalog(args.categories, args.ingredients, args.recipes, args.secret_ratio, args.secret_recipes,
+                                                          args.min_ingredients, args.max_ingredients, args.seed)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+
+    ingredients_file, recipes_file = write_catalog(args.output, ingredients_data, recipes_data)
+    secret = sum(1 for recipe in recipes_data.values() if any(path.startswith("secret.") for path in recipe["ingredients"]))
+    print(f"✅ {args.ingredients} ingredienti in {len(ingredients_data['ingredients'])} categorie -> {ingredients_file} ({os.path.getsize(ingredients_file) / 1e6:.1f} MB)")
+    print(f"✅ {len(recipes_data)} ricette ({secret} segrete) -> {recipes_file} ({os.path.getsize(recipes_file) / 1e6:.1f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""
+Confronto delle politiche di schedulazione della cucina a parità di capacità.
+Gioca le stesse partite (stessi semi) con ogni politica e stampa throughput, ordini scaduti e reputazione medi.
+
+Uso: python tools/kitchen_policies.py [--games 20] [--difficulty normal] [--policies fifo edf profit expiry] [--auto-restock]
+"""
+
+import argparse # importazione del modulo argparse per leggere i parametri da riga di comando
+import statistics # importazione del modulo statistics per calcolare le medie delle metriche
+import time # importazione del modulo time per misurare la durata delle simulazioni
+
+from simulation import isolated_workdir, play_headless # importazione delle funzioni di supporto per partite senza console
+from modules.kitchen import KITCHEN_POLICIES # importazione del registro delle politiche di schedulazione
+
+
+def main():
+    '''
+    Funzione principale dello strumento: legge gli argomenti, gioca games partite per ogni politica con i semi 0..games-1
+    e stampa una tabella con le medie (inclusa l'attesa media in coda) e la differenza percentuale rispetto a FIFO.
+    '''
+    parser = argparse.ArgumentParser(description="Confronto politiche cucina")
+    parser.add_argument("--games", type=int, default=20, help="partite per politica")
+    parser.add_argument("--difficulty", default="normal", help="livello di difficoltà")
+    parser.add_argument("--days", type=int, default=None, help="giorni per partita (default: config)")
+    parser.add_argument("--policies", nargs="+", default=list(KITCHEN_POLICIES), help="politiche da confrontare")
+    parser.add_argument("--auto-restock", action="store_true", help="rifornimento automatico ogni ora")
+    args = parser.parse_args()
+
+    results = {}
+    with isolated_workdir():
+        for policy in args.policies:
+            start = time.perf_counter()
+            runs = [play_headless(seed, args.difficulty, policy, args.days, args.auto_restock) for seed in range(args.games)]
+            elapsed = time.perf_counter() - start
+            results[policy] = {
+                "units": statistics.mean(r["units_prepared"] for r in runs),
+                "completed": statistics.mean(r["orders_completed"] for r in runs),
+                "expired": statistics.mean(r["orders_expired"] for r in runs),
+                "wait": statistics.mean(r["mean_queue_wait"] for r in runs),
+                "reputation": statistics.mean(r["reputation"] for r in runs),
+                "balance": statistics.mean(r["balance"] for r in runs),
+                "wins": sum(r["game_won"] for r in runs),
+                "seconds": elapsed
+            }
+
+    baseline = results.get("fifo")
+    print(f"{'politica':<10}{'panini':>9}{'ordini':>9}{'scaduti':>9}{'attesa':>8}{'reput.':>8}{'saldo':>10}{'vittorie':>10}{'Δ panini':>10}{'tempo':>8}")
+    for policy, r in results.items():
+        delta = ""
+        if baseline and baseline["units"] > 0:
+            delta = f"{(r['units'] / baseline['units'] - 1) * 100:+.1f}%"
+        print(f"{policy:<10}{r['units']:>9.1f}{r['completed']:>9.1f}{r['expired']:>9.1f}{r['wait']:>7.2f}h{r['reputation']:>8.1f}"
+              f"{r['balance']:>10.2f}{r['wins']:>7}/{args.games:<2}{delta:>10}{r['seconds']:>7.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+Generatore di carico per il server di simulazione (tools/sim_server.py): crea --sessions partite e poi, per --duration secondi, --connections connessioni
+keep-alive inviano richieste senza pausa scegliendo a caso sessione e tipo di richiesta secondo --mix (pesi di snapshot, advance, buy, upgrade, report).
+Stampa richieste al secondo, latenze (mediana, 95° e 99° percentile) per tipo di richiesta, codici di risposta e statistiche del server.
+Con --spawn avvia da solo un server su una porta libera e lo ferma alla fine. Esce con codice 1 se il server risponde con errori interni (5xx diversi da 503).
+
+Uso: python tools/load_generator.py [--spawn | --host 127.0.0.1 --port 8080] [--sessions 200] [--connections 32] [--duration 10] [--mix snapshot=60,advance=20,buy=10,upgrade=2,report=8]
+"""
+
+import argparse # importazione del modulo argparse per leggere i parametri da riga di comando
+import asyncio # importazione del modulo asyncio per gestire tutte le connessioni del carico in un unico ciclo di eventi
+import json # importazione del modulo json per codificare i corpi delle richieste e leggere le risposte
+import os # importazione del modulo os per comporre il percorso del server da avviare
+import random # importazione del modulo random per scegliere sessioni e richieste in modo riproducibile
+import statistics # importazione del modulo statistics per i percentili delle latenze
+import subprocess # importazione del modulo subprocess per avviare il server con --spawn
+import sys # importazione del modulo sys per impostare il codice di uscita e l'interprete del server
+import time # importazione del modulo time per misurare durate e latenze
+from collections import Counter, defaultdict # importazione di Counter e defaultdict per contare codici di risposta e raccogliere le latenze
+from typing import Dict, Any, List, Optional, Tuple # importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+
+from simulation import PROJECT_ROOT # importazione della radice del progetto, da cui avviare il server
+
+DEFAULT_MIX = "snapshot=60,advance=20,buy=10,upgrade=2,report=8" # pesi di default dei tipi di richiesta
+UPGRADES = ("upgrade_kitchen", "new_employee", "new_recipe") # upgrade scelti a caso dalle richieste upgrade
+
+
+class Client:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        '''
+        Come parametri riceve esplicitamente gli stream di una connessione aperta oltre all'istanza della classe Client (self implicito).
+        Connessione HTTP/1.1 keep-alive verso il server: le richieste sulla stessa connessione sono inviate una dopo l'altra.
+        '''
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> 'Client':
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None, parse: bool = False) -> Tuple[int, Any]:
+        '''
+        Come parametri riceve esplicitamente metodo e percorso (stringhe), payload (Optional[Dict], corpo JSON) e parse (bool, decodificare la risposta)
+        oltre all'istanza della classe Client (self implicito) e ha tipo di ritorno Tuple[int, Any].
+        Invia la richiesta e restituisce codice HTTP e risposta (decodificata solo con parse True, così il carico misura il server e non il client).
+        '''
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        status = int(lines[0].split(" ")[1])
+        length = 0
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        data = await self.reader.readexactly(length)
+        return status, json.loads(data) if parse else None
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    '''
+    Come parametro riceve la stringa dei pesi ("nome=peso,...") e ha tipo di ritorno Dict[str, int].
+    Solleva ValueError se un nome non è un tipo di richiesta noto o se nessun peso è positivo.
+    '''
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in ("snapshot", "advance", "buy", "upgrade", "report"):
+            raise ValueError(f"tipo di richiesta sconosciuto: {name}")
+        mix[name.strip()] = int(weight or 1)
+    if sum(mix.values()) <= 0:
+        raise ValueError("serve almeno un peso positivo")
+    return mix
+
+
+async def run_load(host: str, port: int, sessions: int, connections: int, duration: float, mix: Dict[str, int], hours: int, seed: int) -> Dict[str, Any]:
+    '''
+    Come parametri riceve indirizzo e porta del server, numero di sessioni e di connessioni (int), durata in secondi (float), pesi delle richieste (Dict[str, int]),
+    ore per ogni advance (int) e seme (int) e ha tipo di ritorno Dict[str, Any].
+    Crea le sessioni (distribuite sulle connessioni), poi invia richieste a ciclo continuo fino alla scadenza e restituisce conteggi, latenze e durate.
+    '''
+    clients = [await Client.connect(host, port) for _ in range(connections)]
+    ingredients: List[str] = []
+    session_ids: List[str] = []
+
+    async def create(client: Client, count: int, offset: int) -> None:
+        for i in range(count):
+            status, data = await client.request("POST", "/sessions", {"seed": seed + offset + i, "player": "Carico"}, parse=True)
+            if status != 201:
+                raise RuntimeError(f"creazione sessione fallita ({status}): {data.get('error')}")
+            session_ids.append(data["session"])
+            if not ingredients:
+                ingredients.extend(data["state"]["ingredients"])
+
+    start = time.perf_counter()
+    per_client = [sessions // connections + (1 if i < sessions % connections else 0) for i in range(connections)]
+    await asyncio.gather(*(create(client, count, sum(per_client[:i])) for i, (client, count) in enumerate(zip(clients, per_client))))
+    create_s = time.perf_counter() - start
+
+    names, weights = list(mix), list(mix.values())
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Counter = Counter()
+    deadline = time.perf_counter() + duration
+
+    async def worker(client: Client, rng: random.Random) -> None:
+        while time.perf_counter() < deadline:
+            kind = rng.choices(names, weights)[0]
+            session = rng.choice(session_ids)
+            if kind == "snapshot":
+                request = ("GET", f"/sessions/{session}", None)
+            elif kind == "report":
+                request = ("GET", f"/sessions/{session}/report?period={rng.choice(('daily', 'weekly', 'all'))}", None)
+            elif kind == "advance":
+                request = ("POST", f"/sessions/{session}/advance", {"hours": hours})
+            elif kind == "buy":
+                request = ("POST", f"/sessions/{session}/buy", {"ingredient": rng.choice(ingredients), "quantity": rng.randint(1, 5)})
+            else:
+                request = ("POST", f"/sessions/{session}/upgrade", {"upgrade": rng.choice(UPGRADES)})
+            sent = time.perf_counter()
+            status, _ = await client.request(*request)
+            latencies[kind].append((time.perf_counter() - sent) * 1000)
+            statuses[status] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(client, random.Random(seed * 1000 + i)) for i, client in enumerate(clients)))
+    elapsed = time.perf_counter() - start
+
+    _, server_stats = await clients[0].request("GET", "/stats", parse=True)
+    for client in clients:
+        client.close()
+    return {"create_s": create_s, "elapsed": elapsed, "latencies": latencies, "statuses": statuses, "server": server_stats}
+
+
+def spawn_server(args: argparse.Namespace) -> Tuple[subprocess.Popen, int]:
+    '''
+    Come parametro riceve gli argomenti da riga di comando e ha tipo di ritorno Tuple[subprocess.Popen, int].
+    Avvia tools/sim_server.py su una porta libera con capacità sufficiente per le sessioni richieste e restituisce il processo e la porta letta dal suo messaggio di avvio.
+    '''
+    command = [sys.executable, os.path.join(PROJECT_ROOT, "tools", "sim_server.py"), "--host", args.host, "--port", "0",
+               "--max-sessions", str(max(1000, args.sessions)), "--memory-mb", str(args.server_memory_mb)]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True, encoding="utf-8")
+    banner = process.stdout.readline()
+    if "http://" not in banner:
+        process.kill()
+        raise RuntimeError(f"avvio del server fallito: {banner.strip()}")
+    print(banner.strip())
+    return process, int(banner.split("http://", 1)[1].split(" ", 1)[0].rsplit(":", 1)[1])
+
+
+def main():
+    '''
+    Funzione principale dello strumento: legge gli argomenti, avvia il server se richiesto, esegue il carico, stampa i risultati e restituisce il codice di uscita.
+    '''
+    parser = argparse.ArgumentParser(description="Generatore di carico per il server di simulazione")
+    parser.add_argument("--host", default="127.0.0.1", help="indirizzo del server")
+    parser.add_argument("--port", type=int, default=8080, help="porta del server")
+    parser.add_argument("--spawn", action="store_true", help="avvia un server su una porta libera e lo ferma alla fine")
+    parser.add_argument("--server-memory-mb", type=float, default=1024.0, help="memoria per le sessioni del server avviato con --spawn (MB)")
+    parser.add_argument("--sessions", type=int, default=200, help="partite create prima del carico")
+    parser.add_argument("--connections", type=int, default=32, help="connessioni keep-alive contemporanee")
+    parser.add_argument("--duration", type=float, default=10.0, help="durata del carico in secondi")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="pesi dei tipi di richiesta (snapshot, advance, buy, upgrade, report)")
+    parser.add_argument("--hours", type=int, default=1, help="ore di gioco per ogni richiesta advance")
+    parser.add_argument("--seed", type=int, default=0, help="seme delle partite e della scelta delle richieste")
+    args = parser.parse_args()
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        print(f"❌ --mix non valido: {e}")
+        return 2
+    if args.sessions < 1 or args.connections < 1:
+        print("❌ servono almeno una sessione e una connessione")
+        return 2
+
+    process = None
+    port = args.port
+    try:
+        if args.spawn:
+            process, port = spawn_server(args)
+        result = asyncio.run(run_load(args.host, port, args.sessions, args.connections, args.duration, mix, args.hours, args.seed))
+    except (OSError, RuntimeError) as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        if process:
+            process.terminate()
+            process.wait()
+
+    total = sum(result["statuses"].values())
+    print(f"🎮 {args.sessions} sessioni create in {result['create_s']:.2f}s ({args.sessions / result['create_s']:.0f}/s)")
+    print(f"📈 {total} richieste in {result['elapsed']:.2f}s: {total / result['elapsed']:.0f} richieste/s su {args.connections} connessioni")
+    print(f"{'richiesta':<10}{'numero':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for kind, values in sorted(result["latencies"].items()):
+        cuts = statistics.quantiles(values, n=100) if len(values) > 1 else values * 99
+        print(f"{kind:<10}{len(values):>9}{statistics.median(values):>9.2f}{cuts[94]:>9.2f}{cuts[98]:>9.2f}")
+    print("🔢 Codici di risposta: " + ", ".join(f"{status}: {count}" for status, count in sorted(result["statuses"].items())))
+    server = result["server"]
+    print(f"🖥️  Server: {server['sessions']}/{server['capacity']} sessioni, ~{server['session_bytes'] / 1024:.0f} KB per sessione, "
+          f"{server['evicted']} rimosse (LRU), {server['rejected']} rifiutate (503), {server['errors']} errori")
+
+    failures = sum(count for status, count in result["statuses"].items() if status >= 500 and status != 503)
+    if failures:
+        print(f"❌ {failures} risposte con errore interno")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Profilo della memoria in una campagna lunga: gioca una partita senza console per --days giorni con la strumentazione della memoria attiva
+(MemoryProfiler: un'istantanea tracemalloc a fine giornata) e stampa per giorno la memoria allocata da modules/, la crescita e le strutture che crescono
+(coda ordini, transazioni, cache, ...), poi la crescita totale per sottosistema e i punti del codice che allocano di più.
+Con --alert-mb e --alert-growth-kb esce con codice 1 se una soglia viene superata, così può essere usato come prova di carico in CI.
+
+Uso: python tools/memory_profile.py [--days 60] [--difficulty easy] [--seed 0] [--auto-restock] [--top 10] [--alert-mb 50] [--alert-growth-kb 200]
+"""
+
+import argparse # importazione del modulo argparse per leggere i parametri da riga di comando
+import sys # importazione del modulo sys per impostare il codice di uscita
+import time # importazione del modulo time per misurare la durata della campagna
+
+from simulation import isolated_workdir, create_headless_game # importazione delle funzioni di supporto per partite senza console
+
+SHOWN_COUNTS = ("orders.queue", "finance.transactions", "finance.history_days", "recipes.recipe_counts", "metrics.days") # conteggi mostrati nella tabella giornaliera
+
+
+def main():
+    '''
+    Funzione principale dello strumento: legge gli argomenti, gioca la campagna in una copia isolata di data/ con la strumentazione attiva,
+    stampa tabella giornaliera, crescita per sottosistema e punti del codice e restituisce il codice di uscita (1 se è scattato un allarme).
+    '''
+    parser = argparse.ArgumentParser(description="Profilo della memoria per giorno di gioco")
+    parser.add_argument("--days", type=int, default=60, help="giorni della campagna (sostituisce time.days della config)")
+    parser.add_argument("--difficulty", default="easy", help="livello di difficoltà")
+    parser.add_argument("--seed", type=int, default=0, help="seme della partita")
+    parser.add_argument("--auto-restock", action="store_true", help="rifornimento automatico ogni ora (campagne più lunghe senza game over)")
+    parser.add_argument("--top", type=int, default=10, help="punti del codice mostrati")
+    parser.add_argument("--alert-mb", type=float, default=0.0, help="soglia di memoria allocata da modules/ in MB (0 = nessuna)")
+    parser.add_argument("--alert-growth-kb", type=float, default=0.0, help="soglia di crescita giornaliera in KB dal secondo giorno (0 = nessuna)")
+    args = parser.parse_args()
+
+    with isolated_workdir():
+        game = create_headless_game(args.seed, args.difficulty, auto_restock=args.auto_restock)
+        game.max_days = args.days
+        profiler = game.enable_memory_profiling(args.top, args.alert_mb, args.alert_growth_kb)
+        start = time.perf_counter()
+        with open("profilo.log", "w", encoding="utf-8") as log:
+            sys.stdout, console = log, sys.stdout
+            try:
+                while not game.game_over:
+                    game.advance_hour()
+            finally:
+                sys.stdout = console
+        elapsed = time.perf_counter() - start
+        summary = profiler.summary()
+        profiler.stop()
+
+    print(f"{'giorno':>6}{'KB':>9}{'Δ KB':>9}  " + "".join(f"{name:>22}" for name in SHOWN_COUNTS))
+    for report in profiler.reports:
+        counts = report["counts"]
+        print(f"{report['day']:>6}{report['traced_bytes'] / 1024:>9.0f}{report['growth_bytes'] / 1024:>+9.1f}  "
+              + "".join(f"{counts.get(name, 0):>22}" for name in SHOWN_COUNTS))
+
+    outcome = "vinta" if game.game_won else "persa"
+    print(f"\n📅 {summary['days']} giorni in {elapsed:.1f}s (partita {outcome}), crescita media {summary['avg_growth_bytes'] / 1024:+.1f} KB/giorno")
+    print("\n🧩 Crescita per sottosistema (dall'inizio):")
+    for name, values in sorted(summary["subsystems"].items(), key=lambda item: -item[1]["growth_bytes"]):
+        print(f"   {name:<16}{values['bytes'] / 1024:>9.0f} KB{values['growth_bytes'] / 1024:>+10.1f} KB{values['growth_blocks']:>+9} blocchi")
+    print(f"\n📍 Punti del codice che crescono di più:")
+    for site, size, count in summary["top_sites"]:
+        print(f"   {site:<28}{size / 1024:>+10.1f} KB{count:>+9} blocchi")
+
+    if summary["alerts"]:
+        print(f"\n❌ {len(summary['alerts'])} allarmi memoria:")
+        for alert in summary["alerts"]:
+            print(f"   {alert}")
+        return 1
+    print("\n✅ Nessuna soglia superata")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""
+Esecuzione di scenari di regressione: ogni file è uno script di comandi (vedi modules/script.py: seed, new, advance, day, buy, upgrade, restock, policy, save, expect)
+eseguito con GameEngine.run_script() in una copia isolata di data/, quindi gli scenari non toccano salvataggi e inventario del progetto e partono sempre dagli stessi dati.
+Stampa l'esito di ogni scenario e i comandi falliti; esce con codice 1 se almeno un comando (ad esempio un expect) fallisce.
+
+Uso: python tools/run_script.py scenario.txt [altro.txt ...] [--verbose] [--stop-on-error]
+"""
+
+import argparse # importazione del modulo argparse per leggere i parametri da riga di comando
+import sys # importazione del modulo sys per impostare il codice di uscita e mostrare l'output del gioco con --verbose
+import time # importazione del modulo time per misurare la durata di ogni scenario
+
+from simulation import isolated_workdir, restore_data # importazione della cartella di lavoro temporanea e del ripristino dei dati originali
+from modules.game import GameEngine # importazione del motore di gioco che esegue gli script
+
+
+def main():
+    '''
+    Funzione principale dello strumento: legge gli argomenti, esegue ogni scenario in una copia di data/ ripristinata, stampa esiti e comandi falliti
+    e restituisce il codice di uscita (1 se qualcosa fallisce, 2 se uno script non esiste).
+    '''
+    parser = argparse.ArgumentParser(description="Scenari di regressione da script di comandi")
+    parser.add_argument("scripts", nargs="+", help="file di comandi da eseguire")
+    parser.add_argument("--verbose", action="store_true", help="mostra l'output del gioco")
+    parser.add_argument("--stop-on-error", action="store_true", help="ferma ogni scenario al primo comando fallito")
+    args = parser.parse_args()
+
+    scripts = {}
+    for path in args.scripts:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                scripts[path] = f.readlines()
+        except OSError as e:
+            print(f"❌ {path}: {e}")
+            return 2
+
+    failures = 0
+    with isolated_workdir():
+        for path, lines in scripts.items():
+            restore_data()
+            start = time.perf_counter()
+            results = GameEngine().run_script(lines, sys.stdout if args.verbose else None, args.stop_on_error)
+            elapsed = time.perf_counter() - start
+            failed = [result for result in results if not result[2]]
+            failures += len(failed)
+            print(f"{'✅' if not failed else '❌'} {path}: {len(results)} comandi in {elapsed * 1000:.0f} ms, {len(failed)} falliti")
+            for number, command, _, message in failed:
+                print(f"   riga {number}: {command} -> {message}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
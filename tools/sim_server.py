@@ -0,0 +1,61 @@
+"""
+Server HTTP/JSON locale di simulazione: ospita molte partite in memoria nello stesso processo (vedi modules/server.py per percorsi e parametri).
+Le partite non scrivono salvataggi né file di data/; l'output dei print() del gioco è silenziato (salvo --verbose) e gli errori del server vanno su stderr.
+Esempio: curl -X POST localhost:8080/sessions -d '{"difficulty": "hard", "seed": 1}' e poi curl -X POST localhost:8080/sessions/1/advance -d '{"hours": 8}'.
+
+Uso: python tools/sim_server.py [--host 127.0.0.1] [--port 8080] [--max-sessions 1000] [--memory-mb 512] [--idle-timeout 900] [--max-pending 256] [--verbose]
+"""
+
+import argparse # importazione del modulo argparse per leggere i parametri da riga di comando
+import asyncio # importazione del modulo asyncio per eseguire il ciclo di eventi del server
+import os # importazione del modulo os per aprire os.devnull come destinazione dell'output silenziato
+import sys # importazione del modulo sys per impostare il codice di uscita e sostituire lo stdout
+
+from simulation import PROJECT_ROOT # importazione della radice del progetto (aggiunta anche al path di ricerca dei moduli)
+from modules.server import SimulationServer # importazione del server di simulazione
+
+
+async def serve(args: argparse.Namespace) -> None:
+    '''
+    Come parametro riceve gli argomenti da riga di comando (argparse.Namespace) e ha tipo di ritorno None.
+    Avvia il server, silenzia lo stdout del gioco (anche durante la stima della memoria), stampa indirizzo, capacità e memoria stimata per sessione e serve fino all'interruzione.
+    '''
+    console = sys.stdout
+    if not args.verbose:
+        sys.stdout = open(os.devnull, 'w', encoding='utf-8')
+    server = SimulationServer(args.max_sessions, args.memory_mb, args.idle_timeout, args.max_pending, args.max_hours)
+    await server.start(args.host, args.port)
+    print(f"✅ Server di simulazione su http://{args.host}:{server.port} "
+          f"(capacità {server.capacity} sessioni, ~{server.session_bytes / 1024:.0f} KB per sessione)", file=console, flush=True)
+    await server.serve_forever()
+
+
+def main():
+    '''
+    Funzione principale dello strumento: legge gli argomenti, sposta la cartella di lavoro nella radice del progetto (i percorsi data/ sono relativi)
+    e serve finché non viene interrotto con Ctrl+C; restituisce il codice di uscita.
+    '''
+    parser = argparse.ArgumentParser(description="Server HTTP/JSON di simulazione")
+    parser.add_argument("--host", default="127.0.0.1", help="indirizzo di ascolto")
+    parser.add_argument("--port", type=int, default=8080, help="porta di ascolto (0 = porta libera)")
+    parser.add_argument("--max-sessions", type=int, default=1000, help="sessioni contemporanee al massimo")
+    parser.add_argument("--memory-mb", type=float, default=512.0, help="memoria destinata alle sessioni (MB)")
+    parser.add_argument("--idle-timeout", type=float, default=900.0, help="secondi di inattività dopo cui una sessione viene rimossa")
+    parser.add_argument("--max-pending", type=int, default=256, help="passi di simulazione in attesa al massimo (oltre: 503)")
+    parser.add_argument("--max-hours", type=int, default=168, help="ore al massimo per una singola richiesta advance")
+    parser.add_argument("--verbose", action="store_true", help="mostra l'output del gioco")
+    args = parser.parse_args()
+
+    os.chdir(PROJECT_ROOT)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        print("\n👋 Server fermato", file=sys.stderr)
+    except OSError as e:
+        print(f"❌ Impossibile avviare il server: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""
+Funzioni di supporto condivise dagli strumenti di simulazione (benchmark, confronti, sweep).
+Permettono di giocare partite complete senza console interattiva, senza ritardi e senza toccare i file di salvataggio del progetto.
+"""
+
+import contextlib # importazione del modulo contextlib per definire context manager e silenziare l'output dei print() del gioco
+import io # importazione del modulo io per usare StringIO come destinazione dell'output silenziato
+import os # importazione del modulo necessario per operazioni sul sistema operativo (percorsi e cartella di lavoro)
+import random # importazione del modulo random per fissare il seme delle partite e renderle riproducibili
+import shutil # importazione del modulo shutil per copiare la cartella data/ in una cartella temporanea
+import sys # importazione del modulo sys per aggiungere la radice del progetto al path di ricerca dei moduli
+import tempfile # importazione del modulo tempfile per creare la cartella di lavoro temporanea
+from typing import Dict, Any, Optional, Iterator #importazione di tipi avanzati per supportare controlli statici e rendere il codice più leggibile
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # radice del progetto (cartella che contiene main.py, modules/ e data/)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from modules.game import GameEngine # importazione della classe principale GameEngine dal pacchetto modules.
+from modules.batch import UPGRADE_POLICY # importazione dell'ordine degli upgrade della politica di acquisto (la stessa del BatchSimulator)
+from modules.money import to_cents # importazione della conversione da euro a centesimi interi, per confrontare saldo e costi come Finance
+
+
+@contextlib.contextmanager
+def isolated_workdir() -> Iterator[str]:
+    '''
+    Context manager che copia data/ in una cartella temporanea e vi sposta la cartella di lavoro,
+    così le partite simulate leggono la configurazione reale ma scrivono salvataggi e inventario solo nella copia.
+    All'uscita ripristina la cartella di lavoro originale ed elimina la copia.
+    '''
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="fantaburger_") as workdir:
+        shutil.copytree(os.path.join(PROJECT_ROOT, "data"), os.path.join(workdir, "data"))
+        os.chdir(workdir)
+        try:
+            yield workdir
+        finally:
+            os.chdir(previous)
+
+
+def restore_data() -> None:
+    '''
+    Ricopia i file originali di data/ nella cartella di lavoro corrente (solo se è una copia creata da isolated_workdir()).
+    Serve perché Inventory salva le quantità in ingredients.json: senza ripristino ogni partita partirebbe dalle scorte lasciate dalla precedente.
+    '''
+    source = os.path.join(PROJECT_ROOT, "data")
+    target = os.path.abspath("data")
+    if os.path.samefile(source, target):
+        return
+    for name in os.listdir(source):
+        if name.endswith(".json") and name != "savestate.json":
+            shutil.copyfile(os.path.join(source, name), os.path.join(target, name))
+
+
+def create_headless_game(seed: int, difficulty: str = "easy", policy: Optional[str] = None, auto_restock: bool = False) -> GameEngine:
+    '''
+    Come parametri riceve il seme casuale (int), la difficoltà (stringa, default "easy"), la politica cucina (Optional[str])
+    e auto_restock (bool, rifornimento automatico ogni ora) e ha tipo di ritorno GameEngine.
+    Crea una nuova partita senza input, senza ritardi nella generazione ordini e senza attese di fine partita (gui_mode).
+    Va chiamata dentro isolated_workdir(): ripristina i dati originali così partite con lo stesso seme sono identiche.
+    '''
+    restore_data()
+    random.seed(seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = GameEngine()
+        game.gui_mode = True
+        game.simulate_delays = False
+        game.auto_restock_hourly = auto_restock
+        if policy:
+            game.set_kitchen_policy(policy)
+        game.new_game("Simulazione", "FantaBurger", difficulty)
+        game.running = True
+    return game
+
+
+def buy_upgrades(game: GameEngine) -> None:
+    '''
+    Come parametro riceve la partita (GameEngine) e ha tipo di ritorno None (non restituisce nulla).
+    Politica di acquisto deterministica delle partite simulate, chiamata all'inizio di ogni giornata (la stessa di BatchSimulator._buy_upgrades()):
+    per ogni upgrade di UPGRADE_POLICY, in ordine, lo acquista con buy_upgrade() se il saldo copre il suo costo attuale (aumento del 15% per livello)
+    più i costi giornalieri; livelli massimi e ricetta già sbloccata sono controllati da buy_upgrade().
+    '''
+    daily_costs = sum(game.finance.daily_costs.values())
+    for upgrade_id in UPGRADE_POLICY:
+        count = 0 if upgrade_id == "new_recipe" else game.upgrade_counts.get(upgrade_id, 0)
+        cost = to_cents(game.upgrade_costs.get(upgrade_id, 0) * (1.0 + count * 0.15))
+        if to_cents(game.finance.get_balance()) >= cost + daily_costs:
+            game.buy_upgrade(upgrade_id)
+
+
+def play_headless(seed: int, difficulty: str = "easy", policy: Optional[str] = None, days: Optional[int] = None, auto_restock: bool = False,
+                  upgrades: bool = False) -> Dict[str, Any]:
+    '''
+    Come parametri riceve il seme casuale (int), la difficoltà (stringa), la politica cucina (Optional[str]), il numero di giorni (Optional[int], default quelli della config),
+    auto_restock (bool) e upgrades (bool, True per acquistare upgrade ogni mattina con buy_upgrades()) e ha tipo di ritorno Dict[str, Any].
+    Gioca una partita completa avanzando ora per ora con l'output silenziato e restituisce le metriche finali
+    (ordini completati e scaduti, panini preparati, attesa media e tasso di timeout, reputazione, saldo, vittoria).
+    '''
+    game = create_headless_game(seed, difficulty, policy, auto_restock)
+    last_day = days if days is not None else game.max_days
+    with contextlib.redirect_stdout(io.StringIO()):
+        while not game.game_over and game.current_game_day <= last_day:
+            day = game.current_game_day
+            game.advance_hour()
+            if upgrades and not game.game_over and game.current_game_day != day:
+                buy_upgrades(game)
+
+    latency = game.get_latency_report()
+    return {
+        "seed": seed,
+        "difficulty": difficulty,
+        "policy": game.kitchen_policy.name,
+        "orders_completed": game.orders_completed_total,
+        "orders_expired": game.orders_expired_total,
+        "units_prepared": game.recipes.stats["total_preparations"],
+        "mean_queue_wait": latency["queue_wait"]["mean"],
+        "timeout_rate": latency["timeout_rate_percent"],
+        "reputation": round(game.reputation, 1),
+        "balance": game.finance.get_balance(),
+        "game_won": game.game_won,
+        "days_played": game.current_game_day
+    }
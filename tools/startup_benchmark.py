@@ -0,0 +1,74 @@
+"""
+Benchmark del tempo di avvio a freddo: ogni misura è un nuovo processo Python, così conta anche il costo delle importazioni.
+Scenari: avvio della console (main.py fino al primo input, con stdin chiuso), importazione batch senza console
+(from modules import GameEngine + creazione del motore) e importazione di gui.py (senza aprire finestre).
+Controlla anche che tkinter non venga mai importato dagli scenari senza GUI; esce con codice 1 se succede
+o se la mediana di uno scenario supera --max-ms, così può essere usato come controllo contro le regressioni.
+
+Uso: python tools/startup_benchmark.py [--runs 10] [--max-ms 500]
+"""
+
+import argparse # importazione del modulo argparse per leggere i parametri da riga di comando
+import re # importazione del modulo re per cercare tkinter nelle righe di -X importtime
+import statistics # importazione del modulo statistics per calcolare mediana dei tempi
+import subprocess # importazione del modulo subprocess per lanciare ogni misura in un nuovo processo Python
+import sys # importazione del modulo sys per conoscere l'interprete corrente e impostare il codice di uscita
+import time # importazione del modulo time per misurare la durata di ogni processo
+
+from simulation import PROJECT_ROOT, isolated_workdir # importazione della radice del progetto e della cartella di lavoro temporanea con una copia di data/
+
+SCENARIOS = {
+    "cli": (["main.py"], False),
+    "batch": (["-c", f"import sys; sys.path.insert(0, {PROJECT_ROOT!r}); from modules import GameEngine; GameEngine()"], False),
+    "gui": (["-c", f"import sys; sys.path.insert(0, {PROJECT_ROOT!r}); import gui"], True)
+} # nome scenario -> (argomenti dell'interprete, True se può importare tkinter)
+
+
+def run_once(args, importtime=False):
+    '''
+    Come parametri riceve gli argomenti dell'interprete (lista di stringhe) e importtime (bool, attiva -X importtime).
+    Lancia un nuovo processo Python nella cartella di lavoro corrente con stdin chiuso e restituisce (secondi trascorsi, stderr del processo).
+    '''
+    if args[0] == "main.py":
+        args = [f"{PROJECT_ROOT}/main.py"] + args[1:]
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + args
+    start = time.perf_counter()
+    completed = subprocess.run(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    return time.perf_counter() - start, completed.stderr
+
+
+def main():
+    '''
+    Funzione principale dello strumento: per ogni scenario esegue una misura con -X importtime (per sapere se tkinter viene importato)
+    e poi --runs misure a freddo, stampa una tabella con minimo, mediana e massimo in millisecondi e restituisce il codice di uscita.
+    '''
+    parser = argparse.ArgumentParser(description="Benchmark tempo di avvio")
+    parser.add_argument("--runs", type=int, default=10, help="misure per scenario")
+    parser.add_argument("--max-ms", type=float, default=None, help="mediana massima ammessa per scenario (ms)")
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), help="scenari da misurare")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'scenario':<10}{'min':>9}{'mediana':>10}{'max':>9}{'tkinter':>10}")
+    with isolated_workdir():
+        for name in args.scenarios:
+            interpreter_args, tk_allowed = SCENARIOS[name]
+            _, imports = run_once(interpreter_args, importtime=True)
+            uses_tk = re.search(r"\|\s*tkinter$", imports, re.MULTILINE) is not None
+            times = [run_once(interpreter_args)[0] * 1000 for _ in range(args.runs)]
+            median = statistics.median(times)
+
+            notes = []
+            if uses_tk and not tk_allowed:
+                notes.append("tkinter importato fuori dalla GUI!")
+                failed = True
+            if args.max_ms is not None and median > args.max_ms:
+                notes.append(f"oltre {args.max_ms:g} ms")
+                failed = True
+            print(f"{name:<10}{min(times):>7.1f}ms{median:>8.1f}ms{max(times):>7.1f}ms{'sì' if uses_tk else 'no':>10}  {' '.join(notes)}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())